@@ -0,0 +1,126 @@
+"""Measure the per-inference tool overhead of an ``AssistantAgent`` with many tools.
+
+The agent has ``--tools`` function tools, each taking a nested Pydantic model so that the schema has
+``$defs`` to resolve, and a model client that answers immediately with a call to the last tool. Every
+turn lists the tools of the workbench, passes their schemas to the model client and calls one tool.
+The previous behavior, which generated the schema of every tool on every access and scanned the
+workbench for the called tool, is compared with the cached schemas and the name index.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, List, Mapping
+
+from autogen_agentchat.agents import AssistantAgent
+from autogen_agentchat.messages import TextMessage
+from autogen_core import CancellationToken, FunctionCall
+from autogen_core.models import CreateResult, ModelFamily, ModelInfo, RequestUsage
+from autogen_core.tools import FunctionTool, StaticWorkbench, ToolResult, ToolSchema
+from autogen_ext.models.replay import ReplayChatCompletionClient
+from pydantic import BaseModel
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+
+
+class Customer(BaseModel):
+    name: str
+    address: Address
+
+
+def update_customer(customer: Customer, note: str) -> str:
+    return f"Updated {customer.name}: {note}"
+
+
+class ToolCallClient(ReplayChatCompletionClient):
+    """Calls the given tool without tokenizing the prompt, so that the timings show the cost of the tools."""
+
+    def __init__(self, tool_name: str) -> None:
+        super().__init__(
+            ["done"],
+            model_info=ModelInfo(
+                vision=False,
+                function_calling=True,
+                json_output=False,
+                family=ModelFamily.UNKNOWN,
+                structured_output=False,
+            ),
+        )
+        self._tool_name = tool_name
+        self.schemas = 0
+
+    async def create(self, *args: Any, **kwargs: Any) -> CreateResult:
+        tools = kwargs.get("tools", [])
+        # The model client reads the schema of every tool it is given.
+        for tool in tools:
+            schema = tool.schema if isinstance(tool, FunctionTool) else tool
+            self.schemas += len(schema["name"])
+        arguments = '{"customer": {"name": "Ada", "address": {"street": "Main St", "city": "Paris"}}, "note": "vip"}'
+        return CreateResult(
+            finish_reason="function_calls",
+            content=[FunctionCall(id="call", name=self._tool_name, arguments=arguments)],
+            usage=RequestUsage(0, 0),
+            cached=False,
+        )
+
+
+class UncachedFunctionTool(FunctionTool):
+    """Generates the schema on every access, as before."""
+
+    @property
+    def schema(self) -> ToolSchema:
+        return self._build_schema()
+
+
+class ScanningWorkbench(StaticWorkbench):
+    """Scans the tools for the called tool, as before."""
+
+    async def call_tool(
+        self, name: str, arguments: Mapping[str, Any] | None = None, cancellation_token: CancellationToken | None = None
+    ) -> ToolResult:
+        next((tool for tool in self._tools if tool.name == name), None)
+        return await super().call_tool(name, arguments, cancellation_token)
+
+
+def _make_agent(tool_class: type[FunctionTool], workbench_class: type[StaticWorkbench], tools: int) -> AssistantAgent:
+    function_tools: List[Any] = [
+        tool_class(update_customer, name=f"update_customer_{i}", description=f"Update a customer in region {i}.")
+        for i in range(tools)
+    ]
+    return AssistantAgent(
+        "assistant",
+        model_client=ToolCallClient(f"update_customer_{tools - 1}"),
+        workbench=workbench_class(function_tools),
+    )
+
+
+async def _measure(name: str, agent: AssistantAgent, turns: int) -> None:
+    cancellation_token = CancellationToken()
+    start = time.perf_counter()
+    for turn in range(turns):
+        await agent.on_messages([TextMessage(content=f"turn {turn}", source="user")], cancellation_token)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<40} {turns / elapsed:>10,.1f} turns/sec  {elapsed / turns * 1000:>8.3f} ms/turn")
+
+
+async def run(tools: int, turns: int) -> None:
+    print(f"{tools} tools")
+    await _measure(
+        "  uncached schemas, scan (previous)", _make_agent(UncachedFunctionTool, ScanningWorkbench, tools), turns
+    )
+    await _measure("  cached schemas, name index", _make_agent(FunctionTool, StaticWorkbench, tools), turns)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tools", type=int, default=100, help="Number of tools of the agent.")
+    parser.add_argument("--turns", type=int, default=200, help="Number of turns, each with one inference.")
+    args = parser.parse_args()
+    asyncio.run(run(args.tools, args.turns))
+
+
+if __name__ == "__main__":
+    main()
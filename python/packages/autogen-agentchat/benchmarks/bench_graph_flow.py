@@ -0,0 +1,121 @@
+"""Measure the makespan of a ``GraphFlow`` on synthetic DAGs, with and without eager scheduling.
+
+Every node of the graph is an agent that sleeps for a random time between ``--min-delay`` and ``--max-delay``
+seconds, drawn once per node from a log-uniform distribution with ``--seed``, so that a few agents are much
+slower than the others, as model calls often are. Two graphs are run:
+
+- wide: a start node that fans out to ``--width`` chains of ``--depth`` nodes, which join into an end node.
+- deep: ``--depth`` layers of ``--width`` nodes, where each node depends on ``--fan-in`` random nodes of the
+  previous layer.
+
+The previous scheduling, which starts the next nodes only once all running nodes have completed, is compared
+with eager scheduling, which starts a node as soon as its parents have completed. Reports the makespan and the
+critical path of the graph, which is the lower bound of the makespan.
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+from typing import Dict, List, Sequence
+
+from autogen_agentchat.agents import BaseChatAgent
+from autogen_agentchat.base import Response
+from autogen_agentchat.messages import BaseChatMessage, TextMessage
+from autogen_agentchat.teams import DiGraph, DiGraphEdge, DiGraphNode, GraphFlow
+from autogen_core import CancellationToken
+
+
+class SleepAgent(BaseChatAgent):
+    def __init__(self, name: str, delay: float) -> None:
+        super().__init__(name, "An agent that sleeps before it answers.")
+        self._delay = delay
+
+    @property
+    def produced_message_types(self) -> Sequence[type[BaseChatMessage]]:
+        return (TextMessage,)
+
+    async def on_messages(self, messages: Sequence[BaseChatMessage], cancellation_token: CancellationToken) -> Response:
+        await asyncio.sleep(self._delay)
+        return Response(chat_message=TextMessage(content="done", source=self.name))
+
+    async def on_reset(self, cancellation_token: CancellationToken) -> None:
+        pass
+
+
+def _wide_graph(width: int, depth: int) -> Dict[str, List[str]]:
+    edges: Dict[str, List[str]] = {"start": [f"chain_{i}_0" for i in range(width)], "end": []}
+    for i in range(width):
+        for j in range(depth):
+            edges[f"chain_{i}_{j}"] = [f"chain_{i}_{j + 1}" if j + 1 < depth else "end"]
+    return edges
+
+
+def _deep_graph(width: int, depth: int, fan_in: int, rng: random.Random) -> Dict[str, List[str]]:
+    edges: Dict[str, List[str]] = {f"node_{i}_{j}": [] for i in range(depth) for j in range(width)}
+    for i in range(1, depth):
+        for j in range(width):
+            for parent in rng.sample(range(width), min(fan_in, width)):
+                edges[f"node_{i - 1}_{parent}"].append(f"node_{i}_{j}")
+    return edges
+
+
+def _critical_path(edges: Dict[str, List[str]], delays: Dict[str, float]) -> float:
+    finish: Dict[str, float] = {}
+
+    def visit(node: str) -> float:
+        if node not in finish:
+            finish[node] = delays[node] + max((visit(child) for child in edges[node]), default=0.0)
+        return finish[node]
+
+    return max(visit(node) for node in edges)
+
+
+async def _measure(name: str, edges: Dict[str, List[str]], delays: Dict[str, float], eager_scheduling: bool) -> None:
+    graph = DiGraph(
+        nodes={
+            node: DiGraphNode(name=node, edges=[DiGraphEdge(target=child) for child in children])
+            for node, children in edges.items()
+        }
+    )
+    team = GraphFlow(
+        participants=[SleepAgent(node, delays[node]) for node in edges],
+        graph=graph,
+        eager_scheduling=eager_scheduling,
+    )
+    start = time.perf_counter()
+    result = await team.run(task="start")
+    elapsed = time.perf_counter() - start
+    # The task, one message per node, and the message of the stop agent.
+    assert len(result.messages) == len(edges) + 2
+    print(f"{name:<32} makespan {elapsed:>7.3f} s")
+
+
+async def run(width: int, depth: int, fan_in: int, min_delay: float, max_delay: float, seed: int) -> None:
+    rng = random.Random(seed)
+    graphs = {
+        f"wide ({width} chains of {depth})": _wide_graph(width, depth),
+        f"deep ({depth} layers of {width}, fan-in {fan_in})": _deep_graph(width, depth, fan_in, rng),
+    }
+    for title, edges in graphs.items():
+        delays = {node: math.exp(rng.uniform(math.log(min_delay), math.log(max_delay))) for node in edges}
+        print(f"{title}: {len(edges)} nodes, critical path {_critical_path(edges, delays):.3f} s")
+        await _measure("  all running nodes (previous)", edges, delays, eager_scheduling=False)
+        await _measure("  eager scheduling", edges, delays, eager_scheduling=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=8, help="Number of chains, or of nodes per layer.")
+    parser.add_argument("--depth", type=int, default=6, help="Number of nodes per chain, or of layers.")
+    parser.add_argument("--fan-in", type=int, default=2, help="Number of parents of a node in the deep graph.")
+    parser.add_argument("--min-delay", type=float, default=0.005, help="Minimum time an agent sleeps, in seconds.")
+    parser.add_argument("--max-delay", type=float, default=0.2, help="Maximum time an agent sleeps, in seconds.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the graph and the delays.")
+    args = parser.parse_args()
+    asyncio.run(run(args.width, args.depth, args.fan_in, args.min_delay, args.max_delay, args.seed))
+
+
+if __name__ == "__main__":
+    main()
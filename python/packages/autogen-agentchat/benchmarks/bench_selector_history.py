@@ -0,0 +1,111 @@
+"""Measure the speaker selection latency of ``SelectorGroupChat`` as the conversation grows.
+
+For each number of ``--turns``, the selector manager's model context is filled with that many
+messages, then ``--selections`` turns are timed, each adding one message and selecting the next
+speaker with a model client that answers immediately. Three modes are compared: rendering the history from scratch
+on every turn (the previous behavior), the incremental rendering, and the incremental rendering
+with ``max_selector_history_tokens`` set to ``--budget``.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, List
+
+from autogen_agentchat.messages import MessageFactory, TextMessage
+from autogen_agentchat.teams._group_chat._selector_group_chat import SelectorGroupChatManager
+from autogen_core import AgentId, AgentInstantiationContext, SingleThreadedAgentRuntime
+from autogen_core.models import CreateResult, LLMMessage, RequestUsage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+PARTICIPANTS = ["planner", "coder", "reviewer"]
+
+
+class NameClient(ReplayChatCompletionClient):
+    """Returns the next participant name without tokenizing the prompt, so that the timings show the
+    cost of building the prompt rather than of the replay client."""
+
+    def __init__(self) -> None:
+        super().__init__(PARTICIPANTS)
+        self.calls = 0
+
+    async def create(self, *args: Any, **kwargs: Any) -> CreateResult:
+        self.calls += 1
+        content = PARTICIPANTS[self.calls % len(PARTICIPANTS)]
+        return CreateResult(finish_reason="stop", content=content, usage=RequestUsage(0, 0), cached=False)
+
+
+class FromScratchManager(SelectorGroupChatManager):
+    """Overriding the history rendering disables the incremental path."""
+
+    def construct_message_history(self, message_history: List[LLMMessage]) -> str:
+        return super().construct_message_history(message_history)
+
+
+def _make_manager(cls: type[SelectorGroupChatManager], budget: int | None) -> SelectorGroupChatManager:
+    runtime = SingleThreadedAgentRuntime()
+    with AgentInstantiationContext.populate_context((runtime, AgentId("selector", "bench"))):
+        return cls(
+            name="SelectorGroupChatManager",
+            group_topic_type="group",
+            output_topic_type="output",
+            participant_topic_types=PARTICIPANTS,
+            participant_names=PARTICIPANTS,
+            participant_descriptions=[f"The {name}." for name in PARTICIPANTS],
+            output_message_queue=asyncio.Queue(),
+            termination_condition=None,
+            max_turns=None,
+            message_factory=MessageFactory(),
+            model_client=NameClient(),
+            selector_prompt="Roles: {roles}\nHistory:\n{history}\nSelect one of {participants}.",
+            allow_repeated_speaker=True,
+            selector_func=None,
+            max_selector_attempts=1,
+            candidate_func=None,
+            emit_team_events=False,
+            model_context=None,
+            max_selector_history_tokens=budget,
+        )
+
+
+def _message(turn: int) -> TextMessage:
+    source = PARTICIPANTS[turn % len(PARTICIPANTS)]
+    return TextMessage(content=f"Turn {turn}: an update on the task with a few more details. " * 4, source=source)
+
+
+async def _measure(name: str, manager: SelectorGroupChatManager, turns: int, selections: int) -> None:
+    await manager.update_message_thread([_message(turn) for turn in range(turns)])
+    # The first selection renders the prefilled messages.
+    await manager.select_speaker(manager._message_thread)  # pyright: ignore[reportPrivateUsage]
+    start = time.perf_counter()
+    for turn in range(turns, turns + selections):
+        await manager.update_message_thread([_message(turn)])
+        await manager.select_speaker(manager._message_thread)  # pyright: ignore[reportPrivateUsage]
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<36} {elapsed / selections * 1e3:9.3f}ms/selection")
+
+
+async def run(turns: List[int], selections: int, budget: int) -> None:
+    for count in turns:
+        print(f"{count} turns")
+        await _measure("from scratch (previous)", _make_manager(FromScratchManager, None), count, selections)
+        await _measure("incremental", _make_manager(SelectorGroupChatManager, None), count, selections)
+        await _measure(
+            f"incremental, {budget} token budget",
+            _make_manager(SelectorGroupChatManager, budget),
+            count,
+            selections,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--selections", type=int, default=20, help="Number of timed selections per mode.")
+    parser.add_argument("--budget", type=int, default=2000, help="Token budget of the selector history.")
+    args = parser.parse_args()
+    asyncio.run(run(args.turns, args.selections, args.budget))
+
+
+if __name__ == "__main__":
+    main()
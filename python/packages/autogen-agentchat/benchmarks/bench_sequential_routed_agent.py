@@ -0,0 +1,172 @@
+"""Measure the FIFO lock and the message delivery of ``SequentialRoutedAgent``.
+
+First acquires and releases the lock from ``--tasks`` contending tasks, comparing the previous lock
+(an ``asyncio.Queue`` of ``asyncio.Event`` objects) with the mailbox of futures. Then publishes
+``--messages`` ``GroupChatAgentResponse`` messages to a sequential agent, with the previous lock and
+``isinstance`` scan over the sequential message types, and with the current agent: through the runtime,
+and as a burst of concurrent ``on_message_impl`` calls that skips the runtime. Reports operations/sec.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Sequence
+
+from autogen_agentchat.base import Response
+from autogen_agentchat.messages import TextMessage
+from autogen_agentchat.teams._group_chat._events import (
+    GroupChatAgentResponse,
+    GroupChatError,
+    GroupChatMessage,
+    GroupChatRequestPublish,
+    GroupChatReset,
+    GroupChatStart,
+    GroupChatTermination,
+)
+from autogen_agentchat.teams._group_chat._sequential_routed_agent import FIFOLock, SequentialRoutedAgent
+from autogen_core import (
+    AgentId,
+    CancellationToken,
+    DefaultTopicId,
+    MessageContext,
+    RoutedAgent,
+    SingleThreadedAgentRuntime,
+    default_subscription,
+    event,
+)
+
+# The sequential message types of a group chat container.
+SEQUENTIAL_MESSAGE_TYPES = [
+    GroupChatStart,
+    GroupChatRequestPublish,
+    GroupChatReset,
+    GroupChatAgentResponse,
+    GroupChatMessage,
+    GroupChatTermination,
+    GroupChatError,
+]
+
+
+class PreviousFIFOLock:
+    """The previous lock, which allocates a queue entry and an event per contended acquire."""
+
+    def __init__(self) -> None:
+        self._queue = asyncio.Queue[asyncio.Event]()
+        self._locked = False
+
+    async def acquire(self) -> None:
+        if not self._locked:
+            self._locked = True
+            return
+        event = asyncio.Event()
+        await self._queue.put(event)
+        await event.wait()
+
+    def release(self) -> None:
+        if not self._queue.empty():
+            self._queue.get_nowait().set()
+        else:
+            self._locked = False
+
+
+@default_subscription
+class CountingAgent(SequentialRoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent that counts responses.", sequential_message_types=SEQUENTIAL_MESSAGE_TYPES)
+        self.count = 0
+
+    @event
+    async def handle_agent_response(self, message: GroupChatAgentResponse, ctx: MessageContext) -> None:
+        self.count += 1
+
+
+@default_subscription
+class PreviousCountingAgent(CountingAgent):
+    def __init__(self) -> None:
+        super().__init__()
+        self._previous_lock = PreviousFIFOLock()
+
+    async def on_message_impl(self, message: Any, ctx: MessageContext) -> Any | None:
+        if any(isinstance(message, sequential_type) for sequential_type in self._sequential_message_types):
+            await self._previous_lock.acquire()
+            try:
+                return await RoutedAgent.on_message_impl(self, message, ctx)
+            finally:
+                self._previous_lock.release()
+        return await RoutedAgent.on_message_impl(self, message, ctx)
+
+
+def _report(name: str, operations: int, elapsed: float) -> None:
+    print(f"{name:<48} {operations / elapsed:>12,.0f}/sec")
+
+
+async def _bench_lock(name: str, lock: FIFOLock | PreviousFIFOLock, tasks: int, rounds: int) -> None:
+    async def worker() -> None:
+        for _ in range(rounds):
+            await lock.acquire()
+            try:
+                await asyncio.sleep(0)
+            finally:
+                lock.release()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(tasks)])
+    _report(name, tasks * rounds, time.perf_counter() - start)
+
+
+async def _bench_delivery(
+    name: str, agent_class: type[CountingAgent], messages: Sequence[GroupChatAgentResponse]
+) -> None:
+    runtime = SingleThreadedAgentRuntime()
+    await agent_class.register(runtime, "counter", agent_class)
+    runtime.start()
+    start = time.perf_counter()
+    for message in messages:
+        await runtime.publish_message(message, topic_id=DefaultTopicId())
+    await runtime.stop_when_idle()
+    _report(name, len(messages), time.perf_counter() - start)
+    agent = await runtime.try_get_underlying_agent_instance(AgentId("counter", "default"), agent_class)
+    assert agent.count == len(messages)
+
+    # Deliver the messages again directly to the agent, all at once.
+    ctx = MessageContext(
+        sender=None,
+        topic_id=DefaultTopicId(),
+        is_rpc=False,
+        cancellation_token=CancellationToken(),
+        message_id="message",
+    )
+    start = time.perf_counter()
+    await asyncio.gather(*[agent.on_message_impl(message, ctx) for message in messages])
+    _report(name.replace("runtime", "direct"), len(messages), time.perf_counter() - start)
+    assert agent.count == 2 * len(messages)
+
+
+async def run(tasks: int, rounds: int, messages: int) -> None:
+    print(f"lock contention ({tasks} tasks)")
+    await _bench_lock("  queue + event (previous)", PreviousFIFOLock(), tasks, rounds)
+    await _bench_lock("  mailbox of futures", FIFOLock(), tasks, rounds)
+
+    print(f"GroupChatAgentResponse delivery ({messages} messages)")
+    responses = [
+        GroupChatAgentResponse(
+            agent_response=Response(chat_message=TextMessage(content=f"message {i}", source="agent")),
+            agent_name="agent",
+        )
+        for i in range(messages)
+    ]
+    await _bench_delivery("  runtime: queue + event, isinstance (previous)", PreviousCountingAgent, responses)
+    await _bench_delivery("  runtime: mailbox, type dict", CountingAgent, responses)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100, help="Number of tasks contending for the lock.")
+    parser.add_argument("--rounds", type=int, default=1000, help="Number of acquisitions per task.")
+    parser.add_argument("--messages", type=int, default=20_000, help="Number of responses published to the agent.")
+    args = parser.parse_args()
+    asyncio.run(run(args.tasks, args.rounds, args.messages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Measure the rate at which streamed tokens are delivered to a ``run_stream`` consumer.
+
+A team of ``--agents`` agents runs ``--turns`` turns in round robin. On each turn, an agent streams
+``--tokens`` ``ModelClientStreamingChunkEvent`` messages of one token each, as fast as it can. The
+previous path, which published every chunk through the runtime to the group chat manager, is compared
+with the direct channel from the participants to the output message queue, and with the direct channel
+and chunk coalescing. Reports tokens/sec and the number of chunk events the consumer received.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, AsyncGenerator, Callable, Sequence
+
+from autogen_agentchat.agents import BaseChatAgent
+from autogen_agentchat.base import ChatAgent, Response, TaskResult
+from autogen_agentchat.conditions import MaxMessageTermination
+from autogen_agentchat.messages import (
+    BaseAgentEvent,
+    BaseChatMessage,
+    MessageFactory,
+    ModelClientStreamingChunkEvent,
+    TextMessage,
+)
+from autogen_agentchat.teams import RoundRobinGroupChat
+from autogen_agentchat.teams._group_chat._chat_agent_container import ChatAgentContainer
+from autogen_core import CancellationToken
+
+
+class StreamingAgent(BaseChatAgent):
+    def __init__(self, name: str, tokens: int) -> None:
+        super().__init__(name, "An agent that streams tokens.")
+        self._tokens = tokens
+
+    @property
+    def produced_message_types(self) -> Sequence[type[BaseChatMessage]]:
+        return (TextMessage,)
+
+    async def on_messages(self, messages: Sequence[BaseChatMessage], cancellation_token: CancellationToken) -> Response:
+        raise NotImplementedError
+
+    async def on_messages_stream(
+        self, messages: Sequence[BaseChatMessage], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[BaseAgentEvent | BaseChatMessage | Response, None]:
+        for i in range(self._tokens):
+            yield ModelClientStreamingChunkEvent(content=f"t{i} ", source=self.name)
+            # Let the consumer run, as a model client does between chunks.
+            await asyncio.sleep(0)
+        yield Response(chat_message=TextMessage(content="done", source=self.name))
+
+    async def on_reset(self, cancellation_token: CancellationToken) -> None:
+        pass
+
+
+class RuntimeOutputGroupChat(RoundRobinGroupChat):
+    """Publishes the messages of the participants through the runtime, as before."""
+
+    def _create_participant_factory(
+        self, parent_topic_type: str, output_topic_type: str, agent: ChatAgent, message_factory: MessageFactory
+    ) -> Callable[[], ChatAgentContainer]:
+        return lambda: ChatAgentContainer(parent_topic_type, output_topic_type, agent, message_factory)
+
+
+async def _measure(
+    name: str, team_class: type[RoundRobinGroupChat], agents: int, turns: int, tokens: int, **kwargs: Any
+) -> None:
+    team = team_class(
+        [StreamingAgent(f"agent_{i}", tokens) for i in range(agents)],
+        termination_condition=MaxMessageTermination(turns + 1),
+    )
+    events = 0
+    delivered = 0
+    start = time.perf_counter()
+    async for message in team.run_stream(task="stream", **kwargs):
+        if isinstance(message, ModelClientStreamingChunkEvent):
+            events += 1
+            delivered += message.content.count(" ")
+        elif isinstance(message, TaskResult):
+            break
+    elapsed = time.perf_counter() - start
+    assert delivered == turns * tokens
+    print(f"{name:<40} {delivered / elapsed:>12,.0f} tokens/sec  {events:>8,} events")
+
+
+async def run(agents: int, turns: int, tokens: int, window: float, size: int) -> None:
+    print(f"{turns} turns of {tokens} tokens")
+    await _measure("  runtime (previous)", RuntimeOutputGroupChat, agents, turns, tokens)
+    await _measure("  direct channel", RoundRobinGroupChat, agents, turns, tokens)
+    await _measure(
+        f"  direct channel, coalesce {window * 1000:g} ms",
+        RoundRobinGroupChat,
+        agents,
+        turns,
+        tokens,
+        chunk_coalesce_window=window,
+        chunk_coalesce_size=size,
+    )
+    await _measure(
+        f"  direct channel, coalesce {size} chars",
+        RoundRobinGroupChat,
+        agents,
+        turns,
+        tokens,
+        chunk_coalesce_size=size,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=2)
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--tokens", type=int, default=2000, help="Number of tokens streamed per turn.")
+    parser.add_argument("--window", type=float, default=0.01, help="Coalesce window in seconds.")
+    parser.add_argument("--size", type=int, default=256, help="Coalesce size in characters.")
+    args = parser.parse_args()
+    asyncio.run(run(args.agents, args.turns, args.tokens, args.window, args.size))
+
+
+if __name__ == "__main__":
+    main()
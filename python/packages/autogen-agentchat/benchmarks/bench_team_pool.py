@@ -0,0 +1,75 @@
+"""Measure the throughput of many short, independent team sessions.
+
+Runs ``--sessions`` round-robin conversations of ``--turns`` messages between echo agents, first with
+a new team and embedded runtime per session (run ``--concurrency`` at a time), then as sessions of a
+``TeamPool`` on one shared runtime with ``max_concurrent_sessions=--concurrency``. Reports sessions/sec.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Sequence
+
+from autogen_agentchat.agents import BaseChatAgent
+from autogen_agentchat.base import Response
+from autogen_agentchat.conditions import MaxMessageTermination
+from autogen_agentchat.messages import BaseChatMessage, TextMessage
+from autogen_agentchat.teams import RoundRobinGroupChat, TeamPool
+from autogen_core import CancellationToken
+
+
+class EchoAgent(BaseChatAgent):
+    def __init__(self, name: str) -> None:
+        super().__init__(name, "An agent that echoes the last message.")
+
+    @property
+    def produced_message_types(self) -> Sequence[type[BaseChatMessage]]:
+        return (TextMessage,)
+
+    async def on_messages(self, messages: Sequence[BaseChatMessage], cancellation_token: CancellationToken) -> Response:
+        content = messages[-1].to_text() if messages else ""
+        return Response(chat_message=TextMessage(content=content, source=self.name))
+
+    async def on_reset(self, cancellation_token: CancellationToken) -> None:
+        pass
+
+
+def _report(name: str, sessions: int, elapsed: float) -> None:
+    print(f"{name:<40} {sessions / elapsed:>10,.1f} sessions/sec  ({elapsed:.2f}s)")
+
+
+async def run(sessions: int, turns: int, concurrency: int) -> None:
+    def create_team() -> RoundRobinGroupChat:
+        return RoundRobinGroupChat(
+            [EchoAgent("agent_1"), EchoAgent("agent_2"), EchoAgent("agent_3")],
+            termination_condition=MaxMessageTermination(turns),
+        )
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_team(index: int) -> None:
+        async with semaphore:
+            await create_team().run(task=f"task {index}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*[run_team(i) for i in range(sessions)])
+    _report("team per session (embedded runtime)", sessions, time.perf_counter() - start)
+
+    pool = TeamPool(create_team, max_concurrent_sessions=concurrency)
+    start = time.perf_counter()
+    await asyncio.gather(*[pool.run(task=f"task {i}") for i in range(sessions)])
+    _report("TeamPool (shared runtime)", sessions, time.perf_counter() - start)
+    await pool.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--turns", type=int, default=4, help="Messages per session, including the task.")
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(run(args.sessions, args.turns, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,7 @@
 )
 
 from autogen_core import CancellationToken, Component, ComponentModel, FunctionCall
-from autogen_core.memory import Memory
+from autogen_core.memory import Memory, UpdateContextResult
 from autogen_core.model_context import (
     ChatCompletionContext,
     UnboundedChatCompletionContext,
@@ -32,11 +32,11 @@
     ModelFamily,
     SystemMessage,
 )
-from autogen_core.tools import BaseTool, FunctionTool, StaticWorkbench, Workbench
+from autogen_core.tools import BaseTool, FunctionTool, StaticWorkbench, ToolSchema, Workbench
 from pydantic import BaseModel
 from typing_extensions import Self
 
-from .. import EVENT_LOGGER_NAME
+from .. import EVENT_LOGGER_NAME, TRACE_LOGGER_NAME
 from ..base import Handoff as HandoffBase
 from ..base import Response
 from ..messages import (
@@ -58,6 +58,75 @@
 from ._base_chat_agent import BaseChatAgent
 
 event_logger = logging.getLogger(EVENT_LOGGER_NAME)
+trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
+
+
+class _MemoryContextRecorder(ChatCompletionContext):
+    """A model context given to a memory while memories update the context concurrently.
+
+    It returns a snapshot of the messages of the agent's model context, taken once for all memories, and records
+    the messages the memory adds, so that they can be added to the model context in the order of the memories.
+    """
+
+    def __init__(self, messages: List[LLMMessage]) -> None:
+        super().__init__()
+        self._snapshot = messages
+        self.added: List[LLMMessage] = []
+
+    async def add_message(self, message: LLMMessage) -> None:
+        self.added.append(message)
+
+    async def get_messages(self) -> List[LLMMessage]:
+        return list(self._snapshot)
+
+
+class _WorkbenchToolIndex:
+    """The tools of a sequence of workbenches, listed once and indexed by name.
+
+    The listing is taken on first use and kept until :meth:`invalidate` is called. A tool name that is
+    not in the index triggers one new listing, so tools added to a workbench since the last listing are found.
+    When several workbenches have a tool with the same name, the first one is used.
+    """
+
+    def __init__(self, workbench: Sequence[Workbench]) -> None:
+        self._workbench = workbench
+        self._tools: List[ToolSchema] | None = None
+        self._index: Dict[str, Workbench] = {}
+        # Incremented on every listing, so that concurrent lookups of a missing name list the tools once.
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        self._tools = None
+
+    async def list_tools(self) -> List[ToolSchema]:
+        tools = self._tools
+        if tools is None:
+            tools = await self._refresh(self._generation)
+        return tools
+
+    async def find(self, name: str) -> Workbench | None:
+        await self.list_tools()
+        generation = self._generation
+        wb = self._index.get(name)
+        if wb is None:
+            await self._refresh(generation)
+            wb = self._index.get(name)
+        return wb
+
+    async def _refresh(self, generation: int) -> List[ToolSchema]:
+        async with self._lock:
+            if self._tools is None or self._generation == generation:
+                tools: List[ToolSchema] = []
+                index: Dict[str, Workbench] = {}
+                for wb in self._workbench:
+                    for tool in await wb.list_tools():
+                        tools.append(tool)
+                        index.setdefault(tool["name"], wb)
+                self._tools = tools
+                self._index = index
+                self._generation += 1
+            return self._tools
 
 
 class AssistantAgentConfig(BaseModel):
@@ -70,6 +139,7 @@ class AssistantAgentConfig(BaseModel):
     handoffs: List[HandoffBase | str] | None = None
     model_context: ComponentModel | None = None
     memory: List[ComponentModel] | None = None
+    memory_timeout: float | None = None
     description: str
     system_message: str | None = None
     model_client_stream: bool = False
@@ -225,6 +295,11 @@ class AssistantAgent(BaseChatAgent, Component[AssistantAgentConfig]):
         configuration files.
 
         memory (Sequence[Memory] | None, optional): The memory store to use for the agent. Defaults to `None`.
+            When there are several memories, they update the model context concurrently, and the content they
+            add is appended to the model context in the order of this list.
+        memory_timeout (float | None, optional): The time in seconds each memory has to update the model context
+            before an inference. A memory that takes longer is skipped for that inference and a warning is logged.
+            Defaults to `None`, which means no timeout.
         metadata (Dict[str, str] | None, optional): Optional metadata for tracking.
 
     Raises:
@@ -675,6 +750,7 @@ def __init__(
         output_content_type: type[BaseModel] | None = None,
         output_content_type_format: str | None = None,
         memory: Sequence[Memory] | None = None,
+        memory_timeout: float | None = None,
         metadata: Dict[str, str] | None = None,
     ):
         super().__init__(name=name, description=description)
@@ -695,6 +771,9 @@ def __init__(
                 self._memory = memory
             else:
                 raise TypeError(f"Expected Memory, List[Memory], or None, got {type(memory)}")
+        if memory_timeout is not None and memory_timeout <= 0:
+            raise ValueError("memory_timeout must be a positive number or None.")
+        self._memory_timeout = memory_timeout
 
         self._system_messages: List[SystemMessage] = []
         if system_message is None:
@@ -755,6 +834,7 @@ def __init__(
                 self._workbench = [workbench]
         else:
             self._workbench = [StaticWorkbench(self._tools)]
+        self._tool_index = _WorkbenchToolIndex(self._workbench)
 
         if model_context is not None:
             self._model_context = model_context
@@ -819,8 +899,9 @@ async def on_messages_stream(
         agent_name = self.name
         model_context = self._model_context
         memory = self._memory
+        memory_timeout = self._memory_timeout
         system_messages = self._system_messages
-        workbench = self._workbench
+        tool_index = self._tool_index
         handoff_tools = self._handoff_tools
         handoffs = self._handoffs
         model_client = self._model_client
@@ -831,6 +912,9 @@ async def on_messages_stream(
         output_content_type = self._output_content_type
         format_string = self._output_content_type_format
 
+        # List the tools of the workbenches again for this turn, they are reused by all inferences and tool calls.
+        tool_index.invalidate()
+
         # STEP 1: Add new user/handoff messages to the model context
         await self._add_messages_to_context(
             model_context=model_context,
@@ -843,6 +927,7 @@ async def on_messages_stream(
             memory=memory,
             model_context=model_context,
             agent_name=agent_name,
+            memory_timeout=memory_timeout,
         ):
             inner_messages.append(event_msg)
             yield event_msg
@@ -854,7 +939,7 @@ async def on_messages_stream(
             model_client_stream=model_client_stream,
             system_messages=system_messages,
             model_context=model_context,
-            workbench=workbench,
+            tool_index=tool_index,
             handoff_tools=handoff_tools,
             agent_name=agent_name,
             cancellation_token=cancellation_token,
@@ -891,7 +976,7 @@ async def on_messages_stream(
             agent_name=agent_name,
             system_messages=system_messages,
             model_context=model_context,
-            workbench=workbench,
+            tool_index=tool_index,
             handoff_tools=handoff_tools,
             handoffs=handoffs,
             model_client=model_client,
@@ -923,20 +1008,48 @@ async def _update_model_context_with_memory(
         memory: Optional[Sequence[Memory]],
         model_context: ChatCompletionContext,
         agent_name: str,
+        memory_timeout: float | None = None,
     ) -> List[MemoryQueryEvent]:
         """
         If memory modules are present, update the model context and return the events produced.
+
+        Several memories update the context concurrently, each on a recorder that shares one snapshot of the
+        model context. The messages they add are then appended to the model context in the order of the memories.
         """
         events: List[MemoryQueryEvent] = []
-        if memory:
-            for mem in memory:
-                update_context_result = await mem.update_context(model_context)
-                if update_context_result and len(update_context_result.memories.results) > 0:
-                    memory_query_event_msg = MemoryQueryEvent(
-                        content=update_context_result.memories.results,
-                        source=agent_name,
-                    )
-                    events.append(memory_query_event_msg)
+        if not memory:
+            return events
+        if len(memory) == 1 and memory_timeout is None:
+            recorders: List[ChatCompletionContext] = [model_context]
+        else:
+            snapshot = await model_context.get_messages()
+            recorders = [_MemoryContextRecorder(snapshot) for _ in memory]
+
+        async def _update(mem: Memory, context: ChatCompletionContext) -> UpdateContextResult | None:
+            if memory_timeout is None:
+                return await mem.update_context(context)
+            try:
+                return await asyncio.wait_for(mem.update_context(context), timeout=memory_timeout)
+            except asyncio.TimeoutError:
+                trace_logger.warning(
+                    f"Memory {type(mem).__name__} did not update the model context within {memory_timeout} seconds "
+                    "and was skipped."
+                )
+                return None
+
+        results = await asyncio.gather(*[_update(mem, context) for mem, context in zip(memory, recorders, strict=True)])
+        for context, update_context_result in zip(recorders, results, strict=True):
+            if update_context_result is None:
+                continue
+            if isinstance(context, _MemoryContextRecorder):
+                for message in context.added:
+                    await model_context.add_message(message)
+            if len(update_context_result.memories.results) > 0:
+                memory_query_event_msg = MemoryQueryEvent(
+                    content=update_context_result.memories.results,
+                    source=agent_name,
+                )
+                events.append(memory_query_event_msg)
         return events
 
     @classmethod
@@ -946,7 +1059,7 @@ async def _call_llm(
         model_client_stream: bool,
         system_messages: List[SystemMessage],
         model_context: ChatCompletionContext,
-        workbench: Sequence[Workbench],
+        tool_index: _WorkbenchToolIndex,
         handoff_tools: List[BaseTool[Any, Any]],
         agent_name: str,
         cancellation_token: CancellationToken,
@@ -958,7 +1071,7 @@ async def _call_llm(
         all_messages = await model_context.get_messages()
         llm_messages = cls._get_compatible_context(model_client=model_client, messages=system_messages + all_messages)
 
-        tools = [tool for wb in workbench for tool in await wb.list_tools()] + handoff_tools
+        tools = (await tool_index.list_tools()) + handoff_tools
 
         if model_client_stream:
             model_result: Optional[CreateResult] = None
@@ -995,7 +1108,7 @@ async def _process_model_result(
         agent_name: str,
         system_messages: List[SystemMessage],
         model_context: ChatCompletionContext,
-        workbench: Sequence[Workbench],
+        tool_index: _WorkbenchToolIndex,
         handoff_tools: List[BaseTool[Any, Any]],
         handoffs: Dict[str, HandoffBase],
         model_client: ChatCompletionClient,
@@ -1055,7 +1168,7 @@ async def _process_model_result(
             *[
                 cls._execute_tool_call(
                     tool_call=call,
-                    workbench=workbench,
+                    tool_index=tool_index,
                     handoff_tools=handoff_tools,
                     agent_name=agent_name,
                     cancellation_token=cancellation_token,
@@ -1296,7 +1409,7 @@ def default_tool_call_summary_formatter(call: FunctionCall, result: FunctionExec
     @staticmethod
     async def _execute_tool_call(
         tool_call: FunctionCall,
-        workbench: Sequence[Workbench],
+        tool_index: _WorkbenchToolIndex,
         handoff_tools: List[BaseTool[Any, Any]],
         agent_name: str,
         cancellation_token: CancellationToken,
@@ -1334,23 +1447,22 @@ async def _execute_tool_call(
                 )
 
         # Handle normal tool call using workbench.
-        for wb in workbench:
-            tools = await wb.list_tools()
-            if any(t["name"] == tool_call.name for t in tools):
-                result = await wb.call_tool(
+        wb = await tool_index.find(tool_call.name)
+        if wb is not None:
+            result = await wb.call_tool(
+                name=tool_call.name,
+                arguments=arguments,
+                cancellation_token=cancellation_token,
+            )
+            return (
+                tool_call,
+                FunctionExecutionResult(
+                    content=result.to_text(),
+                    call_id=tool_call.id,
+                    is_error=result.is_error,
                     name=tool_call.name,
-                    arguments=arguments,
-                    cancellation_token=cancellation_token,
-                )
-                return (
-                    tool_call,
-                    FunctionExecutionResult(
-                        content=result.to_text(),
-                        call_id=tool_call.id,
-                        is_error=result.is_error,
-                        name=tool_call.name,
-                    ),
-                )
+                ),
+            )
 
         return (
             tool_call,
@@ -1365,6 +1477,7 @@ async def _execute_tool_call(
     async def on_reset(self, cancellation_token: CancellationToken) -> None:
         """Reset the assistant agent to its initialization state."""
         await self._model_context.clear()
+        self._tool_index.invalidate()
 
     async def save_state(self) -> Mapping[str, Any]:
         """Save the current state of the assistant agent."""
@@ -1396,6 +1509,7 @@ def _to_config(self) -> AssistantAgentConfig:
             handoffs=list(self._handoffs.values()) if self._handoffs else None,
             model_context=self._model_context.dump_component(),
             memory=[memory.dump_component() for memory in self._memory] if self._memory else None,
+            memory_timeout=self._memory_timeout,
             description=self.description,
             system_message=self._system_messages[0].content
             if self._system_messages and isinstance(self._system_messages[0].content, str)
@@ -1429,6 +1543,7 @@ def _from_config(cls, config: AssistantAgentConfig) -> Self:
             model_context=ChatCompletionContext.load_component(config.model_context) if config.model_context else None,
             tools=[BaseTool.load_component(tool) for tool in config.tools] if config.tools else None,
             memory=[Memory.load_component(memory) for memory in config.memory] if config.memory else None,
+            memory_timeout=config.memory_timeout,
             description=config.description,
             system_message=config.system_message,
             model_client_stream=config.model_client_stream,
@@ -15,6 +15,7 @@
 from ._group_chat._round_robin_group_chat import RoundRobinGroupChat
 from ._group_chat._selector_group_chat import SelectorGroupChat
 from ._group_chat._swarm_group_chat import Swarm
+from ._group_chat._team_pool import TeamPool
 
 __all__ = [
     "BaseGroupChat",
@@ -27,4 +28,5 @@
     "DiGraphNode",
     "DiGraphEdge",
     "GraphFlow",
+    "TeamPool",
 ]
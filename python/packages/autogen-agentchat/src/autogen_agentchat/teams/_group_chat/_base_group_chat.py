@@ -1,10 +1,11 @@
 import asyncio
 import uuid
 from abc import ABC, abstractmethod
-from typing import Any, AsyncGenerator, Callable, Dict, List, Mapping, Sequence
+from typing import Any, AsyncGenerator, Callable, Dict, List, Mapping, Sequence, Tuple
 
 from autogen_core import (
     AgentId,
+    AgentInstantiationContext,
     AgentRuntime,
     AgentType,
     CancellationToken,
@@ -56,6 +57,7 @@ def __init__(
         runtime: AgentRuntime | None = None,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        message_thread_window: int | None = None,
     ):
         if len(participants) == 0:
             raise ValueError("At least one participant is required.")
@@ -128,6 +130,9 @@ def __init__(
         # Flag to track if the team events should be emitted.
         self._emit_team_events = emit_team_events
 
+        # The number of messages of the message thread the group chat manager keeps in memory.
+        self._message_thread_window = message_thread_window
+
     @abstractmethod
     def _create_group_chat_manager_factory(
         self,
@@ -151,26 +156,40 @@ def _create_participant_factory(
         message_factory: MessageFactory,
     ) -> Callable[[], ChatAgentContainer]:
         def _factory() -> ChatAgentContainer:
-            container = ChatAgentContainer(parent_topic_type, output_topic_type, agent, message_factory)
+            # The participants put their streaming chunks directly in the output message queue of the team.
+            container = ChatAgentContainer(
+                parent_topic_type,
+                output_topic_type,
+                agent,
+                message_factory,
+                output_message_queue=self._output_message_queue,
+            )
             return container
 
         return _factory
 
     async def _init(self, runtime: AgentRuntime) -> None:
+        await self._register(runtime, lambda team_id: self)
+        self._initialized = True
+
+    async def _register(self, runtime: AgentRuntime, get_team: Callable[[str], "BaseGroupChat"]) -> None:
+        """Register the agent types and subscriptions of the team with the runtime.
+
+        The agents are created by the team returned by `get_team` for the agent key, which is the team ID.
+        This lets a :class:`TeamPool` run many teams with the same participant names on one registration."""
         # Constants for the group chat manager.
         group_chat_manager_agent_type = AgentType(self._group_chat_manager_topic_type)
 
+        def _participant_factory(index: int) -> Callable[[], ChatAgentContainer]:
+            return lambda: get_team(AgentInstantiationContext.current_agent_id().key)._create_participant_container(
+                index
+            )
+
         # Register participants.
         # Use the participant topic type as the agent type.
-        for participant, agent_type in zip(self._participants, self._participant_topic_types, strict=True):
+        for index, agent_type in enumerate(self._participant_topic_types):
             # Register the participant factory.
-            await ChatAgentContainer.register(
-                runtime,
-                type=agent_type,
-                factory=self._create_participant_factory(
-                    self._group_topic_type, self._output_topic_type, participant, self._message_factory
-                ),
-            )
+            await ChatAgentContainer.register(runtime, type=agent_type, factory=_participant_factory(index))
             # Add subscriptions for the participant.
             # The participant should be able to receive messages from its own topic.
             await runtime.add_subscription(TypeSubscription(topic_type=agent_type, agent_type=agent_type))
@@ -181,18 +200,7 @@ async def _init(self, runtime: AgentRuntime) -> None:
         await self._base_group_chat_manager_class.register(
             runtime,
             type=group_chat_manager_agent_type.type,
-            factory=self._create_group_chat_manager_factory(
-                name=self._group_chat_manager_name,
-                group_topic_type=self._group_topic_type,
-                output_topic_type=self._output_topic_type,
-                participant_names=self._participant_names,
-                participant_topic_types=self._participant_topic_types,
-                participant_descriptions=self._participant_descriptions,
-                output_message_queue=self._output_message_queue,
-                termination_condition=self._termination_condition,
-                max_turns=self._max_turns,
-                message_factory=self._message_factory,
-            ),
+            factory=lambda: get_team(AgentInstantiationContext.current_agent_id().key)._create_group_chat_manager(),
         )
         # Add subscriptions for the group chat manager.
         # The group chat manager should be able to receive messages from the its own topic.
@@ -210,13 +218,45 @@ async def _init(self, runtime: AgentRuntime) -> None:
             TypeSubscription(topic_type=self._output_topic_type, agent_type=group_chat_manager_agent_type.type)
         )
 
+    def _create_participant_container(self, index: int) -> ChatAgentContainer:
+        return self._create_participant_factory(
+            self._group_topic_type, self._output_topic_type, self._participants[index], self._message_factory
+        )()
+
+    def _create_group_chat_manager(self) -> SequentialRoutedAgent:
+        return self._create_group_chat_manager_factory(
+            name=self._group_chat_manager_name,
+            group_topic_type=self._group_topic_type,
+            output_topic_type=self._output_topic_type,
+            participant_names=self._participant_names,
+            participant_topic_types=self._participant_topic_types,
+            participant_descriptions=self._participant_descriptions,
+            output_message_queue=self._output_message_queue,
+            termination_condition=self._termination_condition,
+            max_turns=self._max_turns,
+            message_factory=self._message_factory,
+        )()
+
+    def _attach(self, runtime: AgentRuntime, registered: "BaseGroupChat", team_id: str) -> None:
+        """Run this team on a runtime where the agent types and subscriptions of `registered` are already
+        registered, using `team_id` as the agent key of its participants and group chat manager."""
+        if type(self) is not type(registered) or self._participant_names != registered._participant_names:
+            raise ValueError("The team must have the same type and participant names as the registered team.")
+        self._runtime = runtime
+        self._embedded_runtime = False
         self._initialized = True
+        self._team_id = team_id
+        self._group_chat_manager_topic_type = registered._group_chat_manager_topic_type
+        self._group_topic_type = registered._group_topic_type
+        self._participant_topic_types = registered._participant_topic_types
+        self._output_topic_type = registered._output_topic_type
 
     async def run(
         self,
         *,
         task: str | BaseChatMessage | Sequence[BaseChatMessage] | None = None,
         cancellation_token: CancellationToken | None = None,
+        collect_messages: bool = True,
     ) -> TaskResult:
         """Run the team and return the result. The base implementation uses
         :meth:`run_stream` to run the team and then returns the final result.
@@ -228,6 +268,8 @@ async def run(
                 Setting the cancellation token potentially put the team in an inconsistent state,
                 and it may not reset the termination condition.
                 To gracefully stop the team, use :class:`~autogen_agentchat.conditions.ExternalTermination` instead.
+            collect_messages (bool): Whether to collect the produced messages in the result. Defaults to True.
+                If False, the messages are not kept while the team runs and the result only contains the stop reason.
 
         Returns:
             result: The result of the task as :class:`~autogen_agentchat.base.TaskResult`. The result contains the messages produced by the team and the stop reason.
@@ -307,6 +349,7 @@ async def main() -> None:
         async for message in self.run_stream(
             task=task,
             cancellation_token=cancellation_token,
+            collect_messages=collect_messages,
         ):
             if isinstance(message, TaskResult):
                 result = message
@@ -319,6 +362,9 @@ async def run_stream(
         *,
         task: str | BaseChatMessage | Sequence[BaseChatMessage] | None = None,
         cancellation_token: CancellationToken | None = None,
+        collect_messages: bool = True,
+        chunk_coalesce_window: float | None = None,
+        chunk_coalesce_size: int | None = None,
     ) -> AsyncGenerator[BaseAgentEvent | BaseChatMessage | TaskResult, None]:
         """Run the team and produces a stream of messages and the final result
         of the type :class:`~autogen_agentchat.base.TaskResult` as the last item in the stream. Once the
@@ -336,6 +382,15 @@ async def run_stream(
                 Setting the cancellation token potentially put the team in an inconsistent state,
                 and it may not reset the termination condition.
                 To gracefully stop the team, use :class:`~autogen_agentchat.conditions.ExternalTermination` instead.
+            collect_messages (bool): Whether to collect the yielded messages in the final :class:`~autogen_agentchat.base.TaskResult`.
+                Defaults to True. If False, the messages are only yielded in the stream, so they are not kept in memory
+                for the duration of the run, and the final result has an empty list of messages.
+            chunk_coalesce_window (float | None): If set, consecutive :class:`~autogen_agentchat.messages.ModelClientStreamingChunkEvent`
+                messages from the same agent that arrive within this many seconds of the first one are merged into one event.
+                Defaults to None.
+            chunk_coalesce_size (int | None): If set, consecutive :class:`~autogen_agentchat.messages.ModelClientStreamingChunkEvent`
+                messages from the same agent that are already available are merged into one event, until its content has at least
+                this many characters. Also limits the events merged within `chunk_coalesce_window`. Defaults to None.
 
         Returns:
             stream: an :class:`~collections.abc.AsyncGenerator` that yields :class:`~autogen_agentchat.messages.BaseAgentEvent`, :class:`~autogen_agentchat.messages.BaseChatMessage`, and the final result :class:`~autogen_agentchat.base.TaskResult` as the last item in the stream.
@@ -445,6 +500,12 @@ async def main() -> None:
                         "custom_message_types list when creating the team."
                     )
 
+        if chunk_coalesce_window is not None and chunk_coalesce_window <= 0:
+            raise ValueError("The chunk coalesce window must be greater than 0.")
+        if chunk_coalesce_size is not None and chunk_coalesce_size <= 0:
+            raise ValueError("The chunk coalesce size must be greater than 0.")
+        coalesce_chunks = chunk_coalesce_window is not None or chunk_coalesce_size is not None
+
         if self._is_running:
             raise ValueError("The team is already running, it cannot run again until it is stopped.")
         self._is_running = True
@@ -504,13 +565,22 @@ async def stop_runtime() -> None:
             # Collect the output messages in order.
             output_messages: List[BaseAgentEvent | BaseChatMessage] = []
             stop_reason: str | None = None
+            # A message taken from the queue while coalescing chunks, to be yielded next.
+            next_message: BaseAgentEvent | BaseChatMessage | GroupChatTermination | None = None
             # Yield the messsages until the queue is empty.
             while True:
-                message_future = asyncio.ensure_future(self._output_message_queue.get())
-                if cancellation_token is not None:
-                    cancellation_token.link_future(message_future)
-                # Wait for the next message, this will raise an exception if the task is cancelled.
-                message = await message_future
+                if next_message is not None:
+                    message, next_message = next_message, None
+                else:
+                    message_future = asyncio.ensure_future(self._output_message_queue.get())
+                    if cancellation_token is not None:
+                        cancellation_token.link_future(message_future)
+                    # Wait for the next message, this will raise an exception if the task is cancelled.
+                    message = await message_future
+                if coalesce_chunks and isinstance(message, ModelClientStreamingChunkEvent):
+                    message, next_message = await self._coalesce_chunks(
+                        message, chunk_coalesce_window, chunk_coalesce_size, cancellation_token
+                    )
                 if isinstance(message, GroupChatTermination):
                     # If the message contains an error, we need to raise it here.
                     # This will stop the team and propagate the error.
@@ -522,7 +592,8 @@ async def stop_runtime() -> None:
                 if isinstance(message, ModelClientStreamingChunkEvent):
                     # Skip the model client streaming chunk events.
                     continue
-                output_messages.append(message)
+                if collect_messages:
+                    output_messages.append(message)
 
             # Yield the final result.
             yield TaskResult(messages=output_messages, stop_reason=stop_reason)
@@ -541,6 +612,44 @@ async def stop_runtime() -> None:
                 # Indicate that the team is no longer running.
                 self._is_running = False
 
+    async def _coalesce_chunks(
+        self,
+        chunk: ModelClientStreamingChunkEvent,
+        window: float | None,
+        size: int | None,
+        cancellation_token: CancellationToken | None,
+    ) -> Tuple[ModelClientStreamingChunkEvent, BaseAgentEvent | BaseChatMessage | GroupChatTermination | None]:
+        """Merge the chunks from the same source that follow `chunk` in the output message queue.
+        Returns the merged chunk and the message that ended the merge, if one was taken from the queue."""
+        parts = [chunk.content]
+        length = len(chunk.content)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + window if window is not None else None
+        next_message: BaseAgentEvent | BaseChatMessage | GroupChatTermination | None = None
+        while size is None or length < size:
+            if not self._output_message_queue.empty():
+                message = self._output_message_queue.get_nowait()
+            elif deadline is not None and deadline > loop.time():
+                message_future = asyncio.ensure_future(self._output_message_queue.get())
+                if cancellation_token is not None:
+                    cancellation_token.link_future(message_future)
+                done, _ = await asyncio.wait([message_future], timeout=deadline - loop.time())
+                if not done:
+                    # A cancelled get leaves the queue unchanged.
+                    message_future.cancel()
+                    break
+                message = message_future.result()
+            else:
+                break
+            if not isinstance(message, ModelClientStreamingChunkEvent) or message.source != chunk.source:
+                next_message = message
+                break
+            parts.append(message.content)
+            length += len(message.content)
+        if len(parts) > 1:
+            chunk = chunk.model_copy(update={"content": "".join(parts)})
+        return chunk, next_message
+
     async def reset(self) -> None:
         """Reset the team and its participants to their initial state.
 
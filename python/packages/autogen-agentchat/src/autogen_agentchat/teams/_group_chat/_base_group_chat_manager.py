@@ -18,6 +18,7 @@
     GroupChatTermination,
     SerializableException,
 )
+from ._message_thread import MessageThread
 from ._sequential_routed_agent import SequentialRoutedAgent
 
 
@@ -31,6 +32,9 @@ class BaseGroupChatManager(SequentialRoutedAgent, ABC):
     - For each participant, the agent type must be the same as the topic type.
 
     Without the above conditions, the group chat will not function correctly.
+
+    If `message_thread_window` is set, only the most recent messages of the message thread are
+    kept in memory and older messages are spilled to disk. See :class:`MessageThread`.
     """
 
     def __init__(
@@ -46,6 +50,7 @@ def __init__(
         max_turns: int | None,
         message_factory: MessageFactory,
         emit_team_events: bool = False,
+        message_thread_window: int | None = None,
     ):
         super().__init__(
             description="Group chat manager",
@@ -72,7 +77,7 @@ def __init__(
             name: topic_type for name, topic_type in zip(participant_names, participant_topic_types, strict=True)
         }
         self._participant_descriptions = participant_descriptions
-        self._message_thread: List[BaseAgentEvent | BaseChatMessage] = []
+        self._message_thread = MessageThread(message_factory, window=message_thread_window)
         self._output_message_queue = output_message_queue
         self._termination_condition = termination_condition
         self._max_turns = max_turns
@@ -136,22 +141,7 @@ async def handle_agent_response(self, message: GroupChatAgentResponse, ctx: Mess
                     delta.append(inner_message)
             delta.append(message.agent_response.chat_message)
 
-            # Append the messages to the message thread.
-            await self.update_message_thread(delta)
-
-            # Remove the agent from the active speakers list.
-            self._active_speakers.remove(message.agent_name)
-            if len(self._active_speakers) > 0:
-                # If there are still active speakers, return without doing anything.
-                return
-
-            # Check if the conversation should be terminated.
-            if await self._apply_termination_condition(delta, increment_turn_count=True):
-                # Stop the group chat.
-                return
-
-            # Select speakers to continue the conversation.
-            await self._transition_to_next_speakers(ctx.cancellation_token)
+            await self._process_agent_response(message.agent_name, delta, ctx.cancellation_token)
         except Exception as e:
             # Handle the exception and signal termination with an error.
             error = SerializableException.from_exception(e)
@@ -159,6 +149,28 @@ async def handle_agent_response(self, message: GroupChatAgentResponse, ctx: Mess
             # Raise the exception to the runtime.
             raise
 
+    async def _process_agent_response(
+        self, agent_name: str, delta: List[BaseAgentEvent | BaseChatMessage], cancellation_token: CancellationToken
+    ) -> None:
+        """Update the group chat with the response of an active speaker, and select the next speakers once all
+        active speakers have responded."""
+        # Append the messages to the message thread.
+        await self.update_message_thread(delta)
+
+        # Remove the agent from the active speakers list.
+        self._active_speakers.remove(agent_name)
+        if len(self._active_speakers) > 0:
+            # If there are still active speakers, return without doing anything.
+            return
+
+        # Check if the conversation should be terminated.
+        if await self._apply_termination_condition(delta, increment_turn_count=True):
+            # Stop the group chat.
+            return
+
+        # Select speakers to continue the conversation.
+        await self._transition_to_next_speakers(cancellation_token)
+
     async def _transition_to_next_speakers(self, cancellation_token: CancellationToken) -> None:
         speaker_names_future = asyncio.ensure_future(self.select_speaker(self._message_thread))
         # Link the select speaker future to the cancellation token.
@@ -312,5 +324,8 @@ async def reset(self) -> None:
         """Reset the group chat manager."""
         ...
 
+    async def close(self) -> None:
+        self._message_thread.close()
+
     async def on_unhandled_message(self, message: Any, ctx: MessageContext) -> None:
         raise ValueError(f"Unhandled message in group chat manager: {type(message)}")
@@ -1,8 +1,9 @@
+import asyncio
 from typing import Any, List, Mapping
 
 from autogen_core import DefaultTopicId, MessageContext, event, rpc
 
-from autogen_agentchat.messages import BaseAgentEvent, BaseChatMessage, MessageFactory
+from autogen_agentchat.messages import BaseAgentEvent, BaseChatMessage, MessageFactory, ModelClientStreamingChunkEvent
 
 from ...base import ChatAgent, Response
 from ...state import ChatAgentContainerState
@@ -15,6 +16,7 @@
     GroupChatReset,
     GroupChatResume,
     GroupChatStart,
+    GroupChatTermination,
     SerializableException,
 )
 from ._sequential_routed_agent import SequentialRoutedAgent
@@ -31,10 +33,21 @@ class ChatAgentContainer(SequentialRoutedAgent):
         agent (ChatAgent): The agent to delegate message handling to.
         message_factory (MessageFactory): The message factory to use for
             creating messages from JSON data.
+        output_message_queue (asyncio.Queue[BaseAgentEvent | BaseChatMessage | GroupChatTermination] | None, optional):
+            The output message queue of the team. If provided, every
+            :class:`~autogen_agentchat.messages.ModelClientStreamingChunkEvent` produced by the agent is put in the
+            queue directly instead of being published to the output topic, so streaming chunks bypass the runtime,
+            including its intervention handlers. The other messages are always published to the output topic and
+            relayed to the queue by the group chat manager. Defaults to None.
     """
 
     def __init__(
-        self, parent_topic_type: str, output_topic_type: str, agent: ChatAgent, message_factory: MessageFactory
+        self,
+        parent_topic_type: str,
+        output_topic_type: str,
+        agent: ChatAgent,
+        message_factory: MessageFactory,
+        output_message_queue: asyncio.Queue[BaseAgentEvent | BaseChatMessage | GroupChatTermination] | None = None,
     ) -> None:
         super().__init__(
             description=agent.description,
@@ -50,6 +63,7 @@ def __init__(
         self._agent = agent
         self._message_buffer: List[BaseChatMessage] = []
         self._message_factory = message_factory
+        self._output_message_queue = output_message_queue
 
     @event
     async def handle_start(self, message: GroupChatStart, ctx: MessageContext) -> None:
@@ -113,6 +127,10 @@ def _buffer_message(self, message: BaseChatMessage) -> None:
     async def _log_message(self, message: BaseAgentEvent | BaseChatMessage) -> None:
         if not self._message_factory.is_registered(message.__class__):
             raise ValueError(f"Message type {message.__class__} is not registered.")
+        if self._output_message_queue is not None and isinstance(message, ModelClientStreamingChunkEvent):
+            # Put the streaming chunk in the output message queue of the team directly.
+            await self._output_message_queue.put(message)
+            return
         # Log the message.
         await self.publish_message(
             GroupChatMessage(message=message),
@@ -180,7 +180,12 @@ class GraphFlowManagerState(BaseGroupChatManagerState):
 
 
 class GraphFlowManager(BaseGroupChatManager):
-    """Manages execution of agents using a Directed Graph execution model."""
+    """Manages execution of agents using a Directed Graph execution model.
+
+    By default, the ready nodes are selected together and the next nodes are selected once all of them have
+    completed. With `eager_scheduling`, the nodes that become ready when a node completes are selected right away,
+    while the other nodes are still running, and every agent response counts as a turn.
+    """
 
     def __init__(
         self,
@@ -195,6 +200,8 @@ def __init__(
         max_turns: int | None,
         message_factory: MessageFactory,
         graph: DiGraph,
+        message_thread_window: int | None = None,
+        eager_scheduling: bool = False,
     ) -> None:
         """Initialize the graph-based execution manager."""
         super().__init__(
@@ -208,6 +215,7 @@ def __init__(
             termination_condition=termination_condition,
             max_turns=max_turns,
             message_factory=message_factory,
+            message_thread_window=message_thread_window,
         )
         graph.graph_validate()
         if graph.get_has_cycles() and self._termination_condition is None and self._max_turns is None:
@@ -219,6 +227,7 @@ def __init__(
         self._edges: Dict[str, List[DiGraphEdge]] = {n: node.edges for n, node in graph.nodes.items()}
         # Activation lookup table for each node.
         self._activation: Dict[str, Literal["any", "all"]] = {n: node.activation for n, node in graph.nodes.items()}
+        self._eager_scheduling = eager_scheduling
 
         # === Mutable states for the graph execution ===
         # Count the number of remaining parents to activate each node.
@@ -228,6 +237,36 @@ def __init__(
         self._enqueued_any: Dict[str, bool] = {n: False for n in graph.nodes}
         # Ready queue for nodes that are ready to execute, starting with the start nodes.
         self._ready: Deque[str] = deque([n for n in graph.get_start_nodes()])
+        # Whether the chat has terminated while some nodes were still running, in eager scheduling.
+        # The responses of these nodes update the graph but do not select new speakers.
+        self._draining = False
+
+    async def _process_agent_response(
+        self, agent_name: str, delta: List[BaseAgentEvent | BaseChatMessage], cancellation_token: CancellationToken
+    ) -> None:
+        if not self._eager_scheduling:
+            await super()._process_agent_response(agent_name, delta, cancellation_token)
+            return
+
+        # Append the messages to the message thread and propagate the update to the children of the node.
+        await self.update_message_thread(delta)
+        self._active_speakers.remove(agent_name)
+
+        if self._draining:
+            # The chat has terminated, wait for the remaining nodes without selecting new speakers.
+            self._draining = len(self._active_speakers) > 0
+            return
+
+        if await self._apply_termination_condition(delta, increment_turn_count=True):
+            self._draining = len(self._active_speakers) > 0
+            return
+
+        if self._active_speakers and all(node in self._active_speakers for node in self._ready):
+            # No node can start until a running node completes.
+            return
+
+        # Select the ready nodes without waiting for the running nodes.
+        await self._transition_to_next_speakers(cancellation_token)
 
     async def update_message_thread(self, messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> None:
         await super().update_message_thread(messages)
@@ -259,14 +298,20 @@ async def update_message_thread(self, messages: Sequence[BaseAgentEvent | BaseCh
     async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage]) -> List[str]:
         # Drain the ready queue for the next set of speakers.
         speakers: List[str] = []
+        # Nodes that are still running stay in the ready queue until they complete, in eager scheduling.
+        deferred: List[str] = []
         while self._ready:
             speaker = self._ready.popleft()
+            if speaker in self._active_speakers:
+                deferred.append(speaker)
+                continue
             speakers.append(speaker)
             # Reset the bookkeeping for the node that were selected.
             if self._activation[speaker] == "any":
                 self._enqueued_any[speaker] = False
             else:
                 self._remaining[speaker] = len(self._parents[speaker])
+        self._ready.extend(deferred)
 
         # If there are no speakers, trigger the stop agent.
         if not speakers:
@@ -275,12 +320,14 @@ async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage
         return speakers
 
     async def validate_group_state(self, messages: List[BaseChatMessage] | None) -> None:
-        pass
+        # A new run starts. The nodes that were still running when the previous run terminated
+        # are part of this run, and their responses select the next speakers again.
+        self._draining = False
 
     async def save_state(self) -> Mapping[str, Any]:
         """Save the execution state."""
         state = {
-            "message_thread": [message.dump() for message in self._message_thread],
+            "message_thread": self._message_thread.dump(),
             "current_turn": self._current_turn,
             "remaining": dict(self._remaining),
             "enqueued_any": dict(self._enqueued_any),
@@ -290,7 +337,7 @@ async def save_state(self) -> Mapping[str, Any]:
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         """Restore execution state from saved data."""
-        self._message_thread = [self._message_factory.create(msg) for msg in state["message_thread"]]
+        self._message_thread.load(state["message_thread"])
         self._current_turn = state["current_turn"]
         self._remaining = Counter(state["remaining"])
         self._enqueued_any = state["enqueued_any"]
@@ -305,6 +352,7 @@ async def reset(self) -> None:
         self._remaining = Counter({n: len(p) for n, p in self._parents.items()})
         self._enqueued_any = {n: False for n in self._graph.nodes}
         self._ready = deque([n for n in self._graph.get_start_nodes()])
+        self._draining = False
 
 
 class _StopAgent(BaseChatAgent):
@@ -329,6 +377,8 @@ class GraphFlowConfig(BaseModel):
     termination_condition: ComponentModel | None = None
     max_turns: int | None = None
     graph: DiGraph  # The execution graph for agents
+    message_thread_window: int | None = None
+    eager_scheduling: bool = False
 
 
 class GraphFlow(BaseGroupChat, Component[GraphFlowConfig]):
@@ -366,6 +416,14 @@ class GraphFlow(BaseGroupChat, Component[GraphFlowConfig]):
         termination_condition (TerminationCondition, optional): Termination condition for the chat.
         max_turns (int, optional): Maximum number of turns before forcing termination.
         graph (DiGraph): Directed execution graph defining node flow and conditions.
+        message_thread_window (int, optional): Maximum number of messages of the message thread kept in memory.
+            Older messages are spilled to a temporary on-disk log and read back when needed.
+        eager_scheduling (bool, optional): Whether to start each node as soon as its activation condition is met.
+            By default, the nodes that run in parallel are selected together, and their successors start only when
+            all of them have completed, so a fast branch waits for the slowest one. With eager scheduling, the
+            successors of a node start as soon as it completes, and every agent response counts as a turn
+            for `max_turns`. If the chat terminates while some nodes are still running, their responses are added
+            to the message thread but no new node is started. Defaults to False.
 
     Raises:
         ValueError: If participant names are not unique, or if graph validation fails (e.g., cycles without exit).
@@ -558,6 +616,8 @@ def __init__(
         max_turns: int | None = None,
         runtime: AgentRuntime | None = None,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
+        message_thread_window: int | None = None,
+        eager_scheduling: bool = False,
     ) -> None:
         self._input_participants = participants
         self._input_termination_condition = termination_condition
@@ -579,8 +639,10 @@ def __init__(
             max_turns=max_turns,
             runtime=runtime,
             custom_message_types=custom_message_types,
+            message_thread_window=message_thread_window,
         )
         self._graph = graph
+        self._eager_scheduling = eager_scheduling
 
     def _create_group_chat_manager_factory(
         self,
@@ -610,6 +672,8 @@ def _factory() -> GraphFlowManager:
                 max_turns=max_turns,
                 message_factory=message_factory,
                 graph=self._graph,
+                message_thread_window=self._message_thread_window,
+                eager_scheduling=self._eager_scheduling,
             )
 
         return _factory
@@ -625,6 +689,8 @@ def _to_config(self) -> GraphFlowConfig:
             termination_condition=termination_condition,
             max_turns=self._max_turns,
             graph=self._graph,
+            message_thread_window=self._message_thread_window,
+            eager_scheduling=self._eager_scheduling,
         )
 
     @classmethod
@@ -635,5 +701,10 @@ def _from_config(cls, config: GraphFlowConfig) -> Self:
             TerminationCondition.load_component(config.termination_condition) if config.termination_condition else None
         )
         return cls(
-            participants, graph=config.graph, termination_condition=termination_condition, max_turns=config.max_turns
+            participants,
+            graph=config.graph,
+            termination_condition=termination_condition,
+            max_turns=config.max_turns,
+            message_thread_window=config.message_thread_window,
+            eager_scheduling=config.eager_scheduling,
         )
@@ -29,6 +29,7 @@ class MagenticOneGroupChatConfig(BaseModel):
     max_stalls: int
     final_answer_prompt: str
     emit_team_events: bool = False
+    message_thread_window: int | None = None
 
 
 class MagenticOneGroupChat(BaseGroupChat, Component[MagenticOneGroupChatConfig]):
@@ -51,6 +52,8 @@ class MagenticOneGroupChat(BaseGroupChat, Component[MagenticOneGroupChatConfig])
             If you are using custom message types or your agents produces custom message types, you need to specify them here.
             Make sure your custom message types are subclasses of :class:`~autogen_agentchat.messages.BaseAgentEvent` or :class:`~autogen_agentchat.messages.BaseChatMessage`.
         emit_team_events (bool, optional): Whether to emit team events through :meth:`BaseGroupChat.run_stream`. Defaults to False.
+        message_thread_window (int | None, optional): The maximum number of messages of the message thread the group chat manager keeps in memory.
+            Older messages are spilled to a temporary on-disk log and read back when needed. Defaults to None, meaning no limit.
 
     Raises:
         ValueError: In orchestration logic if progress ledger does not have required keys or if next speaker is not valid.
@@ -110,6 +113,7 @@ def __init__(
         final_answer_prompt: str = ORCHESTRATOR_FINAL_ANSWER_PROMPT,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        message_thread_window: int | None = None,
     ):
         super().__init__(
             participants,
@@ -120,6 +124,7 @@ def __init__(
             runtime=runtime,
             custom_message_types=custom_message_types,
             emit_team_events=emit_team_events,
+            message_thread_window=message_thread_window,
         )
 
         # Validate the participants.
@@ -157,6 +162,7 @@ def _create_group_chat_manager_factory(
             output_message_queue,
             termination_condition,
             self._emit_team_events,
+            message_thread_window=self._message_thread_window,
         )
 
     def _to_config(self) -> MagenticOneGroupChatConfig:
@@ -170,6 +176,7 @@ def _to_config(self) -> MagenticOneGroupChatConfig:
             max_stalls=self._max_stalls,
             final_answer_prompt=self._final_answer_prompt,
             emit_team_events=self._emit_team_events,
+            message_thread_window=self._message_thread_window,
         )
 
     @classmethod
@@ -187,4 +194,5 @@ def _from_config(cls, config: MagenticOneGroupChatConfig) -> Self:
             max_stalls=config.max_stalls,
             final_answer_prompt=config.final_answer_prompt,
             emit_team_events=config.emit_team_events,
+            message_thread_window=config.message_thread_window,
         )
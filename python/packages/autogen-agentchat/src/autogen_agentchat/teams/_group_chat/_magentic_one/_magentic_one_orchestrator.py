@@ -73,6 +73,7 @@ def __init__(
         output_message_queue: asyncio.Queue[BaseAgentEvent | BaseChatMessage | GroupChatTermination],
         termination_condition: TerminationCondition | None,
         emit_team_events: bool,
+        message_thread_window: int | None = None,
     ):
         super().__init__(
             name,
@@ -86,6 +87,7 @@ def __init__(
             max_turns,
             message_factory,
             emit_team_events=emit_team_events,
+            message_thread_window=message_thread_window,
         )
         self._model_client = model_client
         self._max_stalls = max_stalls
@@ -219,7 +221,7 @@ async def validate_group_state(self, messages: List[BaseChatMessage] | None) ->
 
     async def save_state(self) -> Mapping[str, Any]:
         state = MagenticOneOrchestratorState(
-            message_thread=[msg.dump() for msg in self._message_thread],
+            message_thread=self._message_thread.dump(),
             current_turn=self._current_turn,
             task=self._task,
             facts=self._facts,
@@ -231,7 +233,7 @@ async def save_state(self) -> Mapping[str, Any]:
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         orchestrator_state = MagenticOneOrchestratorState.model_validate(state)
-        self._message_thread = [self._message_factory.create(message) for message in orchestrator_state.message_thread]
+        self._message_thread.load(orchestrator_state.message_thread)
         self._current_turn = orchestrator_state.current_turn
         self._task = orchestrator_state.task
         self._facts = orchestrator_state.facts
@@ -0,0 +1,178 @@
+import json
+import sqlite3
+from collections import deque
+from typing import Any, Deque, Iterable, Iterator, List, Mapping, Sequence, overload
+
+from pydantic_core import to_json
+
+from ...messages import BaseAgentEvent, BaseChatMessage, MessageFactory
+
+
+class MessageThread(Sequence[BaseAgentEvent | BaseChatMessage]):
+    """The message thread of a group chat manager.
+
+    Without a window, all messages are kept in memory and the thread behaves like a list.
+    With a window, only the most recent `window` messages are kept in memory. Older messages
+    are appended to an SQLite log on disk and are loaded back page by page when the thread is
+    iterated, indexed or dumped, e.g., by a speaker selector or when saving the state.
+
+    Args:
+        message_factory (MessageFactory): The message factory used to recreate the spilled messages.
+        window (int | None, optional): The maximum number of messages kept in memory. Defaults to None, meaning no limit.
+        path (str | None, optional): The path of the SQLite database for the spilled messages.
+            Defaults to None, which uses a private temporary database that is deleted when the thread is closed.
+        page_size (int, optional): The number of spilled messages loaded per query. Defaults to 256.
+    """
+
+    def __init__(
+        self,
+        message_factory: MessageFactory,
+        window: int | None = None,
+        path: str | None = None,
+        page_size: int = 256,
+    ) -> None:
+        if window is not None and window <= 0:
+            raise ValueError("The message thread window must be greater than 0.")
+        if page_size <= 0:
+            raise ValueError("The page size must be greater than 0.")
+        self._message_factory = message_factory
+        self._window = window
+        self._path = path
+        self._page_size = page_size
+        self._recent: Deque[BaseAgentEvent | BaseChatMessage] = deque()
+        self._spilled = 0
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def window(self) -> int | None:
+        """The maximum number of messages kept in memory."""
+        return self._window
+
+    @property
+    def spilled_count(self) -> int:
+        """The number of messages that have been spilled to disk."""
+        return self._spilled
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            # An empty path creates a private temporary database on disk.
+            self._connection = sqlite3.connect(self._path or "", check_same_thread=False)
+            self._connection.execute("CREATE TABLE IF NOT EXISTS messages (idx INTEGER PRIMARY KEY, data TEXT)")
+            self._connection.execute("DELETE FROM messages")
+            self._connection.commit()
+        return self._connection
+
+    def _write(self, data: Iterable[Mapping[str, Any]]) -> None:
+        rows = [(self._spilled + i, to_json(item).decode("utf-8")) for i, item in enumerate(data)]
+        if not rows:
+            return
+        connection = self._get_connection()
+        connection.executemany("INSERT INTO messages (idx, data) VALUES (?, ?)", rows)
+        connection.commit()
+        self._spilled += len(rows)
+
+    def _read(self, start: int, stop: int) -> List[Mapping[str, Any]]:
+        if start >= stop:
+            return []
+        cursor = self._get_connection().execute(
+            "SELECT data FROM messages WHERE idx >= ? AND idx < ? ORDER BY idx", (start, stop)
+        )
+        return [json.loads(row[0]) for row in cursor]
+
+    def _read_messages(self, start: int, stop: int) -> List[BaseAgentEvent | BaseChatMessage]:
+        return [self._message_factory.create(data) for data in self._read(start, stop)]
+
+    def _spill(self) -> None:
+        if self._window is None or len(self._recent) <= self._window:
+            return
+        overflow = [self._recent.popleft() for _ in range(len(self._recent) - self._window)]
+        self._write(message.dump() for message in overflow)
+
+    def append(self, message: BaseAgentEvent | BaseChatMessage) -> None:
+        """Append a message to the thread."""
+        self._recent.append(message)
+        self._spill()
+
+    def extend(self, messages: Iterable[BaseAgentEvent | BaseChatMessage]) -> None:
+        """Append messages to the thread."""
+        self._recent.extend(messages)
+        self._spill()
+
+    def clear(self) -> None:
+        """Remove all messages from the thread, including the spilled messages."""
+        self._recent.clear()
+        if self._spilled > 0 and self._connection is not None:
+            self._connection.execute("DELETE FROM messages")
+            self._connection.commit()
+        self._spilled = 0
+
+    def dump(self) -> List[Mapping[str, Any]]:
+        """Dump all messages in the thread to JSON-serializable dictionaries.
+        The spilled messages are returned as stored, without recreating the message objects."""
+        return self._read(0, self._spilled) + [message.dump() for message in self._recent]
+
+    def load(self, data: Sequence[Mapping[str, Any]]) -> None:
+        """Replace the messages in the thread with messages dumped by :meth:`dump`.
+        Messages outside of the window are written to disk without recreating the message objects."""
+        self.clear()
+        split = 0 if self._window is None else max(len(data) - self._window, 0)
+        self._write(data[:split])
+        self._recent.extend(self._message_factory.create(item) for item in data[split:])
+
+    def close(self) -> None:
+        """Close the database of the spilled messages."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._recent.clear()
+        self._spilled = 0
+
+    def __len__(self) -> int:
+        return self._spilled + len(self._recent)
+
+    @overload
+    def __getitem__(self, index: int) -> BaseAgentEvent | BaseChatMessage: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[BaseAgentEvent | BaseChatMessage]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> BaseAgentEvent | BaseChatMessage | List[BaseAgentEvent | BaseChatMessage]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1 or start >= stop:
+                return [self[i] for i in range(start, stop, step)]
+            messages = self._read_messages(start, min(stop, self._spilled))
+            recent_start = max(start - self._spilled, 0)
+            recent_stop = stop - self._spilled
+            messages.extend(self._recent[i] for i in range(recent_start, recent_stop))
+            return messages
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("message thread index out of range")
+        if index >= self._spilled:
+            return self._recent[index - self._spilled]
+        return self._read_messages(index, index + 1)[0]
+
+    def __iter__(self) -> Iterator[BaseAgentEvent | BaseChatMessage]:
+        for start in range(0, self._spilled, self._page_size):
+            yield from self._read_messages(start, min(start + self._page_size, self._spilled))
+        yield from list(self._recent)
+
+    def __reversed__(self) -> Iterator[BaseAgentEvent | BaseChatMessage]:
+        yield from reversed(list(self._recent))
+        for stop in range(self._spilled, 0, -self._page_size):
+            yield from reversed(self._read_messages(max(stop - self._page_size, 0), stop))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (MessageThread, list)):
+            return NotImplemented
+        other_messages: Sequence[Any] = other  # type: ignore[reportUnknownVariableType]
+        return len(self) == len(other_messages) and all(a == b for a, b in zip(self, other_messages, strict=True))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"MessageThread(window={self._window}, spilled={self._spilled}, in_memory={len(self._recent)})"
@@ -29,6 +29,7 @@ def __init__(
         max_turns: int | None,
         message_factory: MessageFactory,
         emit_team_events: bool,
+        message_thread_window: int | None = None,
     ) -> None:
         super().__init__(
             name,
@@ -42,6 +43,7 @@ def __init__(
             max_turns,
             message_factory,
             emit_team_events,
+            message_thread_window=message_thread_window,
         )
         self._next_speaker_index = 0
 
@@ -57,7 +59,7 @@ async def reset(self) -> None:
 
     async def save_state(self) -> Mapping[str, Any]:
         state = RoundRobinManagerState(
-            message_thread=[message.dump() for message in self._message_thread],
+            message_thread=self._message_thread.dump(),
             current_turn=self._current_turn,
             next_speaker_index=self._next_speaker_index,
         )
@@ -65,7 +67,7 @@ async def save_state(self) -> Mapping[str, Any]:
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         round_robin_state = RoundRobinManagerState.model_validate(state)
-        self._message_thread = [self._message_factory.create(message) for message in round_robin_state.message_thread]
+        self._message_thread.load(round_robin_state.message_thread)
         self._current_turn = round_robin_state.current_turn
         self._next_speaker_index = round_robin_state.next_speaker_index
 
@@ -89,6 +91,7 @@ class RoundRobinGroupChatConfig(BaseModel):
     termination_condition: ComponentModel | None = None
     max_turns: int | None = None
     emit_team_events: bool = False
+    message_thread_window: int | None = None
 
 
 class RoundRobinGroupChat(BaseGroupChat, Component[RoundRobinGroupChatConfig]):
@@ -106,6 +109,8 @@ class RoundRobinGroupChat(BaseGroupChat, Component[RoundRobinGroupChatConfig]):
             If you are using custom message types or your agents produces custom message types, you need to specify them here.
             Make sure your custom message types are subclasses of :class:`~autogen_agentchat.messages.BaseAgentEvent` or :class:`~autogen_agentchat.messages.BaseChatMessage`.
         emit_team_events (bool, optional): Whether to emit team events through :meth:`BaseGroupChat.run_stream`. Defaults to False.
+        message_thread_window (int | None, optional): The maximum number of messages of the message thread the group chat manager keeps in memory.
+            Older messages are spilled to a temporary on-disk log and read back when needed. Defaults to None, meaning no limit.
 
     Raises:
         ValueError: If no participants are provided or if participant names are not unique.
@@ -180,6 +185,7 @@ def __init__(
         runtime: AgentRuntime | None = None,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        message_thread_window: int | None = None,
     ) -> None:
         super().__init__(
             participants,
@@ -190,6 +196,7 @@ def __init__(
             runtime=runtime,
             custom_message_types=custom_message_types,
             emit_team_events=emit_team_events,
+            message_thread_window=message_thread_window,
         )
 
     def _create_group_chat_manager_factory(
@@ -218,6 +225,7 @@ def _factory() -> RoundRobinGroupChatManager:
                 max_turns,
                 message_factory,
                 self._emit_team_events,
+                message_thread_window=self._message_thread_window,
             )
 
         return _factory
@@ -230,6 +238,7 @@ def _to_config(self) -> RoundRobinGroupChatConfig:
             termination_condition=termination_condition,
             max_turns=self._max_turns,
             emit_team_events=self._emit_team_events,
+            message_thread_window=self._message_thread_window,
         )
 
     @classmethod
@@ -243,4 +252,5 @@ def _from_config(cls, config: RoundRobinGroupChatConfig) -> Self:
             termination_condition=termination_condition,
             max_turns=config.max_turns,
             emit_team_events=config.emit_team_events,
+            message_thread_window=config.message_thread_window,
         )
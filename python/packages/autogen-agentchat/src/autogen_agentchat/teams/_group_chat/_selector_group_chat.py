@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import re
+from dataclasses import dataclass
 from inspect import iscoroutinefunction
 from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Union, cast
 
@@ -48,6 +49,16 @@
 CandidateFuncType = Union[SyncCandidateFunc | AsyncCandidateFunc]
 
 
+@dataclass
+class _HistoryEntry:
+    """The rendering of a model context message in the selector history."""
+
+    message: LLMMessage
+    source: str
+    text: str
+    tokens: int | None = None
+
+
 class SelectorGroupChatManager(BaseGroupChatManager):
     """A group chat manager that selects the next speaker using a ChatCompletion
     model and a custom selector function."""
@@ -73,6 +84,8 @@ def __init__(
         emit_team_events: bool,
         model_context: ChatCompletionContext | None,
         model_client_streaming: bool = False,
+        message_thread_window: int | None = None,
+        max_selector_history_tokens: int | None = None,
     ) -> None:
         super().__init__(
             name,
@@ -86,6 +99,7 @@ def __init__(
             max_turns,
             message_factory,
             emit_team_events,
+            message_thread_window=message_thread_window,
         )
         self._model_client = model_client
         self._selector_prompt = selector_prompt
@@ -102,6 +116,15 @@ def __init__(
         else:
             self._model_context = UnboundedChatCompletionContext()
         self._cancellation_token = CancellationToken()
+        if max_selector_history_tokens is not None and max_selector_history_tokens <= 0:
+            raise ValueError("The maximum number of selector history tokens must be greater than 0.")
+        self._max_selector_history_tokens = max_selector_history_tokens
+        # The rendered history of the model context messages from the previous selection.
+        # It is extended when the model context only has new messages appended.
+        self._history_messages: List[LLMMessage] = []
+        self._history_entries: List[_HistoryEntry] = []
+        self._history_sources: Dict[str, int] = {}
+        self._history_text = ""
 
     async def validate_group_state(self, messages: List[BaseChatMessage] | None) -> None:
         pass
@@ -113,10 +136,14 @@ async def reset(self) -> None:
         if self._termination_condition is not None:
             await self._termination_condition.reset()
         self._previous_speaker = None
+        self._history_messages = []
+        self._history_entries = []
+        self._history_sources = {}
+        self._history_text = ""
 
     async def save_state(self) -> Mapping[str, Any]:
         state = SelectorManagerState(
-            message_thread=[msg.dump() for msg in self._message_thread],
+            message_thread=self._message_thread.dump(),
             current_turn=self._current_turn,
             previous_speaker=self._previous_speaker,
         )
@@ -124,7 +151,7 @@ async def save_state(self) -> Mapping[str, Any]:
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         selector_state = SelectorManagerState.model_validate(state)
-        self._message_thread = [self._message_factory.create(msg) for msg in selector_state.message_thread]
+        self._message_thread.load(selector_state.message_thread)
         await self._add_messages_to_context(
             self._model_context, [msg for msg in self._message_thread if isinstance(msg, BaseChatMessage)]
         )
@@ -217,22 +244,99 @@ async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage
         trace_logger.debug(f"Selected speaker: {agent_name}")
         return [agent_name]
 
+    @staticmethod
+    def _render_message(msg: LLMMessage) -> str | None:
+        if isinstance(msg, UserMessage) or isinstance(msg, AssistantMessage):
+            message = f"{msg.source}: {msg.content}"
+            # Create some consistency for how messages are separated in the transcript
+            return message.rstrip() + "\n\n"
+        return None
+
     def construct_message_history(self, message_history: List[LLMMessage]) -> str:
         # Construct the history of the conversation.
         history_messages: List[str] = []
         for msg in message_history:
-            if isinstance(msg, UserMessage) or isinstance(msg, AssistantMessage):
-                message = f"{msg.source}: {msg.content}"
-                history_messages.append(
-                    message.rstrip() + "\n\n"
-                )  # Create some consistency for how messages are separated in the transcript
+            text = self._render_message(msg)
+            if text is not None:
+                history_messages.append(text)
 
         history: str = "\n".join(history_messages)
         return history
 
-    async def _select_speaker(self, roles: str, participants: List[str], max_attempts: int) -> str:
+    def _update_history(self, messages: List[LLMMessage]) -> None:
+        """Update the rendered history to the given model context messages.
+
+        If the messages extend the messages of the previous selection, only the new messages are
+        rendered and appended to the history text. Otherwise, the history is rebuilt, reusing the
+        renderings of the messages that are still in the model context."""
+        count = len(self._history_messages)
+        # List equality compares the items by identity first, so this is cheap for an unchanged prefix.
+        if len(messages) >= count and messages[:count] == self._history_messages:
+            new_messages = messages[count:]
+            previous: Dict[int, _HistoryEntry] = {}
+        else:
+            new_messages = messages
+            previous = {id(entry.message): entry for entry in self._history_entries}
+            self._history_messages = []
+            self._history_entries = []
+            self._history_sources = {}
+            self._history_text = ""
+        new_texts: List[str] = []
+        for msg in new_messages:
+            entry = previous.get(id(msg))
+            if entry is None or entry.message is not msg:
+                text = self._render_message(msg)
+                if text is None:
+                    continue
+                assert isinstance(msg, UserMessage | AssistantMessage)
+                entry = _HistoryEntry(msg, msg.source, text)
+            self._history_entries.append(entry)
+            self._history_sources[entry.source] = self._history_sources.get(entry.source, 0) + 1
+            new_texts.append(entry.text)
+        self._history_messages.extend(new_messages)
+        if new_texts:
+            new_text = "\n".join(new_texts)
+            self._history_text = f"{self._history_text}\n{new_text}" if self._history_text else new_text
+
+    def _count_entry_tokens(self, entry: _HistoryEntry) -> int:
+        if entry.tokens is None:
+            message = UserMessage(content=entry.text, source="user")
+            entry.tokens = self._model_client.count_tokens([message]) - self._model_client.count_tokens([])
+        return entry.tokens
+
+    def _budgeted_history(self, max_tokens: int) -> str:
+        """Return the most recent part of the history that fits in `max_tokens` tokens,
+        preceded by a note with the number of omitted messages per speaker."""
+        entries = self._history_entries
+        total = 0
+        start = len(entries)
+        while start > 0:
+            tokens = self._count_entry_tokens(entries[start - 1])
+            if total + tokens > max_tokens:
+                break
+            total += tokens
+            start -= 1
+        if start == 0:
+            return self._history_text
+        omitted = dict(self._history_sources)
+        for entry in entries[start:]:
+            omitted[entry.source] -= 1
+        summary = ", ".join(f"{source} ({count})" for source, count in omitted.items() if count > 0)
+        note = f"[{start} earlier messages omitted: {summary}]\n\n"
+        return "\n".join([note] + [entry.text for entry in entries[start:]])
+
+    async def _get_history(self) -> str:
         model_context_messages = await self._model_context.get_messages()
-        model_context_history = self.construct_message_history(model_context_messages)
+        if type(self).construct_message_history is not SelectorGroupChatManager.construct_message_history:
+            # A subclass customizes the rendering of the history.
+            return self.construct_message_history(model_context_messages)
+        self._update_history(model_context_messages)
+        if self._max_selector_history_tokens is not None:
+            return self._budgeted_history(self._max_selector_history_tokens)
+        return self._history_text
+
+    async def _select_speaker(self, roles: str, participants: List[str], max_attempts: int) -> str:
+        model_context_history = await self._get_history()
 
         select_speaker_prompt = self._selector_prompt.format(
             roles=roles, participants=str(participants), history=model_context_history
@@ -354,8 +458,10 @@ class SelectorGroupChatConfig(BaseModel):
     # selector_func: ComponentModel | None
     max_selector_attempts: int = 3
     emit_team_events: bool = False
+    message_thread_window: int | None = None
     model_client_streaming: bool = False
     model_context: ComponentModel | None = None
+    max_selector_history_tokens: int | None = None
 
 
 class SelectorGroupChat(BaseGroupChat, Component[SelectorGroupChatConfig]):
@@ -393,9 +499,14 @@ class SelectorGroupChat(BaseGroupChat, Component[SelectorGroupChatConfig]):
             If you are using custom message types or your agents produces custom message types, you need to specify them here.
             Make sure your custom message types are subclasses of :class:`~autogen_agentchat.messages.BaseAgentEvent` or :class:`~autogen_agentchat.messages.BaseChatMessage`.
         emit_team_events (bool, optional): Whether to emit team events through :meth:`BaseGroupChat.run_stream`. Defaults to False.
+        message_thread_window (int | None, optional): The maximum number of messages of the message thread the group chat manager keeps in memory.
+            Older messages are spilled to a temporary on-disk log and read back when needed. Defaults to None, meaning no limit.
         model_client_streaming (bool, optional): Whether to use streaming for the model client. (This is useful for reasoning models like QwQ). Defaults to False.
         model_context (ChatCompletionContext | None, optional): The model context for storing and retrieving
             :class:`~autogen_core.models.LLMMessage`. It can be preloaded with initial messages. Messages stored in model context will be used for speaker selection. The initial messages will be cleared when the team is reset.
+        max_selector_history_tokens (int | None, optional): The maximum number of tokens of the `{history}` in the selector prompt,
+            counted with the model client. If set, only the most recent messages that fit are rendered, preceded by a note
+            with the number of omitted messages per speaker. Defaults to None, meaning the whole model context is rendered.
 
     Raises:
         ValueError: If the number of participants is less than two or if the selector prompt is invalid.
@@ -596,8 +707,10 @@ def __init__(
         candidate_func: Optional[CandidateFuncType] = None,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        message_thread_window: int | None = None,
         model_client_streaming: bool = False,
         model_context: ChatCompletionContext | None = None,
+        max_selector_history_tokens: int | None = None,
     ):
         super().__init__(
             participants,
@@ -608,6 +721,7 @@ def __init__(
             runtime=runtime,
             custom_message_types=custom_message_types,
             emit_team_events=emit_team_events,
+            message_thread_window=message_thread_window,
         )
         # Validate the participants.
         if len(participants) < 2:
@@ -620,6 +734,7 @@ def __init__(
         self._candidate_func = candidate_func
         self._model_client_streaming = model_client_streaming
         self._model_context = model_context
+        self._max_selector_history_tokens = max_selector_history_tokens
 
     def _create_group_chat_manager_factory(
         self,
@@ -654,6 +769,8 @@ def _create_group_chat_manager_factory(
             self._emit_team_events,
             self._model_context,
             self._model_client_streaming,
+            message_thread_window=self._message_thread_window,
+            max_selector_history_tokens=self._max_selector_history_tokens,
         )
 
     def _to_config(self) -> SelectorGroupChatConfig:
@@ -667,8 +784,10 @@ def _to_config(self) -> SelectorGroupChatConfig:
             max_selector_attempts=self._max_selector_attempts,
             # selector_func=self._selector_func.dump_component() if self._selector_func else None,
             emit_team_events=self._emit_team_events,
+            message_thread_window=self._message_thread_window,
             model_client_streaming=self._model_client_streaming,
             model_context=self._model_context.dump_component() if self._model_context else None,
+            max_selector_history_tokens=self._max_selector_history_tokens,
         )
 
     @classmethod
@@ -687,6 +806,8 @@ def _from_config(cls, config: SelectorGroupChatConfig) -> Self:
             # if config.selector_func
             # else None,
             emit_team_events=config.emit_team_events,
+            message_thread_window=config.message_thread_window,
             model_client_streaming=config.model_client_streaming,
             model_context=ChatCompletionContext.load_component(config.model_context) if config.model_context else None,
+            max_selector_history_tokens=config.max_selector_history_tokens,
         )
@@ -1,16 +1,24 @@
 import asyncio
-from typing import Any, Sequence
+from collections import deque
+from typing import Any, Deque, Dict, Sequence
 
 from autogen_core import MessageContext, RoutedAgent
 
 
 class FIFOLock:
-    """A lock that ensures coroutines acquire the lock in the order they request it."""
+    """A lock that ensures coroutines acquire the lock in the order they request it.
+
+    Waiting coroutines are kept in a mailbox of futures. Acquiring an unlocked lock does not allocate,
+    and releasing the lock hands it over directly to the oldest waiter."""
 
     def __init__(self) -> None:
-        self._queue = asyncio.Queue[asyncio.Event]()
+        self._waiters: Deque[asyncio.Future[None]] = deque()
         self._locked = False
 
+    def locked(self) -> bool:
+        """Return True if the lock is held."""
+        return self._locked
+
     async def acquire(self) -> None:
         # If the lock is not held by any coroutine, set the lock to be held
         # by the current coroutine.
@@ -18,20 +26,27 @@ async def acquire(self) -> None:
             self._locked = True
             return
 
-        # If the lock is held by another coroutine, create an event and put it
-        # in the queue. Wait for the event to be set.
-        event = asyncio.Event()
-        await self._queue.put(event)
-        await event.wait()
+        # If the lock is held by another coroutine, wait in the mailbox until
+        # the lock is handed over.
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The lock was handed over before the cancellation, pass it on.
+                self.release()
+            raise
 
     def release(self) -> None:
-        if not self._queue.empty():
-            # If there are events in the queue, get the next event and set it.
-            next_event = self._queue.get_nowait()
-            next_event.set()
-        else:
-            # If there are no events in the queue, release the lock.
-            self._locked = False
+        # Hand the lock over to the oldest waiter that has not been cancelled.
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        # If there are no waiters, release the lock.
+        self._locked = False
 
 
 class SequentialRoutedAgent(RoutedAgent):
@@ -56,10 +71,23 @@ class SequentialRoutedAgent(RoutedAgent):
     def __init__(self, description: str, sequential_message_types: Sequence[type[Any]]) -> None:
         super().__init__(description=description)
         self._fifo_lock = FIFOLock()
-        self._sequential_message_types = sequential_message_types
+        self._sequential_message_types = tuple(sequential_message_types)
+        # Whether messages of a class are sequential, filled in as message classes are seen.
+        self._is_sequential_type: Dict[type, bool] = {
+            message_type: True for message_type in self._sequential_message_types
+        }
+
+    def _is_sequential(self, message: Any) -> bool:
+        message_type = type(message)
+        is_sequential = self._is_sequential_type.get(message_type)
+        if is_sequential is None:
+            # Subclasses of the sequential message types are sequential as well.
+            is_sequential = isinstance(message, self._sequential_message_types)
+            self._is_sequential_type[message_type] = is_sequential
+        return is_sequential
 
     async def on_message_impl(self, message: Any, ctx: MessageContext) -> Any | None:
-        if any(isinstance(message, sequential_type) for sequential_type in self._sequential_message_types):
+        if self._is_sequential(message):
             # Acquire the FIFO lock to ensure that this message is processed
             # in the order it was received.
             await self._fifo_lock.acquire()
@@ -28,6 +28,7 @@ def __init__(
         max_turns: int | None,
         message_factory: MessageFactory,
         emit_team_events: bool,
+        message_thread_window: int | None = None,
     ) -> None:
         super().__init__(
             name,
@@ -41,6 +42,7 @@ def __init__(
             max_turns,
             message_factory,
             emit_team_events,
+            message_thread_window=message_thread_window,
         )
         self._current_speaker = self._participant_names[0]
 
@@ -99,7 +101,7 @@ async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage
 
     async def save_state(self) -> Mapping[str, Any]:
         state = SwarmManagerState(
-            message_thread=[msg.dump() for msg in self._message_thread],
+            message_thread=self._message_thread.dump(),
             current_turn=self._current_turn,
             current_speaker=self._current_speaker,
         )
@@ -107,7 +109,7 @@ async def save_state(self) -> Mapping[str, Any]:
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         swarm_state = SwarmManagerState.model_validate(state)
-        self._message_thread = [self._message_factory.create(message) for message in swarm_state.message_thread]
+        self._message_thread.load(swarm_state.message_thread)
         self._current_turn = swarm_state.current_turn
         self._current_speaker = swarm_state.current_speaker
 
@@ -119,6 +121,7 @@ class SwarmConfig(BaseModel):
     termination_condition: ComponentModel | None = None
     max_turns: int | None = None
     emit_team_events: bool = False
+    message_thread_window: int | None = None
 
 
 class Swarm(BaseGroupChat, Component[SwarmConfig]):
@@ -138,6 +141,8 @@ class Swarm(BaseGroupChat, Component[SwarmConfig]):
             If you are using custom message types or your agents produces custom message types, you need to specify them here.
             Make sure your custom message types are subclasses of :class:`~autogen_agentchat.messages.BaseAgentEvent` or :class:`~autogen_agentchat.messages.BaseChatMessage`.
         emit_team_events (bool, optional): Whether to emit team events through :meth:`BaseGroupChat.run_stream`. Defaults to False.
+        message_thread_window (int | None, optional): The maximum number of messages of the message thread the group chat manager keeps in memory.
+            Older messages are spilled to a temporary on-disk log and read back when needed. Defaults to None, meaning no limit.
 
     Basic example:
 
@@ -226,6 +231,7 @@ def __init__(
         runtime: AgentRuntime | None = None,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        message_thread_window: int | None = None,
     ) -> None:
         super().__init__(
             participants,
@@ -236,6 +242,7 @@ def __init__(
             runtime=runtime,
             custom_message_types=custom_message_types,
             emit_team_events=emit_team_events,
+            message_thread_window=message_thread_window,
         )
         # The first participant must be able to produce handoff messages.
         first_participant = self._participants[0]
@@ -268,6 +275,7 @@ def _factory() -> SwarmGroupChatManager:
                 max_turns,
                 message_factory,
                 self._emit_team_events,
+                message_thread_window=self._message_thread_window,
             )
 
         return _factory
@@ -280,6 +288,7 @@ def _to_config(self) -> SwarmConfig:
             termination_condition=termination_condition,
             max_turns=self._max_turns,
             emit_team_events=self._emit_team_events,
+            message_thread_window=self._message_thread_window,
         )
 
     @classmethod
@@ -293,4 +302,5 @@ def _from_config(cls, config: SwarmConfig) -> "Swarm":
             termination_condition=termination_condition,
             max_turns=config.max_turns,
             emit_team_events=config.emit_team_events,
+            message_thread_window=config.message_thread_window,
         )
@@ -0,0 +1,233 @@
+import asyncio
+import uuid
+from typing import AsyncGenerator, Callable, Dict, List, Sequence, Set
+
+from autogen_core import AgentId, CancellationToken, SingleThreadedAgentRuntime
+from autogen_core.exceptions import RuntimeOverloadedError
+
+from ...base import TaskResult
+from ...messages import BaseAgentEvent, BaseChatMessage
+from ._base_group_chat import BaseGroupChat
+
+
+class TeamPool:
+    """Runs many independent sessions of a team concurrently on one shared runtime.
+
+    A :class:`BaseGroupChat` registers the agent types and subscriptions of its participants and
+    group chat manager every time a team is created, and with an embedded runtime it also creates
+    and starts its own runtime. The pool registers them once on a shared runtime and runs each session
+    with a team created by `team_factory`. The agents of a session use the session ID as their agent
+    key, and they are removed from the runtime when the session is over.
+
+    Each call to :meth:`run` or :meth:`run_stream` runs one session from the task to its termination.
+
+    Args:
+        team_factory (Callable[[], BaseGroupChat]): Creates the team of a session. Every call must create
+            new participants and a new termination condition, and the teams must have the same type and participant names.
+        runtime (SingleThreadedAgentRuntime | None, optional): The shared runtime. Defaults to None, which creates a runtime
+            that is started with the first session and closed by :meth:`close`. A runtime that is passed in must be started by the caller.
+        max_concurrent_sessions (int | None, optional): The maximum number of sessions running at the same time.
+            Further sessions wait for a running session to finish. Defaults to None, meaning no limit.
+        max_waiting_sessions (int | None, optional): The maximum number of sessions waiting to start. A session that would exceed
+            the limit is rejected with a :class:`~autogen_core.exceptions.RuntimeOverloadedError`. Defaults to None, meaning no limit.
+
+    Example:
+
+        .. code-block:: python
+
+            import asyncio
+
+            from autogen_agentchat.agents import AssistantAgent
+            from autogen_agentchat.conditions import MaxMessageTermination
+            from autogen_agentchat.teams import RoundRobinGroupChat, TeamPool
+            from autogen_ext.models.openai import OpenAIChatCompletionClient
+
+
+            async def main() -> None:
+                model_client = OpenAIChatCompletionClient(model="gpt-4o")
+
+                def create_team() -> RoundRobinGroupChat:
+                    writer = AssistantAgent("writer", model_client=model_client)
+                    critic = AssistantAgent("critic", model_client=model_client)
+                    return RoundRobinGroupChat([writer, critic], termination_condition=MaxMessageTermination(4))
+
+                pool = TeamPool(create_team, max_concurrent_sessions=100)
+                results = await asyncio.gather(*[pool.run(task=f"Write a haiku about {topic}.") for topic in ["rain", "snow"]])
+                for result in results:
+                    print(result.messages[-1].to_text())
+                await pool.close()
+
+
+            asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        team_factory: Callable[[], BaseGroupChat],
+        *,
+        runtime: SingleThreadedAgentRuntime | None = None,
+        max_concurrent_sessions: int | None = None,
+        max_waiting_sessions: int | None = None,
+    ) -> None:
+        if max_concurrent_sessions is not None and max_concurrent_sessions <= 0:
+            raise ValueError("The maximum number of concurrent sessions must be greater than 0.")
+        if max_waiting_sessions is not None and max_waiting_sessions < 0:
+            raise ValueError("The maximum number of waiting sessions must not be negative.")
+        self._team_factory = team_factory
+        if runtime is not None:
+            self._runtime = runtime
+            self._embedded_runtime = False
+        else:
+            self._runtime = SingleThreadedAgentRuntime()
+            self._embedded_runtime = True
+        self._started = False
+        self._closed = False
+        self._registered_team: BaseGroupChat | None = None
+        self._register_lock = asyncio.Lock()
+        self._session_slots = (
+            asyncio.Semaphore(max_concurrent_sessions) if max_concurrent_sessions is not None else None
+        )
+        self._max_waiting_sessions = max_waiting_sessions
+        self._waiting_sessions = 0
+        # The IDs of the sessions that were admitted or are waiting, to reject duplicates.
+        self._session_ids: Set[str] = set()
+        # The teams of the running sessions by session ID.
+        self._sessions: Dict[str, BaseGroupChat] = {}
+
+    @property
+    def active_sessions(self) -> List[str]:
+        """The IDs of the running sessions."""
+        return list(self._sessions)
+
+    @property
+    def waiting_sessions(self) -> int:
+        """The number of sessions waiting for a running session to finish."""
+        return self._waiting_sessions
+
+    def _get_session_team(self, session_id: str) -> BaseGroupChat:
+        team = self._sessions.get(session_id)
+        if team is None:
+            raise LookupError(f"Session {session_id} is not running in the team pool.")
+        return team
+
+    async def _ensure_registered(self) -> BaseGroupChat:
+        async with self._register_lock:
+            if self._registered_team is None:
+                registered_team = self._team_factory()
+                await registered_team._register(self._runtime, self._get_session_team)  # type: ignore[reportPrivateUsage]
+                self._registered_team = registered_team
+            if self._embedded_runtime and not self._started:
+                self._runtime.start()
+                self._started = True
+            return self._registered_team
+
+    async def _acquire_session_slot(self) -> None:
+        if self._session_slots is None:
+            return
+        if (
+            self._session_slots.locked()
+            and self._max_waiting_sessions is not None
+            and self._waiting_sessions >= self._max_waiting_sessions
+        ):
+            raise RuntimeOverloadedError(
+                f"The team pool is full: {len(self._sessions)} sessions are running "
+                f"and {self._waiting_sessions} sessions are waiting."
+            )
+        self._waiting_sessions += 1
+        try:
+            await self._session_slots.acquire()
+        finally:
+            self._waiting_sessions -= 1
+
+    async def _remove_session_agents(self, team: BaseGroupChat, session_id: str) -> None:
+        agent_types = team._participant_topic_types + [team._group_chat_manager_topic_type]  # type: ignore[reportPrivateUsage]
+        for agent_type in agent_types:
+            await self._runtime.remove_agent(AgentId(agent_type, session_id))
+
+    async def run(
+        self,
+        *,
+        task: str | BaseChatMessage | Sequence[BaseChatMessage] | None = None,
+        session_id: str | None = None,
+        cancellation_token: CancellationToken | None = None,
+        collect_messages: bool = True,
+    ) -> TaskResult:
+        """Run a session of the team and return the result. See :meth:`run_stream`."""
+        result: TaskResult | None = None
+        async for message in self.run_stream(
+            task=task,
+            session_id=session_id,
+            cancellation_token=cancellation_token,
+            collect_messages=collect_messages,
+        ):
+            if isinstance(message, TaskResult):
+                result = message
+        if result is not None:
+            return result
+        raise AssertionError("The stream should have returned the final result.")
+
+    async def run_stream(
+        self,
+        *,
+        task: str | BaseChatMessage | Sequence[BaseChatMessage] | None = None,
+        session_id: str | None = None,
+        cancellation_token: CancellationToken | None = None,
+        collect_messages: bool = True,
+        chunk_coalesce_window: float | None = None,
+        chunk_coalesce_size: int | None = None,
+    ) -> AsyncGenerator[BaseAgentEvent | BaseChatMessage | TaskResult, None]:
+        """Run a session of the team and produce a stream of messages and the final result, like
+        :meth:`BaseGroupChat.run_stream`. The agents of the session are removed from the runtime
+        when the stream ends.
+
+        Args:
+            task (str | BaseChatMessage | Sequence[BaseChatMessage] | None): The task to run the session with.
+            session_id (str | None): The ID of the session, used as the agent key of its agents. Defaults to a random UUID.
+            cancellation_token (CancellationToken | None): The cancellation token to kill the session immediately.
+            collect_messages (bool): Whether to collect the yielded messages in the final :class:`~autogen_agentchat.base.TaskResult`.
+            chunk_coalesce_window (float | None): The time window for merging streaming chunks, see :meth:`BaseGroupChat.run_stream`.
+            chunk_coalesce_size (int | None): The size for merging streaming chunks, see :meth:`BaseGroupChat.run_stream`.
+
+        Raises:
+            ValueError: If a session with the same ID is running or waiting.
+            RuntimeError: If the pool is closed.
+            RuntimeOverloadedError: If the pool has too many waiting sessions.
+        """
+        if self._closed:
+            raise RuntimeError("The team pool is closed.")
+        if session_id is None:
+            session_id = str(uuid.uuid4())
+        if session_id in self._session_ids:
+            raise ValueError(f"Session {session_id} is already running in the team pool.")
+        self._session_ids.add(session_id)
+        try:
+            await self._acquire_session_slot()
+            try:
+                registered_team = await self._ensure_registered()
+                team = self._team_factory()
+                team._attach(self._runtime, registered_team, session_id)  # type: ignore[reportPrivateUsage]
+                self._sessions[session_id] = team
+                try:
+                    async for message in team.run_stream(
+                        task=task,
+                        cancellation_token=cancellation_token,
+                        collect_messages=collect_messages,
+                        chunk_coalesce_window=chunk_coalesce_window,
+                        chunk_coalesce_size=chunk_coalesce_size,
+                    ):
+                        yield message
+                finally:
+                    del self._sessions[session_id]
+                    await self._remove_session_agents(team, session_id)
+            finally:
+                if self._session_slots is not None:
+                    self._session_slots.release()
+        finally:
+            self._session_ids.discard(session_id)
+
+    async def close(self) -> None:
+        """Close the pool. A runtime created by the pool is closed as well."""
+        self._closed = True
+        if self._embedded_runtime and self._started:
+            await self._runtime.close()
+            self._started = False
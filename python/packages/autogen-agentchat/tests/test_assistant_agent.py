@@ -1,6 +1,7 @@
+import asyncio
 import json
 import logging
-from typing import Dict, List
+from typing import Any, Dict, List
 
 import pytest
 from autogen_agentchat import EVENT_LOGGER_NAME
@@ -20,8 +21,15 @@
     ToolCallSummaryMessage,
 )
 from autogen_core import ComponentModel, FunctionCall, Image
-from autogen_core.memory import ListMemory, Memory, MemoryContent, MemoryMimeType, MemoryQueryResult
-from autogen_core.model_context import BufferedChatCompletionContext
+from autogen_core.memory import (
+    ListMemory,
+    Memory,
+    MemoryContent,
+    MemoryMimeType,
+    MemoryQueryResult,
+    UpdateContextResult,
+)
+from autogen_core.model_context import BufferedChatCompletionContext, ChatCompletionContext
 from autogen_core.models import (
     AssistantMessage,
     CreateResult,
@@ -33,7 +41,7 @@
     UserMessage,
 )
 from autogen_core.models._model_client import ModelFamily, ModelInfo
-from autogen_core.tools import BaseTool, FunctionTool, StaticWorkbench
+from autogen_core.tools import BaseTool, FunctionTool, StaticWorkbench, ToolSchema
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from autogen_ext.models.replay import ReplayChatCompletionClient
 from autogen_ext.tools.mcp import (
@@ -581,6 +589,64 @@ async def test_run_with_workbench() -> None:
     assert state == state2
 
 
+class CountingWorkbench(StaticWorkbench):
+    def __init__(self, tools: List[BaseTool[Any, Any]]) -> None:
+        super().__init__(tools)
+        self.list_tools_calls = 0
+
+    async def list_tools(self) -> List[ToolSchema]:
+        self.list_tools_calls += 1
+        return await super().list_tools()
+
+
+@pytest.mark.asyncio
+async def test_workbench_tools_listed_once_per_turn() -> None:
+    tool_calls = [
+        FunctionCall(id=str(i), arguments=json.dumps({"input": f"task {i}"}), name="_pass_function") for i in range(10)
+    ]
+    model_client = ReplayChatCompletionClient(
+        [
+            CreateResult(
+                finish_reason="function_calls",
+                content=tool_calls,
+                usage=RequestUsage(prompt_tokens=10, completion_tokens=5),
+                cached=False,
+            ),
+            CreateResult(
+                finish_reason="function_calls",
+                content=[FunctionCall(id="10", arguments=json.dumps({"input": "task"}), name="_unknown_function")],
+                usage=RequestUsage(prompt_tokens=10, completion_tokens=5),
+                cached=False,
+            ),
+        ],
+        model_info={
+            "function_calling": True,
+            "vision": True,
+            "json_output": True,
+            "family": ModelFamily.GPT_4O,
+            "structured_output": True,
+        },
+    )
+    pass_workbench = CountingWorkbench([FunctionTool(_pass_function, description="Pass")])
+    echo_workbench = CountingWorkbench([FunctionTool(_echo_function, description="Echo")])
+    agent = AssistantAgent("tool_use_agent", model_client=model_client, workbench=[echo_workbench, pass_workbench])
+
+    result = await agent.run(task="task")
+    execution_event = result.messages[2]
+    assert isinstance(execution_event, ToolCallExecutionEvent)
+    assert [r.content for r in execution_event.content] == ["pass"] * 10
+    # One listing for the inference, reused by all ten tool calls.
+    assert pass_workbench.list_tools_calls == 1
+    assert echo_workbench.list_tools_calls == 1
+
+    # A new turn lists the tools again, and an unknown tool lists them once more before failing.
+    result = await agent.run(task="task")
+    execution_event = result.messages[2]
+    assert isinstance(execution_event, ToolCallExecutionEvent)
+    assert execution_event.content[0].is_error
+    assert pass_workbench.list_tools_calls == 3
+
+
 @pytest.mark.asyncio
 async def test_output_format() -> None:
     class AgentResponse(BaseModel):
@@ -1257,6 +1323,42 @@ class BadMemory:
     assert isinstance(ListMemory(), Memory)
 
 
+class SlowListMemory(ListMemory):
+    def __init__(self, delay: float) -> None:
+        super().__init__()
+        self.delay = delay
+
+    async def update_context(self, model_context: ChatCompletionContext) -> UpdateContextResult:
+        await asyncio.sleep(self.delay)
+        return await super().update_context(model_context)
+
+
+@pytest.mark.asyncio
+async def test_run_with_concurrent_memories() -> None:
+    model_client = ReplayChatCompletionClient(["Hello"])
+    first = SlowListMemory(delay=0.2)
+    await first.add(MemoryContent(content="first memory", mime_type=MemoryMimeType.TEXT))
+    second = SlowListMemory(delay=0.0)
+    await second.add(MemoryContent(content="second memory", mime_type=MemoryMimeType.TEXT))
+    stuck = SlowListMemory(delay=60)
+    await stuck.add(MemoryContent(content="stuck memory", mime_type=MemoryMimeType.TEXT))
+
+    agent = AssistantAgent("test_agent", model_client=model_client, memory=[first, second, stuck], memory_timeout=1.0)
+    result = await agent.run(task="test task")
+
+    # The memories are added in their order, and the one that timed out is skipped.
+    memory_events = [msg for msg in result.messages if isinstance(msg, MemoryQueryEvent)]
+    assert [event.content[0].content for event in memory_events] == ["first memory", "second memory"]
+    llm_messages = model_client.create_calls[0]["messages"]
+    assert len(llm_messages) == 4
+    assert isinstance(llm_messages[2], SystemMessage) and "first memory" in llm_messages[2].content
+    assert isinstance(llm_messages[3], SystemMessage) and "second memory" in llm_messages[3].content
+
+    assert agent.dump_component().config["memory_timeout"] == 1.0
+    with pytest.raises(ValueError):
+        AssistantAgent("test_agent", model_client=model_client, memory=[first], memory_timeout=0)
+
+
 @pytest.mark.asyncio
 async def test_assistant_agent_declarative() -> None:
     model_client = ReplayChatCompletionClient(
@@ -23,6 +23,7 @@
     BaseAgentEvent,
     BaseChatMessage,
     HandoffMessage,
+    MessageFactory,
     ModelClientStreamingChunkEvent,
     MultiModalMessage,
     SelectorEvent,
@@ -35,11 +36,25 @@
     ToolCallSummaryMessage,
 )
 from autogen_agentchat.teams import MagenticOneGroupChat, RoundRobinGroupChat, SelectorGroupChat, Swarm
+from autogen_agentchat.teams._group_chat._events import GroupChatMessage
+from autogen_agentchat.teams._group_chat._message_thread import MessageThread
 from autogen_agentchat.teams._group_chat._round_robin_group_chat import RoundRobinGroupChatManager
 from autogen_agentchat.teams._group_chat._selector_group_chat import SelectorGroupChatManager
 from autogen_agentchat.teams._group_chat._swarm_group_chat import SwarmGroupChatManager
 from autogen_agentchat.ui import Console
-from autogen_core import AgentId, AgentRuntime, CancellationToken, FunctionCall, SingleThreadedAgentRuntime
+from autogen_core import (
+    AgentId,
+    AgentRuntime,
+    CancellationToken,
+    DefaultInterventionHandler,
+    DropMessage,
+    FunctionCall,
+    MessageContext,
+    RoutedAgent,
+    SingleThreadedAgentRuntime,
+    TypeSubscription,
+    event,
+)
 from autogen_core.model_context import BufferedChatCompletionContext
 from autogen_core.models import (
     AssistantMessage,
@@ -444,6 +459,102 @@ async def test_round_robin_group_chat_state(task: TaskType, runtime: AgentRuntim
     assert manager_1._message_thread == manager_2._message_thread  # pyright: ignore
 
 
+def test_message_thread_window() -> None:
+    thread = MessageThread(MessageFactory(), window=3, page_size=2)
+    messages = [TextMessage(content=f"message {i}", source="user") for i in range(10)]
+    thread.extend(messages[:4])
+    for message in messages[4:]:
+        thread.append(message)
+    assert len(thread) == 10
+    assert thread.spilled_count == 7
+    assert thread == messages
+    assert list(reversed(thread)) == messages[::-1]
+    assert thread[0] == messages[0]
+    assert thread[-1] == messages[-1]
+    assert thread[5:8] == messages[5:8]
+    assert thread[::3] == messages[::3]
+    with pytest.raises(IndexError):
+        thread[10]
+
+    dumped = thread.dump()
+    assert [message["content"] for message in dumped] == [message.content for message in messages]
+
+    loaded = MessageThread(MessageFactory(), window=3)
+    loaded.load(json.loads(json.dumps(dumped, default=str)))
+    assert loaded.spilled_count == 7
+    assert loaded == messages
+
+    thread.clear()
+    assert len(thread) == 0
+    assert thread.spilled_count == 0
+    thread.append(messages[0])
+    assert thread == messages[:1]
+    thread.close()
+    loaded.close()
+
+
+@pytest.mark.asyncio
+async def test_round_robin_group_chat_message_thread_window(runtime: AgentRuntime | None) -> None:
+    agent_1 = _EchoAgent("agent_1", description="echo agent 1")
+    agent_2 = _EchoAgent("agent_2", description="echo agent 2")
+    termination = MaxMessageTermination(10)
+    team = RoundRobinGroupChat(
+        participants=[agent_1, agent_2],
+        termination_condition=termination,
+        runtime=runtime,
+        message_thread_window=3,
+    )
+    # The messages are only streamed, not collected in the result.
+    streamed: List[BaseAgentEvent | BaseChatMessage] = []
+    result: TaskResult | None = None
+    async for message in team.run_stream(task="Write a program that prints 'Hello, world!'", collect_messages=False):
+        if isinstance(message, TaskResult):
+            result = message
+        else:
+            streamed.append(message)
+    assert result is not None
+    assert result.messages == []
+    assert (
+        result.stop_reason is not None
+        and result.stop_reason == "Maximum number of messages 10 reached, current message count: 10"
+    )
+    assert len(streamed) == 10
+
+    manager = await team._runtime.try_get_underlying_agent_instance(  # pyright: ignore
+        AgentId(f"{team._group_chat_manager_name}_{team._team_id}", team._team_id),  # pyright: ignore
+        RoundRobinGroupChatManager,  # pyright: ignore
+    )  # pyright: ignore
+    assert manager._message_thread.spilled_count == 7  # pyright: ignore
+    assert manager._message_thread == streamed  # pyright: ignore
+
+    # The spilled messages are paged back when saving the state.
+    state = await team.save_state()
+    manager_state = state["agent_states"]["RoundRobinGroupChatManager"]
+    assert [message["content"] for message in manager_state["message_thread"]] == [
+        message.content for message in streamed if isinstance(message, TextMessage)
+    ]
+
+    team2 = RoundRobinGroupChat(
+        participants=[
+            _EchoAgent("agent_1", description="echo agent 1"),
+            _EchoAgent("agent_2", description="echo agent 2"),
+        ],
+        termination_condition=termination,
+        runtime=runtime,
+        message_thread_window=3,
+    )
+    await team2.load_state(json.loads(json.dumps(state, default=str)))
+    manager2 = await team2._runtime.try_get_underlying_agent_instance(  # pyright: ignore
+        AgentId(f"{team2._group_chat_manager_name}_{team2._team_id}", team2._team_id),  # pyright: ignore
+        RoundRobinGroupChatManager,  # pyright: ignore
+    )  # pyright: ignore
+    assert manager2._message_thread.spilled_count == 7  # pyright: ignore
+    assert manager2._message_thread == manager._message_thread  # pyright: ignore
+
+    await team.reset()
+    assert len(manager._message_thread) == 0  # pyright: ignore
+
+
 @pytest.mark.asyncio
 async def test_round_robin_group_chat_with_tools(runtime: AgentRuntime | None) -> None:
     model_client = ReplayChatCompletionClient(
@@ -512,6 +623,134 @@ async def test_round_robin_group_chat_with_tools(runtime: AgentRuntime | None) -
     assert compare_task_results(result2, result)
 
 
+@pytest.mark.asyncio
+async def test_round_robin_group_chat_streaming_chunks(runtime: AgentRuntime | None) -> None:
+    model_client = ReplayChatCompletionClient(["Hello from agent 1 and friends", "Hello from agent 2 and friends"])
+    agent_1 = AssistantAgent("agent_1", model_client=model_client, model_client_stream=True)
+    agent_2 = AssistantAgent("agent_2", model_client=model_client, model_client_stream=True)
+    team = RoundRobinGroupChat(
+        participants=[agent_1, agent_2], termination_condition=MaxMessageTermination(3), runtime=runtime
+    )
+
+    # The chunks are streamed directly to the output in order, before the message they make up.
+    streamed: List[BaseAgentEvent | BaseChatMessage] = []
+    async for message in team.run_stream(task="Say hello."):
+        if not isinstance(message, TaskResult):
+            streamed.append(message)
+    chunks = [message for message in streamed if isinstance(message, ModelClientStreamingChunkEvent)]
+    assert len(chunks) > 2
+    assert [message.source for message in streamed if not isinstance(message, ModelClientStreamingChunkEvent)] == [
+        "user",
+        "agent_1",
+        "agent_2",
+    ]
+    assert "".join(chunk.content for chunk in chunks if chunk.source == "agent_1") == "Hello from agent 1 and friends"
+    assert streamed.index(chunks[0]) == 1
+
+    # With a coalesce window, the chunks of each response are merged into one event.
+    await team.reset()
+    model_client.reset()
+    streamed = []
+    async for message in team.run_stream(task="Say hello.", chunk_coalesce_window=10):
+        if not isinstance(message, TaskResult):
+            streamed.append(message)
+    assert [(type(message).__name__, message.source) for message in streamed] == [
+        ("TextMessage", "user"),
+        ("ModelClientStreamingChunkEvent", "agent_1"),
+        ("TextMessage", "agent_1"),
+        ("ModelClientStreamingChunkEvent", "agent_2"),
+        ("TextMessage", "agent_2"),
+    ]
+    assert streamed[1].to_text() == "Hello from agent 1 and friends"
+    assert streamed[3].to_text() == "Hello from agent 2 and friends"
+
+    with pytest.raises(ValueError, match="chunk coalesce size"):
+        async for _ in team.run_stream(task="Say hello.", chunk_coalesce_size=0):
+            pass
+
+
+class _OutputObserver(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("Observes the output topic of a team.")
+        self.messages: List[BaseAgentEvent | BaseChatMessage] = []
+
+    @event
+    async def on_group_chat_message(self, message: GroupChatMessage, ctx: MessageContext) -> None:
+        self.messages.append(message.message)
+
+
+@pytest.mark.asyncio
+async def test_round_robin_group_chat_output_topic_subscriber() -> None:
+    runtime = SingleThreadedAgentRuntime()
+    runtime.start()
+    model_client = ReplayChatCompletionClient(["Hello from agent 1", "Hello from agent 2"])
+    agent_1 = AssistantAgent("agent_1", model_client=model_client, model_client_stream=True)
+    agent_2 = AssistantAgent("agent_2", model_client=model_client, model_client_stream=True)
+    team = RoundRobinGroupChat(
+        participants=[agent_1, agent_2], termination_condition=MaxMessageTermination(3), runtime=runtime
+    )
+    observer = _OutputObserver()
+    # The output topic of the team has the team ID as its source.
+    await runtime.register_agent_instance(observer, AgentId("observer", team._team_id))  # pyright: ignore[reportPrivateUsage]
+    await runtime.add_subscription(TypeSubscription(team._output_topic_type, "observer"))  # pyright: ignore[reportPrivateUsage]
+
+    streamed: List[BaseAgentEvent | BaseChatMessage] = []
+    async for message in team.run_stream(task="Say hello."):
+        if not isinstance(message, TaskResult):
+            streamed.append(message)
+    await runtime.stop_when_idle()
+
+    # The messages of the participants are still published to the output topic, except for the chunks.
+    assert [(type(message).__name__, message.source) for message in observer.messages] == [
+        ("TextMessage", "agent_1"),
+        ("TextMessage", "agent_2"),
+    ]
+    # The published messages are relayed to the output of the team once.
+    assert [message.source for message in streamed if not isinstance(message, ModelClientStreamingChunkEvent)] == [
+        "user",
+        "agent_1",
+        "agent_2",
+    ]
+    assert any(isinstance(message, ModelClientStreamingChunkEvent) for message in streamed)
+
+
+class _DropAgentMessages(DefaultInterventionHandler):
+    def __init__(self, source: str) -> None:
+        self.source = source
+
+    async def on_publish(self, message: Any, *, message_context: MessageContext) -> Any:
+        if isinstance(message, GroupChatMessage) and message.message.source == self.source:
+            return DropMessage
+        return message
+
+
+@pytest.mark.asyncio
+async def test_round_robin_group_chat_output_intervention() -> None:
+    runtime = SingleThreadedAgentRuntime(intervention_handlers=[_DropAgentMessages("agent_1")])
+    runtime.start()
+    model_client = ReplayChatCompletionClient(["Hello from agent 1", "Hello from agent 2"])
+    agent_1 = AssistantAgent("agent_1", model_client=model_client, model_client_stream=True)
+    agent_2 = AssistantAgent("agent_2", model_client=model_client, model_client_stream=True)
+    team = RoundRobinGroupChat(
+        participants=[agent_1, agent_2], termination_condition=MaxMessageTermination(3), runtime=runtime
+    )
+
+    streamed: List[BaseAgentEvent | BaseChatMessage] = []
+    async for message in team.run_stream(task="Say hello."):
+        if not isinstance(message, TaskResult):
+            streamed.append(message)
+    await runtime.stop()
+
+    # Intervention handlers decide which messages of the participants are streamed, except for the chunks.
+    assert [message.source for message in streamed if not isinstance(message, ModelClientStreamingChunkEvent)] == [
+        "user",
+        "agent_2",
+    ]
+    assert any(
+        isinstance(message, ModelClientStreamingChunkEvent) and message.source == "agent_1" for message in streamed
+    )
+
+
 @pytest.mark.asyncio
 async def test_round_robin_group_chat_with_resume_and_reset(runtime: AgentRuntime | None) -> None:
     agent_1 = _EchoAgent("agent_1", description="echo agent 1")
@@ -755,6 +994,60 @@ async def test_selector_group_chat_with_model_context(runtime: AgentRuntime | No
         ), f"Expected all lines {chat_history} to be in prompt, but got {prompt_lines}"
 
 
+@pytest.mark.asyncio
+async def test_selector_group_chat_history(runtime: AgentRuntime | None) -> None:
+    selector_group_chat_model_client = ReplayChatCompletionClient(["agent2", "agent1", "agent2", "agent1"])
+    agent_one_model_client = ReplayChatCompletionClient(["[Agent One] First generation", "TERMINATE"])
+    agent_two_model_client = ReplayChatCompletionClient(
+        ["[Agent Two] First generation", "[Agent Two] Second generation"]
+    )
+    agent1 = AssistantAgent("agent1", model_client=agent_one_model_client, description="Assistant agent 1")
+    agent2 = AssistantAgent("agent2", model_client=agent_two_model_client, description="Assistant agent 2")
+    team = SelectorGroupChat(
+        participants=[agent1, agent2],
+        model_client=selector_group_chat_model_client,
+        termination_condition=TextMentionTermination("TERMINATE"),
+        runtime=runtime,
+        allow_repeated_speaker=True,
+        selector_prompt="{history}",
+    )
+    await team.run(task="[GroupChat] Task")
+
+    # The incrementally rendered history matches the history rendered from scratch.
+    transcript = [
+        "user: [GroupChat] Task",
+        "agent2: [Agent Two] First generation",
+        "agent1: [Agent One] First generation",
+        "agent2: [Agent Two] Second generation",
+    ]
+    create_calls: List[Dict[str, Any]] = selector_group_chat_model_client.create_calls
+    assert len(create_calls) == 4
+    for idx, call in enumerate(create_calls):
+        assert call["messages"][0].content == "\n".join(f"{line}\n\n" for line in transcript[: idx + 1])
+
+    # With a token budget, only the most recent messages are rendered.
+    selector_group_chat_model_client = ReplayChatCompletionClient(["agent2", "agent1", "agent2", "agent1"])
+    agent_one_model_client.reset()
+    agent_two_model_client.reset()
+    await agent1.on_reset(CancellationToken())
+    await agent2.on_reset(CancellationToken())
+    team = SelectorGroupChat(
+        participants=[agent1, agent2],
+        model_client=selector_group_chat_model_client,
+        termination_condition=TextMentionTermination("TERMINATE"),
+        runtime=runtime,
+        allow_repeated_speaker=True,
+        selector_prompt="{history}",
+        max_selector_history_tokens=10,
+    )
+    await team.run(task="[GroupChat] Task")
+    prompt = selector_group_chat_model_client.create_calls[-1]["messages"][0].content
+    assert prompt.startswith("[2 earlier messages omitted: user (1), agent2 (1)]")
+    assert "agent1: [Agent One] First generation" in prompt
+    assert "agent2: [Agent Two] Second generation" in prompt
+    assert "[GroupChat] Task" not in prompt
+
+
 @pytest.mark.asyncio
 async def test_selector_group_chat_with_team_event(runtime: AgentRuntime | None) -> None:
     model_client = ReplayChatCompletionClient(
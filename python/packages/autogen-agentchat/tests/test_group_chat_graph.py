@@ -487,6 +487,110 @@ async def test_digraph_group_chat_parallel_join_any(runtime: AgentRuntime | None
     assert result.stop_reason is not None
 
 
+class _SlowEchoAgent(_EchoAgent):
+    def __init__(self, name: str, description: str, delay: float) -> None:
+        super().__init__(name, description)
+        self._delay = delay
+
+    async def on_messages(self, messages: Sequence[BaseChatMessage], cancellation_token: CancellationToken) -> Response:
+        await asyncio.sleep(self._delay)
+        return await super().on_messages(messages, cancellation_token)
+
+
+@pytest.mark.asyncio
+async def test_digraph_group_chat_eager_scheduling(runtime: AgentRuntime | None) -> None:
+    # A → (B, C), C → D, where B is slow.
+    graph = DiGraph(
+        nodes={
+            "A": DiGraphNode(name="A", edges=[DiGraphEdge(target="B"), DiGraphEdge(target="C")]),
+            "B": DiGraphNode(name="B", edges=[]),
+            "C": DiGraphNode(name="C", edges=[DiGraphEdge(target="D")]),
+            "D": DiGraphNode(name="D", edges=[]),
+        }
+    )
+
+    def make_team(eager_scheduling: bool) -> GraphFlow:
+        return GraphFlow(
+            participants=[
+                _EchoAgent("A", description="Echo agent A"),
+                _SlowEchoAgent("B", description="Slow echo agent B", delay=0.2),
+                _EchoAgent("C", description="Echo agent C"),
+                _EchoAgent("D", description="Echo agent D"),
+            ],
+            graph=graph,
+            runtime=runtime,
+            termination_condition=MaxMessageTermination(10),
+            eager_scheduling=eager_scheduling,
+        )
+
+    # By default, D starts once both B and C have completed.
+    result = await make_team(eager_scheduling=False).run(task="Start")
+    sources = [m.source for m in result.messages]
+    assert sources[:2] == ["user", "A"]
+    assert set(sources[2:4]) == {"B", "C"}
+    assert sources[4:] == ["D", _DIGRAPH_STOP_AGENT_NAME]
+
+    # With eager scheduling, D starts as soon as C completes, and the stop agent runs after B.
+    team = make_team(eager_scheduling=True)
+    result = await team.run(task="Start")
+    assert [m.source for m in result.messages] == ["user", "A", "C", "D", "B", _DIGRAPH_STOP_AGENT_NAME]
+    assert result.stop_reason is not None
+
+    # A termination condition that is met while B is still running stops the chat without starting new nodes.
+    team = GraphFlow(
+        participants=[
+            _EchoAgent("A", description="Echo agent A"),
+            _SlowEchoAgent("B", description="Slow echo agent B", delay=0.2),
+            _EchoAgent("C", description="Echo agent C"),
+            _EchoAgent("D", description="Echo agent D"),
+        ],
+        graph=graph,
+        runtime=runtime,
+        termination_condition=SourceMatchTermination(sources=["C"]),
+        eager_scheduling=True,
+    )
+    result = await team.run(task="Start")
+    assert [m.source for m in result.messages] == ["user", "A", "C"]
+    assert result.stop_reason is not None
+
+
+@pytest.mark.asyncio
+async def test_digraph_group_chat_eager_scheduling_resume_after_termination() -> None:
+    runtime = SingleThreadedAgentRuntime()
+    runtime.start()
+    # A → (B, C), C → D, where B is slow.
+    graph = DiGraph(
+        nodes={
+            "A": DiGraphNode(name="A", edges=[DiGraphEdge(target="B"), DiGraphEdge(target="C")]),
+            "B": DiGraphNode(name="B", edges=[]),
+            "C": DiGraphNode(name="C", edges=[DiGraphEdge(target="D")]),
+            "D": DiGraphNode(name="D", edges=[]),
+        }
+    )
+    team = GraphFlow(
+        participants=[
+            _EchoAgent("A", description="Echo agent A"),
+            _SlowEchoAgent("B", description="Slow echo agent B", delay=0.2),
+            _EchoAgent("C", description="Echo agent C"),
+            _EchoAgent("D", description="Echo agent D"),
+        ],
+        graph=graph,
+        runtime=runtime,
+        termination_condition=SourceMatchTermination(sources=["C"]),
+        eager_scheduling=True,
+    )
+
+    # With an external runtime, the run returns while B is still running.
+    result = await team.run(task="Start")
+    assert [m.source for m in result.messages] == ["user", "A", "C"]
+
+    # Resuming starts D, and the response of B from the previous run completes the graph.
+    result = await asyncio.wait_for(team.run(), timeout=5)
+    assert [m.source for m in result.messages] == ["D", "B", _DIGRAPH_STOP_AGENT_NAME]
+    assert result.stop_reason is not None
+    await runtime.stop()
+
+
 @pytest.mark.asyncio
 async def test_digraph_group_chat_multiple_start_nodes(runtime: AgentRuntime | None) -> None:
     agent_a = _EchoAgent("A", description="Echo agent A")
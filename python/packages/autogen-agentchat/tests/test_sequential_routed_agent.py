@@ -4,7 +4,7 @@
 from typing import List
 
 import pytest
-from autogen_agentchat.teams._group_chat._sequential_routed_agent import SequentialRoutedAgent
+from autogen_agentchat.teams._group_chat._sequential_routed_agent import FIFOLock, SequentialRoutedAgent
 from autogen_core import (
     AgentId,
     DefaultTopicId,
@@ -45,3 +45,30 @@ async def test_sequential_routed_agent() -> None:
     test_agent = await runtime.try_get_underlying_agent_instance(test_agent_id, _TestAgent)
     for i in range(100):
         assert test_agent.messages[i].content == f"{i}"
+
+
+@pytest.mark.asyncio
+async def test_fifo_lock_cancelled_waiter() -> None:
+    lock = FIFOLock()
+    order: List[int] = []
+
+    async def worker(i: int) -> None:
+        await lock.acquire()
+        try:
+            order.append(i)
+            await asyncio.sleep(0)
+        finally:
+            lock.release()
+
+    await lock.acquire()
+    tasks = [asyncio.create_task(worker(i)) for i in range(4)]
+    await asyncio.sleep(0)
+    # Cancel a waiter before the lock is handed over, and another one right after.
+    tasks[1].cancel()
+    lock.release()
+    tasks[0].cancel()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert isinstance(results[1], asyncio.CancelledError)
+    assert order == [2, 3]
+    assert not lock.locked()
@@ -0,0 +1,92 @@
+import asyncio
+from typing import List, Sequence
+
+import pytest
+from autogen_agentchat.agents import BaseChatAgent
+from autogen_agentchat.base import Response, TaskResult
+from autogen_agentchat.conditions import MaxMessageTermination
+from autogen_agentchat.messages import BaseChatMessage, TextMessage
+from autogen_agentchat.teams import RoundRobinGroupChat, TeamPool
+from autogen_core import CancellationToken, SingleThreadedAgentRuntime
+from autogen_core.exceptions import RuntimeOverloadedError
+
+
+class _EchoAgent(BaseChatAgent):
+    def __init__(self, name: str, delay: float = 0.0) -> None:
+        super().__init__(name, "An agent that echoes the last message.")
+        self._delay = delay
+        self._last_message = ""
+
+    @property
+    def produced_message_types(self) -> Sequence[type[BaseChatMessage]]:
+        return (TextMessage,)
+
+    async def on_messages(self, messages: Sequence[BaseChatMessage], cancellation_token: CancellationToken) -> Response:
+        if messages:
+            self._last_message = messages[-1].to_text()
+        await asyncio.sleep(self._delay)
+        return Response(chat_message=TextMessage(content=self._last_message, source=self.name))
+
+    async def on_reset(self, cancellation_token: CancellationToken) -> None:
+        self._last_message = ""
+
+
+def _create_team(delay: float = 0.0) -> RoundRobinGroupChat:
+    return RoundRobinGroupChat(
+        [_EchoAgent("agent_1", delay), _EchoAgent("agent_2", delay)],
+        termination_condition=MaxMessageTermination(3),
+    )
+
+
+@pytest.mark.asyncio
+async def test_team_pool_runs_concurrent_sessions() -> None:
+    runtime = SingleThreadedAgentRuntime()
+    runtime.start()
+    pool = TeamPool(_create_team, runtime=runtime)
+    results = await asyncio.gather(*[pool.run(task=f"task {i}", session_id=f"session_{i}") for i in range(10)])
+    for i, result in enumerate(results):
+        # The sessions do not see each other's messages.
+        assert [message.to_text() for message in result.messages] == [f"task {i}"] * 3
+        assert [message.source for message in result.messages] == ["user", "agent_1", "agent_2"]
+
+    # The agents of the finished sessions are removed from the runtime.
+    assert pool.active_sessions == []
+    assert runtime._instantiated_agents == {}  # pyright: ignore[reportPrivateUsage]
+
+    # A session ID can be reused once the session is over.
+    result = await pool.run(task="again", session_id="session_0")
+    assert [message.to_text() for message in result.messages] == ["again"] * 3
+    await pool.close()
+    await runtime.stop()
+
+
+@pytest.mark.asyncio
+async def test_team_pool_admission_control() -> None:
+    pool = TeamPool(lambda: _create_team(delay=0.05), max_concurrent_sessions=2, max_waiting_sessions=1)
+    streams = [pool.run_stream(task=f"task {i}") for i in range(3)]
+    tasks = [asyncio.ensure_future(stream.__anext__()) for stream in streams]
+    await asyncio.sleep(0.01)
+    assert len(pool.active_sessions) == 2
+    assert pool.waiting_sessions == 1
+    with pytest.raises(RuntimeOverloadedError):
+        await pool.run(task="rejected")
+
+    async def _drain(stream_index: int) -> TaskResult:
+        await tasks[stream_index]
+        result: TaskResult | None = None
+        async for message in streams[stream_index]:
+            if isinstance(message, TaskResult):
+                result = message
+        assert result is not None
+        return result
+
+    results: List[TaskResult] = await asyncio.gather(*[_drain(i) for i in range(3)])
+    assert all(len(result.messages) == 3 for result in results)
+    assert pool.active_sessions == []
+    assert pool.waiting_sessions == 0
+
+    with pytest.raises(ValueError):
+        TeamPool(_create_team, max_concurrent_sessions=0)
+    await pool.close()
+    with pytest.raises(RuntimeError):
+        await pool.run(task="closed")
@@ -0,0 +1,147 @@
+"""Measure ``RoutedAgent`` instantiation rate and message dispatch latency.
+
+Creates ``--agents`` instances of a routed agent with ``--handlers`` message handlers, once with the
+previous per-instance handler discovery (``dir()`` over the class and a new handler table for every
+agent) and once with the class-level handler table. Then creates agents for ``--agents`` keys through
+the runtime, and finally dispatches ``--messages`` messages to ``on_message_impl``, for a message type
+with its own handler and for a subclass that is resolved to the handler of its base class.
+"""
+
+import argparse
+import asyncio
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Coroutine, Dict, List, Type
+
+from autogen_core import (
+    AgentId,
+    AgentInstantiationContext,
+    CancellationToken,
+    MessageContext,
+    RoutedAgent,
+    SingleThreadedAgentRuntime,
+    message_handler,
+)
+
+
+@dataclass
+class Message:
+    index: int
+
+
+@dataclass
+class DerivedMessage(Message):
+    pass
+
+
+class WorkerAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent with many handlers.")
+
+    @message_handler
+    async def handle_message(self, message: Message, ctx: MessageContext) -> None:
+        pass
+
+
+def _make_agent_class(handlers: int) -> Type[WorkerAgent]:
+    """Create a subclass of ``WorkerAgent`` with ``handlers - 1`` more handlers for other message types."""
+    namespace: Dict[str, Any] = {}
+    for i in range(handlers - 1):
+        message_type: Type[Any] = dataclass(type(f"OtherMessage{i}", (), {"__annotations__": {"value": int}}))
+
+        async def handle_other(self: WorkerAgent, message: Any, ctx: MessageContext) -> None:
+            pass
+
+        handle_other.__annotations__["message"] = message_type
+        namespace[f"handle_other_{i}"] = message_handler(handle_other)
+    return type("ManyHandlerAgent", (WorkerAgent,), namespace)
+
+
+def _previous_discover_handlers(agent: RoutedAgent) -> Dict[Type[Any], List[Any]]:
+    """The previous per-instance discovery, which ran on every instantiation."""
+    cls = type(agent)
+    table: Dict[Type[Any], List[Any]] = defaultdict(list)
+    for attr in dir(cls):
+        if callable(getattr(cls, attr, None)):
+            handler = getattr(cls, attr)
+            if hasattr(handler, "is_message_handler"):
+                for target_type in handler.target_types:
+                    table[target_type].append(handler)
+    return table
+
+
+def _report(name: str, operations: int, elapsed: float) -> None:
+    print(f"{name:<44} {operations / elapsed:>12,.0f}/sec  {elapsed / operations * 1e6:>8.2f} us/op")
+
+
+def _bench_instantiation(name: str, count: int, create: Callable[[], Any], runtime: SingleThreadedAgentRuntime) -> None:
+    start = time.perf_counter()
+    for i in range(count):
+        with AgentInstantiationContext.populate_context((runtime, AgentId("worker", str(i)))):
+            create()
+    _report(name, count, time.perf_counter() - start)
+
+
+async def _bench_dispatch(name: str, count: int, dispatch: Callable[[], Coroutine[Any, Any, Any]]) -> None:
+    start = time.perf_counter()
+    for _ in range(count):
+        await dispatch()
+    _report(name, count, time.perf_counter() - start)
+
+
+async def run(agents: int, handlers: int, messages: int) -> None:
+    agent_class = _make_agent_class(handlers)
+    runtime = SingleThreadedAgentRuntime()
+
+    print(f"instantiation ({handlers} handlers)")
+
+    def create_previous() -> None:
+        agent = agent_class()
+        _previous_discover_handlers(agent)
+
+    _bench_instantiation("  per-instance discovery (previous)", agents, create_previous, runtime)
+    _bench_instantiation("  class-level handler table", agents, agent_class, runtime)
+
+    await agent_class.register(runtime, "worker", agent_class)
+    runtime.start()
+    start = time.perf_counter()
+    for i in range(agents):
+        await runtime.get(AgentId("worker", str(i)), lazy=False)
+    _report("  runtime, one agent per key", agents, time.perf_counter() - start)
+    await runtime.stop()
+
+    print("dispatch")
+    with AgentInstantiationContext.populate_context((runtime, AgentId("worker", "dispatch"))):
+        agent = agent_class()
+    ctx = MessageContext(
+        sender=None, topic_id=None, is_rpc=True, cancellation_token=CancellationToken(), message_id="message"
+    )
+    previous_table = _previous_discover_handlers(agent)
+
+    async def dispatch_previous(message: Any) -> Any:
+        for handler in previous_table.get(type(message), []):
+            if handler.router(message, ctx):
+                return await handler(agent, message, ctx)
+        return await agent.on_unhandled_message(message, ctx)
+
+    message = Message(0)
+    derived_message = DerivedMessage(0)
+    await _bench_dispatch("  exact type lookup (previous)", messages, lambda: dispatch_previous(message))
+    await _bench_dispatch("  resolved handlers, exact type", messages, lambda: agent.on_message_impl(message, ctx))
+    await _bench_dispatch(
+        "  resolved handlers, base class fallback", messages, lambda: agent.on_message_impl(derived_message, ctx)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=20_000, help="Number of agents to create.")
+    parser.add_argument("--handlers", type=int, default=10, help="Number of message handlers of the agent class.")
+    parser.add_argument("--messages", type=int, default=200_000, help="Number of messages to dispatch.")
+    args = parser.parse_args()
+    asyncio.run(run(args.agents, args.handlers, args.messages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Stress :class:`~autogen_core.SingleThreadedAgentRuntime` with a publish burst and report peak memory.
+
+A producer publishes messages with a large payload as fast as it can while the
+subscribed handlers are slow. Without limits the queue and the number of handler
+tasks grow with the burst; with ``max_queue_size`` and ``max_concurrent_handlers``
+the producer is throttled and memory stays bounded.
+
+Each configuration runs in its own subprocess so that the reported peak RSS is not
+shared between runs.
+"""
+
+import argparse
+import asyncio
+import resource
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+from autogen_core import (
+    AgentType,
+    MessageContext,
+    RoutedAgent,
+    SingleThreadedAgentRuntime,
+    TopicId,
+    TypeSubscription,
+    event,
+)
+
+
+@dataclass
+class Blob:
+    data: bytes
+
+
+class SlowSink(RoutedAgent):
+    def __init__(self, delay: float) -> None:
+        super().__init__("A slow sink agent.")
+        self._delay = delay
+
+    @event
+    async def on_blob(self, message: Blob, ctx: MessageContext) -> None:
+        await asyncio.sleep(self._delay)
+
+
+async def run(messages: int, payload_size: int, max_queue_size: int, max_concurrent_handlers: int | None) -> None:
+    runtime = SingleThreadedAgentRuntime(
+        max_queue_size=max_queue_size, max_concurrent_handlers=max_concurrent_handlers
+    )
+    await runtime.register_factory(AgentType("sink"), lambda: SlowSink(0.001))
+    await runtime.add_subscription(TypeSubscription("bench", "sink"))
+
+    runtime.start()
+    start = time.perf_counter()
+    for i in range(messages):
+        # A fresh payload per message, so that queued messages hold their own memory.
+        await runtime.publish_message(Blob(data=bytes(payload_size)), TopicId("bench", str(i % 100)))
+    await runtime.stop_when_idle()
+    elapsed = time.perf_counter() - start
+    await runtime.close()
+
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"max_queue_size={max_queue_size:<6} max_concurrent_handlers={str(max_concurrent_handlers):<6} "
+        f"{messages / elapsed:>10,.0f} msgs/sec  peak RSS {peak_rss_mb:,.0f} MB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--payload-size", type=int, default=64 * 1024)
+    parser.add_argument("--max-queue-size", type=int, default=None, help="Run a single configuration.")
+    parser.add_argument("--max-concurrent-handlers", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.max_queue_size is not None:
+        asyncio.run(run(args.messages, args.payload_size, args.max_queue_size, args.max_concurrent_handlers))
+        return
+
+    for max_queue_size, max_concurrent_handlers in [(0, None), (1000, 100)]:
+        command = [
+            sys.executable,
+            __file__,
+            f"--messages={args.messages}",
+            f"--payload-size={args.payload_size}",
+            f"--max-queue-size={max_queue_size}",
+        ]
+        if max_concurrent_handlers is not None:
+            command.append(f"--max-concurrent-handlers={max_concurrent_handlers}")
+        subprocess.run(command, check=True)
+
+
+if __name__ == "__main__":
+    main()
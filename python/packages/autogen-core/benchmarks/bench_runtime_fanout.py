@@ -0,0 +1,104 @@
+"""Measure publish fan-out throughput of :class:`~autogen_core.SingleThreadedAgentRuntime`.
+
+The benchmark publishes messages to a topic with ``--subscribers`` subscribers, for each of the given
+subscriber counts, and reports the number of delivered messages per second. The previous behavior, which
+serialized the payload of every message once when it was published and once more per recipient, whether
+or not a handler was listening, is compared with the deferred payload, first with the event logger
+disabled and then with an INFO-level handler attached, so that the cost of serialization can be compared.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+from autogen_core import (
+    EVENT_LOGGER_NAME,
+    AgentType,
+    MessageContext,
+    RoutedAgent,
+    SingleThreadedAgentRuntime,
+    TopicId,
+    TypeSubscription,
+    event,
+    try_get_known_serializers_for_type,
+)
+from autogen_core._single_threaded_agent_runtime import PublishMessageEnvelope
+from autogen_core.logging import DeferredPayload
+
+
+@dataclass
+class Payload:
+    content: str
+    items: List[int] = field(default_factory=list)
+
+
+class Sink(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("A sink agent.")
+
+    @event
+    async def on_payload(self, message: Payload, ctx: MessageContext) -> None:
+        pass
+
+
+class EagerSerializationRuntime(SingleThreadedAgentRuntime):
+    """Serializes the payload when a message is published and once per recipient, as before."""
+
+    def _deferred_payload(self, message: object) -> DeferredPayload:
+        value = self._try_serialize(message)
+        return DeferredPayload(lambda: value)
+
+    async def _process_publish(self, message_envelope: PublishMessageEnvelope) -> None:
+        recipients = await self._subscription_manager.get_subscribed_recipients(message_envelope.topic_id)
+        for _ in recipients:
+            self._try_serialize(message_envelope.message)
+        await super()._process_publish(message_envelope)
+
+
+async def _measure(runtime: SingleThreadedAgentRuntime, subscribers: int, messages: int) -> float:
+    runtime.add_message_serializer(try_get_known_serializers_for_type(Payload))
+    for i in range(subscribers):
+        await runtime.register_factory(AgentType(f"sink_{i}"), lambda: Sink())
+        await runtime.add_subscription(TypeSubscription("bench", f"sink_{i}"))
+
+    message = Payload(content="x" * 256, items=list(range(64)))
+    runtime.start()
+    start = time.perf_counter()
+    for _ in range(messages):
+        await runtime.publish_message(message, TopicId("bench", "default"))
+    await runtime.stop_when_idle()
+    elapsed = time.perf_counter() - start
+    await runtime.close()
+    return subscribers * messages / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--subscribers", type=int, nargs="+", default=[1, 4, 16, 64], help="Numbers of subscribers to measure."
+    )
+    parser.add_argument("--messages", type=int, default=2000, help="Number of messages published per measurement.")
+    args = parser.parse_args()
+
+    event_logger = logging.getLogger(EVENT_LOGGER_NAME)
+    handler = logging.NullHandler()
+
+    print(f"{'subscribers':>11}  {'previous':>14}  {'deferred':>14}  {'deferred, logging':>18}  (deliveries/sec)")
+    for subscribers in args.subscribers:
+        event_logger.setLevel(logging.WARNING)
+        previous = asyncio.run(_measure(EagerSerializationRuntime(), subscribers, args.messages))
+        deferred = asyncio.run(_measure(SingleThreadedAgentRuntime(), subscribers, args.messages))
+
+        event_logger.setLevel(logging.INFO)
+        event_logger.addHandler(handler)
+        logging_enabled = asyncio.run(_measure(SingleThreadedAgentRuntime(), subscribers, args.messages))
+        event_logger.removeHandler(handler)
+
+        print(f"{subscribers:>11}  {previous:>14,.0f}  {deferred:>14,.0f}  {logging_enabled:>18,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Measure message serializer construction and encode/decode throughput.
+
+Compares the previous dataclass path (``asdict`` + ``json.dumps``) with the field accessor
+JSON serializer and the MessagePack serializers, for a dataclass shaped like a chat message
+and for the Pydantic ``UserMessage`` and ``AssistantMessage`` model types. The MessagePack
+rows are skipped when the ``msgpack`` package is not installed.
+"""
+
+import argparse
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List
+
+from autogen_core import FunctionCall
+from autogen_core._serialization import (
+    JSON_DATA_CONTENT_TYPE,
+    MSGPACK_DATA_CONTENT_TYPE,
+    DataclassJsonMessageSerializer,
+    contains_a_union,
+    has_nested_base_model,
+    has_nested_dataclass,
+    try_get_known_serializers_for_type,
+)
+from autogen_core.models import AssistantMessage, UserMessage
+
+
+@dataclass
+class ChatMessage:
+    source: str
+    content: str
+    models_usage: Dict[str, int] = field(default_factory=dict)
+    metadata: Dict[str, str] = field(default_factory=dict)
+    tags: List[str] = field(default_factory=list)
+
+
+def _report(name: str, iterations: int, func: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<48} {iterations / elapsed:>12,.0f}/sec")
+
+
+def _has_msgpack() -> bool:
+    try:
+        import msgpack  # type: ignore[import-untyped, unused-ignore]  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def run(iterations: int, content_size: int) -> None:
+    content = "x" * content_size
+    chat_message = ChatMessage(
+        source="assistant",
+        content=content,
+        models_usage={"prompt_tokens": 120, "completion_tokens": 48},
+        metadata={"conversation": "c-1"},
+        tags=["draft", "reviewed"],
+    )
+    user_message = UserMessage(content=content, source="user")
+    assistant_message = AssistantMessage(
+        content=[FunctionCall(id="call_1", name="search", arguments='{"query": "autogen"}')], source="assistant"
+    )
+    msgpack = _has_msgpack()
+
+    print("serializer construction")
+
+    def _legacy_construction() -> None:
+        # Every construction used to walk the type hints again.
+        contains_a_union(ChatMessage)
+        has_nested_dataclass(ChatMessage)
+        has_nested_base_model(ChatMessage)
+        DataclassJsonMessageSerializer(ChatMessage)
+
+    _report("  validate + construct (previous)", iterations, _legacy_construction)
+    _report(
+        "  try_get_known_serializers_for_type (cached)",
+        iterations,
+        lambda: try_get_known_serializers_for_type(ChatMessage),
+    )
+
+    print("dataclass encode/decode")
+    json_serializer = try_get_known_serializers_for_type(ChatMessage, JSON_DATA_CONTENT_TYPE)[0]
+    encoded = json_serializer.serialize(chat_message)
+    _report(
+        "  encode asdict + json.dumps (previous)", iterations, lambda: json.dumps(asdict(chat_message)).encode("utf-8")
+    )
+    _report("  encode json field accessor", iterations, lambda: json_serializer.serialize(chat_message))
+    _report("  decode json", iterations, lambda: json_serializer.deserialize(encoded))
+    if msgpack:
+        msgpack_serializer = try_get_known_serializers_for_type(ChatMessage, MSGPACK_DATA_CONTENT_TYPE)[0]
+        packed = msgpack_serializer.serialize(chat_message)
+        _report("  encode msgpack", iterations, lambda: msgpack_serializer.serialize(chat_message))
+        _report("  decode msgpack", iterations, lambda: msgpack_serializer.deserialize(packed))
+
+    for model in (user_message, assistant_message):
+        name = type(model).__name__
+        print(f"pydantic {name} encode/decode")
+        json_serializer = try_get_known_serializers_for_type(type(model), JSON_DATA_CONTENT_TYPE)[0]
+        encoded = json_serializer.serialize(model)
+        _report("  encode json", iterations, lambda: json_serializer.serialize(model))  # noqa: B023
+        _report("  decode json", iterations, lambda: json_serializer.deserialize(encoded))  # noqa: B023
+        if msgpack:
+            msgpack_serializer = try_get_known_serializers_for_type(type(model), MSGPACK_DATA_CONTENT_TYPE)[0]
+            packed = msgpack_serializer.serialize(model)
+            _report("  encode msgpack", iterations, lambda: msgpack_serializer.serialize(model))  # noqa: B023
+            _report("  decode msgpack", iterations, lambda: msgpack_serializer.deserialize(packed))  # noqa: B023
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=50_000)
+    parser.add_argument("--content-size", type=int, default=200, help="Length of the message content in characters.")
+    args = parser.parse_args()
+    run(args.iterations, args.content_size)
+
+
+if __name__ == "__main__":
+    main()
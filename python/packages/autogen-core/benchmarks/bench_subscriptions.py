@@ -0,0 +1,60 @@
+"""Measure subscription registration and topic resolution in ``SubscriptionManager``.
+
+The benchmark registers many :class:`~autogen_core.TypeSubscription` and
+:class:`~autogen_core.TypePrefixSubscription` instances (as created by many
+per-session teams), then resolves recipients for many unique topics, and finally
+removes all subscriptions again.
+"""
+
+import argparse
+import asyncio
+import time
+
+from autogen_core import Subscription, TopicId, TypePrefixSubscription, TypeSubscription
+from autogen_core._runtime_impl_helpers import SubscriptionManager
+
+
+async def run(subscriptions: int, topics: int, prefix_every: int, cache_capacity: int | None) -> None:
+    manager = SubscriptionManager(recipient_cache_capacity=cache_capacity)
+    added: list[Subscription] = []
+
+    start = time.perf_counter()
+    for i in range(subscriptions):
+        sub: Subscription
+        if prefix_every and i % prefix_every == 0:
+            sub = TypePrefixSubscription(f"team_{i}_", f"agent_{i}")
+        else:
+            sub = TypeSubscription(f"team_{i}", f"agent_{i}")
+        await manager.add_subscription(sub)
+        added.append(sub)
+    elapsed = time.perf_counter() - start
+    print(f"register {subscriptions:,} subscriptions: {elapsed:.3f}s ({subscriptions / elapsed:,.0f}/sec)")
+
+    start = time.perf_counter()
+    total_recipients = 0
+    for i in range(topics):
+        topic = TopicId(f"team_{i % subscriptions}", f"conversation_{i}")
+        total_recipients += len(await manager.get_subscribed_recipients(topic))
+    elapsed = time.perf_counter() - start
+    print(f"resolve {topics:,} new topics: {elapsed:.3f}s ({topics / elapsed:,.0f}/sec, {total_recipients:,} recipients)")
+    print(f"recipient cache: {manager.recipient_cache_stats}")
+
+    start = time.perf_counter()
+    for sub in added:
+        await manager.remove_subscription(sub.id)
+    elapsed = time.perf_counter() - start
+    print(f"remove {subscriptions:,} subscriptions: {elapsed:.3f}s ({subscriptions / elapsed:,.0f}/sec)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--subscriptions", type=int, default=10_000)
+    parser.add_argument("--topics", type=int, default=100_000)
+    parser.add_argument("--prefix-every", type=int, default=10, help="Make every n-th subscription a prefix one.")
+    parser.add_argument("--cache-capacity", type=int, default=10_000, help="Use 0 for an unbounded cache.")
+    args = parser.parse_args()
+    asyncio.run(run(args.subscriptions, args.topics, args.prefix_every, args.cache_capacity or None))
+
+
+if __name__ == "__main__":
+    main()
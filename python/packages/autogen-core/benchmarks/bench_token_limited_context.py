@@ -0,0 +1,78 @@
+"""Measure per-turn latency of ``TokenLimitedChatCompletionContext`` on long histories.
+
+Each turn adds one message to a context that already holds ``--history`` messages and then calls
+``get_messages``, the way an agent does before every model call. The previous implementation, which
+recounted the whole list after removing each message from the middle, is timed alongside for
+comparison. Token counts come from the ``ReplayChatCompletionClient``, which counts words, so the
+numbers measure the trimming work rather than the tokenizer.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+from autogen_core.model_context import TokenLimitedChatCompletionContext
+from autogen_core.models import AssistantMessage, ChatCompletionClient, LLMMessage, UserMessage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+
+def _make_message(index: int, words: int) -> LLMMessage:
+    content = " ".join(f"w{index}" for _ in range(words))
+    if index % 2 == 0:
+        return UserMessage(content=content, source="user")
+    return AssistantMessage(content=content, source="assistant")
+
+
+def _previous_get_messages(
+    model_client: ChatCompletionClient, messages: List[LLMMessage], token_limit: int
+) -> List[LLMMessage]:
+    messages = list(messages)
+    token_count = model_client.count_tokens(messages)
+    while token_count > token_limit and len(messages) > 0:
+        messages.pop(len(messages) // 2)
+        token_count = model_client.count_tokens(messages)
+    return messages
+
+
+async def run(history: int, turns: int, words: int, token_limit: int, previous: bool) -> None:
+    model_client = ReplayChatCompletionClient([])
+    model_context = TokenLimitedChatCompletionContext(model_client=model_client, token_limit=token_limit)
+    for index in range(history):
+        await model_context.add_message(_make_message(index, words))
+
+    latencies: List[float] = []
+    for index in range(history, history + turns):
+        start = time.perf_counter()
+        await model_context.add_message(_make_message(index, words))
+        kept = await model_context.get_messages()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    print(f"history={history} turns={turns} token_limit={token_limit} kept={len(kept)}")
+    print(f"  {'incremental':<12} p50={latencies[len(latencies) // 2] * 1e3:8.3f}ms max={latencies[-1] * 1e3:8.3f}ms")
+
+    if previous:
+        messages = [_make_message(index, words) for index in range(history)]
+        latencies = []
+        for index in range(history, history + turns):
+            start = time.perf_counter()
+            messages.append(_make_message(index, words))
+            _previous_get_messages(model_client, messages, token_limit)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        print(f"  {'previous':<12} p50={latencies[len(latencies) // 2] * 1e3:8.3f}ms max={latencies[-1] * 1e3:8.3f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--history", type=int, default=2000, help="Number of messages in the context.")
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--words", type=int, default=20, help="Number of words per message.")
+    parser.add_argument("--token-limit", type=int, default=8000)
+    parser.add_argument("--skip-previous", action="store_true", help="Do not time the previous implementation.")
+    args = parser.parse_args()
+    asyncio.run(run(args.history, args.turns, args.words, args.token_limit, not args.skip_previous))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Measure how slow synchronous tools delay other users of the default executor.
+
+Runs ``--calls`` concurrent calls of a ``FunctionTool`` whose function blocks for ``--tool-time`` seconds,
+while probing the default executor of the event loop every ``--probe-interval`` seconds with a trivial call,
+as ``loop.getaddrinfo`` does for DNS resolution. The tools run in the default executor (the previous behavior),
+then in a dedicated ``ToolExecutor`` thread pool with ``--max-workers`` workers. Reports the probe latency, the
+tool throughput and the queue time metrics of the executor.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from autogen_core import CancellationToken
+from autogen_core.tools import FunctionTool, ToolExecutor
+
+
+async def _probe(latencies: List[float], interval: float, stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = time.perf_counter()
+        await loop.run_in_executor(None, lambda: None)
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(interval)
+
+
+async def _measure(name: str, tool: FunctionTool, calls: int, probe_interval: float) -> None:
+    latencies: List[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(latencies, probe_interval, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*[tool.run_json({"index": i}, CancellationToken()) for i in range(calls)])
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe
+    print(
+        f"{name:<36} {calls / elapsed:>8,.1f} calls/sec  probe latency "
+        f"median {statistics.median(latencies) * 1000:>8.2f} ms  max {max(latencies) * 1000:>8.2f} ms"
+    )
+
+
+async def run(calls: int, tool_time: float, max_workers: int, probe_interval: float) -> None:
+    def slow_tool(index: int) -> int:
+        time.sleep(tool_time)
+        return index
+
+    await _measure(
+        "  default executor (previous)", FunctionTool(slow_tool, description="A slow tool."), calls, probe_interval
+    )
+    executor = ToolExecutor("thread", max_workers=max_workers)
+    await _measure(
+        f"  ToolExecutor, {max_workers} threads",
+        FunctionTool(slow_tool, description="A slow tool.", executor=executor),
+        calls,
+        probe_interval,
+    )
+    metrics = executor.metrics
+    print(
+        f"  queue time: mean {metrics.total_queue_time / metrics.calls * 1000:.1f} ms, "
+        f"max {metrics.max_queue_time * 1000:.1f} ms"
+    )
+    executor.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200, help="Number of concurrent tool calls.")
+    parser.add_argument("--tool-time", type=float, default=0.05, help="Time each tool call blocks, in seconds.")
+    parser.add_argument("--max-workers", type=int, default=8, help="Size of the dedicated thread pool.")
+    parser.add_argument("--probe-interval", type=float, default=0.01, help="Time between probes, in seconds.")
+    args = parser.parse_args()
+    asyncio.run(run(args.calls, args.tool_time, args.max_workers, args.probe_interval))
+
+
+if __name__ == "__main__":
+    main()
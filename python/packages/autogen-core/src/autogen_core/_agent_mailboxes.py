@@ -0,0 +1,126 @@
+import asyncio
+import logging
+from asyncio import Task
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Set
+
+from ._agent_id import AgentId
+
+logger = logging.getLogger("autogen_core")
+
+
+class AgentMailboxes:
+    """Runs work items in submission order for each agent, and for several agents concurrently.
+
+    Every agent with outstanding work has a mailbox. A mailbox is processed by one worker at a time, so the
+    work items of an agent never overlap. At most `max_workers` workers run at the same time; agents with
+    outstanding work wait for a free worker in a round-robin ready queue, and a worker moves on to the next
+    ready agent after each work item so that a busy agent cannot starve the others.
+
+    Args:
+        max_workers (int | None): The maximum number of agents processed concurrently. None means unlimited.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be a positive integer or None")
+        self._max_workers = max_workers
+        self._mailboxes: Dict[AgentId, deque[Callable[[], Awaitable[None]]]] = {}
+        # Agents that are being processed by a worker.
+        self._running: Set[AgentId] = set()
+        # Agents with outstanding work that are waiting for a worker, in round-robin order.
+        self._ready: deque[AgentId] = deque()
+        self._ready_set: Set[AgentId] = set()
+        self._workers = 0
+        self._tasks: Set[Task[Any]] = set()
+
+    @property
+    def active_workers(self) -> int:
+        """The number of workers counted against `max_workers`."""
+        return self._workers
+
+    @property
+    def pending_count(self) -> int:
+        """The number of work items that have not started yet."""
+        return sum(len(mailbox) for mailbox in self._mailboxes.values())
+
+    def submit(self, agent_id: AgentId, work: Callable[[], Awaitable[None]], unlimited: bool = False) -> None:
+        """Append a work item to the mailbox of the agent.
+
+        If `unlimited` is True and the agent is waiting for a worker, it is started right away without counting
+        against `max_workers`. This is used for RPCs sent from within a handler, whose sender holds a worker
+        while it waits for the response.
+        """
+        mailbox = self._mailboxes.get(agent_id)
+        if mailbox is None:
+            mailbox = self._mailboxes[agent_id] = deque()
+        mailbox.append(work)
+
+        if agent_id in self._running:
+            return
+        if agent_id in self._ready_set:
+            if unlimited:
+                self._ready.remove(agent_id)
+                self._ready_set.discard(agent_id)
+                self._start_worker(agent_id, counted=False)
+            return
+        if self._max_workers is None or self._workers < self._max_workers:
+            self._start_worker(agent_id, counted=True)
+        elif unlimited:
+            self._start_worker(agent_id, counted=False)
+        else:
+            self._ready.append(agent_id)
+            self._ready_set.add(agent_id)
+
+    def _start_worker(self, agent_id: AgentId, counted: bool) -> None:
+        if counted:
+            self._workers += 1
+        self._running.add(agent_id)
+        task = asyncio.create_task(self._work(agent_id, counted))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _work(self, agent_id: AgentId, counted: bool) -> None:
+        current: AgentId | None = agent_id
+        try:
+            while current is not None:
+                mailbox = self._mailboxes[current]
+                work = mailbox.popleft()
+                try:
+                    await work()
+                except Exception:
+                    logger.error(f"Error processing mailbox of {current}", exc_info=True)
+
+                if mailbox and not (counted and self._ready):
+                    continue
+
+                # Hand the worker over to the next ready agent.
+                self._running.discard(current)
+                if mailbox:
+                    self._ready.append(current)
+                    self._ready_set.add(current)
+                else:
+                    del self._mailboxes[current]
+                current = None
+                if counted and self._ready:
+                    current = self._ready.popleft()
+                    self._ready_set.discard(current)
+                    self._running.add(current)
+        finally:
+            if current is not None:
+                # The worker was cancelled, so the remaining work of the agent is handed to another worker.
+                self._running.discard(current)
+                if self._mailboxes.get(current):
+                    self._ready.appendleft(current)
+                    self._ready_set.add(current)
+                else:
+                    self._mailboxes.pop(current, None)
+            if counted:
+                self._workers -= 1
+                self._start_ready_workers()
+
+    def _start_ready_workers(self) -> None:
+        while self._ready and (self._max_workers is None or self._workers < self._max_workers):
+            agent_id = self._ready.popleft()
+            self._ready_set.discard(agent_id)
+            self._start_worker(agent_id, counted=True)
@@ -0,0 +1,70 @@
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+
+from ._cache_store import CacheStore, InMemoryStore
+
+
+@dataclass
+class AgentPassivationPolicy:
+    """Policy used by :class:`~autogen_core.SingleThreadedAgentRuntime` to passivate idle agent instances.
+
+    A passivated agent has its state saved with :meth:`~autogen_core.Agent.save_state` into
+    :attr:`state_store`, is closed with :meth:`~autogen_core.Agent.close` and is dropped by the runtime.
+    The next time the agent is needed, the runtime re-creates it with its registered factory and
+    restores the saved state with :meth:`~autogen_core.Agent.load_state`.
+
+    Agents registered with :meth:`~autogen_core.AgentRuntime.register_agent_instance` and agents that are
+    currently handling a message are never passivated.
+
+    .. note::
+
+        References to agent instances obtained through
+        :meth:`~autogen_core.SingleThreadedAgentRuntime.try_get_underlying_agent_instance` become stale once
+        the agent is passivated.
+
+    Args:
+        max_resident_agents (int | None, optional): The maximum number of instantiated agents. When a new agent
+            is instantiated above this limit, the least recently used agents are passivated. Defaults to None.
+        idle_timeout (float | None, optional): Passivate agents that have not been used for this many seconds.
+            Checked every ``sweep_interval`` seconds while the runtime is running. Defaults to None.
+        sweep_interval (float, optional): How often, in seconds, to check for idle agents. Defaults to 1.0.
+        state_store (CacheStore[Mapping[str, Any]], optional): The store to save the state of passivated agents
+            in, keyed by the string form of the agent ID. Defaults to a new :class:`~autogen_core.InMemoryStore`.
+
+    Example:
+
+        .. code-block:: python
+
+            from autogen_core import AgentPassivationPolicy, SingleThreadedAgentRuntime
+
+            runtime = SingleThreadedAgentRuntime(
+                passivation_policy=AgentPassivationPolicy(max_resident_agents=1000, idle_timeout=300),
+            )
+    """
+
+    max_resident_agents: int | None = None
+    idle_timeout: float | None = None
+    sweep_interval: float = 1.0
+    state_store: CacheStore[Mapping[str, Any]] = field(default_factory=InMemoryStore)
+
+    def __post_init__(self) -> None:
+        if self.max_resident_agents is not None and self.max_resident_agents < 1:
+            raise ValueError("max_resident_agents must be a positive integer or None")
+        if self.idle_timeout is not None and self.idle_timeout < 0:
+            raise ValueError("idle_timeout must be non-negative or None")
+        if self.sweep_interval <= 0:
+            raise ValueError("sweep_interval must be positive")
+
+
+@dataclass
+class AgentPassivationStats:
+    """Counters reported by :attr:`~autogen_core.SingleThreadedAgentRuntime.passivation_stats`."""
+
+    resident: int = 0
+    """The number of agent instances currently held by the runtime."""
+    passivated: int = 0
+    """The number of agents whose state is currently held in the state store."""
+    passivations: int = 0
+    """The total number of times an agent was passivated."""
+    rehydrations: int = 0
+    """The total number of times a passivated agent was re-created."""
@@ -1,5 +1,10 @@
+import sys
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Generic, Optional, TypeVar
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Generic, Mapping, Optional, TypeVar
 
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -44,27 +49,193 @@ def set(self, key: str, value: T) -> None:
         """
         ...
 
+    async def aget(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        """
+        Retrieve an item from the store without blocking the event loop.
+
+        The default implementation calls :meth:`get`. Stores backed by network or disk I/O
+        should override it.
+
+        Args:
+            key: The key identifying the item in the store.
+            default (optional): The default value to return if the key is not found.
+                                Defaults to None.
+
+        Returns:
+            The value associated with the key if found, else the default value.
+        """
+        return self.get(key, default)
+
+    async def aset(self, key: str, value: T) -> None:
+        """
+        Set an item in the store without blocking the event loop.
+
+        The default implementation calls :meth:`set`. Stores backed by network or disk I/O
+        should override it.
+
+        Args:
+            key: The key under which the item is to be stored.
+            value: The value to be stored in the store.
+        """
+        self.set(key, value)
+
 
 class InMemoryStoreConfig(BaseModel):
-    pass
+    max_entries: Optional[int] = None
+    max_bytes: Optional[int] = None
+    ttl: Optional[float] = None
+
+
+@dataclass
+class InMemoryStoreMetrics:
+    """Counters of an :class:`InMemoryStore`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    """Entries removed to stay within `max_entries` or `max_bytes`."""
+    expirations: int = 0
+    """Entries removed because their time to live passed."""
+    entries: int = 0
+    bytes: int = 0
+
+
+def _estimate_size(value: Any) -> int:
+    """Estimate the size of a value in bytes, counting the contents of containers and Pydantic models."""
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if isinstance(value, BaseModel):
+        return len(value.model_dump_json())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(_estimate_size(item) for item in value)  # type: ignore[reportUnknownVariableType]
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_estimate_size(k) + _estimate_size(v) for k, v in value.items())  # type: ignore[reportUnknownVariableType]
+    return sys.getsizeof(value)
+
+
+@dataclass
+class _Entry(Generic[T]):
+    value: T
+    size: int
+    expires_at: Optional[float]
 
 
 class InMemoryStore(CacheStore[T], Component[InMemoryStoreConfig]):
+    """A cache store that keeps items in memory.
+
+    The store is unbounded by default. When `max_entries` or `max_bytes` is set, the least recently used items
+    are evicted to stay within the limits, and when `ttl` is set, items expire that many seconds after they were
+    set. Hits, misses, evictions and expirations are counted in :attr:`metrics`.
+
+    Args:
+        max_entries (int | None): The maximum number of items kept. None means unlimited.
+        max_bytes (int | None): The maximum total size of the items kept, in bytes. None means unlimited.
+            Sizes are estimated with `size_of`. An item larger than `max_bytes` is not stored.
+        ttl (float | None): The time to live of an item in seconds. None means items do not expire.
+        size_of (Callable[[T], int] | None): A function that returns the size of an item in bytes. Defaults to
+            an estimate that counts the length of strings and bytes, the JSON length of Pydantic models, and
+            the contents of lists, tuples, sets and dicts. It is not part of the component config.
+    """
+
     component_provider_override = "autogen_core.InMemoryStore"
     component_config_schema = InMemoryStoreConfig
 
-    def __init__(self) -> None:
-        self.store: Dict[str, T] = {}
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        size_of: Optional[Callable[[T], int]] = None,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be a positive integer or None")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be a positive integer or None")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be a positive number or None")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._size_of: Callable[[T], int] = size_of or _estimate_size
+        self._entries: OrderedDict[str, _Entry[T]] = OrderedDict()
+        self._bytes = 0
+        self._metrics = InMemoryStoreMetrics()
+
+    @property
+    def metrics(self) -> InMemoryStoreMetrics:
+        """A snapshot of the counters of the store."""
+        return InMemoryStoreMetrics(
+            hits=self._metrics.hits,
+            misses=self._metrics.misses,
+            evictions=self._metrics.evictions,
+            expirations=self._metrics.expirations,
+            entries=len(self._entries),
+            bytes=self._bytes,
+        )
+
+    @property
+    def store(self) -> Mapping[str, T]:
+        """A read-only snapshot of the items in the store that have not expired, from the least to the most
+        recently used. Reading it does not count as a use of the items, and does not update :attr:`metrics`."""
+        now = time.monotonic()
+        return MappingProxyType(
+            {
+                key: entry.value
+                for key, entry in self._entries.items()
+                if entry.expires_at is None or entry.expires_at > now
+            }
+        )
 
     def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
-        return self.store.get(key, default)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._metrics.misses += 1
+            return default
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self._metrics.expirations += 1
+            self._metrics.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self._metrics.hits += 1
+        return entry.value
 
     def set(self, key: str, value: T) -> None:
-        self.store[key] = value
+        if key in self._entries:
+            self._remove(key)
+        size = self._size_of(value) if self._max_bytes is not None else 0
+        if self._max_bytes is not None and size > self._max_bytes:
+            self._metrics.evictions += 1
+            return
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+        self._entries[key] = _Entry(value, size, expires_at)
+        self._bytes += size
+        self._evict()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _evict(self) -> None:
+        if self._ttl is not None:
+            # Expired entries go first. Entries are ordered by use, not by expiry, so stop at the first live one.
+            now = time.monotonic()
+            while self._entries:
+                key, entry = next(iter(self._entries.items()))
+                if entry.expires_at is None or entry.expires_at > now:
+                    break
+                self._remove(key)
+                self._metrics.expirations += 1
+        while (self._max_entries is not None and len(self._entries) > self._max_entries) or (
+            self._max_bytes is not None and self._bytes > self._max_bytes
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self._metrics.evictions += 1
 
     def _to_config(self) -> InMemoryStoreConfig:
-        return InMemoryStoreConfig()
+        return InMemoryStoreConfig(max_entries=self._max_entries, max_bytes=self._max_bytes, ttl=self._ttl)
 
     @classmethod
     def _from_config(cls, config: InMemoryStoreConfig) -> Self:
-        return cls()
+        return cls(max_entries=config.max_entries, max_bytes=config.max_bytes, ttl=config.ttl)
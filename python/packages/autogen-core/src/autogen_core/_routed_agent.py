@@ -3,8 +3,9 @@
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Coroutine,
-    DefaultDict,
+    Dict,
     List,
     Literal,
     Protocol,
@@ -129,6 +130,8 @@ def decorator(
         target_types = get_types(type_hints["message"])
         if target_types is None:
             raise AssertionError("Message type not found")
+        # Messages of subclasses of the target types are handled as well.
+        target_classes = tuple(t for t in target_types if isinstance(t, type))
 
         # print(type_hints)
         return_types = get_types(type_hints["return"])
@@ -140,7 +143,7 @@ def decorator(
 
         @wraps(func)
         async def wrapper(self: AgentT, message: ReceivesT, ctx: MessageContext) -> ProducesT:
-            if type(message) not in target_types:
+            if type(message) not in target_types and not isinstance(message, target_classes):
                 if strict:
                     raise CantHandleException(f"Message type {type(message)} not in target types {target_types}")
                 else:
@@ -249,6 +252,8 @@ def decorator(
         target_types = get_types(type_hints["message"])
         if target_types is None:
             raise AssertionError("Message type not found. Please provide a type hint for the message parameter.")
+        # Messages of subclasses of the target types are handled as well.
+        target_classes = tuple(t for t in target_types if isinstance(t, type))
 
         return_types = get_types(type_hints["return"])
 
@@ -259,7 +264,7 @@ def decorator(
 
         @wraps(func)
         async def wrapper(self: AgentT, message: ReceivesT, ctx: MessageContext) -> None:
-            if type(message) not in target_types:
+            if type(message) not in target_types and not isinstance(message, target_classes):
                 if strict:
                     raise CantHandleException(f"Message type {type(message)} not in target types {target_types}")
                 else:
@@ -369,6 +374,8 @@ def decorator(
         target_types = get_types(type_hints["message"])
         if target_types is None:
             raise AssertionError("Message type not found")
+        # Messages of subclasses of the target types are handled as well.
+        target_classes = tuple(t for t in target_types if isinstance(t, type))
 
         # print(type_hints)
         return_types = get_types(type_hints["return"])
@@ -380,7 +387,7 @@ def decorator(
 
         @wraps(func)
         async def wrapper(self: AgentT, message: ReceivesT, ctx: MessageContext) -> ProducesT:
-            if type(message) not in target_types:
+            if type(message) not in target_types and not isinstance(message, target_classes):
                 if strict:
                     raise CantHandleException(f"Message type {type(message)} not in target types {target_types}")
                 else:
@@ -455,34 +462,39 @@ async def handle_event_message(self, message: Message, ctx: MessageContext) -> N
             @rpc(match=lambda message, ctx: message.content == "special")  # type: ignore
             async def handle_special_rpc_message(self, message: MessageWithContent, ctx: MessageContext) -> Response:
                 return Response()
-    """
 
-    def __init__(self, description: str) -> None:
-        # Self is already bound to the handlers
-        self._handlers: DefaultDict[
-            Type[Any],
-            List[MessageHandler[RoutedAgent, Any, Any]],
-        ] = DefaultDict(list)
+    A message is routed to the handlers of its own type first, followed by the handlers of its base
+    classes in method resolution order. The handlers of an agent class are discovered once, when the
+    first agent of the class is created or registered, so handlers must be defined in the class body.
+    """
 
-        handlers = self._discover_handlers()
-        for message_handler in handlers:
-            for target_type in message_handler.target_types:
-                self._handlers[target_type].append(message_handler)
+    internal_discovered_handlers: ClassVar[Sequence[MessageHandler[Any, Any, Any]] | None] = None
+    """:meta private:"""
+    internal_handler_table: ClassVar[Dict[Type[Any], List[MessageHandler[Any, Any, Any]]] | None] = None
+    """:meta private:"""
+    internal_resolved_handlers: ClassVar[Dict[Type[Any], Tuple[MessageHandler[Any, Any, Any], ...]]] = {}
+    """:meta private:"""
 
-        super().__init__(description)
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Every subclass discovers its own handlers, as it may add or override handlers.
+        cls.internal_discovered_handlers = None
+        cls.internal_handler_table = None
+        cls.internal_resolved_handlers = {}
 
     async def on_message_impl(self, message: Any, ctx: MessageContext) -> Any | None:
         """Handle a message by routing it to the appropriate message handler.
         Do not override this method in subclasses. Instead, add message handlers as methods decorated with
         either the :func:`event` or :func:`rpc` decorator."""
         key_type: Type[Any] = type(message)  # type: ignore
-        handlers = self._handlers.get(key_type)  # type: ignore
-        if handlers is not None:
-            # Iterate over all handlers for this matching message type.
-            # Call the first handler whose router returns True and then return the result.
-            for h in handlers:
-                if h.router(message, ctx):
-                    return await h(self, message, ctx)
+        handlers = self.internal_resolved_handlers.get(key_type)
+        if handlers is None:
+            handlers = self._resolve_handlers(key_type)
+        # Iterate over all handlers for the type of the message and its base classes.
+        # Call the first handler whose router returns True and then return the result.
+        for h in handlers:
+            if h.router(message, ctx):
+                return await h(self, message, ctx)
         return await self.on_unhandled_message(message, ctx)  # type: ignore
 
     async def on_unhandled_message(self, message: Any, ctx: MessageContext) -> None:
@@ -492,6 +504,8 @@ async def on_unhandled_message(self, message: Any, ctx: MessageContext) -> None:
 
     @classmethod
     def _discover_handlers(cls) -> Sequence[MessageHandler[Any, Any, Any]]:
+        if cls.internal_discovered_handlers is not None:
+            return cls.internal_discovered_handlers
         handlers: List[MessageHandler[Any, Any, Any]] = []
         for attr in dir(cls):
             if callable(getattr(cls, attr, None)):
@@ -499,6 +513,31 @@ def _discover_handlers(cls) -> Sequence[MessageHandler[Any, Any, Any]]:
                 handler = getattr(cls, attr)
                 if hasattr(handler, "is_message_handler"):
                     handlers.append(cast(MessageHandler[Any, Any, Any], handler))
+        cls.internal_discovered_handlers = handlers
+        return handlers
+
+    @classmethod
+    def _get_handler_table(cls) -> Dict[Type[Any], List[MessageHandler[Any, Any, Any]]]:
+        if cls.internal_handler_table is None:
+            table: Dict[Type[Any], List[MessageHandler[Any, Any, Any]]] = {}
+            for message_handler in cls._discover_handlers():
+                for target_type in message_handler.target_types:
+                    table.setdefault(target_type, []).append(message_handler)
+            cls.internal_handler_table = table
+        return cls.internal_handler_table
+
+    @classmethod
+    def _resolve_handlers(cls, message_type: Type[Any]) -> Tuple[MessageHandler[Any, Any, Any], ...]:
+        handlers = cls.internal_resolved_handlers.get(message_type)
+        if handlers is None:
+            table = cls._get_handler_table()
+            # The handlers of the message type come first, then those of its base classes.
+            # A handler registered for several of the base classes is only included once.
+            resolved = dict.fromkeys(
+                message_handler for base in message_type.__mro__ for message_handler in table.get(base, [])
+            )
+            handlers = tuple(resolved)
+            cls.internal_resolved_handlers[message_type] = handlers
         return handlers
 
     @classmethod
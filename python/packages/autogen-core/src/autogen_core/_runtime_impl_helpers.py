@@ -1,11 +1,15 @@
-from collections import defaultdict
-from typing import Awaitable, Callable, DefaultDict, List, Sequence, Set
+import bisect
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, DefaultDict, Dict, Iterator, List, Sequence, Set, Tuple
 
 from ._agent import Agent
 from ._agent_id import AgentId
 from ._agent_type import AgentType
 from ._subscription import Subscription
 from ._topic import TopicId
+from ._type_prefix_subscription import TypePrefixSubscription
+from ._type_subscription import TypeSubscription
 
 
 async def get_impl(
@@ -29,50 +33,264 @@ async def get_impl(
     return id
 
 
-class SubscriptionManager:
+def _is_plain_type_subscription(subscription: Subscription) -> bool:
+    cls = type(subscription)
+    return (
+        isinstance(subscription, TypeSubscription)
+        and cls.is_match is TypeSubscription.is_match
+        and cls.map_to_agent is TypeSubscription.map_to_agent
+        and cls.__eq__ is TypeSubscription.__eq__
+    )
+
+
+def _is_plain_type_prefix_subscription(subscription: Subscription) -> bool:
+    cls = type(subscription)
+    return (
+        isinstance(subscription, TypePrefixSubscription)
+        and cls.is_match is TypePrefixSubscription.is_match
+        and cls.map_to_agent is TypePrefixSubscription.map_to_agent
+        and cls.__eq__ is TypePrefixSubscription.__eq__
+    )
+
+
+class _PrefixTrieNode:
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _PrefixTrieNode] = {}
+        self.subscriptions: Dict[int, TypePrefixSubscription] = {}
+
+
+class _PrefixTrie:
+    """A character trie of :class:`TypePrefixSubscription` keyed by topic type prefix."""
+
     def __init__(self) -> None:
-        self._subscriptions: List[Subscription] = []
-        self._seen_topics: Set[TopicId] = set()
-        self._subscribed_recipients: DefaultDict[TopicId, List[AgentId]] = defaultdict(list)
+        self._root = _PrefixTrieNode()
+
+    def add(self, seq: int, subscription: TypePrefixSubscription) -> None:
+        node = self._root
+        for char in subscription.topic_type_prefix:
+            node = node.children.setdefault(char, _PrefixTrieNode())
+        node.subscriptions[seq] = subscription
+
+    def remove(self, seq: int, subscription: TypePrefixSubscription) -> None:
+        path: List[Tuple[_PrefixTrieNode, str]] = []
+        node = self._root
+        for char in subscription.topic_type_prefix:
+            path.append((node, char))
+            node = node.children[char]
+        del node.subscriptions[seq]
+        # Prune nodes that no longer lead to any subscription.
+        while path and not node.subscriptions and not node.children:
+            parent, char = path.pop()
+            del parent.children[char]
+            node = parent
+
+    def exact(self, prefix: str) -> Iterator[Tuple[int, TypePrefixSubscription]]:
+        """Yield all subscriptions whose prefix is exactly ``prefix``."""
+        node = self._root
+        for char in prefix:
+            child = node.children.get(char)
+            if child is None:
+                return
+            node = child
+        yield from node.subscriptions.items()
+
+    def match(self, topic_type: str) -> Iterator[Tuple[int, TypePrefixSubscription]]:
+        """Yield all subscriptions whose prefix is a prefix of ``topic_type``."""
+        node = self._root
+        yield from node.subscriptions.items()
+        for char in topic_type:
+            child = node.children.get(char)
+            if child is None:
+                return
+            node = child
+            yield from node.subscriptions.items()
+
+
+DEFAULT_RECIPIENT_CACHE_CAPACITY = 10_000
+
+
+@dataclass
+class RecipientCacheStats:
+    """Counters of the topic to recipients cache of a :class:`SubscriptionManager`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    capacity: int | None = None
+
+
+class SubscriptionManager:
+    """Keeps track of subscriptions and resolves the recipients of a topic.
+
+    :class:`TypeSubscription` instances are indexed by topic type and :class:`TypePrefixSubscription`
+    instances are stored in a prefix trie, so resolving the recipients of a topic does not scan
+    every subscription. Other subscription implementations are checked linearly.
+    Adding or removing a subscription only recomputes the recipients of the cached topics
+    that the subscription matches.
+
+    Resolved recipients are kept in an LRU cache of at most ``recipient_cache_capacity`` topics.
+    Evicted topics are resolved again from the indexes on their next use, so topics with unique
+    sources (e.g. one per conversation) do not grow memory for the lifetime of the runtime.
+
+    Args:
+        recipient_cache_capacity (int | None, optional): The maximum number of topics whose recipients
+            are cached. ``None`` disables eviction. Defaults to 10,000.
+    """
+
+    def __init__(self, recipient_cache_capacity: int | None = DEFAULT_RECIPIENT_CACHE_CAPACITY) -> None:
+        if recipient_cache_capacity is not None and recipient_cache_capacity < 1:
+            raise ValueError("recipient_cache_capacity must be a positive integer or None")
+        # Subscriptions keyed by insertion sequence number, used to preserve registration order.
+        self._subscriptions: Dict[int, Subscription] = {}
+        self._next_seq = 0
+        self._seqs_by_id: DefaultDict[str, List[int]] = defaultdict(list)
+        self._type_index: DefaultDict[str, Dict[int, TypeSubscription]] = defaultdict(dict)
+        self._type_keys: Set[Tuple[str, str]] = set()
+        self._prefix_trie = _PrefixTrie()
+        self._other_subscriptions: Dict[int, Subscription] = {}
+        self._seen_topics_by_type: DefaultDict[str, Set[TopicId]] = defaultdict(set)
+        # Sorted seen topic types, so the topics affected by a prefix subscription form a contiguous range.
+        self._sorted_topic_types: List[str] = []
+        # Cached recipients per topic in least recently used order.
+        self._subscribed_recipients: OrderedDict[TopicId, List[AgentId]] = OrderedDict()
+        self._recipient_cache_capacity = recipient_cache_capacity
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
 
     @property
     def subscriptions(self) -> Sequence[Subscription]:
-        return self._subscriptions
+        return list(self._subscriptions.values())
+
+    @property
+    def recipient_cache_stats(self) -> RecipientCacheStats:
+        return RecipientCacheStats(
+            hits=self._cache_hits,
+            misses=self._cache_misses,
+            evictions=self._cache_evictions,
+            size=len(self._subscribed_recipients),
+            capacity=self._recipient_cache_capacity,
+        )
 
     async def add_subscription(self, subscription: Subscription) -> None:
         # Check if the subscription already exists
-        if any(sub == subscription for sub in self._subscriptions):
+        if self._exists(subscription):
             raise ValueError("Subscription already exists")
 
-        self._subscriptions.append(subscription)
-        self._rebuild_subscriptions(self._seen_topics)
+        seq = self._next_seq
+        self._next_seq += 1
+        self._subscriptions[seq] = subscription
+        self._seqs_by_id[subscription.id].append(seq)
+        if _is_plain_type_subscription(subscription):
+            assert isinstance(subscription, TypeSubscription)
+            self._type_index[subscription.topic_type][seq] = subscription
+            self._type_keys.add((subscription.topic_type, subscription.agent_type))
+        elif _is_plain_type_prefix_subscription(subscription):
+            assert isinstance(subscription, TypePrefixSubscription)
+            self._prefix_trie.add(seq, subscription)
+        else:
+            self._other_subscriptions[seq] = subscription
+
+        self._rebuild_subscriptions(self._affected_topics(subscription))
 
     async def remove_subscription(self, id: str) -> None:
         # Check if the subscription exists
-        if not any(sub.id == id for sub in self._subscriptions):
+        seqs = self._seqs_by_id.pop(id, None)
+        if not seqs:
             raise ValueError("Subscription does not exist")
 
-        def is_not_sub(x: Subscription) -> bool:
-            return x.id != id
-
-        self._subscriptions = list(filter(is_not_sub, self._subscriptions))
+        affected: Set[TopicId] = set()
+        for seq in seqs:
+            subscription = self._subscriptions.pop(seq)
+            affected.update(self._affected_topics(subscription))
+            if _is_plain_type_subscription(subscription):
+                assert isinstance(subscription, TypeSubscription)
+                by_seq = self._type_index[subscription.topic_type]
+                del by_seq[seq]
+                if not by_seq:
+                    del self._type_index[subscription.topic_type]
+                self._type_keys.discard((subscription.topic_type, subscription.agent_type))
+            elif _is_plain_type_prefix_subscription(subscription):
+                assert isinstance(subscription, TypePrefixSubscription)
+                self._prefix_trie.remove(seq, subscription)
+            else:
+                del self._other_subscriptions[seq]
 
         # Rebuild the subscriptions
-        self._rebuild_subscriptions(self._seen_topics)
+        self._rebuild_subscriptions(affected)
 
     async def get_subscribed_recipients(self, topic: TopicId) -> List[AgentId]:
-        if topic not in self._seen_topics:
-            self._build_for_new_topic(topic)
+        return self.get_subscribed_recipients_nowait(topic)
+
+    def get_subscribed_recipients_nowait(self, topic: TopicId) -> List[AgentId]:
+        """Synchronous version of :meth:`get_subscribed_recipients`, for callers that must not yield to the event loop."""
+        recipients = self._subscribed_recipients.get(topic)
+        if recipients is not None:
+            self._cache_hits += 1
+            self._subscribed_recipients.move_to_end(topic)
+            return recipients
+
+        self._cache_misses += 1
+        self._build_for_new_topic(topic)
+        if self._recipient_cache_capacity is not None:
+            while len(self._subscribed_recipients) > self._recipient_cache_capacity:
+                self._evict_oldest_topic()
         return self._subscribed_recipients[topic]
 
-    # TODO: optimize this...
+    def _exists(self, subscription: Subscription) -> bool:
+        # An existing plain type or type prefix subscription compares equal to the new one
+        # if the ids match or if they route the same topic type (prefix) to the same agent type.
+        for seq in self._seqs_by_id.get(subscription.id, []):
+            if self._subscriptions[seq] == subscription:
+                return True
+        if isinstance(subscription, TypeSubscription):
+            if (subscription.topic_type, subscription.agent_type) in self._type_keys:
+                return True
+        if isinstance(subscription, TypePrefixSubscription):
+            for _, existing in self._prefix_trie.exact(subscription.topic_type_prefix):
+                if existing == subscription:
+                    return True
+        return any(sub == subscription for sub in self._other_subscriptions.values())
+
+    def _affected_topics(self, subscription: Subscription) -> Set[TopicId]:
+        if _is_plain_type_subscription(subscription):
+            assert isinstance(subscription, TypeSubscription)
+            return set(self._seen_topics_by_type.get(subscription.topic_type, ()))
+        if _is_plain_type_prefix_subscription(subscription):
+            assert isinstance(subscription, TypePrefixSubscription)
+            prefix = subscription.topic_type_prefix
+            affected: Set[TopicId] = set()
+            index = bisect.bisect_left(self._sorted_topic_types, prefix)
+            while index < len(self._sorted_topic_types) and self._sorted_topic_types[index].startswith(prefix):
+                affected.update(self._seen_topics_by_type[self._sorted_topic_types[index]])
+                index += 1
+            return affected
+        return {topic for topic in self._subscribed_recipients if subscription.is_match(topic)}
+
     def _rebuild_subscriptions(self, topics: Set[TopicId]) -> None:
-        self._subscribed_recipients.clear()
         for topic in topics:
             self._build_for_new_topic(topic)
 
     def _build_for_new_topic(self, topic: TopicId) -> None:
-        self._seen_topics.add(topic)
-        for subscription in self._subscriptions:
-            if subscription.is_match(topic):
-                self._subscribed_recipients[topic].append(subscription.map_to_agent(topic))
+        if topic.type not in self._seen_topics_by_type:
+            bisect.insort(self._sorted_topic_types, topic.type)
+        self._seen_topics_by_type[topic.type].add(topic)
+        matches: List[Tuple[int, Subscription]] = list(self._type_index.get(topic.type, {}).items())
+        matches.extend(self._prefix_trie.match(topic.type))
+        matches.extend((seq, sub) for seq, sub in self._other_subscriptions.items() if sub.is_match(topic))
+        # Deliver in subscription registration order.
+        matches.sort(key=lambda match: match[0])
+        self._subscribed_recipients[topic] = [subscription.map_to_agent(topic) for _, subscription in matches]
+
+    def _evict_oldest_topic(self) -> None:
+        topic, _ = self._subscribed_recipients.popitem(last=False)
+        self._cache_evictions += 1
+        topics = self._seen_topics_by_type[topic.type]
+        topics.discard(topic)
+        if not topics:
+            del self._seen_topics_by_type[topic.type]
+            index = bisect.bisect_left(self._sorted_topic_types, topic.type)
+            del self._sorted_topic_types[index]
@@ -1,6 +1,22 @@
 import json
+import weakref
 from dataclasses import asdict, dataclass, fields
-from typing import Any, ClassVar, Dict, List, Protocol, Sequence, TypeVar, cast, get_args, get_origin, runtime_checkable
+from functools import lru_cache
+from operator import attrgetter
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+    get_args,
+    get_origin,
+    runtime_checkable,
+)
 
 from google.protobuf import any_pb2
 from google.protobuf.message import Message
@@ -98,33 +114,105 @@ def has_nested_base_model_in_type(tp: Any) -> bool:
 PROTOBUF_DATA_CONTENT_TYPE = "application/x-protobuf"
 """Protobuf data content type"""
 
+MSGPACK_DATA_CONTENT_TYPE = "application/msgpack"
+"""MessagePack data content type. Requires the `msgpack` package."""
+
+
+@lru_cache(maxsize=None)
+def _msgpack() -> Any:
+    try:
+        import msgpack  # type: ignore[import-untyped, unused-ignore]
+    except ImportError as e:
+        raise ImportError(
+            "The MessagePack content type requires the msgpack package. Run `pip install autogen-core[msgpack]`"
+        ) from e
+    return msgpack
+
+
+# Dataclass -> field names, for dataclasses that passed validation.
+_dataclass_field_names: "weakref.WeakKeyDictionary[type[Any], Tuple[str, ...]]" = weakref.WeakKeyDictionary()
+
+
+def _checked_dataclass_field_names(cls: type[IsDataclass]) -> Tuple[str, ...]:
+    """Validate that the dataclass is supported and return its field names. The result is cached per class."""
+    field_names = _dataclass_field_names.get(cls)
+    if field_names is not None:
+        return field_names
+
+    if contains_a_union(cls):
+        raise ValueError("Dataclass has a union type, which is not supported. To use a union, use a Pydantic model")
+
+    if has_nested_dataclass(cls) or has_nested_base_model(cls):
+        raise ValueError(
+            "Dataclass has nested dataclasses or base models, which are not supported. To use nested types, use a Pydantic model"
+        )
+
+    field_names = tuple(f.name for f in fields(cls))
+    _dataclass_field_names[cls] = field_names
+    return field_names
+
+
+def _encode_default(value: Any) -> Any:
+    # Dataclasses inside containers are converted the same way as by asdict.
+    if is_dataclass(type(value)):
+        return asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+class _DataclassFieldAccessor:
+    """Reads the fields of a flat dataclass into a dict with a precompiled getter, without the deep copy of asdict."""
+
+    def __init__(self, field_names: Tuple[str, ...]) -> None:
+        self._field_names = field_names
+        self._getter = attrgetter(*field_names) if len(field_names) > 1 else None
+
+    def __call__(self, message: Any) -> Dict[str, Any]:
+        if self._getter is not None:
+            return dict(zip(self._field_names, self._getter(message), strict=False))
+        return {name: getattr(message, name) for name in self._field_names}
+
 
 class DataclassJsonMessageSerializer(MessageSerializer[DataclassT]):
     def __init__(self, cls: type[DataclassT]) -> None:
-        if contains_a_union(cls):
-            raise ValueError("Dataclass has a union type, which is not supported. To use a union, use a Pydantic model")
+        self._to_dict = _DataclassFieldAccessor(_checked_dataclass_field_names(cls))
+        self.cls = cls
 
-        if has_nested_dataclass(cls) or has_nested_base_model(cls):
-            raise ValueError(
-                "Dataclass has nested dataclasses or base models, which are not supported. To use nested types, use a Pydantic model"
-            )
+    @property
+    def data_content_type(self) -> str:
+        return JSON_DATA_CONTENT_TYPE
 
+    @property
+    def type_name(self) -> str:
+        return _type_name(self.cls)
+
+    def deserialize(self, payload: bytes) -> DataclassT:
+        return self.cls(**json.loads(payload))
+
+    def serialize(self, message: DataclassT) -> bytes:
+        return json.dumps(self._to_dict(message), default=_encode_default).encode("utf-8")
+
+
+class DataclassMsgpackMessageSerializer(MessageSerializer[DataclassT]):
+    """Serializes dataclasses with MessagePack. Requires the `msgpack` package."""
+
+    def __init__(self, cls: type[DataclassT]) -> None:
+        _msgpack()
+        self._to_dict = _DataclassFieldAccessor(_checked_dataclass_field_names(cls))
         self.cls = cls
 
     @property
     def data_content_type(self) -> str:
-        return JSON_DATA_CONTENT_TYPE
+        return MSGPACK_DATA_CONTENT_TYPE
 
     @property
     def type_name(self) -> str:
         return _type_name(self.cls)
 
     def deserialize(self, payload: bytes) -> DataclassT:
-        message_str = payload.decode("utf-8")
-        return self.cls(**json.loads(message_str))
+        return self.cls(**_msgpack().unpackb(payload))
 
     def serialize(self, message: DataclassT) -> bytes:
-        return json.dumps(asdict(message)).encode("utf-8")
+        return cast(bytes, _msgpack().packb(self._to_dict(message), default=_encode_default))
 
 
 PydanticT = TypeVar("PydanticT", bound=BaseModel)
@@ -150,6 +238,28 @@ def serialize(self, message: PydanticT) -> bytes:
         return message.model_dump_json().encode("utf-8")
 
 
+class PydanticMsgpackMessageSerializer(MessageSerializer[PydanticT]):
+    """Serializes Pydantic models with MessagePack. Requires the `msgpack` package."""
+
+    def __init__(self, cls: type[PydanticT]) -> None:
+        _msgpack()
+        self.cls = cls
+
+    @property
+    def data_content_type(self) -> str:
+        return MSGPACK_DATA_CONTENT_TYPE
+
+    @property
+    def type_name(self) -> str:
+        return _type_name(self.cls)
+
+    def deserialize(self, payload: bytes) -> PydanticT:
+        return self.cls.model_validate(_msgpack().unpackb(payload))
+
+    def serialize(self, message: PydanticT) -> bytes:
+        return cast(bytes, _msgpack().packb(message.model_dump(mode="json")))
+
+
 ProtobufT = TypeVar("ProtobufT", bound=Message)
 
 
@@ -208,17 +318,47 @@ def _type_name(cls: type[Any] | Any) -> str:
 V = TypeVar("V")
 
 
-def try_get_known_serializers_for_type(cls: type[Any]) -> list[MessageSerializer[Any]]:
-    """:meta private:"""
+# Type -> data content type -> serializers. Serializers are stateless, so they are shared between registries.
+_known_serializers: "weakref.WeakKeyDictionary[type[Any], Dict[str | None, Tuple[MessageSerializer[Any], ...]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def try_get_known_serializers_for_type(
+    cls: type[Any], data_content_type: str | None = None
+) -> list[MessageSerializer[Any]]:
+    """:meta private:
+
+    `data_content_type` selects the serializers for a content type. None selects JSON for dataclasses and
+    Pydantic models, and Protobuf for Protobuf messages. The serializers are cached per type.
+    """
+    try:
+        cached = _known_serializers.get(cls)
+    except TypeError:
+        # Not weak referenceable.
+        cached = None
+    if cached is not None and data_content_type in cached:
+        return list(cached[data_content_type])
 
     serializers: List[MessageSerializer[Any]] = []
     if issubclass(cls, BaseModel):
-        serializers.append(PydanticJsonMessageSerializer(cls))
+        if data_content_type in (None, JSON_DATA_CONTENT_TYPE):
+            serializers.append(PydanticJsonMessageSerializer(cls))
+        elif data_content_type == MSGPACK_DATA_CONTENT_TYPE:
+            serializers.append(PydanticMsgpackMessageSerializer(cls))
     elif is_dataclass(cls):
-        serializers.append(DataclassJsonMessageSerializer(cls))
+        if data_content_type in (None, JSON_DATA_CONTENT_TYPE):
+            serializers.append(DataclassJsonMessageSerializer(cls))
+        elif data_content_type == MSGPACK_DATA_CONTENT_TYPE:
+            serializers.append(DataclassMsgpackMessageSerializer(cls))
     elif issubclass(cls, Message):
-        serializers.append(ProtobufMessageSerializer(cls))
+        if data_content_type in (None, PROTOBUF_DATA_CONTENT_TYPE):
+            serializers.append(ProtobufMessageSerializer(cls))
 
+    try:
+        _known_serializers.setdefault(cls, {})[data_content_type] = tuple(serializers)
+    except TypeError:
+        pass
     return serializers
 
 
@@ -0,0 +1,901 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import itertools
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import sys
+import threading
+import uuid
+import zlib
+from asyncio import Future, Queue, Task
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from typing import Any, Awaitable, Callable, DefaultDict, Dict, List, Mapping, Set, Tuple, Type, TypeVar
+
+from ._agent import Agent
+from ._agent_id import AgentId
+from ._agent_metadata import AgentMetadata
+from ._agent_runtime import AgentRuntime
+from ._agent_type import AgentType
+from ._cancellation_token import CancellationToken
+from ._runtime_impl_helpers import SubscriptionManager
+from ._serialization import (
+    JSON_DATA_CONTENT_TYPE,
+    MessageSerializer,
+    SerializationRegistry,
+    try_get_known_serializers_for_type,
+)
+from ._single_threaded_agent_runtime import (
+    PublishMessageEnvelope,
+    ResponseMessageEnvelope,
+    SendMessageEnvelope,
+    SingleThreadedAgentRuntime,
+)
+from ._subscription import Subscription
+from ._topic import TopicId
+
+if sys.version_info >= (3, 13):
+    from asyncio import Queue
+else:
+    from ._queue import Queue  # type: ignore
+
+logger = logging.getLogger("autogen_core")
+
+T = TypeVar("T", bound=Agent)
+
+AgentFactory = Callable[[], Agent | Awaitable[Agent]]
+
+
+def _shard_for(agent_id: AgentId, num_shards: int) -> int:
+    # A stable hash, so that every process maps an agent to the same shard.
+    return zlib.crc32(str(agent_id).encode("utf-8")) % num_shards
+
+
+@dataclass
+class _Payload:
+    type_name: str
+    data_content_type: str
+    data: bytes
+    # Set for types that were not registered before the runtime started, so the receiver can register them too.
+    serializer: MessageSerializer[Any] | None = None
+
+
+@dataclass
+class _SendRequest:
+    request_id: int
+    message: _Payload
+    recipient: AgentId
+    sender: AgentId | None
+    message_id: str
+
+
+@dataclass
+class _PublishRequest:
+    message: _Payload
+    topic_id: TopicId
+    sender: AgentId | None
+    message_id: str
+
+
+@dataclass
+class _ControlRequest:
+    """Calls a method of the shard runtime. No response is sent if `request_id` is None."""
+
+    request_id: int | None
+    method: str
+    args: Tuple[Any, ...]
+
+
+@dataclass
+class _Response:
+    request_id: int
+    result: Any = None
+    error: BaseException | None = None
+
+
+@dataclass
+class _IdleQuery:
+    request_id: int
+
+
+@dataclass
+class _IdleReply:
+    request_id: int
+    idle: bool
+    sent: int
+    received: int
+
+
+@dataclass
+class _Stop:
+    pass
+
+
+@dataclass
+class _Stopped:
+    error: BaseException | None = None
+
+
+# Messages that are not counted when detecting whether all shards are idle.
+_UNCOUNTED_MESSAGES = (_IdleQuery, _IdleReply, _Stop, _Stopped)
+
+_SHARD_METHODS = {
+    "add_message_serializer",
+    "add_subscription",
+    "agent_load_state",
+    "agent_metadata",
+    "agent_save_state",
+    "get",
+    "load_state",
+    "remove_subscription",
+    "save_state",
+}
+
+
+def _portable_exception(exception: BaseException) -> BaseException:
+    """Return the exception if it can be sent to another process, otherwise a generic exception with its message."""
+    try:
+        pickle.dumps(exception)
+    except Exception:
+        return Exception(f"{type(exception).__name__}: {exception}")
+    return exception
+
+
+class _PayloadCodec:
+    """Converts messages to and from payloads using a :class:`SerializationRegistry`."""
+
+    def __init__(self, data_content_type: str = JSON_DATA_CONTENT_TYPE) -> None:
+        self.registry = SerializationRegistry()
+        self._data_content_type = data_content_type
+        self._late_serializers: Dict[str, MessageSerializer[Any]] = {}
+
+    def encode(self, message: Any) -> _Payload | None:
+        if message is None:
+            return None
+        type_name = self.registry.type_name(message)
+        late_serializer = self._late_serializers.get(type_name)
+        if late_serializer is None and not self.registry.is_registered(type_name, self._data_content_type):
+            serializers = try_get_known_serializers_for_type(type(message), self._data_content_type)
+            if not serializers:
+                raise ValueError(
+                    f"Messages of type {type_name} cannot be sent between shards. "
+                    "Use a dataclass, a Pydantic model or a Protobuf message, or add a message serializer."
+                )
+            self.registry.add_serializer(serializers)
+            late_serializer = self._late_serializers[type_name] = serializers[0]
+        data = self.registry.serialize(message, type_name=type_name, data_content_type=self._data_content_type)
+        return _Payload(type_name, self._data_content_type, data, late_serializer)
+
+    def decode(self, payload: _Payload | None) -> Any:
+        if payload is None:
+            return None
+        if payload.serializer is not None and not self.registry.is_registered(
+            payload.type_name, payload.data_content_type
+        ):
+            self.registry.add_serializer(payload.serializer)
+        return self.registry.deserialize(
+            payload.data, type_name=payload.type_name, data_content_type=payload.data_content_type
+        )
+
+
+class _Channel:
+    """Exchanges pickled objects over a pipe connection without blocking the event loop.
+
+    A reader thread hands received objects to the event loop, and a writer thread sends queued objects, so neither
+    side can block the other on a full pipe.
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection = connection
+        # None closes the connection.
+        self._outbox: queue.SimpleQueue[bytes | None] = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+        self.sent = 0
+        self.received = 0
+
+    def start(self, on_message: Callable[[Any], None], on_closed: Callable[[], None]) -> None:
+        loop = asyncio.get_running_loop()
+
+        def _read() -> None:
+            while True:
+                try:
+                    message = pickle.loads(self._connection.recv_bytes())
+                except (EOFError, OSError):
+                    break
+                try:
+                    loop.call_soon_threadsafe(on_message, message)
+                except RuntimeError:
+                    # The event loop is closed.
+                    return
+            try:
+                loop.call_soon_threadsafe(on_closed)
+            except RuntimeError:
+                pass
+
+        def _write() -> None:
+            while True:
+                data = self._outbox.get()
+                if data is None:
+                    return
+                try:
+                    self._connection.send_bytes(data)
+                except OSError:
+                    return
+
+        threading.Thread(target=_read, daemon=True).start()
+        self._writer = threading.Thread(target=_write, daemon=True)
+        self._writer.start()
+
+    def send(self, message: Any) -> None:
+        # Pickle on the caller's side, so that errors are raised to the caller.
+        self._outbox.put(pickle.dumps(message))
+        if not isinstance(message, _UNCOUNTED_MESSAGES):
+            self.sent += 1
+
+    def count_received(self, message: Any) -> None:
+        if not isinstance(message, _UNCOUNTED_MESSAGES):
+            self.received += 1
+
+    async def close(self) -> None:
+        """Send the queued objects and close the connection."""
+        self._outbox.put(None)
+        if self._writer is not None:
+            await asyncio.to_thread(self._writer.join)
+        self._connection.close()
+
+
+class _ShardSubscriptionManager(SubscriptionManager):
+    """A subscription manager that only resolves the recipients that live on its shard."""
+
+    def __init__(self, shard: int, num_shards: int) -> None:
+        super().__init__()
+        self._shard = shard
+        self._num_shards = num_shards
+
+    def get_subscribed_recipients_nowait(self, topic: TopicId) -> List[AgentId]:
+        return [
+            agent_id
+            for agent_id in super().get_subscribed_recipients_nowait(topic)
+            if _shard_for(agent_id, self._num_shards) == self._shard
+        ]
+
+
+class _CountingMessageQueue(Queue[PublishMessageEnvelope | SendMessageEnvelope | ResponseMessageEnvelope]):
+    """An unbounded message queue that counts the envelopes that were put and are not marked done yet."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.unfinished = 0
+
+    async def put(self, item: PublishMessageEnvelope | SendMessageEnvelope | ResponseMessageEnvelope) -> None:
+        # The queue is unbounded, so putting never waits.
+        self.put_nowait(item)
+
+    def put_nowait(self, item: PublishMessageEnvelope | SendMessageEnvelope | ResponseMessageEnvelope) -> None:
+        super().put_nowait(item)
+        self.unfinished += 1
+
+    def task_done(self) -> None:
+        super().task_done()
+        self.unfinished -= 1
+
+    def shutdown(self, immediate: bool = False) -> None:
+        if immediate:
+            # The envelopes discarded by an immediate shutdown are marked done.
+            self.unfinished -= self.qsize()
+        super().shutdown(immediate)  # type: ignore
+
+
+class _ShardRuntime(SingleThreadedAgentRuntime):
+    """The runtime of a shard process. Messages for agents of other shards are forwarded to the parent process."""
+
+    def __init__(self, worker: _ShardWorker, *, ignore_unhandled_exceptions: bool) -> None:
+        super().__init__(ignore_unhandled_exceptions=ignore_unhandled_exceptions)
+        self._worker = worker
+        self._subscription_manager = _ShardSubscriptionManager(worker.shard, worker.num_shards)
+        self._message_queue = _CountingMessageQueue()
+
+    @property
+    def idle(self) -> bool:
+        """Whether every message put in the queue of the shard has been processed."""
+        assert isinstance(self._message_queue, _CountingMessageQueue)
+        return self._message_queue.unfinished == 0
+
+    def _reset_message_queue(self) -> None:
+        super()._reset_message_queue()
+        self._message_queue = _CountingMessageQueue()
+
+    async def send_message(
+        self,
+        message: Any,
+        recipient: AgentId,
+        *,
+        sender: AgentId | None = None,
+        cancellation_token: CancellationToken | None = None,
+        message_id: str | None = None,
+    ) -> Any:
+        if _shard_for(recipient, self._worker.num_shards) == self._worker.shard:
+            return await super().send_message(
+                message, recipient, sender=sender, cancellation_token=cancellation_token, message_id=message_id
+            )
+        if recipient.type not in self._known_agent_names:
+            raise LookupError(f"Agent type '{recipient.type}' does not exist.")
+        return await self._worker.forward_send(message, recipient, sender=sender, message_id=message_id)
+
+    async def publish_message(
+        self,
+        message: Any,
+        topic_id: TopicId,
+        *,
+        sender: AgentId | None = None,
+        cancellation_token: CancellationToken | None = None,
+        message_id: str | None = None,
+    ) -> None:
+        if message_id is None:
+            message_id = str(uuid.uuid4())
+        await super().publish_message(
+            message, topic_id, sender=sender, cancellation_token=cancellation_token, message_id=message_id
+        )
+        self._worker.forward_publish(message, topic_id, sender=sender, message_id=message_id)
+
+    async def deliver_send(self, request: _SendRequest, message: Any) -> Any:
+        return await super().send_message(
+            message, request.recipient, sender=request.sender, message_id=request.message_id
+        )
+
+    async def deliver_publish(self, request: _PublishRequest, message: Any) -> None:
+        await super().publish_message(message, request.topic_id, sender=request.sender, message_id=request.message_id)
+
+
+@dataclass
+class _ShardBootstrap:
+    factories: Dict[str, Tuple[AgentFactory, type[Agent] | None]]
+    subscriptions: List[Subscription]
+    serializers: List[MessageSerializer[Any]]
+    ignore_unhandled_exceptions: bool
+    payload_serialization_format: str
+
+
+class _ShardWorker:
+    """Runs a shard runtime in a worker process and exchanges messages with the parent process."""
+
+    def __init__(self, shard: int, num_shards: int, connection: Connection, bootstrap: _ShardBootstrap) -> None:
+        self.shard = shard
+        self.num_shards = num_shards
+        self._channel = _Channel(connection)
+        self._bootstrap = bootstrap
+        self._codec = _PayloadCodec(bootstrap.payload_serialization_format)
+        self._request_ids = itertools.count()
+        self._pending_requests: Dict[int, Future[Any]] = {}
+        # Requests from the parent process that have not been handed to the runtime yet.
+        self._inflight = 0
+        self._tasks: Set[Task[Any]] = set()
+        self._stopped = asyncio.Event()
+        self._runtime = _ShardRuntime(self, ignore_unhandled_exceptions=bootstrap.ignore_unhandled_exceptions)
+
+    async def run(self) -> None:
+        for agent_type, (factory, expected_class) in self._bootstrap.factories.items():
+            await self._runtime.register_factory(agent_type, factory, expected_class=expected_class)
+        for subscription in self._bootstrap.subscriptions:
+            await self._runtime.add_subscription(subscription)
+        self._runtime.add_message_serializer(self._bootstrap.serializers)
+        self._codec.registry.add_serializer(self._bootstrap.serializers)
+        self._runtime.start()
+        self._channel.start(self._on_message, self._stopped.set)
+        await self._stopped.wait()
+        await self._channel.close()
+
+    async def forward_send(
+        self, message: Any, recipient: AgentId, *, sender: AgentId | None, message_id: str | None
+    ) -> Any:
+        request_id = next(self._request_ids)
+        future: Future[Any] = asyncio.get_running_loop().create_future()
+        self._pending_requests[request_id] = future
+        payload = self._codec.encode(message)
+        assert payload is not None, "Cannot send None as a message."
+        self._channel.send(_SendRequest(request_id, payload, recipient, sender, message_id or str(uuid.uuid4())))
+        return await future
+
+    def forward_publish(self, message: Any, topic_id: TopicId, *, sender: AgentId | None, message_id: str) -> None:
+        payload = self._codec.encode(message)
+        assert payload is not None, "Cannot publish None as a message."
+        self._channel.send(_PublishRequest(payload, topic_id, sender, message_id))
+
+    def _on_message(self, message: Any) -> None:
+        self._channel.count_received(message)
+        match message:
+            case _SendRequest() | _PublishRequest() | _ControlRequest():
+                self._inflight += 1
+                self._spawn(self._handle_request(message))
+            case _Response(request_id=request_id, result=result, error=error):
+                future = self._pending_requests.pop(request_id)
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    try:
+                        future.set_result(self._codec.decode(result))
+                    except Exception as e:
+                        future.set_exception(e)
+            case _IdleQuery(request_id=request_id):
+                idle = self._inflight == 0 and self._runtime.idle
+                self._channel.send(_IdleReply(request_id, idle, self._channel.sent, self._channel.received))
+            case _Stop():
+                self._spawn(self._stop())
+            case _:
+                logger.warning(f"Shard {self.shard} received an unknown message: {message!r}")
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _handle_request(self, request: _SendRequest | _PublishRequest | _ControlRequest) -> None:
+        try:
+            match request:
+                case _SendRequest():
+                    try:
+                        result = self._codec.encode(
+                            await self._runtime.deliver_send(request, self._codec.decode(request.message))
+                        )
+                    except BaseException as e:
+                        self._channel.send(_Response(request.request_id, error=_portable_exception(e)))
+                    else:
+                        self._channel.send(_Response(request.request_id, result=result))
+                case _PublishRequest():
+                    await self._runtime.deliver_publish(request, self._codec.decode(request.message))
+                case _ControlRequest(request_id=request_id, method=method, args=args):
+                    try:
+                        if method not in _SHARD_METHODS:
+                            raise ValueError(f"Unsupported shard method: {method}")
+                        result = getattr(self._runtime, method)(*args)
+                        if inspect.isawaitable(result):
+                            result = await result
+                    except BaseException as e:
+                        if request_id is None:
+                            logger.error(f"Error calling {method} on shard {self.shard}", exc_info=True)
+                        else:
+                            self._channel.send(_Response(request_id, error=_portable_exception(e)))
+                    else:
+                        if request_id is not None:
+                            self._channel.send(_Response(request_id, result=result))
+        except Exception:
+            logger.error(f"Error handling request on shard {self.shard}", exc_info=True)
+        finally:
+            self._inflight -= 1
+
+    async def _stop(self) -> None:
+        error: BaseException | None = None
+        try:
+            await self._runtime.stop()
+        except BaseException as e:
+            error = _portable_exception(e)
+        try:
+            await self._runtime.close()
+        except BaseException as e:
+            error = error or _portable_exception(e)
+        self._channel.send(_Stopped(error))
+        self._stopped.set()
+
+
+def _run_shard(shard: int, num_shards: int, connection: Connection, bootstrap: _ShardBootstrap) -> None:
+    asyncio.run(_ShardWorker(shard, num_shards, connection, bootstrap).run())
+
+
+@dataclass
+class _Shard:
+    process: BaseProcess
+    channel: _Channel
+    stopped: Future[_Stopped]
+
+
+class ShardedAgentRuntime(AgentRuntime):
+    """An agent runtime that spreads agents across worker processes, so that a single machine can use all of its cores.
+
+    Each agent ID is assigned to one of `num_shards` worker processes by a stable hash. Every worker process runs a
+    :class:`~autogen_core.SingleThreadedAgentRuntime` that hosts the agents of its shard. Messages between shards are
+    serialized with the registered message serializers and exchanged over pipes through the parent process, which
+    also holds the subscriptions and routes every published message to the shards that have recipients for it.
+
+    Agent types, subscriptions and message serializers added to the parent runtime are copied to every shard.
+    Agent types must be registered before :meth:`start` is called, because the agent factories are handed to the
+    worker processes when they start.
+
+    .. note::
+
+        Messages and RPC results that cross shards must be dataclasses, Pydantic models or Protobuf messages, or
+        have a serializer added with :meth:`add_message_serializer`. Cancellation tokens are not propagated across
+        shards.
+
+    .. note::
+
+        Worker processes are started with the `mp_context`. With the ``"spawn"`` and ``"forkserver"`` start
+        methods, agent factories, subscriptions and serializers must be picklable, so agent factories must be
+        module-level functions or classes rather than lambdas.
+
+    .. note::
+
+        Agent instances live in the worker processes, so :meth:`register_agent_instance` and
+        :meth:`try_get_underlying_agent_instance` are not supported. Stopping the runtime closes the agents and
+        ends the worker processes; use :meth:`save_state` before stopping to keep the state of the agents.
+
+    Args:
+        num_shards (int | None, optional): The number of worker processes. Defaults to the number of CPUs.
+        mp_context (multiprocessing.context.BaseContext | None, optional): The multiprocessing context used to start
+            the worker processes. Defaults to the default context of the platform.
+        ignore_unhandled_exceptions (bool, optional): Passed to the runtime of every shard. Unhandled exceptions in
+            event handlers are raised by :meth:`stop`, :meth:`stop_when_idle` and :meth:`close`. Defaults to True.
+        idle_poll_interval (float, optional): How often, in seconds, :meth:`stop_when_idle` checks whether all shards
+            are idle. Defaults to 0.05.
+        payload_serialization_format (str, optional): The content type used for messages that cross shards, for
+            example :data:`~autogen_core.MSGPACK_DATA_CONTENT_TYPE`. Serializers for dataclasses and Pydantic models
+            are created for it as needed. Defaults to :data:`~autogen_core.JSON_DATA_CONTENT_TYPE`.
+
+    Example:
+
+        .. code-block:: python
+
+            import asyncio
+            from dataclasses import dataclass
+
+            from autogen_core import (
+                DefaultTopicId,
+                MessageContext,
+                RoutedAgent,
+                ShardedAgentRuntime,
+                default_subscription,
+                message_handler,
+            )
+
+
+            @dataclass
+            class MyMessage:
+                content: str
+
+
+            @default_subscription
+            class MyAgent(RoutedAgent):
+                @message_handler
+                async def handle_my_message(self, message: MyMessage, ctx: MessageContext) -> None:
+                    print(f"{self.id} received: {message.content}")
+
+
+            async def main() -> None:
+                runtime = ShardedAgentRuntime(num_shards=4)
+                await MyAgent.register(runtime, "my_agent", lambda: MyAgent("My agent"))
+
+                runtime.start()
+                await runtime.publish_message(MyMessage("Hello, world!"), DefaultTopicId())
+                await runtime.stop_when_idle()
+
+
+            if __name__ == "__main__":
+                asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        *,
+        num_shards: int | None = None,
+        mp_context: BaseContext | None = None,
+        ignore_unhandled_exceptions: bool = True,
+        idle_poll_interval: float = 0.05,
+        payload_serialization_format: str = JSON_DATA_CONTENT_TYPE,
+    ) -> None:
+        if num_shards is None:
+            num_shards = os.cpu_count() or 1
+        if num_shards < 1:
+            raise ValueError("num_shards must be a positive integer")
+        self._num_shards = num_shards
+        self._mp_context = mp_context or multiprocessing.get_context()
+        self._ignore_unhandled_exceptions = ignore_unhandled_exceptions
+        self._idle_poll_interval = idle_poll_interval
+        self._agent_factories: Dict[str, Tuple[AgentFactory, type[Agent] | None]] = {}
+        self._subscription_manager = SubscriptionManager()
+        self._serializers: List[MessageSerializer[Any]] = []
+        self._payload_serialization_format = payload_serialization_format
+        self._codec = _PayloadCodec(payload_serialization_format)
+        self._shards: List[_Shard] = []
+        self._request_ids = itertools.count()
+        # Request id -> (future, target shard) for requests made by this process.
+        self._pending_requests: Dict[int, Tuple[Future[Any], int]] = {}
+        # Request id -> (origin shard, origin request id, target shard) for requests routed between shards.
+        self._forwarded_requests: Dict[int, Tuple[int, int, int]] = {}
+
+    @property
+    def num_shards(self) -> int:
+        """The number of worker processes."""
+        return self._num_shards
+
+    def shard_for(self, agent_id: AgentId) -> int:
+        """The index of the shard that hosts the agent."""
+        return _shard_for(agent_id, self._num_shards)
+
+    @property
+    def _running(self) -> bool:
+        return len(self._shards) > 0
+
+    def start(self) -> None:
+        """Start the worker processes. Must be called from within a running event loop."""
+        if self._running:
+            raise RuntimeError("Runtime is already started")
+        loop = asyncio.get_running_loop()
+        bootstrap = _ShardBootstrap(
+            factories=dict(self._agent_factories),
+            subscriptions=list(self._subscription_manager.subscriptions),
+            serializers=list(self._serializers),
+            ignore_unhandled_exceptions=self._ignore_unhandled_exceptions,
+            payload_serialization_format=self._payload_serialization_format,
+        )
+        connections: List[Connection] = []
+        for shard in range(self._num_shards):
+            parent_connection, child_connection = self._mp_context.Pipe()
+            process = self._mp_context.Process(  # type: ignore[attr-defined]
+                target=_run_shard,
+                args=(shard, self._num_shards, child_connection, bootstrap),
+                name=f"autogen-shard-{shard}",
+                daemon=True,
+            )
+            process.start()
+            child_connection.close()
+            connections.append(parent_connection)
+            self._shards.append(_Shard(process, _Channel(parent_connection), loop.create_future()))
+        # The reader and writer threads are only started once all processes are forked.
+        for shard, entry in enumerate(self._shards):
+            entry.channel.start(partial(self._on_message, shard), partial(self._on_closed, shard, entry))
+
+    async def stop(self) -> None:
+        """Stop the worker processes immediately. Messages that are still being processed are discarded."""
+        if not self._running:
+            raise RuntimeError("Runtime is not started")
+        shards = self._shards
+        for shard in shards:
+            shard.channel.send(_Stop())
+        results = [await shard.stopped for shard in shards]
+        for shard in shards:
+            await asyncio.to_thread(shard.process.join)
+            await shard.channel.close()
+        self._shards = []
+        for future, _ in self._pending_requests.values():
+            if not future.done():
+                future.set_exception(RuntimeError("Runtime was stopped."))
+        self._pending_requests.clear()
+        self._forwarded_requests.clear()
+        for result in results:
+            if result.error is not None:
+                raise result.error
+
+    async def stop_when_idle(self) -> None:
+        """Stop the worker processes once no shard is processing a message and no message is in transit."""
+        if not self._running:
+            raise RuntimeError("Runtime is not started")
+        previous: Tuple[int, ...] | None = None
+        while True:
+            snapshot = await self._idle_snapshot()
+            # All shards must report the same counters twice in a row, so that no message was in transit between
+            # the shards while they were being asked.
+            if snapshot is not None and snapshot == previous:
+                break
+            previous = snapshot
+            await asyncio.sleep(self._idle_poll_interval)
+        await self.stop()
+
+    async def close(self) -> None:
+        """Stop the runtime if it is running. The agents are closed in their worker processes."""
+        if self._running:
+            await self.stop()
+
+    async def _idle_snapshot(self) -> Tuple[int, ...] | None:
+        """Return the message counters of all shards if they are idle and all sent messages were received."""
+        replies: List[_IdleReply] = await asyncio.gather(
+            *[self._request(shard, lambda request_id: _IdleQuery(request_id)) for shard in range(self._num_shards)]
+        )
+        if not all(reply.idle for reply in replies):
+            return None
+        sent = sum(shard.channel.sent for shard in self._shards)
+        received = sum(shard.channel.received for shard in self._shards)
+        if sent != sum(reply.received for reply in replies) or received != sum(reply.sent for reply in replies):
+            return None
+        return tuple(itertools.chain.from_iterable((reply.sent, reply.received) for reply in replies))
+
+    def _request(self, shard: int, make_request: Callable[[int], Any]) -> Future[Any]:
+        if not self._running:
+            raise RuntimeError("Runtime is not started")
+        request_id = next(self._request_ids)
+        future: Future[Any] = asyncio.get_running_loop().create_future()
+        self._pending_requests[request_id] = (future, shard)
+        try:
+            self._shards[shard].channel.send(make_request(request_id))
+        except BaseException:
+            del self._pending_requests[request_id]
+            raise
+        return future
+
+    async def _call(self, shard: int, method: str, *args: Any) -> Any:
+        response: _Response = await self._request(shard, lambda request_id: _ControlRequest(request_id, method, args))
+        return response.result
+
+    def _broadcast(self, method: str, *args: Any) -> None:
+        for shard in self._shards:
+            shard.channel.send(_ControlRequest(None, method, args))
+
+    def _on_message(self, shard: int, message: Any) -> None:
+        self._shards[shard].channel.count_received(message)
+        match message:
+            case _SendRequest(recipient=recipient, request_id=origin_request_id):
+                target = _shard_for(recipient, self._num_shards)
+                request_id = next(self._request_ids)
+                self._forwarded_requests[request_id] = (shard, origin_request_id, target)
+                message.request_id = request_id
+                self._shards[target].channel.send(message)
+            case _PublishRequest():
+                # The origin shard has already delivered the message to its own recipients.
+                for target in self._shards_for_topic(message.topic_id, message.sender) - {shard}:
+                    self._shards[target].channel.send(message)
+            case _Response(request_id=request_id) | _IdleReply(request_id=request_id):
+                if request_id in self._forwarded_requests:
+                    origin, origin_request_id, _ = self._forwarded_requests.pop(request_id)
+                    assert isinstance(message, _Response)
+                    message.request_id = origin_request_id
+                    self._shards[origin].channel.send(message)
+                elif request_id in self._pending_requests:
+                    future, _ = self._pending_requests.pop(request_id)
+                    if future.done():
+                        return
+                    if isinstance(message, _Response) and message.error is not None:
+                        future.set_exception(message.error)
+                    else:
+                        future.set_result(message)
+            case _Stopped():
+                if not self._shards[shard].stopped.done():
+                    self._shards[shard].stopped.set_result(message)
+            case _:
+                logger.warning(f"Received an unknown message from shard {shard}: {message!r}")
+
+    def _on_closed(self, shard: int, entry: _Shard) -> None:
+        if entry.stopped.done():
+            return
+        logger.error(f"Shard {shard} exited unexpectedly.")
+        error = RuntimeError(f"Shard {shard} exited unexpectedly.")
+        entry.stopped.set_result(_Stopped(error))
+        for request_id, (future, target) in list(self._pending_requests.items()):
+            if target == shard:
+                del self._pending_requests[request_id]
+                if not future.done():
+                    future.set_exception(error)
+        for request_id, (origin, origin_request_id, target) in list(self._forwarded_requests.items()):
+            if target == shard:
+                del self._forwarded_requests[request_id]
+                self._shards[origin].channel.send(_Response(origin_request_id, error=error))
+
+    def _shards_for_topic(self, topic_id: TopicId, sender: AgentId | None) -> Set[int]:
+        return {
+            _shard_for(agent_id, self._num_shards)
+            for agent_id in self._subscription_manager.get_subscribed_recipients_nowait(topic_id)
+            if agent_id != sender
+        }
+
+    async def send_message(
+        self,
+        message: Any,
+        recipient: AgentId,
+        *,
+        sender: AgentId | None = None,
+        cancellation_token: CancellationToken | None = None,
+        message_id: str | None = None,
+    ) -> Any:
+        if recipient.type not in self._agent_factories:
+            raise LookupError(f"Agent type '{recipient.type}' does not exist.")
+        if message_id is None:
+            message_id = str(uuid.uuid4())
+        payload = self._codec.encode(message)
+        assert payload is not None, "Cannot send None as a message."
+        response: _Response = await self._request(
+            _shard_for(recipient, self._num_shards),
+            lambda request_id: _SendRequest(request_id, payload, recipient, sender, message_id),
+        )
+        return self._codec.decode(response.result)
+
+    async def publish_message(
+        self,
+        message: Any,
+        topic_id: TopicId,
+        *,
+        sender: AgentId | None = None,
+        cancellation_token: CancellationToken | None = None,
+        message_id: str | None = None,
+    ) -> None:
+        if not self._running:
+            raise RuntimeError("Runtime is not started")
+        if message_id is None:
+            message_id = str(uuid.uuid4())
+        targets = self._shards_for_topic(topic_id, sender)
+        if not targets:
+            return
+        payload = self._codec.encode(message)
+        assert payload is not None, "Cannot publish None as a message."
+        request = _PublishRequest(payload, topic_id, sender, message_id)
+        for target in targets:
+            self._shards[target].channel.send(request)
+
+    async def register_factory(
+        self,
+        type: str | AgentType,
+        agent_factory: Callable[[], T | Awaitable[T]],
+        *,
+        expected_class: Type[T] | None = None,
+    ) -> AgentType:
+        if isinstance(type, str):
+            type = AgentType(type)
+        if self._running:
+            raise RuntimeError("Agent types must be registered before the runtime is started.")
+        if type.type in self._agent_factories:
+            raise ValueError(f"Agent with type {type} already exists.")
+        self._agent_factories[type.type] = (agent_factory, expected_class)
+        return type
+
+    async def register_agent_instance(self, agent_instance: Agent, agent_id: AgentId) -> AgentId:
+        raise NotImplementedError("Agent instances cannot be registered with a sharded runtime.")
+
+    # TODO: uncomment out the following type ignore when this is fixed in mypy: https://github.com/python/mypy/issues/3737
+    async def try_get_underlying_agent_instance(self, id: AgentId, type: Type[T] = Agent) -> T:  # type: ignore[assignment]
+        raise NotImplementedError("Agent instances live in the worker processes of a sharded runtime.")
+
+    async def get(
+        self, id_or_type: AgentId | AgentType | str, /, key: str = "default", *, lazy: bool = True
+    ) -> AgentId:
+        if isinstance(id_or_type, AgentId):
+            agent_id = id_or_type
+        else:
+            agent_id = AgentId(id_or_type if isinstance(id_or_type, str) else id_or_type.type, key)
+        if not lazy:
+            await self._call(_shard_for(agent_id, self._num_shards), "get", agent_id)
+        return agent_id
+
+    async def save_state(self) -> Mapping[str, Any]:
+        state: Dict[str, Any] = {}
+        for shard_state in await asyncio.gather(
+            *[self._call(shard, "save_state") for shard in range(self._num_shards)]
+        ):
+            state.update(shard_state)
+        return state
+
+    async def load_state(self, state: Mapping[str, Any]) -> None:
+        shard_states: DefaultDict[int, Dict[str, Any]] = defaultdict(dict)
+        for agent_id_str, agent_state in state.items():
+            shard_states[_shard_for(AgentId.from_str(agent_id_str), self._num_shards)][agent_id_str] = agent_state
+        await asyncio.gather(
+            *[self._call(shard, "load_state", shard_state) for shard, shard_state in shard_states.items()]
+        )
+
+    async def agent_metadata(self, agent: AgentId) -> AgentMetadata:
+        return await self._call(_shard_for(agent, self._num_shards), "agent_metadata", agent)  # type: ignore[no-any-return]
+
+    async def agent_save_state(self, agent: AgentId) -> Mapping[str, Any]:
+        return await self._call(_shard_for(agent, self._num_shards), "agent_save_state", agent)  # type: ignore[no-any-return]
+
+    async def agent_load_state(self, agent: AgentId, state: Mapping[str, Any]) -> None:
+        await self._call(_shard_for(agent, self._num_shards), "agent_load_state", agent, state)
+
+    async def add_subscription(self, subscription: Subscription) -> None:
+        await self._subscription_manager.add_subscription(subscription)
+        self._broadcast("add_subscription", subscription)
+
+    async def remove_subscription(self, id: str) -> None:
+        await self._subscription_manager.remove_subscription(id)
+        self._broadcast("remove_subscription", id)
+
+    def add_message_serializer(self, serializer: MessageSerializer[Any] | Sequence[MessageSerializer[Any]]) -> None:
+        serializers = list(serializer) if isinstance(serializer, Sequence) else [serializer]
+        self._serializers.extend(serializers)
+        self._codec.registry.add_serializer(serializers)
+        self._broadcast("add_message_serializer", serializers)
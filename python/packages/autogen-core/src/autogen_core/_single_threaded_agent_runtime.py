@@ -5,17 +5,21 @@
 import json
 import logging
 import sys
+import time
 import uuid
 import warnings
 from asyncio import CancelledError, Future, Queue, Task
+from collections import OrderedDict, deque
 from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import partial
 from typing import Any, Awaitable, Callable, Dict, List, Mapping, ParamSpec, Set, Type, TypeVar, cast
 
 from opentelemetry.trace import TracerProvider
 
 from .logging import (
     AgentConstructionExceptionEvent,
+    DeferredPayload,
     DeliveryStage,
     MessageDroppedEvent,
     MessageEvent,
@@ -32,19 +36,21 @@
 from ._agent import Agent
 from ._agent_id import AgentId
 from ._agent_instantiation import AgentInstantiationContext
+from ._agent_mailboxes import AgentMailboxes
 from ._agent_metadata import AgentMetadata
+from ._agent_passivation import AgentPassivationPolicy, AgentPassivationStats
 from ._agent_runtime import AgentRuntime
 from ._agent_type import AgentType
 from ._cancellation_token import CancellationToken
 from ._intervention import DropMessage, InterventionHandler
 from ._message_context import MessageContext
 from ._message_handler_context import MessageHandlerContext
-from ._runtime_impl_helpers import SubscriptionManager, get_impl
+from ._runtime_impl_helpers import DEFAULT_RECIPIENT_CACHE_CAPACITY, SubscriptionManager, get_impl
 from ._serialization import JSON_DATA_CONTENT_TYPE, MessageSerializer, SerializationRegistry
 from ._subscription import Subscription
 from ._telemetry import EnvelopeMetadata, MessageRuntimeTracingConfig, TraceHelper, get_telemetry_envelope_metadata
 from ._topic import TopicId
-from .exceptions import MessageDroppedException
+from .exceptions import MessageDroppedException, RuntimeOverloadedError
 
 logger = logging.getLogger("autogen_core")
 event_logger = logging.getLogger("autogen_core.events")
@@ -65,6 +71,8 @@ class PublishMessageEnvelope:
     topic_id: TopicId
     metadata: EnvelopeMetadata | None = None
     message_id: str
+    payload: DeferredPayload | None = None
+    holds_queue_slot: bool = False
 
 
 @dataclass(kw_only=True)
@@ -79,6 +87,9 @@ class SendMessageEnvelope:
     cancellation_token: CancellationToken
     metadata: EnvelopeMetadata | None = None
     message_id: str
+    payload: DeferredPayload | None = None
+    holds_queue_slot: bool = False
+    from_handler: bool = False
 
 
 @dataclass(kw_only=True)
@@ -90,6 +101,7 @@ class ResponseMessageEnvelope:
     sender: AgentId
     recipient: AgentId | None
     metadata: EnvelopeMetadata | None = None
+    payload: DeferredPayload | None = None
 
 
 P = ParamSpec("P")
@@ -101,6 +113,27 @@ def __init__(self, runtime: SingleThreadedAgentRuntime) -> None:
         self._runtime = runtime
         self._run_task = asyncio.create_task(self._run())
         self._stopped = asyncio.Event()
+        self._passivation_task: Task[None] | None = None
+        policy = runtime._passivation_policy  # type: ignore
+        if policy is not None and policy.idle_timeout is not None:
+            self._passivation_task = asyncio.create_task(self._run_passivation(policy.sweep_interval))
+
+    async def _run_passivation(self, sweep_interval: float) -> None:
+        while True:
+            await asyncio.sleep(sweep_interval)
+            try:
+                await self._runtime._passivate_idle_agents()  # type: ignore
+            except Exception:
+                logger.error("Error passivating idle agents", exc_info=True)
+
+    async def _stop_passivation(self) -> None:
+        if self._passivation_task is None:
+            return
+        self._passivation_task.cancel()
+        try:
+            await self._passivation_task
+        except CancelledError:
+            pass
 
     async def _run(self) -> None:
         while True:
@@ -110,12 +143,14 @@ async def _run(self) -> None:
             await self._runtime._process_next()  # type: ignore
 
     async def stop(self) -> None:
+        await self._stop_passivation()
         self._stopped.set()
         self._runtime._message_queue.shutdown(immediate=True)  # type: ignore
         await self._run_task
 
     async def stop_when_idle(self) -> None:
         await self._runtime._message_queue.join()  # type: ignore
+        await self._stop_passivation()
         self._stopped.set()
         self._runtime._message_queue.shutdown(immediate=True)  # type: ignore
         await self._run_task
@@ -129,6 +164,14 @@ async def check_condition() -> None:
         await asyncio.create_task(check_condition())
 
 
+def _in_message_handler() -> bool:
+    try:
+        MessageHandlerContext.agent_id()
+    except RuntimeError:
+        return False
+    return True
+
+
 def _warn_if_none(value: Any, handler_name: str) -> None:
     """
     Utility function to check if the intervention handler returned None and issue a warning.
@@ -161,6 +204,13 @@ class SingleThreadedAgentRuntime(AgentRuntime):
             handlers that can intercept messages before they are sent or published. Defaults to None.
         tracer_provider (TracerProvider, optional): The tracer provider to use for tracing. Defaults to None.
         ignore_unhandled_exceptions (bool, optional): Whether to ignore unhandled exceptions in that occur in agent event handlers. Any background exceptions will be raised on the next call to `process_next` or from an awaited `stop`, `stop_when_idle` or `stop_when`. Note, this does not apply to RPC handlers. Defaults to True.
+        recipient_cache_capacity (int | None, optional): The maximum number of topics whose subscribed recipients are cached. The least recently used topics are evicted and resolved again on their next use. Set to None to cache every topic ever published to. Defaults to 10,000.
+        max_queue_size (int, optional): The maximum number of messages sent or published from outside of message handlers that can be waiting to be processed. When the limit is reached, :meth:`send_message` and :meth:`publish_message` wait for capacity, or raise :class:`~autogen_core.exceptions.RuntimeOverloadedError` if `block_on_full_queue` is False. Messages sent or published by agents from within their message handlers are always accepted, so agents cannot deadlock on a full queue. 0 means unbounded. Defaults to 0.
+        max_concurrent_handlers (int, optional): The maximum number of message envelopes whose handlers run concurrently. Further messages wait in the runtime until a handler finishes. Responses and RPC messages sent from within message handlers are not limited, so nested `send_message` calls cannot deadlock. Defaults to None, which means unlimited.
+        block_on_full_queue (bool, optional): Whether :meth:`send_message` and :meth:`publish_message` wait for capacity when `max_queue_size` is reached, instead of raising :class:`~autogen_core.exceptions.RuntimeOverloadedError`. Defaults to True.
+        passivation_policy (AgentPassivationPolicy, optional): A policy for saving the state of least recently used or idle agents and dropping their instances. Passivated agents are re-created with their factory and their state is restored the next time they are needed. See :class:`~autogen_core.AgentPassivationPolicy`. Defaults to None, which keeps all instantiated agents in memory.
+        ordered_dispatch (bool, optional): Whether to deliver messages to each agent one at a time, in the order they were dequeued. Each agent ID gets a mailbox whose handlers never overlap, while different agents are still processed concurrently, so agents do not need their own locks to handle messages sequentially. An agent that sends an RPC to itself, directly or through other agents, waits forever for the response in this mode. Defaults to False, which runs every message handler as soon as the message is dequeued.
+        dispatch_workers (int, optional): The maximum number of agents that handle messages at the same time when `ordered_dispatch` is True. Agents with outstanding messages take turns on the workers. RPC messages sent from within message handlers are not limited, so nested `send_message` calls cannot deadlock on the workers. Defaults to None, which means unlimited.
 
     Examples:
 
@@ -251,17 +301,49 @@ def __init__(
         intervention_handlers: List[InterventionHandler] | None = None,
         tracer_provider: TracerProvider | None = None,
         ignore_unhandled_exceptions: bool = True,
+        recipient_cache_capacity: int | None = DEFAULT_RECIPIENT_CACHE_CAPACITY,
+        passivation_policy: AgentPassivationPolicy | None = None,
+        max_queue_size: int = 0,
+        max_concurrent_handlers: int | None = None,
+        block_on_full_queue: bool = True,
+        ordered_dispatch: bool = False,
+        dispatch_workers: int | None = None,
     ) -> None:
+        if dispatch_workers is not None and not ordered_dispatch:
+            raise ValueError("dispatch_workers requires ordered_dispatch")
+        if max_queue_size < 0:
+            raise ValueError("max_queue_size must be non-negative")
+        if max_concurrent_handlers is not None and max_concurrent_handlers < 1:
+            raise ValueError("max_concurrent_handlers must be a positive integer or None")
         self._tracer_helper = TraceHelper(tracer_provider, MessageRuntimeTracingConfig("SingleThreadedAgentRuntime"))
         self._message_queue: Queue[PublishMessageEnvelope | SendMessageEnvelope | ResponseMessageEnvelope] = Queue()
         # (namespace, type) -> List[AgentId]
         self._agent_factories: Dict[
             str, Callable[[], Agent | Awaitable[Agent]] | Callable[[AgentRuntime, AgentId], Agent | Awaitable[Agent]]
         ] = {}
-        self._instantiated_agents: Dict[AgentId, Agent] = {}
+        # Instantiated agents in least recently used order.
+        self._instantiated_agents: OrderedDict[AgentId, Agent] = OrderedDict()
+        self._passivation_policy = passivation_policy
+        # Agents registered as instances cannot be re-created by a factory and are never passivated.
+        self._pinned_agents: Set[AgentId] = set()
+        self._active_handler_counts: Dict[AgentId, int] = {}
+        self._last_used: Dict[AgentId, float] = {}
+        self._passivated_agents: Set[AgentId] = set()
+        self._passivating_agents: Dict[AgentId, asyncio.Event] = {}
+        self._passivation_count = 0
+        self._rehydration_count = 0
+        # Queue capacity for messages sent or published from outside of message handlers.
+        self._queue_slots = asyncio.Semaphore(max_queue_size) if max_queue_size > 0 else None
+        self._held_queue_slots = 0
+        self._block_on_full_queue = block_on_full_queue
+        self._max_concurrent_handlers = max_concurrent_handlers
+        self._running_limited_handlers = 0
+        # Envelopes that were dequeued while all handler slots were in use.
+        self._pending_envelopes: deque[SendMessageEnvelope | PublishMessageEnvelope] = deque()
+        self._mailboxes = AgentMailboxes(dispatch_workers) if ordered_dispatch else None
         self._intervention_handlers = intervention_handlers
         self._background_tasks: Set[Task[Any]] = set()
-        self._subscription_manager = SubscriptionManager()
+        self._subscription_manager = SubscriptionManager(recipient_cache_capacity=recipient_cache_capacity)
         self._run_context: RunContext | None = None
         self._serialization_registry = SerializationRegistry()
         self._ignore_unhandled_handler_exceptions = ignore_unhandled_exceptions
@@ -274,23 +356,47 @@ def unprocessed_messages_count(
     ) -> int:
         return self._message_queue.qsize()
 
+    @property
+    def passivation_stats(self) -> AgentPassivationStats:
+        """The number of resident and passivated agents, and how often agents were passivated and re-created."""
+        return AgentPassivationStats(
+            resident=len(self._instantiated_agents),
+            passivated=len(self._passivated_agents),
+            passivations=self._passivation_count,
+            rehydrations=self._rehydration_count,
+        )
+
     @property
     def _known_agent_names(self) -> Set[str]:
         return set(self._agent_factories.keys())
 
-    async def _create_otel_attributes(
+    def _agent_class_name(self, agent_id: AgentId) -> str | None:
+        """Return the class name of the agent if it is known, without instantiating the agent."""
+        agent = self._instantiated_agents.get(agent_id)
+        if agent is not None:
+            return agent.__class__.__name__
+        agent_class = self._agent_instance_types.get(agent_id.type)
+        return agent_class.__name__ if agent_class is not None else None
+
+    def _create_otel_attributes(
         self,
         sender_agent_id: AgentId | None = None,
         recipient_agent_id: AgentId | None = None,
         message_context: MessageContext | None = None,
         message: Any = None,
+        payload: DeferredPayload | None = None,
     ) -> Mapping[str, str]:
         """Create OpenTelemetry attributes for the given agent and message.
 
+        The agents are not instantiated, and the message is serialized, so this should only be called
+        when the span is recording.
+
         Args:
-            sender_agent (Agent, optional): The sender agent instance.
-            recipient_agent (Agent, optional): The recipient agent instance.
+            sender_agent_id (AgentId, optional): The sender agent id.
+            recipient_agent_id (AgentId, optional): The recipient agent id.
             message (Any): The message instance.
+            payload (DeferredPayload, optional): The shared serialized payload of the message envelope.
+                If provided, it is used instead of serializing the message again.
 
         Returns:
             Attributes: A dictionary of OpenTelemetry attributes.
@@ -298,14 +404,12 @@ async def _create_otel_attributes(
         if not sender_agent_id and not recipient_agent_id and not message:
             return {}
         attributes: Dict[str, str] = {}
-        if sender_agent_id:
-            sender_agent = await self._get_agent(sender_agent_id)
-            attributes["sender_agent_type"] = sender_agent.id.type
-            attributes["sender_agent_class"] = sender_agent.__class__.__name__
-        if recipient_agent_id:
-            recipient_agent = await self._get_agent(recipient_agent_id)
-            attributes["recipient_agent_type"] = recipient_agent.id.type
-            attributes["recipient_agent_class"] = recipient_agent.__class__.__name__
+        for prefix, agent_id in (("sender", sender_agent_id), ("recipient", recipient_agent_id)):
+            if agent_id:
+                attributes[f"{prefix}_agent_type"] = agent_id.type
+                agent_class_name = self._agent_class_name(agent_id)
+                if agent_class_name is not None:
+                    attributes[f"{prefix}_agent_class"] = agent_class_name
 
         if message_context:
             serialized_message_context = {
@@ -318,7 +422,7 @@ async def _create_otel_attributes(
 
         if message:
             try:
-                serialized_message = self._try_serialize(message)
+                serialized_message = payload.value if payload is not None else self._try_serialize(message)
             except Exception as e:
                 serialized_message = str(e)
         else:
@@ -343,15 +447,17 @@ async def send_message(
         if message_id is None:
             message_id = str(uuid.uuid4())
 
-        event_logger.info(
-            MessageEvent(
-                payload=self._try_serialize(message),
-                sender=sender,
-                receiver=recipient,
-                kind=MessageKind.DIRECT,
-                delivery_stage=DeliveryStage.SEND,
+        payload = self._deferred_payload(message)
+        if event_logger.isEnabledFor(logging.INFO):
+            event_logger.info(
+                MessageEvent(
+                    payload=payload,
+                    sender=sender,
+                    receiver=recipient,
+                    kind=MessageKind.DIRECT,
+                    delivery_stage=DeliveryStage.SEND,
+                )
             )
-        )
 
         with self._tracer_helper.trace_block(
             "create",
@@ -364,9 +470,11 @@ async def send_message(
                 future.set_exception(Exception("Recipient not found"))
                 return await future
 
-            content = message.__dict__ if hasattr(message, "__dict__") else message
-            logger.info(f"Sending message of type {type(message).__name__} to {recipient.type}: {content}")
+            if logger.isEnabledFor(logging.INFO):
+                content = message.__dict__ if hasattr(message, "__dict__") else message
+                logger.info(f"Sending message of type {type(message).__name__} to {recipient.type}: {content}")
 
+            from_handler = _in_message_handler()
             await self._message_queue.put(
                 SendMessageEnvelope(
                     message=message,
@@ -376,6 +484,9 @@ async def send_message(
                     sender=sender,
                     metadata=get_telemetry_envelope_metadata(),
                     message_id=message_id,
+                    payload=payload,
+                    holds_queue_slot=await self._acquire_queue_slot(from_handler),
+                    from_handler=from_handler,
                 )
             )
 
@@ -400,21 +511,24 @@ async def publish_message(
         ):
             if cancellation_token is None:
                 cancellation_token = CancellationToken()
-            content = message.__dict__ if hasattr(message, "__dict__") else message
-            logger.info(f"Publishing message of type {type(message).__name__} to all subscribers: {content}")
+            if logger.isEnabledFor(logging.INFO):
+                content = message.__dict__ if hasattr(message, "__dict__") else message
+                logger.info(f"Publishing message of type {type(message).__name__} to all subscribers: {content}")
 
             if message_id is None:
                 message_id = str(uuid.uuid4())
 
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(message),
-                    sender=sender,
-                    receiver=topic_id,
-                    kind=MessageKind.PUBLISH,
-                    delivery_stage=DeliveryStage.SEND,
+            payload = self._deferred_payload(message)
+            if event_logger.isEnabledFor(logging.INFO):
+                event_logger.info(
+                    MessageEvent(
+                        payload=payload,
+                        sender=sender,
+                        receiver=topic_id,
+                        kind=MessageKind.PUBLISH,
+                        delivery_stage=DeliveryStage.SEND,
+                    )
                 )
-            )
 
             await self._message_queue.put(
                 PublishMessageEnvelope(
@@ -424,6 +538,8 @@ async def publish_message(
                     topic_id=topic_id,
                     metadata=get_telemetry_envelope_metadata(),
                     message_id=message_id,
+                    payload=payload,
+                    holds_queue_slot=await self._acquire_queue_slot(_in_message_handler()),
                 )
             )
 
@@ -441,8 +557,13 @@ async def save_state(self) -> Mapping[str, Any]:
 
         """
         state: Dict[str, Dict[str, Any]] = {}
-        for agent_id in self._instantiated_agents:
+        for agent_id in list(self._instantiated_agents):
             state[str(agent_id)] = dict(await (await self._get_agent(agent_id)).save_state())
+        if self._passivation_policy is not None:
+            for agent_id in self._passivated_agents:
+                saved_state = self._passivation_policy.state_store.get(str(agent_id))
+                if saved_state is not None:
+                    state[str(agent_id)] = dict(saved_state)
         return state
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
@@ -469,78 +590,92 @@ async def _process_send(self, message_envelope: SendMessageEnvelope) -> None:
             if recipient.type not in self._known_agent_names:
                 raise LookupError(f"Agent type '{recipient.type}' does not exist.")
 
+            payload = self._envelope_payload(message_envelope)
             try:
-                sender_id = str(message_envelope.sender) if message_envelope.sender is not None else "Unknown"
-                logger.info(
-                    f"Calling message handler for {recipient} with message type {type(message_envelope.message).__name__} sent by {sender_id}"
-                )
-                event_logger.info(
-                    MessageEvent(
-                        payload=self._try_serialize(message_envelope.message),
-                        sender=message_envelope.sender,
-                        receiver=recipient,
-                        kind=MessageKind.DIRECT,
-                        delivery_stage=DeliveryStage.DELIVER,
+                if logger.isEnabledFor(logging.INFO):
+                    sender_id = str(message_envelope.sender) if message_envelope.sender is not None else "Unknown"
+                    logger.info(
+                        f"Calling message handler for {recipient} with message type {type(message_envelope.message).__name__} sent by {sender_id}"
                     )
-                )
-                recipient_agent = await self._get_agent(recipient)
-
-                message_context = MessageContext(
-                    sender=message_envelope.sender,
-                    topic_id=None,
-                    is_rpc=True,
-                    cancellation_token=message_envelope.cancellation_token,
-                    message_id=message_envelope.message_id,
-                )
-                with self._tracer_helper.trace_block(
-                    "process",
-                    recipient_agent.id,
-                    parent=message_envelope.metadata,
-                    attributes=await self._create_otel_attributes(
-                        sender_agent_id=message_envelope.sender,
-                        recipient_agent_id=recipient,
-                        message_context=message_context,
-                        message=message_envelope.message,
-                    ),
-                ):
-                    with MessageHandlerContext.populate_context(recipient_agent.id):
-                        response = await recipient_agent.on_message(
-                            message_envelope.message,
-                            ctx=message_context,
+                if event_logger.isEnabledFor(logging.INFO):
+                    event_logger.info(
+                        MessageEvent(
+                            payload=payload,
+                            sender=message_envelope.sender,
+                            receiver=recipient,
+                            kind=MessageKind.DIRECT,
+                            delivery_stage=DeliveryStage.DELIVER,
                         )
+                    )
+                recipient_agent = await self._get_agent(recipient)
+                self._mark_agent_busy(recipient)
+                try:
+                    message_context = MessageContext(
+                        sender=message_envelope.sender,
+                        topic_id=None,
+                        is_rpc=True,
+                        cancellation_token=message_envelope.cancellation_token,
+                        message_id=message_envelope.message_id,
+                    )
+                    with self._tracer_helper.trace_block(
+                        "process",
+                        recipient_agent.id,
+                        parent=message_envelope.metadata,
+                    ) as span:
+                        if span.is_recording():
+                            span.set_attributes(
+                                self._create_otel_attributes(
+                                    sender_agent_id=message_envelope.sender,
+                                    recipient_agent_id=recipient,
+                                    message_context=message_context,
+                                    message=message_envelope.message,
+                                    payload=payload,
+                                )
+                            )
+                        with MessageHandlerContext.populate_context(recipient_agent.id):
+                            response = await recipient_agent.on_message(
+                                message_envelope.message,
+                                ctx=message_context,
+                            )
+                finally:
+                    await self._mark_agent_idle(recipient)
             except CancelledError as e:
                 if not message_envelope.future.cancelled():
                     message_envelope.future.set_exception(e)
                 self._message_queue.task_done()
-                event_logger.info(
-                    MessageHandlerExceptionEvent(
-                        payload=self._try_serialize(message_envelope.message),
-                        handling_agent=recipient,
-                        exception=e,
+                if event_logger.isEnabledFor(logging.INFO):
+                    event_logger.info(
+                        MessageHandlerExceptionEvent(
+                            payload=payload,
+                            handling_agent=recipient,
+                            exception=e,
+                        )
                     )
-                )
                 return
             except BaseException as e:
                 message_envelope.future.set_exception(e)
                 self._message_queue.task_done()
-                event_logger.info(
-                    MessageHandlerExceptionEvent(
-                        payload=self._try_serialize(message_envelope.message),
-                        handling_agent=recipient,
-                        exception=e,
+                if event_logger.isEnabledFor(logging.INFO):
+                    event_logger.info(
+                        MessageHandlerExceptionEvent(
+                            payload=payload,
+                            handling_agent=recipient,
+                            exception=e,
+                        )
                     )
-                )
                 return
 
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(response),
-                    sender=message_envelope.recipient,
-                    receiver=message_envelope.sender,
-                    kind=MessageKind.RESPOND,
-                    delivery_stage=DeliveryStage.SEND,
+            response_payload = self._deferred_payload(response)
+            if event_logger.isEnabledFor(logging.INFO):
+                event_logger.info(
+                    MessageEvent(
+                        payload=response_payload,
+                        sender=message_envelope.recipient,
+                        receiver=message_envelope.sender,
+                        kind=MessageKind.RESPOND,
+                        delivery_stage=DeliveryStage.SEND,
+                    )
                 )
-            )
 
             await self._message_queue.put(
                 ResponseMessageEnvelope(
@@ -549,36 +684,40 @@ async def _process_send(self, message_envelope: SendMessageEnvelope) -> None:
                     sender=message_envelope.recipient,
                     recipient=message_envelope.sender,
                     metadata=get_telemetry_envelope_metadata(),
+                    payload=response_payload,
                 )
             )
             self._message_queue.task_done()
 
     async def _process_publish(self, message_envelope: PublishMessageEnvelope) -> None:
         with self._tracer_helper.trace_block("publish", message_envelope.topic_id, parent=message_envelope.metadata):
+            # Recipients are kept from being passivated until all handlers have finished.
+            busy_agents: List[AgentId] = []
             try:
                 responses: List[Awaitable[Any]] = []
                 recipients = await self._subscription_manager.get_subscribed_recipients(message_envelope.topic_id)
+                # The payload is serialized at most once and shared across all recipients.
+                payload = self._envelope_payload(message_envelope)
                 for agent_id in recipients:
                     # Avoid sending the message back to the sender
                     if message_envelope.sender is not None and agent_id == message_envelope.sender:
                         continue
 
-                    sender_agent = (
-                        await self._get_agent(message_envelope.sender) if message_envelope.sender is not None else None
-                    )
-                    sender_name = str(sender_agent.id) if sender_agent is not None else "Unknown"
-                    logger.info(
-                        f"Calling message handler for {agent_id.type} with message type {type(message_envelope.message).__name__} published by {sender_name}"
-                    )
-                    event_logger.info(
-                        MessageEvent(
-                            payload=self._try_serialize(message_envelope.message),
-                            sender=message_envelope.sender,
-                            receiver=None,
-                            kind=MessageKind.PUBLISH,
-                            delivery_stage=DeliveryStage.DELIVER,
+                    if logger.isEnabledFor(logging.INFO):
+                        sender_name = str(message_envelope.sender) if message_envelope.sender is not None else "Unknown"
+                        logger.info(
+                            f"Calling message handler for {agent_id.type} with message type {type(message_envelope.message).__name__} published by {sender_name}"
+                        )
+                    if event_logger.isEnabledFor(logging.INFO):
+                        event_logger.info(
+                            MessageEvent(
+                                payload=payload,
+                                sender=message_envelope.sender,
+                                receiver=None,
+                                kind=MessageKind.PUBLISH,
+                                delivery_stage=DeliveryStage.DELIVER,
+                            )
                         )
-                    )
                     message_context = MessageContext(
                         sender=message_envelope.sender,
                         topic_id=message_envelope.topic_id,
@@ -587,37 +726,10 @@ async def _process_publish(self, message_envelope: PublishMessageEnvelope) -> No
                         message_id=message_envelope.message_id,
                     )
                     agent = await self._get_agent(agent_id)
+                    self._mark_agent_busy(agent_id)
+                    busy_agents.append(agent_id)
 
-                    async def _on_message(agent: Agent, message_context: MessageContext) -> Any:
-                        with self._tracer_helper.trace_block(
-                            "process",
-                            agent.id,
-                            parent=message_envelope.metadata,
-                            attributes=await self._create_otel_attributes(
-                                sender_agent_id=message_envelope.sender,
-                                recipient_agent_id=agent.id,
-                                message_context=message_context,
-                                message=message_envelope.message,
-                            ),
-                        ):
-                            with MessageHandlerContext.populate_context(agent.id):
-                                try:
-                                    return await agent.on_message(
-                                        message_envelope.message,
-                                        ctx=message_context,
-                                    )
-                                except BaseException as e:
-                                    logger.error(f"Error processing publish message for {agent.id}", exc_info=True)
-                                    event_logger.info(
-                                        MessageHandlerExceptionEvent(
-                                            payload=self._try_serialize(message_envelope.message),
-                                            handling_agent=agent.id,
-                                            exception=e,
-                                        )
-                                    )
-                                    raise e
-
-                    future = _on_message(agent, message_context)
+                    future = self._handle_published(agent, message_envelope, message_context, payload)
                     responses.append(future)
 
                 await asyncio.gather(*responses)
@@ -625,37 +737,149 @@ async def _on_message(agent: Agent, message_context: MessageContext) -> Any:
                 if not self._ignore_unhandled_handler_exceptions:
                     self._background_exception = e
             finally:
+                for agent_id in busy_agents:
+                    await self._mark_agent_idle(agent_id)
                 self._message_queue.task_done()
             # TODO if responses are given for a publish
 
+    async def _handle_published(
+        self,
+        agent: Agent,
+        message_envelope: PublishMessageEnvelope,
+        message_context: MessageContext,
+        payload: DeferredPayload,
+    ) -> Any:
+        with self._tracer_helper.trace_block("process", agent.id, parent=message_envelope.metadata) as span:
+            if span.is_recording():
+                span.set_attributes(
+                    self._create_otel_attributes(
+                        sender_agent_id=message_envelope.sender,
+                        recipient_agent_id=agent.id,
+                        message_context=message_context,
+                        message=message_envelope.message,
+                        payload=payload,
+                    )
+                )
+            with MessageHandlerContext.populate_context(agent.id):
+                try:
+                    return await agent.on_message(
+                        message_envelope.message,
+                        ctx=message_context,
+                    )
+                except BaseException as e:
+                    logger.error(f"Error processing publish message for {agent.id}", exc_info=True)
+                    if event_logger.isEnabledFor(logging.INFO):
+                        event_logger.info(
+                            MessageHandlerExceptionEvent(
+                                payload=payload,
+                                handling_agent=agent.id,
+                                exception=e,
+                            )
+                        )
+                    raise e
+
+    def _submit_publish(
+        self, message_envelope: PublishMessageEnvelope, on_done: Callable[[], None] | None = None
+    ) -> None:
+        """Append a published message to the mailbox of every recipient, in ordered dispatch mode."""
+        assert self._mailboxes is not None
+        try:
+            recipients = [
+                agent_id
+                for agent_id in self._subscription_manager.get_subscribed_recipients_nowait(message_envelope.topic_id)
+                if agent_id != message_envelope.sender
+            ]
+        except BaseException as e:
+            recipients = []
+            if not self._ignore_unhandled_handler_exceptions:
+                self._background_exception = e
+        payload = self._envelope_payload(message_envelope)
+        remaining = len(recipients)
+
+        def _finish() -> None:
+            self._message_queue.task_done()
+            if on_done is not None:
+                on_done()
+
+        if remaining == 0:
+            _finish()
+            return
+
+        async def _deliver(agent_id: AgentId) -> None:
+            nonlocal remaining
+            try:
+                if logger.isEnabledFor(logging.INFO):
+                    sender_name = str(message_envelope.sender) if message_envelope.sender is not None else "Unknown"
+                    logger.info(
+                        f"Calling message handler for {agent_id.type} with message type {type(message_envelope.message).__name__} published by {sender_name}"
+                    )
+                if event_logger.isEnabledFor(logging.INFO):
+                    event_logger.info(
+                        MessageEvent(
+                            payload=payload,
+                            sender=message_envelope.sender,
+                            receiver=None,
+                            kind=MessageKind.PUBLISH,
+                            delivery_stage=DeliveryStage.DELIVER,
+                        )
+                    )
+                message_context = MessageContext(
+                    sender=message_envelope.sender,
+                    topic_id=message_envelope.topic_id,
+                    is_rpc=False,
+                    cancellation_token=message_envelope.cancellation_token,
+                    message_id=message_envelope.message_id,
+                )
+                agent = await self._get_agent(agent_id)
+                self._mark_agent_busy(agent_id)
+                try:
+                    await self._handle_published(agent, message_envelope, message_context, payload)
+                finally:
+                    await self._mark_agent_idle(agent_id)
+            except BaseException as e:
+                if not self._ignore_unhandled_handler_exceptions:
+                    self._background_exception = e
+            finally:
+                remaining -= 1
+                if remaining == 0:
+                    _finish()
+
+        for agent_id in recipients:
+            self._mailboxes.submit(agent_id, partial(_deliver, agent_id))
+
     async def _process_response(self, message_envelope: ResponseMessageEnvelope) -> None:
+        payload = self._envelope_payload(message_envelope)
         with self._tracer_helper.trace_block(
-            "ack",
-            message_envelope.recipient,
-            parent=message_envelope.metadata,
-            attributes=await self._create_otel_attributes(
-                sender_agent_id=message_envelope.sender,
-                recipient_agent_id=message_envelope.recipient,
-                message=message_envelope.message,
-            ),
-        ):
-            content = (
-                message_envelope.message.__dict__
-                if hasattr(message_envelope.message, "__dict__")
-                else message_envelope.message
-            )
-            logger.info(
-                f"Resolving response with message type {type(message_envelope.message).__name__} for recipient {message_envelope.recipient} from {message_envelope.sender.type}: {content}"
-            )
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(message_envelope.message),
-                    sender=message_envelope.sender,
-                    receiver=message_envelope.recipient,
-                    kind=MessageKind.RESPOND,
-                    delivery_stage=DeliveryStage.DELIVER,
+            "ack", message_envelope.recipient, parent=message_envelope.metadata
+        ) as span:
+            if span.is_recording():
+                span.set_attributes(
+                    self._create_otel_attributes(
+                        sender_agent_id=message_envelope.sender,
+                        recipient_agent_id=message_envelope.recipient,
+                        message=message_envelope.message,
+                        payload=payload,
+                    )
+                )
+            if logger.isEnabledFor(logging.INFO):
+                content = (
+                    message_envelope.message.__dict__
+                    if hasattr(message_envelope.message, "__dict__")
+                    else message_envelope.message
+                )
+                logger.info(
+                    f"Resolving response with message type {type(message_envelope.message).__name__} for recipient {message_envelope.recipient} from {message_envelope.sender.type}: {content}"
+                )
+            if event_logger.isEnabledFor(logging.INFO):
+                event_logger.info(
+                    MessageEvent(
+                        payload=payload,
+                        sender=message_envelope.sender,
+                        receiver=message_envelope.recipient,
+                        kind=MessageKind.RESPOND,
+                        delivery_stage=DeliveryStage.DELIVER,
+                    )
                 )
-            )
             if not message_envelope.future.cancelled():
                 message_envelope.future.set_result(message_envelope.message)
             self._message_queue.task_done()
@@ -685,6 +909,21 @@ async def _process_next(self) -> None:
                 raise e from None
             return
 
+        pending = False
+        try:
+            pending = await self._process_envelope(message_envelope)
+        finally:
+            # Envelopes waiting for a handler slot keep their queue slot until they are started.
+            if not pending and not isinstance(message_envelope, ResponseMessageEnvelope):
+                self._release_queue_slot(message_envelope)
+
+        # Yield control to the message loop to allow other tasks to run
+        await asyncio.sleep(0)
+
+    async def _process_envelope(
+        self, message_envelope: SendMessageEnvelope | PublishMessageEnvelope | ResponseMessageEnvelope
+    ) -> bool:
+        """Run intervention handlers and dispatch the envelope. Returns whether it is waiting for a handler slot."""
         match message_envelope:
             case SendMessageEnvelope(message=message, sender=sender, recipient=recipient, future=future):
                 if self._intervention_handlers is not None:
@@ -706,23 +945,28 @@ async def _process_next(self) -> None:
                                 _warn_if_none(temp_message, "on_send")
                             except BaseException as e:
                                 future.set_exception(e)
-                                return
+                                return False
                             if temp_message is DropMessage or isinstance(temp_message, DropMessage):
-                                event_logger.info(
-                                    MessageDroppedEvent(
-                                        payload=self._try_serialize(message),
-                                        sender=sender,
-                                        receiver=recipient,
-                                        kind=MessageKind.DIRECT,
+                                if event_logger.isEnabledFor(logging.INFO):
+                                    event_logger.info(
+                                        MessageDroppedEvent(
+                                            payload=self._deferred_payload(message),
+                                            sender=sender,
+                                            receiver=recipient,
+                                            kind=MessageKind.DIRECT,
+                                        )
                                     )
-                                )
                                 future.set_exception(MessageDroppedException())
-                                return
+                                return False
 
                         message_envelope.message = temp_message
-                task = asyncio.create_task(self._process_send(message_envelope))
-                self._background_tasks.add(task)
-                task.add_done_callback(self._background_tasks.discard)
+                    # Intervention handlers may have replaced or mutated the message.
+                    message_envelope.payload = None
+                if message_envelope.from_handler:
+                    # Nested RPCs are not limited: the sending handler holds a slot while it waits for the response.
+                    self._start_envelope(message_envelope)
+                    return False
+                return self._dispatch_limited(message_envelope)
             case PublishMessageEnvelope(
                 message=message,
                 sender=sender,
@@ -746,23 +990,24 @@ async def _process_next(self) -> None:
                             except BaseException as e:
                                 # TODO: we should raise the intervention exception to the publisher.
                                 logger.error(f"Exception raised in in intervention handler: {e}", exc_info=True)
-                                return
+                                return False
                             if temp_message is DropMessage or isinstance(temp_message, DropMessage):
-                                event_logger.info(
-                                    MessageDroppedEvent(
-                                        payload=self._try_serialize(message),
-                                        sender=sender,
-                                        receiver=topic_id,
-                                        kind=MessageKind.PUBLISH,
+                                if event_logger.isEnabledFor(logging.INFO):
+                                    event_logger.info(
+                                        MessageDroppedEvent(
+                                            payload=self._deferred_payload(message),
+                                            sender=sender,
+                                            receiver=topic_id,
+                                            kind=MessageKind.PUBLISH,
+                                        )
                                     )
-                                )
-                                return
+                                return False
 
                         message_envelope.message = temp_message
+                    # Intervention handlers may have replaced or mutated the message.
+                    message_envelope.payload = None
 
-                task = asyncio.create_task(self._process_publish(message_envelope))
-                self._background_tasks.add(task)
-                task.add_done_callback(self._background_tasks.discard)
+                return self._dispatch_limited(message_envelope)
             case ResponseMessageEnvelope(message=message, sender=sender, recipient=recipient, future=future):
                 if self._intervention_handlers is not None:
                     for handler in self._intervention_handlers:
@@ -772,25 +1017,112 @@ async def _process_next(self) -> None:
                         except BaseException as e:
                             # TODO: should we raise the exception to sender of the response instead?
                             future.set_exception(e)
-                            return
+                            return False
                         if temp_message is DropMessage or isinstance(temp_message, DropMessage):
-                            event_logger.info(
-                                MessageDroppedEvent(
-                                    payload=self._try_serialize(message),
-                                    sender=sender,
-                                    receiver=recipient,
-                                    kind=MessageKind.RESPOND,
+                            if event_logger.isEnabledFor(logging.INFO):
+                                event_logger.info(
+                                    MessageDroppedEvent(
+                                        payload=self._deferred_payload(message),
+                                        sender=sender,
+                                        receiver=recipient,
+                                        kind=MessageKind.RESPOND,
+                                    )
                                 )
-                            )
                             future.set_exception(MessageDroppedException())
-                            return
+                            return False
                         message_envelope.message = temp_message
-                task = asyncio.create_task(self._process_response(message_envelope))
-                self._background_tasks.add(task)
-                task.add_done_callback(self._background_tasks.discard)
-
-        # Yield control to the message loop to allow other tasks to run
-        await asyncio.sleep(0)
+                    # Intervention handlers may have replaced or mutated the message.
+                    message_envelope.payload = None
+                self._start_envelope(message_envelope)
+        return False
+
+    def _dispatch_limited(self, message_envelope: SendMessageEnvelope | PublishMessageEnvelope) -> bool:
+        """Start the envelope if a handler slot is free, otherwise keep it pending. Returns whether it is pending."""
+        if self._max_concurrent_handlers is None:
+            self._start_envelope(message_envelope)
+            return False
+        if self._running_limited_handlers >= self._max_concurrent_handlers:
+            self._pending_envelopes.append(message_envelope)
+            return True
+        self._running_limited_handlers += 1
+        self._start_envelope(message_envelope, on_done=self._on_limited_handler_done)
+        return False
+
+    def _on_limited_handler_done(self) -> None:
+        self._running_limited_handlers -= 1
+        if self._pending_envelopes:
+            message_envelope = self._pending_envelopes.popleft()
+            self._release_queue_slot(message_envelope)
+            self._running_limited_handlers += 1
+            self._start_envelope(message_envelope, on_done=self._on_limited_handler_done)
+
+    def _start_envelope(
+        self,
+        message_envelope: SendMessageEnvelope | PublishMessageEnvelope | ResponseMessageEnvelope,
+        on_done: Callable[[], None] | None = None,
+    ) -> None:
+        if self._mailboxes is not None:
+            match message_envelope:
+                case SendMessageEnvelope():
+                    self._mailboxes.submit(
+                        message_envelope.recipient,
+                        partial(self._process_send_then, message_envelope, on_done),
+                        unlimited=message_envelope.from_handler,
+                    )
+                    return
+                case PublishMessageEnvelope():
+                    self._submit_publish(message_envelope, on_done)
+                    return
+                case _:
+                    pass
+        coro: Awaitable[None]
+        match message_envelope:
+            case SendMessageEnvelope():
+                coro = self._process_send(message_envelope)
+            case PublishMessageEnvelope():
+                coro = self._process_publish(message_envelope)
+            case ResponseMessageEnvelope():
+                coro = self._process_response(message_envelope)
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        if on_done is not None:
+            task.add_done_callback(lambda _: on_done())
+
+    async def _process_send_then(
+        self, message_envelope: SendMessageEnvelope, on_done: Callable[[], None] | None = None
+    ) -> None:
+        try:
+            await self._process_send(message_envelope)
+        finally:
+            if on_done is not None:
+                on_done()
+
+    async def _acquire_queue_slot(self, from_handler: bool) -> bool:
+        """Wait for queue capacity for a new message. Returns whether a queue slot was taken."""
+        if self._queue_slots is None or from_handler:
+            return False
+        if self._queue_slots.locked() and not self._block_on_full_queue:
+            raise RuntimeOverloadedError("The runtime message queue is full.")
+        await self._queue_slots.acquire()
+        self._held_queue_slots += 1
+        return True
+
+    def _release_queue_slot(self, message_envelope: SendMessageEnvelope | PublishMessageEnvelope) -> None:
+        if message_envelope.holds_queue_slot:
+            assert self._queue_slots is not None
+            message_envelope.holds_queue_slot = False
+            self._held_queue_slots -= 1
+            self._queue_slots.release()
+
+    def _reset_message_queue(self) -> None:
+        self._message_queue = Queue()
+        # Messages discarded with the old queue give their capacity back.
+        self._pending_envelopes.clear()
+        if self._queue_slots is not None:
+            for _ in range(self._held_queue_slots):
+                self._queue_slots.release()
+        self._held_queue_slots = 0
 
     def start(self) -> None:
         """Start the runtime message processing loop. This runs in a background task.
@@ -825,7 +1157,7 @@ async def close(self) -> None:
         if self._run_context is not None:
             await self.stop()
         # close all the agents that have been instantiated
-        for agent_id in self._instantiated_agents:
+        for agent_id in list(self._instantiated_agents):
             agent = await self._get_agent(agent_id)
             await agent.close()
 
@@ -838,7 +1170,7 @@ async def stop(self) -> None:
             await self._run_context.stop()
         finally:
             self._run_context = None
-            self._message_queue = Queue()
+            self._reset_message_queue()
 
     async def stop_when_idle(self) -> None:
         """Stop the runtime message processing loop when there is
@@ -850,7 +1182,7 @@ async def stop_when_idle(self) -> None:
             await self._run_context.stop_when_idle()
         finally:
             self._run_context = None
-            self._message_queue = Queue()
+            self._reset_message_queue()
 
     async def stop_when(self, condition: Callable[[], bool]) -> None:
         """Stop the runtime message processing loop when the condition is met.
@@ -871,7 +1203,7 @@ async def stop_when(self, condition: Callable[[], bool]) -> None:
         await self._run_context.stop_when(condition)
 
         self._run_context = None
-        self._message_queue = Queue()
+        self._reset_message_queue()
 
     async def agent_metadata(self, agent: AgentId) -> AgentMetadata:
         return (await self._get_agent(agent)).metadata
@@ -882,6 +1214,27 @@ async def agent_save_state(self, agent: AgentId) -> Mapping[str, Any]:
     async def agent_load_state(self, agent: AgentId, state: Mapping[str, Any]) -> None:
         await (await self._get_agent(agent)).load_state(state)
 
+    async def remove_agent(self, agent: AgentId) -> None:
+        """Close and drop the instance of an agent, e.g., when the conversation it takes part in is over.
+
+        The agent type stays registered, so a new instance is created by its factory if the agent
+        receives another message. The state of the agent is not saved.
+
+        Args:
+            agent (AgentId): The agent to remove. Nothing happens if the agent has not been instantiated.
+
+        Raises:
+            ValueError: If the agent was registered with :meth:`register_agent_instance`.
+        """
+        if agent in self._pinned_agents:
+            raise ValueError(f"Agent {agent} was registered as an instance and cannot be removed.")
+        instance = self._instantiated_agents.pop(agent, None)
+        self._last_used.pop(agent, None)
+        # A removed agent is not restored from the state it was passivated with.
+        self._passivated_agents.discard(agent)
+        if instance is not None:
+            await instance.close()
+
     async def register_factory(
         self,
         type: str | AgentType,
@@ -935,6 +1288,7 @@ def agent_factory() -> Agent:
 
         await agent_instance.bind_id_and_runtime(id=agent_id, runtime=self)
         self._instantiated_agents[agent_id] = agent_instance
+        self._pinned_agents.add(agent_id)
         return agent_id
 
     async def _invoke_agent_factory(
@@ -973,16 +1327,116 @@ async def _invoke_agent_factory(
 
     async def _get_agent(self, agent_id: AgentId) -> Agent:
         if agent_id in self._instantiated_agents:
+            if self._passivation_policy is not None:
+                self._touch_agent(agent_id)
             return self._instantiated_agents[agent_id]
 
         if agent_id.type not in self._agent_factories:
             raise LookupError(f"Agent with name {agent_id.type} not found.")
 
         agent_factory = self._agent_factories[agent_id.type]
+        if self._passivation_policy is None:
+            agent = await self._invoke_agent_factory(agent_factory, agent_id)
+            self._instantiated_agents[agent_id] = agent
+            return agent
+
+        # Wait for an in-progress passivation to finish saving the state of this agent.
+        passivating = self._passivating_agents.get(agent_id)
+        if passivating is not None:
+            await passivating.wait()
+            if agent_id in self._instantiated_agents:
+                return await self._get_agent(agent_id)
+
         agent = await self._invoke_agent_factory(agent_factory, agent_id)
+        if agent_id in self._passivated_agents:
+            saved_state = self._passivation_policy.state_store.get(str(agent_id))
+            if saved_state is not None:
+                await agent.load_state(saved_state)
+            self._passivated_agents.discard(agent_id)
+            self._rehydration_count += 1
         self._instantiated_agents[agent_id] = agent
+        self._touch_agent(agent_id)
+        await self._passivate_excess_agents(exclude=agent_id)
         return agent
 
+    def _touch_agent(self, agent_id: AgentId) -> None:
+        self._instantiated_agents.move_to_end(agent_id)
+        self._last_used[agent_id] = time.monotonic()
+
+    def _mark_agent_busy(self, agent_id: AgentId) -> None:
+        self._active_handler_counts[agent_id] = self._active_handler_counts.get(agent_id, 0) + 1
+
+    async def _mark_agent_idle(self, agent_id: AgentId) -> None:
+        count = self._active_handler_counts.get(agent_id, 0) - 1
+        if count > 0:
+            self._active_handler_counts[agent_id] = count
+            return
+        self._active_handler_counts.pop(agent_id, None)
+        if self._passivation_policy is not None and agent_id in self._instantiated_agents:
+            self._touch_agent(agent_id)
+            # Agents that were busy when the limit was exceeded can be passivated now.
+            await self._passivate_excess_agents()
+
+    def _can_passivate(self, agent_id: AgentId) -> bool:
+        return agent_id not in self._pinned_agents and agent_id not in self._active_handler_counts
+
+    async def _passivate_excess_agents(self, exclude: AgentId | None = None) -> None:
+        assert self._passivation_policy is not None
+        max_resident_agents = self._passivation_policy.max_resident_agents
+        if max_resident_agents is None:
+            return
+        excess = len(self._instantiated_agents) - max_resident_agents
+        if excess <= 0:
+            return
+        candidates: List[AgentId] = []
+        # Iterate from the least recently used agent.
+        for agent_id in self._instantiated_agents:
+            if len(candidates) == excess:
+                break
+            if agent_id != exclude and self._can_passivate(agent_id):
+                candidates.append(agent_id)
+        for agent_id in candidates:
+            await self._passivate_agent(agent_id)
+
+    async def _passivate_idle_agents(self) -> None:
+        assert self._passivation_policy is not None
+        idle_timeout = self._passivation_policy.idle_timeout
+        if idle_timeout is None:
+            return
+        now = time.monotonic()
+        candidates: List[AgentId] = []
+        # Iterate from the least recently used agent and stop at the first recently used one.
+        for agent_id in self._instantiated_agents:
+            if agent_id in self._pinned_agents:
+                continue
+            if now - self._last_used.get(agent_id, now) < idle_timeout:
+                break
+            if self._can_passivate(agent_id):
+                candidates.append(agent_id)
+        for agent_id in candidates:
+            await self._passivate_agent(agent_id)
+
+    async def _passivate_agent(self, agent_id: AgentId) -> None:
+        assert self._passivation_policy is not None
+        agent = self._instantiated_agents.pop(agent_id)
+        self._last_used.pop(agent_id, None)
+        passivating = asyncio.Event()
+        self._passivating_agents[agent_id] = passivating
+        try:
+            saved_state = await agent.save_state()
+            self._passivation_policy.state_store.set(str(agent_id), saved_state)
+            self._passivated_agents.add(agent_id)
+            self._passivation_count += 1
+            await agent.close()
+        except Exception:
+            logger.error(f"Error passivating agent {agent_id}, keeping it resident", exc_info=True)
+            if agent_id not in self._instantiated_agents and agent_id not in self._passivated_agents:
+                self._instantiated_agents[agent_id] = agent
+                self._touch_agent(agent_id)
+        finally:
+            del self._passivating_agents[agent_id]
+            passivating.set()
+
     # TODO: uncomment out the following type ignore when this is fixed in mypy: https://github.com/python/mypy/issues/3737
     async def try_get_underlying_agent_instance(self, id: AgentId, type: Type[T] = Agent) -> T:  # type: ignore[assignment]
         if id.type not in self._agent_factories:
@@ -1017,6 +1471,16 @@ async def get(
     def add_message_serializer(self, serializer: MessageSerializer[Any] | Sequence[MessageSerializer[Any]]) -> None:
         self._serialization_registry.add_serializer(serializer)
 
+    def _deferred_payload(self, message: Any) -> DeferredPayload:
+        return DeferredPayload(lambda: self._try_serialize(message))
+
+    def _envelope_payload(
+        self, message_envelope: SendMessageEnvelope | PublishMessageEnvelope | ResponseMessageEnvelope
+    ) -> DeferredPayload:
+        if message_envelope.payload is None:
+            message_envelope.payload = self._deferred_payload(message_envelope.message)
+        return message_envelope.payload
+
     def _try_serialize(self, message: Any) -> str:
         try:
             type_name = self._serialization_registry.type_name(message)
@@ -1,4 +1,10 @@
-__all__ = ["CantHandleException", "UndeliverableException", "MessageDroppedException", "NotAccessibleError"]
+__all__ = [
+    "CantHandleException",
+    "UndeliverableException",
+    "MessageDroppedException",
+    "NotAccessibleError",
+    "RuntimeOverloadedError",
+]
 
 
 class CantHandleException(Exception):
@@ -15,3 +21,8 @@ class MessageDroppedException(Exception):
 
 class NotAccessibleError(Exception):
     """Tried to access a value that is not accessible. For example if it is remote cannot be accessed locally."""
+
+
+class RuntimeOverloadedError(Exception):
+    """Raised when a message can't be accepted because the runtime's message queue is full,
+    or when a session can't be admitted because a team pool has too many waiting sessions."""
@@ -1,6 +1,6 @@
 import json
 from enum import Enum
-from typing import Any, Dict, List, cast
+from typing import Any, Callable, Dict, List, cast
 
 from ._agent_id import AgentId
 from ._message_handler_context import MessageHandlerContext
@@ -210,24 +210,65 @@ class DeliveryStage(Enum):
     DELIVER = 2
 
 
+class DeferredPayload:
+    """A message payload that is only serialized when it is first accessed.
+
+    The runtime creates one deferred payload per message envelope and shares it
+    between all events logged for that envelope, so a message is serialized at most
+    once, and not at all when no handler formats the event.
+
+    Args:
+        serialize (Callable[[], str]): A callable that produces the serialized payload.
+    """
+
+    __slots__ = ("_serialize", "_value")
+
+    def __init__(self, serialize: Callable[[], str]) -> None:
+        self._serialize: Callable[[], str] | None = serialize
+        self._value: str | None = None
+
+    @property
+    def value(self) -> str:
+        if self._value is None:
+            assert self._serialize is not None
+            self._value = self._serialize()
+            # Release the reference to the message once it has been serialized.
+            self._serialize = None
+        return self._value
+
+    def __str__(self) -> str:
+        return self.value
+
+
+def _resolve_payload(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    payload = kwargs.get("payload")
+    if isinstance(payload, DeferredPayload):
+        kwargs["payload"] = payload.value
+    return kwargs
+
+
 class MessageEvent:
     def __init__(
         self,
         *,
-        payload: str,
+        payload: str | DeferredPayload,
         sender: AgentId | None,
         receiver: AgentId | TopicId | None,
         kind: MessageKind,
         delivery_stage: DeliveryStage,
         **kwargs: Any,
     ) -> None:
-        self.kwargs = kwargs
-        self.kwargs["payload"] = payload
-        self.kwargs["sender"] = None if sender is None else str(sender)
-        self.kwargs["receiver"] = None if receiver is None else str(receiver)
-        self.kwargs["kind"] = str(kind)
-        self.kwargs["delivery_stage"] = str(delivery_stage)
-        self.kwargs["type"] = "Message"
+        self._kwargs = kwargs
+        self._kwargs["payload"] = payload
+        self._kwargs["sender"] = None if sender is None else str(sender)
+        self._kwargs["receiver"] = None if receiver is None else str(receiver)
+        self._kwargs["kind"] = str(kind)
+        self._kwargs["delivery_stage"] = str(delivery_stage)
+        self._kwargs["type"] = "Message"
+
+    @property
+    def kwargs(self) -> Dict[str, Any]:
+        return _resolve_payload(self._kwargs)
 
     # This must output the event in a json serializable format
     def __str__(self) -> str:
@@ -238,18 +279,22 @@ class MessageDroppedEvent:
     def __init__(
         self,
         *,
-        payload: str,
+        payload: str | DeferredPayload,
         sender: AgentId | None,
         receiver: AgentId | TopicId | None,
         kind: MessageKind,
         **kwargs: Any,
     ) -> None:
-        self.kwargs = kwargs
-        self.kwargs["payload"] = payload
-        self.kwargs["sender"] = None if sender is None else str(sender)
-        self.kwargs["receiver"] = None if receiver is None else str(receiver)
-        self.kwargs["kind"] = str(kind)
-        self.kwargs["type"] = "MessageDropped"
+        self._kwargs = kwargs
+        self._kwargs["payload"] = payload
+        self._kwargs["sender"] = None if sender is None else str(sender)
+        self._kwargs["receiver"] = None if receiver is None else str(receiver)
+        self._kwargs["kind"] = str(kind)
+        self._kwargs["type"] = "MessageDropped"
+
+    @property
+    def kwargs(self) -> Dict[str, Any]:
+        return _resolve_payload(self._kwargs)
 
     # This must output the event in a json serializable format
     def __str__(self) -> str:
@@ -260,16 +305,20 @@ class MessageHandlerExceptionEvent:
     def __init__(
         self,
         *,
-        payload: str,
+        payload: str | DeferredPayload,
         handling_agent: AgentId,
         exception: BaseException,
         **kwargs: Any,
     ) -> None:
-        self.kwargs = kwargs
-        self.kwargs["payload"] = payload
-        self.kwargs["handling_agent"] = str(handling_agent)
-        self.kwargs["exception"] = str(exception)
-        self.kwargs["type"] = "MessageHandlerException"
+        self._kwargs = kwargs
+        self._kwargs["payload"] = payload
+        self._kwargs["handling_agent"] = str(handling_agent)
+        self._kwargs["exception"] = str(exception)
+        self._kwargs["type"] = "MessageHandlerException"
+
+    @property
+    def kwargs(self) -> Dict[str, Any]:
+        return _resolve_payload(self._kwargs)
 
     # This must output the event in a json serializable format
     def __str__(self) -> str:
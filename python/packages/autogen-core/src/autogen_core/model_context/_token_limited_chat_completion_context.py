@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Tuple
 
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -34,6 +34,13 @@ class TokenLimitedChatCompletionContext(ChatCompletionContext, Component[TokenLi
         tools (List[ToolSchema] | None): A list of tool schema to use in the context.
         initial_messages (List[LLMMessage] | None): A list of initial messages to include in the context.
 
+    .. note::
+
+        The tokens of each message are counted once, when the message is added, and the
+        count of a list of messages is taken to be the count of an empty list plus the counts
+        of its messages, as it is for the OpenAI and Ollama clients. Messages must not be
+        modified after they are added.
+
     """
 
     component_config_schema = TokenLimitedChatCompletionContextConfig
@@ -53,23 +60,52 @@ def __init__(
         self._token_limit = token_limit
         self._model_client = model_client
         self._tool_schema = tool_schema or []
+        # id(message) -> (message, tokens of the message alone). The message is kept to detect reused ids.
+        self._message_tokens: Dict[int, Tuple[LLMMessage, int]] = {}
+        self._empty_token_count: int | None = None
+
+    async def add_message(self, message: LLMMessage) -> None:
+        await super().add_message(message)
+        self._count_message_tokens(message)
+
+    def _count_message_tokens(self, message: LLMMessage) -> int:
+        entry = self._message_tokens.get(id(message))
+        if entry is not None and entry[0] is message:
+            return entry[1]
+        if self._empty_token_count is None:
+            self._empty_token_count = self._model_client.count_tokens([])
+        tokens = self._model_client.count_tokens([message]) - self._empty_token_count
+        self._message_tokens[id(message)] = (message, tokens)
+        return tokens
 
     async def get_messages(self) -> List[LLMMessage]:
         """Get at most `token_limit` tokens in recent messages. If the token limit is not
         provided, then return as many messages as the remaining token allowed by the model client."""
-        messages = list(self._messages)
+        messages = self._messages
+        message_tokens = [self._count_message_tokens(message) for message in messages]
+        if len(self._message_tokens) > len(messages):
+            # Forget messages that were removed from the context.
+            self._message_tokens = {id(message): self._message_tokens[id(message)] for message in messages}
         if self._token_limit is None:
-            remaining_tokens = self._model_client.remaining_tokens(messages, tools=self._tool_schema)
-            while remaining_tokens < 0 and len(messages) > 0:
-                middle_index = len(messages) // 2
-                messages.pop(middle_index)
-                remaining_tokens = self._model_client.remaining_tokens(messages, tools=self._tool_schema)
+            budget = self._model_client.remaining_tokens([], tools=self._tool_schema)
         else:
-            token_count = self._model_client.count_tokens(messages, tools=self._tool_schema)
-            while token_count > self._token_limit and len(messages) > 0:
-                middle_index = len(messages) // 2
-                messages.pop(middle_index)
-                token_count = self._model_client.count_tokens(messages, tools=self._tool_schema)
+            budget = self._token_limit - self._model_client.count_tokens([], tools=self._tool_schema)
+
+        # Messages are removed from the middle until the rest fits, so the kept messages are always
+        # the first ceil(kept / 2) and the last floor(kept / 2) messages.
+        prefix_sums = [0]
+        for tokens in message_tokens:
+            prefix_sums.append(prefix_sums[-1] + tokens)
+        total = len(messages)
+        kept = total
+        while kept > 0:
+            head = (kept + 1) // 2
+            tail = kept - head
+            if prefix_sums[head] + prefix_sums[total] - prefix_sums[total - tail] <= budget:
+                break
+            kept -= 1
+        head = (kept + 1) // 2
+        messages = messages[:head] + messages[total - (kept - head) :]
         if messages and isinstance(messages[0], FunctionExecutionResultMessage):
             # Handle the first message is a function call result message.
             # Remove the first message from the list.
@@ -1,6 +1,7 @@
 from ._base import BaseTool, BaseToolWithState, ParametersSchema, Tool, ToolSchema
 from ._function_tool import FunctionTool
 from ._static_workbench import StaticWorkbench
+from ._tool_executor import ToolExecutor, ToolExecutorMetrics
 from ._workbench import ImageResultContent, TextResultContent, ToolResult, Workbench
 
 __all__ = [
@@ -15,4 +16,6 @@
     "TextResultContent",
     "ImageResultContent",
     "StaticWorkbench",
+    "ToolExecutor",
+    "ToolExecutorMetrics",
 ]
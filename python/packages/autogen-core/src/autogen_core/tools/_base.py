@@ -1,3 +1,4 @@
+import copy
 import json
 import logging
 from abc import ABC, abstractmethod
@@ -81,9 +82,20 @@ def __init__(
         self._name = name
         self._description = description
         self._strict = strict
+        self._schema: ToolSchema | None = None
+        if strict:
+            # Validate the schema of a strict tool once, when it is created.
+            self._schema = self._build_schema()
 
     @property
     def schema(self) -> ToolSchema:
+        """The schema of the tool. It is generated on first access and cached, and a copy is returned so that
+        callers can modify it."""
+        if self._schema is None:
+            self._schema = self._build_schema()
+        return copy.deepcopy(self._schema)
+
+    def _build_schema(self) -> ToolSchema:
         model_schema: Dict[str, Any] = self._args_type.model_json_schema()
 
         if "$defs" in model_schema:
@@ -15,6 +15,7 @@
 )
 from ..code_executor._func_with_reqs import Import, import_to_str, to_code
 from ._base import BaseTool
+from ._tool_executor import ToolExecutor, current_tool_executor
 
 
 class FunctionToolConfig(BaseModel):
@@ -50,6 +51,10 @@ class FunctionTool(BaseTool[BaseModel, BaseModel], Component[FunctionToolConfig]
         strict (bool, optional): If set to True, the tool schema will only contain arguments that are explicitly
             defined in the function signature, and no default values will be allowed. Defaults to False.
             This is required to be set to True when used with models in structured output mode.
+        executor (ToolExecutor | None, optional): The executor that runs the function if it is synchronous.
+            Defaults to None, which uses the executor of the :class:`~autogen_core.tools.StaticWorkbench`
+            calling the tool if it has one, and otherwise the default executor of the event loop.
+            The executor is not part of the component config.
 
     Example:
 
@@ -92,6 +97,7 @@ def __init__(
         name: str | None = None,
         global_imports: Sequence[Import] = [],
         strict: bool = False,
+        executor: ToolExecutor | None = None,
     ) -> None:
         self._func = func
         self._global_imports = global_imports
@@ -99,6 +105,9 @@ def __init__(
         func_name = name or func.func.__name__ if isinstance(func, functools.partial) else name or func.__name__
         args_model = args_base_model_from_signature(func_name + "args", self._signature)
         self._has_cancellation_support = "cancellation_token" in self._signature.parameters
+        if executor is not None:
+            executor.check_function(func, self._has_cancellation_support)
+        self._executor = executor
         return_type = self._signature.return_annotation
         super().__init__(args_model, return_type, func_name, description, strict)
 
@@ -114,6 +123,16 @@ async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> A
                 result = await self._func(**kwargs, cancellation_token=cancellation_token)
             else:
                 result = await self._func(**kwargs)
+        elif (executor := self._executor or current_tool_executor.get()) is not None:
+            if self._has_cancellation_support:
+                if executor.mode == "process":
+                    raise ValueError("A function that takes a cancellation token cannot run in a process pool.")
+                # The function handles the cancellation itself.
+                result = await executor.run(
+                    functools.partial(self._func, **kwargs, cancellation_token=cancellation_token)
+                )
+            else:
+                result = await executor.run(functools.partial(self._func, **kwargs), cancellation_token)
         else:
             if self._has_cancellation_support:
                 result = await asyncio.get_event_loop().run_in_executor(
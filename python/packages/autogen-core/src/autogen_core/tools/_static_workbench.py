@@ -8,6 +8,7 @@
 from .._cancellation_token import CancellationToken
 from .._component_config import Component, ComponentModel
 from ._base import BaseTool, ToolSchema
+from ._tool_executor import ToolExecutor, current_tool_executor
 from ._workbench import TextResultContent, ToolResult, Workbench
 
 
@@ -28,13 +29,21 @@ class StaticWorkbench(Workbench, Component[StaticWorkbenchConfig]):
     Args:
         tools (List[BaseTool[Any, Any]]): A list of tools to be included in the workbench.
             The tools should be subclasses of :class:`~autogen_core.tools.BaseTool`.
+        executor (ToolExecutor | None, optional): The executor that runs the synchronous functions of the
+            :class:`~autogen_core.tools.FunctionTool` tools that do not have their own executor. Defaults to None,
+            which uses the default executor of the event loop. The executor is not part of the component config.
     """
 
     component_provider_override = "autogen_core.tools.StaticWorkbench"
     component_config_schema = StaticWorkbenchConfig
 
-    def __init__(self, tools: List[BaseTool[Any, Any]]) -> None:
+    def __init__(self, tools: List[BaseTool[Any, Any]], executor: ToolExecutor | None = None) -> None:
         self._tools = tools
+        self._executor = executor
+        # Index the tools by name. The first tool with a given name is used.
+        self._tools_by_name: Dict[str, BaseTool[Any, Any]] = {}
+        for tool in tools:
+            self._tools_by_name.setdefault(tool.name, tool)
 
     async def list_tools(self) -> List[ToolSchema]:
         return [tool.schema for tool in self._tools]
@@ -42,7 +51,7 @@ async def list_tools(self) -> List[ToolSchema]:
     async def call_tool(
         self, name: str, arguments: Mapping[str, Any] | None = None, cancellation_token: CancellationToken | None = None
     ) -> ToolResult:
-        tool = next((tool for tool in self._tools if tool.name == name), None)
+        tool = self._tools_by_name.get(name)
         if tool is None:
             return ToolResult(
                 name=name,
@@ -54,7 +63,12 @@ async def call_tool(
         if not arguments:
             arguments = {}
         try:
-            result_future = asyncio.ensure_future(tool.run_json(arguments, cancellation_token))
+            # The tool runs in a new task, which copies the context with the executor of the workbench.
+            executor_token = current_tool_executor.set(self._executor)
+            try:
+                result_future = asyncio.ensure_future(tool.run_json(arguments, cancellation_token))
+            finally:
+                current_tool_executor.reset(executor_token)
             cancellation_token.link_future(result_future)
             actual_tool_output = await result_future
             is_error = False
@@ -0,0 +1,187 @@
+import asyncio
+import pickle
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Literal
+
+from .._cancellation_token import CancellationToken
+
+
+@dataclass
+class ToolExecutorMetrics:
+    """Counters reported by :attr:`ToolExecutor.metrics`."""
+
+    calls: int = 0
+    """The total number of calls submitted to the executor."""
+    failures: int = 0
+    """The number of calls that raised an exception or were cancelled."""
+    running: int = 0
+    """The number of calls currently running."""
+    waiting: int = 0
+    """The number of calls currently waiting for a worker."""
+    total_queue_time: float = 0.0
+    """The total time, in seconds, that calls waited for a worker."""
+    max_queue_time: float = 0.0
+    """The longest time, in seconds, that a call waited for a worker."""
+
+
+class ToolExecutor:
+    """Runs the synchronous functions of :class:`~autogen_core.tools.FunctionTool` with a given execution policy.
+
+    By default, a :class:`~autogen_core.tools.FunctionTool` runs a synchronous function in the default executor of
+    the event loop, which is shared with everything else that uses it, such as DNS resolution. A tool executor
+    runs the functions of the tools that use it on its own workers instead:
+
+    - ``"thread"``: a dedicated thread pool, for blocking functions.
+    - ``"process"``: a process pool, for CPU-bound functions. The function and its arguments must be picklable,
+      e.g., a function defined at the top level of a module, and it cannot take a cancellation token.
+    - ``"inline"``: the event loop thread, for functions that return almost immediately.
+
+    At most `max_workers` calls run at the same time; further calls wait for a worker, and the time they wait is
+    counted in :attr:`metrics`. The pool is created on first use and shut down by :meth:`close`.
+
+    An executor can be set on a single tool, or on a :class:`~autogen_core.tools.StaticWorkbench` for the tools
+    in it that do not have their own. It is not part of the component config of the tool or the workbench.
+
+    Args:
+        mode (Literal["thread", "process", "inline"], optional): How to run the functions. Defaults to ``"thread"``.
+        max_workers (int | None, optional): The maximum number of calls running at the same time, and the size of
+            the pool. Defaults to None, which uses the default size of the pool. Ignored in ``"inline"`` mode,
+            where calls run one at a time.
+
+    Example:
+
+        .. code-block:: python
+
+            import asyncio
+
+            from autogen_core import CancellationToken
+            from autogen_core.tools import FunctionTool, ToolExecutor
+
+
+            def count_primes(limit: int) -> int:
+                return sum(all(n % d for d in range(2, int(n**0.5) + 1)) for n in range(2, limit))
+
+
+            async def main() -> None:
+                executor = ToolExecutor("process", max_workers=4)
+                tool = FunctionTool(count_primes, description="Count the primes below a limit.", executor=executor)
+                print(await tool.run_json({"limit": 100000}, CancellationToken()))
+                print(executor.metrics)
+                executor.close()
+
+
+            asyncio.run(main())
+    """
+
+    def __init__(self, mode: Literal["thread", "process", "inline"] = "thread", max_workers: int | None = None) -> None:
+        if mode not in ("thread", "process", "inline"):
+            raise ValueError(f"Unsupported tool executor mode: {mode}")
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("max_workers must be a positive integer or None")
+        self._mode = mode
+        self._max_workers = max_workers
+        self._pool: Executor | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._metrics = ToolExecutorMetrics()
+
+    @property
+    def mode(self) -> Literal["thread", "process", "inline"]:
+        """How the executor runs the functions."""
+        return self._mode
+
+    @property
+    def max_workers(self) -> int | None:
+        """The maximum number of calls running at the same time."""
+        return self._max_workers
+
+    @property
+    def metrics(self) -> ToolExecutorMetrics:
+        """A snapshot of the counters of the executor."""
+        return ToolExecutorMetrics(
+            calls=self._metrics.calls,
+            failures=self._metrics.failures,
+            running=self._metrics.running,
+            waiting=self._metrics.waiting,
+            total_queue_time=self._metrics.total_queue_time,
+            max_queue_time=self._metrics.max_queue_time,
+        )
+
+    def check_function(self, func: Callable[..., Any], has_cancellation_support: bool) -> None:
+        """Check that a function can run on the executor.
+
+        Raises:
+            ValueError: In ``"process"`` mode, if the function is not picklable or takes a cancellation token.
+        """
+        if self._mode != "process":
+            return
+        if has_cancellation_support:
+            raise ValueError("A function that takes a cancellation token cannot run in a process pool.")
+        try:
+            pickle.dumps(func)
+        except Exception as e:
+            raise ValueError(f"The function must be picklable to run in a process pool: {e}") from e
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self._mode == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self._max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="tool_executor")
+        return self._pool
+
+    async def run(self, func: Callable[[], Any], cancellation_token: CancellationToken | None = None) -> Any:
+        """Run a synchronous function without arguments, e.g., a :func:`functools.partial`, and return its result.
+
+        If the cancellation token is cancelled while the call is waiting for a worker, the call does not run.
+        A call that is already running in a thread or a process runs to completion, but its result is discarded.
+        """
+        self._metrics.calls += 1
+        self._metrics.waiting += 1
+        submitted = time.perf_counter()
+        slots: asyncio.Semaphore | None = None
+        try:
+            if self._mode != "inline" and self._max_workers is not None:
+                if self._slots is None:
+                    self._slots = asyncio.Semaphore(self._max_workers)
+                slots = self._slots
+                acquire = asyncio.ensure_future(slots.acquire())
+                if cancellation_token is not None:
+                    cancellation_token.link_future(acquire)
+                await acquire
+        except BaseException:
+            self._metrics.failures += 1
+            raise
+        finally:
+            self._metrics.waiting -= 1
+        queue_time = time.perf_counter() - submitted
+        self._metrics.total_queue_time += queue_time
+        self._metrics.max_queue_time = max(self._metrics.max_queue_time, queue_time)
+        self._metrics.running += 1
+        try:
+            if self._mode == "inline":
+                return func()
+            future = asyncio.get_running_loop().run_in_executor(self._get_pool(), func)
+            if cancellation_token is not None:
+                cancellation_token.link_future(future)
+            return await future
+        except BaseException:
+            self._metrics.failures += 1
+            raise
+        finally:
+            self._metrics.running -= 1
+            if slots is not None:
+                slots.release()
+
+    def close(self) -> None:
+        """Shut down the pool of the executor without waiting for the running calls. A new pool is created if the
+        executor is used again."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# The executor of the workbench that is calling a tool, used by tools that do not have their own executor.
+current_tool_executor: ContextVar[ToolExecutor | None] = ContextVar("current_tool_executor", default=None)
@@ -0,0 +1,143 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+import pytest
+from autogen_core import (
+    AgentId,
+    AgentPassivationPolicy,
+    InMemoryStore,
+    MessageContext,
+    RoutedAgent,
+    SingleThreadedAgentRuntime,
+    TopicId,
+    TypeSubscription,
+    message_handler,
+    rpc,
+)
+
+
+@dataclass
+class Increment:
+    pass
+
+
+@dataclass
+class GetCount:
+    pass
+
+
+class CounterAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("A counter agent.")
+        self.count = 0
+        self.closed = False
+
+    @message_handler
+    async def on_increment(self, message: Increment, ctx: MessageContext) -> None:
+        self.count += 1
+
+    @rpc
+    async def on_get_count(self, message: GetCount, ctx: MessageContext) -> int:
+        return self.count
+
+    async def save_state(self) -> Mapping[str, Any]:
+        return {"count": self.count}
+
+    async def load_state(self, state: Mapping[str, Any]) -> None:
+        self.count = state["count"]
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_passivate_least_recently_used_agents() -> None:
+    store = InMemoryStore[Mapping[str, Any]]()
+    runtime = SingleThreadedAgentRuntime(
+        passivation_policy=AgentPassivationPolicy(max_resident_agents=2, state_store=store)
+    )
+    await CounterAgent.register(runtime, "counter", CounterAgent, skip_class_subscriptions=True)
+    await runtime.add_subscription(TypeSubscription("increment", "counter"))
+
+    runtime.start()
+    for key in ["a", "b", "c", "a"]:
+        await runtime.publish_message(Increment(), topic_id=TopicId("increment", key))
+    await runtime.stop_when_idle()
+
+    stats = runtime.passivation_stats
+    assert stats.resident == 2
+    # "a" was passivated when "c" was created, then re-created; "b" was passivated when "a" came back.
+    assert stats.passivations == 2
+    assert stats.rehydrations == 1
+    assert stats.passivated == 1
+    assert store.get(str(AgentId("counter", "b"))) == {"count": 1}
+
+    runtime.start()
+    assert await runtime.send_message(GetCount(), AgentId("counter", "a")) == 2
+    assert await runtime.send_message(GetCount(), AgentId("counter", "b")) == 1
+    await runtime.stop_when_idle()
+
+    # The runtime state includes the state of passivated agents.
+    state = await runtime.save_state()
+    assert {key: value["count"] for key, value in state.items()} == {"counter/a": 2, "counter/b": 1, "counter/c": 1}
+    assert runtime.passivation_stats.resident == 2
+
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_passivate_idle_agents() -> None:
+    runtime = SingleThreadedAgentRuntime(
+        passivation_policy=AgentPassivationPolicy(idle_timeout=0.05, sweep_interval=0.01)
+    )
+    await CounterAgent.register(runtime, "counter", CounterAgent, skip_class_subscriptions=True)
+    instance = CounterAgent()
+    await runtime.register_agent_instance(instance, AgentId("pinned", "default"))
+
+    runtime.start()
+    await runtime.send_message(Increment(), AgentId("counter", "default"))
+    await runtime.send_message(Increment(), AgentId("pinned", "default"))
+    agent = await runtime.try_get_underlying_agent_instance(AgentId("counter", "default"), CounterAgent)
+    await asyncio.sleep(0.2)
+
+    # Only the agent created by a factory is passivated.
+    assert agent.closed
+    assert not instance.closed
+    assert runtime.passivation_stats.resident == 1
+    assert runtime.passivation_stats.passivated == 1
+
+    assert await runtime.send_message(GetCount(), AgentId("counter", "default")) == 1
+    assert runtime.passivation_stats.rehydrations == 1
+    await runtime.stop()
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_publish_does_not_rehydrate_passivated_sender() -> None:
+    runtime = SingleThreadedAgentRuntime(passivation_policy=AgentPassivationPolicy(max_resident_agents=1))
+    await CounterAgent.register(runtime, "counter", CounterAgent, skip_class_subscriptions=True)
+    await runtime.add_subscription(TypeSubscription("increment", "counter"))
+
+    runtime.start()
+    await runtime.publish_message(Increment(), topic_id=TopicId("increment", "a"))
+    await runtime.publish_message(Increment(), topic_id=TopicId("increment", "b"))
+    await runtime.stop_when_idle()
+
+    runtime.start()
+    await runtime.publish_message(Increment(), topic_id=TopicId("increment", "b"), sender=AgentId("counter", "a"))
+    await runtime.stop_when_idle()
+
+    # "a" was passivated when "b" was created, and publishing on its behalf does not bring it back.
+    stats = runtime.passivation_stats
+    assert stats.passivations == 1
+    assert stats.rehydrations == 0
+
+    await runtime.close()
+
+
+def test_passivation_policy_validation() -> None:
+    with pytest.raises(ValueError):
+        AgentPassivationPolicy(max_resident_agents=0)
+    with pytest.raises(ValueError):
+        AgentPassivationPolicy(sweep_interval=0)
@@ -1,6 +1,7 @@
 from unittest.mock import Mock
 
-from autogen_core import CacheStore, InMemoryStore
+import pytest
+from autogen_core import CacheStore, InMemoryStore, InMemoryStoreMetrics
 
 
 def test_set_and_get_object_key_value() -> None:
@@ -46,3 +47,70 @@ def test_inmemory_store() -> None:
     key = "non_existent_key"
     default_value = 99
     assert store.get(key, default_value) == default_value
+
+    assert store.store == {test_key: new_value}
+    with pytest.raises(TypeError):
+        store.store[test_key] = 0  # type: ignore[index]
+
+
+@pytest.mark.asyncio
+async def test_inmemory_store_async() -> None:
+    store = InMemoryStore[int]()
+    await store.aset("test_key", 42)
+    assert await store.aget("test_key") == 42
+    assert store.get("test_key") == 42
+    assert await store.aget("non_existent_key", 99) == 99
+
+
+def test_inmemory_store_lru_eviction() -> None:
+    store = InMemoryStore[int](max_entries=2)
+    store.set("a", 1)
+    store.set("b", 2)
+    assert store.get("a") == 1  # "b" is now the least recently used.
+    store.set("c", 3)
+    assert store.get("b") is None
+    assert store.get("a") == 1
+    assert store.get("c") == 3
+    assert store.metrics == InMemoryStoreMetrics(hits=3, misses=1, evictions=1, expirations=0, entries=2, bytes=0)
+
+
+def test_inmemory_store_max_bytes() -> None:
+    store = InMemoryStore[str](max_bytes=10)
+    store.set("a", "12345")
+    store.set("b", "1234")
+    store.set("c", "123")
+    assert store.get("a") is None
+    assert store.get("b") == "1234"
+    assert store.metrics.bytes == 7
+    # An item larger than the limit is not stored.
+    store.set("d", "12345678901")
+    assert store.get("d") is None
+    assert store.metrics.evictions == 2
+
+
+def test_inmemory_store_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 100.0
+    monkeypatch.setattr("autogen_core._cache_store.time.monotonic", lambda: now)
+    store = InMemoryStore[int](ttl=10)
+    store.set("a", 1)
+    now = 105.0
+    assert store.get("a") == 1
+    store.set("b", 2)
+    assert store.store == {"a": 1, "b": 2}
+    now = 110.0
+    # The snapshot skips expired items without counting them.
+    assert store.store == {"b": 2}
+    assert store.metrics.expirations == 0
+    assert store.get("a") is None
+    assert store.metrics.expirations == 1
+
+
+def test_inmemory_store_config() -> None:
+    store = InMemoryStore[int](max_entries=10, max_bytes=1000, ttl=60)
+    config = store.dump_component()
+    assert config.config == {"max_entries": 10, "max_bytes": 1000, "ttl": 60}
+    loaded: InMemoryStore[int] = InMemoryStore.load_component(config)
+    assert isinstance(loaded, InMemoryStore)
+    assert loaded.dump_component() == config
+    with pytest.raises(ValueError):
+        InMemoryStore[int](max_entries=0)
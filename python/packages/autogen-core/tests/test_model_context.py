@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Sequence
 
 import pytest
 from autogen_core.model_context import (
@@ -16,6 +16,7 @@
 )
 from autogen_ext.models.ollama import OllamaChatCompletionClient
 from autogen_ext.models.openai import OpenAIChatCompletionClient
+from autogen_ext.models.replay import ReplayChatCompletionClient
 
 
 @pytest.mark.asyncio
@@ -205,3 +206,47 @@ async def test_token_limited_model_context_openai_with_function_result(
     assert type(retrieved[0]) == UserMessage  # Function result should be removed
     assert type(retrieved[1]) == AssistantMessage
     assert type(retrieved[2]) == UserMessage
+
+
+class CountingReplayChatCompletionClient(ReplayChatCompletionClient):
+    def __init__(self) -> None:
+        super().__init__([])
+        self.counted_messages = 0
+
+    def count_tokens(self, messages: Sequence[LLMMessage], **kwargs: object) -> int:
+        self.counted_messages += len(messages)
+        return super().count_tokens(messages)
+
+
+def _trim_by_popping_middle(
+    model_client: ChatCompletionClient, messages: List[LLMMessage], token_limit: int
+) -> List[LLMMessage]:
+    messages = list(messages)
+    while model_client.count_tokens(messages) > token_limit and len(messages) > 0:
+        messages.pop(len(messages) // 2)
+    return messages
+
+
+@pytest.mark.asyncio
+async def test_token_limited_model_context_counts_each_message_once() -> None:
+    model_client = CountingReplayChatCompletionClient()
+    messages: List[LLMMessage] = [
+        UserMessage(content=" ".join(["word"] * (i % 7 + 1)), source="user") for i in range(50)
+    ]
+    for token_limit in range(1, 240, 7):
+        model_context = TokenLimitedChatCompletionContext(model_client=model_client, token_limit=token_limit)
+        for msg in messages:
+            await model_context.add_message(msg)
+        retrieved = await model_context.get_messages()
+        assert retrieved == _trim_by_popping_middle(model_client, messages, token_limit)
+
+    model_context = TokenLimitedChatCompletionContext(model_client=model_client, token_limit=100)
+    for msg in messages:
+        await model_context.add_message(msg)
+    model_client.counted_messages = 0
+    for _ in range(3):
+        await model_context.get_messages()
+    await model_context.add_message(UserMessage(content="one more", source="user"))
+    await model_context.get_messages()
+    # Only the new message is counted, the rest are cached.
+    assert model_client.counted_messages == 1
@@ -1,6 +1,6 @@
 import logging
 from dataclasses import dataclass
-from typing import Callable, cast
+from typing import Callable, List, cast
 
 import pytest
 from autogen_core import (
@@ -219,3 +219,54 @@ async def test_rpc() -> None:
     agent = await runtime.try_get_underlying_agent_instance(agent_id, type=RPCAgent)
     assert agent.num_calls[0] == 1
     assert agent.num_calls[1] == 1
+
+
+@dataclass
+class SpecialMessage(MyMessage):
+    pass
+
+
+class BaseMessageAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent that handles base messages.")
+        self.handled: List[str] = []
+
+    @message_handler
+    async def on_my_message(self, message: MyMessage, ctx: MessageContext) -> None:
+        self.handled.append(f"base:{message.value}")
+
+
+class SpecialMessageAgent(BaseMessageAgent):
+    @message_handler(match=lambda msg, ctx: msg.value == "special")  # type: ignore
+    async def on_special_message(self, message: SpecialMessage, ctx: MessageContext) -> None:
+        self.handled.append(f"special:{message.value}")
+
+
+@pytest.mark.asyncio
+async def test_routed_agent_base_class_fallback() -> None:
+    runtime = SingleThreadedAgentRuntime()
+    await BaseMessageAgent.register(runtime, "base", BaseMessageAgent)
+    await SpecialMessageAgent.register(runtime, "special", SpecialMessageAgent)
+    base_id = AgentId(type="base", key="default")
+    special_id = AgentId(type="special", key="default")
+
+    runtime.start()
+    for recipient in (base_id, special_id):
+        await runtime.send_message(MyMessage("plain"), recipient=recipient)
+        await runtime.send_message(SpecialMessage("special"), recipient=recipient)
+        # Falls back to the base class handler when the subclass handler does not match.
+        await runtime.send_message(SpecialMessage("other"), recipient=recipient)
+    await runtime.stop_when_idle()
+
+    base_agent = await runtime.try_get_underlying_agent_instance(base_id, type=BaseMessageAgent)
+    assert base_agent.handled == ["base:plain", "base:special", "base:other"]
+    special_agent = await runtime.try_get_underlying_agent_instance(special_id, type=SpecialMessageAgent)
+    assert special_agent.handled == ["base:plain", "special:special", "base:other"]
+
+    # The handler tables are built once per class and are not shared with subclasses.
+    assert BaseMessageAgent.internal_handler_table is not None
+    assert SpecialMessage not in BaseMessageAgent.internal_handler_table
+    assert SpecialMessageAgent.internal_resolved_handlers[SpecialMessage] == (
+        SpecialMessageAgent.on_special_message,
+        SpecialMessageAgent.on_my_message,
+    )
@@ -1,21 +1,29 @@
+import asyncio
 import logging
+from dataclasses import dataclass
+from typing import Dict, List, cast
 
 import pytest
 from autogen_core import (
+    EVENT_LOGGER_NAME,
     AgentId,
     AgentInstantiationContext,
     AgentType,
     DefaultTopicId,
     MessageContext,
+    MessageSerializer,
     RoutedAgent,
     SingleThreadedAgentRuntime,
     TopicId,
     TypeSubscription,
     event,
+    rpc,
     try_get_known_serializers_for_type,
     type_subscription,
 )
 from autogen_core._default_subscription import default_subscription
+from autogen_core.exceptions import RuntimeOverloadedError
+from autogen_core.logging import MessageEvent
 from autogen_test_utils import (
     CascadingAgent,
     CascadingMessageType,
@@ -99,6 +107,32 @@ async def test_agent_type_register_instance() -> None:
         await agent1_dup.register_instance(runtime=runtime, agent_id=agent1_id)
 
 
+@pytest.mark.asyncio
+async def test_remove_agent() -> None:
+    runtime = SingleThreadedAgentRuntime()
+    await LoopbackAgent.register(runtime, "name", LoopbackAgent)
+    agent_id = AgentId("name", "key")
+    runtime.start()
+    await runtime.send_message(MessageType(), recipient=agent_id)
+    agent = await runtime.try_get_underlying_agent_instance(agent_id, type=LoopbackAgent)
+    assert agent.num_calls == 1
+
+    await runtime.remove_agent(agent_id)
+    # Removing an agent that is not instantiated does nothing.
+    await runtime.remove_agent(agent_id)
+    # The agent is created again by its factory, without the previous state.
+    await runtime.send_message(MessageType(), recipient=agent_id)
+    new_agent = await runtime.try_get_underlying_agent_instance(agent_id, type=LoopbackAgent)
+    assert new_agent is not agent
+    assert new_agent.num_calls == 1
+
+    instance_id = AgentId("instance", "default")
+    await NoopAgent().register_instance(runtime=runtime, agent_id=instance_id)
+    with pytest.raises(ValueError):
+        await runtime.remove_agent(instance_id)
+    await runtime.stop()
+
+
 @pytest.mark.asyncio
 async def test_agent_type_register_instance_different_types() -> None:
     runtime = SingleThreadedAgentRuntime()
@@ -168,6 +202,11 @@ async def test_register_receives_publish(tracer_provider: TracerProvider) -> Non
         "autogen process name.(default)-A",
         "autogen publish default.(default)-T",
     ]
+    process_attributes = exported_spans[1].attributes
+    assert process_attributes is not None
+    assert process_attributes["recipient_agent_type"] == "name"
+    assert process_attributes["recipient_agent_class"] == "LoopbackAgent"
+    assert "message" in process_attributes
 
     await runtime.close()
 
@@ -364,3 +403,290 @@ async def test_event_handler_exception_multi_message() -> None:
         await runtime.stop_when_idle()
 
     await runtime.close()
+
+
+class CountingSerializer(MessageSerializer[MessageType]):
+    def __init__(self) -> None:
+        self._inner = try_get_known_serializers_for_type(MessageType)[0]
+        self.num_serialize_calls = 0
+
+    @property
+    def data_content_type(self) -> str:
+        return self._inner.data_content_type
+
+    @property
+    def type_name(self) -> str:
+        return self._inner.type_name
+
+    def deserialize(self, payload: bytes) -> MessageType:
+        return cast(MessageType, self._inner.deserialize(payload))
+
+    def serialize(self, message: MessageType) -> bytes:
+        self.num_serialize_calls += 1
+        return self._inner.serialize(message)
+
+
+@pytest.mark.asyncio
+async def test_event_payload_serialized_once_per_envelope(caplog: pytest.LogCaptureFixture) -> None:
+    runtime = SingleThreadedAgentRuntime()
+    serializer = CountingSerializer()
+    runtime.add_message_serializer(serializer)
+    for i in range(5):
+        await runtime.register_factory(type=AgentType(f"name-{i}"), agent_factory=lambda: LoopbackAgent())
+        await runtime.add_subscription(TypeSubscription("default", f"name-{i}"))
+
+    with caplog.at_level(logging.INFO, logger=EVENT_LOGGER_NAME):
+        runtime.start()
+        await runtime.publish_message(MessageType(), topic_id=TopicId("default", "default"))
+        await runtime.stop_when_idle()
+
+    # The SEND event and the DELIVER events for all recipients share one serialized payload.
+    message_events = [record.msg for record in caplog.records if isinstance(record.msg, MessageEvent)]
+    assert len(message_events) == 6
+    assert all(isinstance(event.kwargs["payload"], str) for event in message_events)
+    assert serializer.num_serialize_calls == 1
+
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_event_payload_not_serialized_without_handler() -> None:
+    runtime = SingleThreadedAgentRuntime()
+    serializer = CountingSerializer()
+    runtime.add_message_serializer(serializer)
+    await runtime.register_factory(type=AgentType("name"), agent_factory=lambda: LoopbackAgent())
+    await runtime.add_subscription(TypeSubscription("default", "name"))
+
+    event_logger = logging.getLogger(EVENT_LOGGER_NAME)
+    previous_level = event_logger.level
+    event_logger.setLevel(logging.WARNING)
+    try:
+        runtime.start()
+        await runtime.send_message(MessageType(), recipient=AgentId("name", "default"))
+        await runtime.stop_when_idle()
+    finally:
+        event_logger.setLevel(previous_level)
+
+    # Without an event handler and without a recording tracer, the payload is never serialized.
+    assert serializer.num_serialize_calls == 0
+
+    await runtime.close()
+
+
+class SlowAgent(RoutedAgent):
+    def __init__(self, release: asyncio.Event) -> None:
+        super().__init__("A slow agent.")
+        self.release = release
+        self.running = 0
+        self.max_running = 0
+        self.num_calls = 0
+
+    @event
+    async def on_message_type(self, message: MessageType, ctx: MessageContext) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await self.release.wait()
+        self.running -= 1
+        self.num_calls += 1
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_handlers() -> None:
+    release = asyncio.Event()
+    runtime = SingleThreadedAgentRuntime(max_concurrent_handlers=2)
+    await runtime.register_factory(type=AgentType("slow"), agent_factory=lambda: SlowAgent(release))
+    for i in range(5):
+        await runtime.add_subscription(TypeSubscription(f"topic-{i}", "slow"))
+
+    runtime.start()
+    for i in range(5):
+        await runtime.publish_message(MessageType(), topic_id=TopicId(f"topic-{i}", "default"))
+    await asyncio.sleep(0.05)
+    agent = await runtime.try_get_underlying_agent_instance(AgentId("slow", "default"), type=SlowAgent)
+    assert agent.running == 2
+
+    release.set()
+    await runtime.stop_when_idle()
+    assert agent.num_calls == 5
+    assert agent.max_running == 2
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_max_queue_size_raises_when_not_blocking() -> None:
+    release = asyncio.Event()
+    runtime = SingleThreadedAgentRuntime(max_queue_size=2, max_concurrent_handlers=1, block_on_full_queue=False)
+    await runtime.register_factory(type=AgentType("slow"), agent_factory=lambda: SlowAgent(release))
+    await runtime.add_subscription(TypeSubscription("default", "slow"))
+
+    # The runtime is not started, so the queue fills up.
+    await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+    await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+    with pytest.raises(RuntimeOverloadedError):
+        await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+
+    release.set()
+    runtime.start()
+    await runtime.stop_when_idle()
+    # Capacity is given back once the queued messages are processed.
+    await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+    runtime.start()
+    await runtime.stop_when_idle()
+    agent = await runtime.try_get_underlying_agent_instance(AgentId("slow", "default"), type=SlowAgent)
+    assert agent.num_calls == 3
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_max_queue_size_blocks_publisher() -> None:
+    release = asyncio.Event()
+    release.set()
+    runtime = SingleThreadedAgentRuntime(max_queue_size=1)
+    await runtime.register_factory(type=AgentType("slow"), agent_factory=lambda: SlowAgent(release))
+    await runtime.add_subscription(TypeSubscription("default", "slow"))
+
+    await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+    blocked = asyncio.create_task(runtime.publish_message(MessageType(), topic_id=DefaultTopicId()))
+    await asyncio.sleep(0.05)
+    assert not blocked.done()
+
+    runtime.start()
+    await blocked
+    await runtime.stop_when_idle()
+    agent = await runtime.try_get_underlying_agent_instance(AgentId("slow", "default"), type=SlowAgent)
+    assert agent.num_calls == 2
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_handlers_nested_rpc() -> None:
+    runtime = SingleThreadedAgentRuntime(max_queue_size=1, max_concurrent_handlers=1)
+    await CascadingRpcAgent.register(runtime, "cascading", lambda: CascadingRpcAgent())
+
+    runtime.start()
+    result = await asyncio.wait_for(
+        runtime.send_message(CascadingMessageType(round=0), AgentId("cascading", "default")), timeout=5
+    )
+    assert result == 5
+    await runtime.stop()
+    await runtime.close()
+
+
+class CascadingRpcAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent that calls itself recursively.")
+
+    @rpc
+    async def on_cascading(self, message: CascadingMessageType, ctx: MessageContext) -> int:
+        if message.round == 5:
+            return message.round
+        return cast(
+            int, await self.send_message(CascadingMessageType(round=message.round + 1), AgentId("cascading", "next"))
+        )
+
+
+@dataclass
+class OrderedMessage:
+    index: int
+
+
+class OrderRecordingAgent(RoutedAgent):
+    def __init__(self, counters: Dict[str, int]) -> None:
+        super().__init__("An agent that records the order of its messages.")
+        self.counters = counters
+        self.received: List[int] = []
+        self.running = 0
+        self.max_running = 0
+
+    @event
+    async def on_ordered(self, message: OrderedMessage, ctx: MessageContext) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        self.counters["running"] += 1
+        self.counters["max_running"] = max(self.counters["max_running"], self.counters["running"])
+        # Later messages finish sooner, so they would overtake earlier ones if handlers overlapped.
+        await asyncio.sleep(0.01 * (5 - message.index))
+        self.received.append(message.index)
+        self.counters["running"] -= 1
+        self.running -= 1
+
+
+async def _publish_interleaved(runtime: SingleThreadedAgentRuntime, keys: List[str]) -> None:
+    for index in range(5):
+        for key in keys:
+            await runtime.publish_message(OrderedMessage(index), topic_id=TopicId("orders", key))
+
+
+@pytest.mark.asyncio
+async def test_ordered_dispatch() -> None:
+    counters = {"running": 0, "max_running": 0}
+    runtime = SingleThreadedAgentRuntime(ordered_dispatch=True)
+    await runtime.register_factory(type=AgentType("orderer"), agent_factory=lambda: OrderRecordingAgent(counters))
+    await runtime.add_subscription(TypeSubscription("orders", "orderer"))
+    keys = ["a", "b", "c"]
+
+    runtime.start()
+    await _publish_interleaved(runtime, keys)
+    await runtime.stop_when_idle()
+
+    for key in keys:
+        agent = await runtime.try_get_underlying_agent_instance(AgentId("orderer", key), type=OrderRecordingAgent)
+        assert agent.received == [0, 1, 2, 3, 4]
+        assert agent.max_running == 1
+    # Different agents are processed concurrently.
+    assert counters["max_running"] == len(keys)
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_ordered_dispatch_workers() -> None:
+    counters = {"running": 0, "max_running": 0}
+    runtime = SingleThreadedAgentRuntime(ordered_dispatch=True, dispatch_workers=2)
+    await runtime.register_factory(type=AgentType("orderer"), agent_factory=lambda: OrderRecordingAgent(counters))
+    await runtime.add_subscription(TypeSubscription("orders", "orderer"))
+    keys = ["a", "b", "c", "d"]
+
+    runtime.start()
+    await _publish_interleaved(runtime, keys)
+    await runtime.stop_when_idle()
+
+    for key in keys:
+        agent = await runtime.try_get_underlying_agent_instance(AgentId("orderer", key), type=OrderRecordingAgent)
+        assert agent.received == [0, 1, 2, 3, 4]
+    assert counters["max_running"] == 2
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_ordered_dispatch_nested_rpc() -> None:
+    runtime = SingleThreadedAgentRuntime(ordered_dispatch=True, dispatch_workers=1)
+    await ChainRpcAgent.register(runtime, "chain", lambda: ChainRpcAgent())
+
+    runtime.start()
+    result = await asyncio.wait_for(
+        runtime.send_message(CascadingMessageType(round=0), AgentId("chain", "0")), timeout=5
+    )
+    assert result == 5
+    await runtime.stop()
+    await runtime.close()
+
+
+def test_dispatch_workers_requires_ordered_dispatch() -> None:
+    with pytest.raises(ValueError):
+        SingleThreadedAgentRuntime(dispatch_workers=2)
+
+
+class ChainRpcAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent that calls the agent with the next key.")
+
+    @rpc
+    async def on_cascading(self, message: CascadingMessageType, ctx: MessageContext) -> int:
+        if message.round == 5:
+            return message.round
+        return cast(
+            int,
+            await self.send_message(
+                CascadingMessageType(round=message.round + 1), AgentId("chain", str(message.round + 1))
+            ),
+        )
@@ -1,10 +1,13 @@
-from dataclasses import dataclass
-from typing import Union
+import json
+import pickle
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Union
 
 import pytest
 from autogen_core import Image
 from autogen_core._serialization import (
     JSON_DATA_CONTENT_TYPE,
+    MSGPACK_DATA_CONTENT_TYPE,
     PROTOBUF_DATA_CONTENT_TYPE,
     DataclassJsonMessageSerializer,
     MessageSerializer,
@@ -200,3 +203,53 @@ def test_type_name_for_protos() -> None:
 
     type_name = SerializationRegistry().type_name(NestingProtoMessage)
     assert type_name == "agents.NestingProtoMessage"
+
+
+@dataclass
+class FlatDataclassMessage:
+    content: str
+    count: int = 0
+    tags: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def test_dataclass_serialization_matches_asdict() -> None:
+    serializer = DataclassJsonMessageSerializer(FlatDataclassMessage)
+    message = FlatDataclassMessage(
+        content="hello", count=2, tags=["a", "b"], metadata={"nested": DataclassMessage(message="hi")}
+    )
+    assert serializer.serialize(message) == json.dumps(asdict(message)).encode("utf-8")
+
+    message = FlatDataclassMessage(content="hello")
+    assert serializer.deserialize(serializer.serialize(message)) == message
+
+
+def test_known_serializers_are_cached() -> None:
+    first = try_get_known_serializers_for_type(FlatDataclassMessage)
+    second = try_get_known_serializers_for_type(FlatDataclassMessage)
+    assert first is not second
+    assert first[0] is second[0]
+    assert try_get_known_serializers_for_type(ProtoMessage, MSGPACK_DATA_CONTENT_TYPE) == []
+
+
+def test_serializers_are_picklable() -> None:
+    serializer = DataclassJsonMessageSerializer(FlatDataclassMessage)
+    copy = pickle.loads(pickle.dumps(serializer))
+    message = FlatDataclassMessage(content="hello", tags=["a"])
+    assert copy.deserialize(serializer.serialize(message)) == message
+
+
+@pytest.mark.parametrize("cls", [FlatDataclassMessage, NestingPydanticMessage])
+def test_msgpack(cls: type[Any]) -> None:
+    pytest.importorskip("msgpack")
+    serde = SerializationRegistry()
+    serde.add_serializer(try_get_known_serializers_for_type(cls, MSGPACK_DATA_CONTENT_TYPE))
+
+    message: Any
+    if cls is FlatDataclassMessage:
+        message = FlatDataclassMessage(content="hello", count=3, tags=["a"], metadata={"key": [1, 2]})
+    else:
+        message = NestingPydanticMessage(message="hello", nested=PydanticMessage(message="world"))
+    name = serde.type_name(message)
+    data = serde.serialize(message, type_name=name, data_content_type=MSGPACK_DATA_CONTENT_TYPE)
+    assert serde.deserialize(data, type_name=name, data_content_type=MSGPACK_DATA_CONTENT_TYPE) == message
@@ -0,0 +1,185 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping
+
+import pytest
+from autogen_core import (
+    MSGPACK_DATA_CONTENT_TYPE,
+    AgentId,
+    CancellationToken,
+    MessageContext,
+    RoutedAgent,
+    ShardedAgentRuntime,
+    TopicId,
+    TypeSubscription,
+    message_handler,
+    rpc,
+    type_subscription,
+)
+from autogen_core._sharded_agent_runtime import _CountingMessageQueue  # pyright: ignore[reportPrivateUsage]
+from autogen_core._single_threaded_agent_runtime import PublishMessageEnvelope
+
+
+@dataclass
+class Ping:
+    hops: int = 0
+
+
+@dataclass
+class Pong:
+    pid: int
+    hops: int
+
+
+@dataclass
+class Increment:
+    amount: int
+
+
+@dataclass
+class Failure:
+    pass
+
+
+class PingAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent that reports the process it runs in.")
+        self.count = 0
+
+    @rpc
+    async def on_ping(self, message: Ping, ctx: MessageContext) -> Pong:
+        if message.hops > 0:
+            # Forward to the next key, which may live on another shard.
+            next_key = str(int(self.id.key) + 1)
+            result = await self.send_message(Ping(hops=message.hops - 1), AgentId("ping", next_key))
+            assert isinstance(result, Pong)
+            return Pong(pid=result.pid, hops=result.hops + 1)
+        return Pong(pid=os.getpid(), hops=0)
+
+    @rpc
+    async def on_failure(self, message: Failure, ctx: MessageContext) -> None:
+        raise ValueError("Test failure")
+
+    @message_handler
+    async def on_increment(self, message: Increment, ctx: MessageContext) -> None:
+        self.count += message.amount
+
+    async def save_state(self) -> Mapping[str, Any]:
+        return {"count": self.count}
+
+    async def load_state(self, state: Mapping[str, Any]) -> None:
+        self.count = state["count"]
+
+
+@type_subscription("relay")
+class RelayAgent(RoutedAgent):
+    def __init__(self, log_path: Path) -> None:
+        super().__init__("An agent that appends its messages to a file and relays them to the next key.")
+        self.log_path = log_path
+
+    @message_handler
+    async def on_increment(self, message: Increment, ctx: MessageContext) -> None:
+        with self.log_path.open("a") as f:
+            f.write(f"{self.id.key}\n")
+        if message.amount > 0:
+            next_topic = TopicId("relay", str(int(self.id.key) + 1))
+            await self.publish_message(Increment(message.amount - 1), next_topic)
+
+
+@pytest.mark.asyncio
+async def test_send_message_across_shards() -> None:
+    runtime = ShardedAgentRuntime(num_shards=2)
+    await PingAgent.register(runtime, "ping", lambda: PingAgent())
+
+    runtime.start()
+    pids = {(await runtime.send_message(Ping(), AgentId("ping", str(key)))).pid for key in range(8)}
+    assert len(pids) == 2
+    assert os.getpid() not in pids
+
+    # A chain of RPCs that hops between shards.
+    result = await runtime.send_message(Ping(hops=5), AgentId("ping", "0"))
+    assert result.hops == 5
+    assert result.pid == (await runtime.send_message(Ping(), AgentId("ping", "5"))).pid
+
+    with pytest.raises(ValueError, match="Test failure"):
+        await runtime.send_message(Failure(), AgentId("ping", "0"))
+    await runtime.stop()
+
+
+@pytest.mark.asyncio
+async def test_msgpack_payloads() -> None:
+    pytest.importorskip("msgpack")
+    runtime = ShardedAgentRuntime(num_shards=2, payload_serialization_format=MSGPACK_DATA_CONTENT_TYPE)
+    await PingAgent.register(runtime, "ping", lambda: PingAgent())
+
+    runtime.start()
+    result = await runtime.send_message(Ping(hops=3), AgentId("ping", "0"))
+    assert result.hops == 3
+    await runtime.stop()
+
+
+@pytest.mark.asyncio
+async def test_publish_cascade_stop_when_idle(tmp_path: Path) -> None:
+    log_path = tmp_path / "log.txt"
+    runtime = ShardedAgentRuntime(num_shards=3)
+    await RelayAgent.register(runtime, "relay", lambda: RelayAgent(log_path))
+
+    runtime.start()
+    await runtime.publish_message(Increment(9), TopicId("relay", "0"))
+    await runtime.stop_when_idle()
+
+    assert log_path.read_text().split() == [str(key) for key in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_save_and_load_state() -> None:
+    runtime = ShardedAgentRuntime(num_shards=2)
+    await PingAgent.register(runtime, "ping", lambda: PingAgent(), skip_class_subscriptions=True)
+    await runtime.add_subscription(TypeSubscription("counter", "ping"))
+
+    runtime.start()
+    for key in range(4):
+        await runtime.publish_message(Increment(key + 1), TopicId("counter", str(key)))
+    # An RPC to each agent is processed after the published message.
+    for key in range(4):
+        await runtime.send_message(Ping(), AgentId("ping", str(key)))
+    state = await runtime.save_state()
+    assert state == {f"ping/{key}": {"count": key + 1} for key in range(4)}
+    await runtime.stop()
+
+    runtime.start()
+    await runtime.load_state(state)
+    assert await runtime.agent_save_state(AgentId("ping", "2")) == {"count": 3}
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_register_after_start_raises() -> None:
+    runtime = ShardedAgentRuntime(num_shards=1)
+    runtime.start()
+    with pytest.raises(RuntimeError):
+        await PingAgent.register(runtime, "ping", lambda: PingAgent())
+    await runtime.stop()
+
+
+@pytest.mark.asyncio
+async def test_counting_message_queue() -> None:
+    message_queue = _CountingMessageQueue()
+    for _ in range(3):
+        await message_queue.put(
+            PublishMessageEnvelope(
+                message=Increment(1),
+                cancellation_token=CancellationToken(),
+                sender=None,
+                topic_id=TopicId("a", "b"),
+                message_id="id",
+            )
+        )
+    assert message_queue.unfinished == 3
+    await message_queue.get()
+    message_queue.task_done()
+    assert message_queue.unfinished == 2
+    # The envelopes discarded by an immediate shutdown are done.
+    message_queue.shutdown(immediate=True)  # type: ignore
+    assert message_queue.unfinished == 0
@@ -5,8 +5,10 @@
     DefaultTopicId,
     SingleThreadedAgentRuntime,
     TopicId,
+    TypePrefixSubscription,
     TypeSubscription,
 )
+from autogen_core._runtime_impl_helpers import SubscriptionManager
 from autogen_core.exceptions import CantHandleException
 from autogen_test_utils import LoopbackAgent, MessageType
 
@@ -120,3 +122,99 @@ async def test_subscription_deduplication() -> None:
     default_subscription = DefaultSubscription(agent_type=agent_type)
     with pytest.raises(ValueError, match="Subscription already exists"):
         await runtime.add_subscription(default_subscription)
+
+
+@pytest.mark.asyncio
+async def test_subscription_manager_indexed_matching() -> None:
+    manager = SubscriptionManager()
+    await manager.add_subscription(TypeSubscription("t1", "a1"))
+    await manager.add_subscription(TypePrefixSubscription("t", "a2"))
+    await manager.add_subscription(TypeSubscription("t2", "a3"))
+    await manager.add_subscription(TypePrefixSubscription("t1x", "a4"))
+    await manager.add_subscription(TypePrefixSubscription("", "a5"))
+
+    # Recipients are returned in subscription registration order.
+    assert await manager.get_subscribed_recipients(TopicId("t1", "s")) == [
+        AgentId("a1", "s"),
+        AgentId("a2", "s"),
+        AgentId("a5", "s"),
+    ]
+    assert await manager.get_subscribed_recipients(TopicId("t1xy", "s")) == [
+        AgentId("a2", "s"),
+        AgentId("a4", "s"),
+        AgentId("a5", "s"),
+    ]
+    assert await manager.get_subscribed_recipients(TopicId("other", "s")) == [AgentId("a5", "s")]
+
+    with pytest.raises(ValueError, match="Subscription already exists"):
+        await manager.add_subscription(TypePrefixSubscription("t1x", "a4"))
+
+
+@pytest.mark.asyncio
+async def test_subscription_manager_incremental_updates() -> None:
+    manager = SubscriptionManager()
+    t1 = TopicId("t1", "s")
+    t2 = TopicId("t2", "s")
+    assert await manager.get_subscribed_recipients(t1) == []
+    assert await manager.get_subscribed_recipients(t2) == []
+
+    sub1 = TypeSubscription("t1", "a1")
+    await manager.add_subscription(sub1)
+    prefix_sub = TypePrefixSubscription("t", "a2")
+    await manager.add_subscription(prefix_sub)
+    assert await manager.get_subscribed_recipients(t1) == [AgentId("a1", "s"), AgentId("a2", "s")]
+    assert await manager.get_subscribed_recipients(t2) == [AgentId("a2", "s")]
+
+    await manager.remove_subscription(prefix_sub.id)
+    assert await manager.get_subscribed_recipients(t1) == [AgentId("a1", "s")]
+    assert await manager.get_subscribed_recipients(t2) == []
+
+    await manager.remove_subscription(sub1.id)
+    assert await manager.get_subscribed_recipients(t1) == []
+    assert manager.subscriptions == []
+
+    with pytest.raises(ValueError, match="Subscription does not exist"):
+        await manager.remove_subscription(sub1.id)
+
+    # The same subscription can be added again after removal.
+    await manager.add_subscription(TypeSubscription("t1", "a1"))
+    assert await manager.get_subscribed_recipients(t1) == [AgentId("a1", "s")]
+
+
+@pytest.mark.asyncio
+async def test_subscription_manager_recipient_cache_eviction() -> None:
+    manager = SubscriptionManager(recipient_cache_capacity=2)
+    await manager.add_subscription(TypeSubscription("t1", "a1"))
+    await manager.add_subscription(TypePrefixSubscription("t", "a2"))
+
+    for source in ["s1", "s2", "s1", "s3"]:
+        assert await manager.get_subscribed_recipients(TopicId("t1", source)) == [
+            AgentId("a1", source),
+            AgentId("a2", source),
+        ]
+
+    stats = manager.recipient_cache_stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.size, stats.capacity) == (1, 3, 1, 2, 2)
+
+    # s2 was the least recently used topic and was evicted; it is resolved again on its next use.
+    await manager.add_subscription(TypeSubscription("t1", "a3"))
+    assert await manager.get_subscribed_recipients(TopicId("t1", "s2")) == [
+        AgentId("a1", "s2"),
+        AgentId("a2", "s2"),
+        AgentId("a3", "s2"),
+    ]
+    assert manager.recipient_cache_stats.misses == 4
+    assert manager.recipient_cache_stats.size == 2
+
+    with pytest.raises(ValueError):
+        SubscriptionManager(recipient_cache_capacity=0)
+
+
+@pytest.mark.asyncio
+async def test_subscription_manager_unbounded_recipient_cache() -> None:
+    manager = SubscriptionManager(recipient_cache_capacity=None)
+    await manager.add_subscription(TypeSubscription("t1", "a1"))
+    for i in range(100):
+        await manager.get_subscribed_recipients(TopicId("t1", f"s{i}"))
+    assert manager.recipient_cache_stats.size == 100
+    assert manager.recipient_cache_stats.evictions == 0
@@ -1,4 +1,8 @@
+import asyncio
 import inspect
+import os
+import threading
+import time
 from dataclasses import dataclass
 from functools import partial
 from typing import Annotated, List
@@ -6,7 +10,7 @@
 import pytest
 from autogen_core import CancellationToken
 from autogen_core._function_utils import get_typed_signature
-from autogen_core.tools import BaseTool, FunctionTool
+from autogen_core.tools import BaseTool, FunctionTool, StaticWorkbench, ToolExecutor
 from autogen_core.tools._base import ToolSchema
 from pydantic import BaseModel, Field, ValidationError, model_serializer
 from pydantic_core import PydanticUndefined
@@ -152,6 +156,27 @@ def my_function(arg: str = "default") -> MyResult:
         _ = tool.schema
 
 
+def test_func_tool_schema_cached() -> None:
+    def my_function(arg: str, other: Annotated[int, "int arg"]) -> MyResult:
+        return MyResult(result="test")
+
+    tool = FunctionTool(my_function, description="Function tool.")
+    assert tool.schema == tool.schema
+
+    # Modifying a returned schema does not change the cached schema.
+    schema = tool.schema
+    assert "parameters" in schema
+    del schema["parameters"]["properties"]["arg"]["title"]
+    assert tool.schema["parameters"]["properties"]["arg"]["title"] == "Arg"
+
+    # A strict tool is validated when it is created.
+    def my_function_default(arg: str = "default") -> MyResult:
+        return MyResult(result="test")
+
+    with pytest.raises(ValueError, match="Strict mode is enabled"):
+        FunctionTool(my_function_default, description="Function tool.", strict=True)
+
+
 def test_func_tool_with_partial_positional_arguments_schema_generation() -> None:
     """Test correct schema generation for a partial function with positional arguments."""
 
@@ -589,3 +614,54 @@ async def test_func_tool_with_dataclass_conversion_failure() -> None:
 
     with pytest.raises(ValidationError, match="Field required"):
         await tool.run_json(test_input, CancellationToken())
+
+
+def process_id_tool(offset: int) -> int:
+    return os.getpid() + offset
+
+
+@pytest.mark.asyncio
+async def test_func_tool_executor() -> None:
+    running = 0
+    max_running = 0
+    threads: List[str] = []
+
+    def slow_tool(value: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        threads.append(threading.current_thread().name)
+        time.sleep(0.02)
+        running -= 1
+        return value
+
+    # A dedicated thread pool with one worker runs one call at a time and counts the queue time.
+    executor = ToolExecutor("thread", max_workers=1)
+    tool = FunctionTool(slow_tool, description="A slow tool.", executor=executor)
+    results = await asyncio.gather(*[tool.run_json({"value": i}, CancellationToken()) for i in range(4)])
+    assert results == [0, 1, 2, 3]
+    assert max_running == 1
+    assert all(name.startswith("tool_executor") for name in threads)
+    metrics = executor.metrics
+    assert metrics.calls == 4
+    assert metrics.failures == 0
+    assert metrics.running == 0 and metrics.waiting == 0
+    assert metrics.max_queue_time >= 0.04
+    executor.close()
+
+    # The executor of the workbench is used by the tools without their own executor.
+    inline_executor = ToolExecutor("inline")
+    threads.clear()
+    async with StaticWorkbench([FunctionTool(slow_tool, description="A slow tool.")], executor=inline_executor) as wb:
+        result = await wb.call_tool("slow_tool", {"value": 5})
+    assert not result.is_error
+    assert threads == [threading.current_thread().name]
+    assert inline_executor.metrics.calls == 1
+
+    # A process pool runs picklable functions only.
+    process_executor = ToolExecutor("process", max_workers=2)
+    process_tool = FunctionTool(process_id_tool, description="A process tool.", executor=process_executor)
+    assert await process_tool.run_json({"offset": 0}, CancellationToken()) != os.getpid()
+    process_executor.close()
+    with pytest.raises(ValueError, match="picklable"):
+        FunctionTool(slow_tool, description="A slow tool.", executor=process_executor)
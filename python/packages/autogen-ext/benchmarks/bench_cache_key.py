@@ -0,0 +1,74 @@
+"""Measure the time to compute the ``ChatCompletionCache`` key against history length.
+
+For each history length, a conversation of that many messages is extended by one message per
+turn and the cache key of the whole conversation is computed, as an agent does before every model
+call. The previous key, a ``json.dumps`` of every dumped message and of the structured output
+schema, is timed alongside for comparison.
+"""
+
+import argparse
+import hashlib
+import json
+import time
+from typing import Any, Callable, List, Mapping, Optional
+
+from autogen_core.models import AssistantMessage, LLMMessage, UserMessage
+from autogen_ext.models.cache._chat_completion_cache import _cache_key  # pyright: ignore[reportPrivateUsage]
+from pydantic import BaseModel
+
+
+class Answer(BaseModel):
+    text: str
+    confidence: float
+    sources: List[str]
+
+
+def _previous_cache_key(
+    messages: List[LLMMessage], json_output: Optional[type[BaseModel]], extra_create_args: Mapping[str, Any]
+) -> str:
+    data = {
+        "messages": [message.model_dump() for message in messages],
+        "tools": [],
+        "json_output": json.dumps(json_output.model_json_schema()) if json_output is not None else None,
+        "extra_create_args": extra_create_args,
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def _make_message(index: int, size: int) -> LLMMessage:
+    content = f"message {index} " + "x" * size
+    if index % 2 == 0:
+        return UserMessage(content=content, source="user")
+    return AssistantMessage(content=content, source="assistant")
+
+
+def _measure(history: int, turns: int, size: int, compute: Callable[[List[LLMMessage]], str]) -> float:
+    messages = [_make_message(index, size) for index in range(history)]
+    compute(messages)
+    start = time.perf_counter()
+    for index in range(history, history + turns):
+        messages.append(_make_message(index, size))
+        compute(messages)
+    return (time.perf_counter() - start) / turns
+
+
+def run(histories: List[int], turns: int, size: int) -> None:
+    extra_create_args = {"temperature": 0.0}
+    print(f"{'history':>8} {'previous':>12} {'incremental':>12}")
+    for history in histories:
+        previous = _measure(history, turns, size, lambda m: _previous_cache_key(m, Answer, extra_create_args))
+        incremental = _measure(history, turns, size, lambda m: _cache_key(m, [], Answer, extra_create_args))
+        print(f"{history:>8} {previous * 1e3:>10.3f}ms {incremental * 1e3:>10.3f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--histories", type=int, nargs="+", default=[10, 50, 200, 1000])
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument("--size", type=int, default=500, help="Length of the message content in characters.")
+    args = parser.parse_args()
+    run(args.histories, args.turns, args.size)
+
+
+if __name__ == "__main__":
+    main()
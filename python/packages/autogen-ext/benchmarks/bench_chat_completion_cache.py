@@ -0,0 +1,90 @@
+"""Measure ``ChatCompletionCache`` under concurrent duplicate requests.
+
+Sends ``--requests`` identical prompts at the same time through a model client that takes
+``--latency`` seconds per call, first without a cache and then through ``ChatCompletionCache`` with
+the in-memory store and, when ``diskcache`` is installed, the disk store. Reports the wall time, the
+number of calls that reached the model client, and the longest stall of the event loop observed by a
+ticker task, which shows whether store I/O blocks the loop.
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from typing import Any, List, Optional
+
+from autogen_core import CacheStore, InMemoryStore
+from autogen_core.models import ChatCompletionClient, CreateResult, LLMMessage, UserMessage
+from autogen_ext.models.cache import CHAT_CACHE_VALUE_TYPE, ChatCompletionCache
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+
+class SlowClient(ReplayChatCompletionClient):
+    def __init__(self, latency: float) -> None:
+        super().__init__(["response"])
+        self.latency = latency
+        self.calls = 0
+
+    async def create(self, *args: Any, **kwargs: Any) -> CreateResult:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        self._current_index = 0
+        return await super().create(*args, **kwargs)
+
+
+async def _ticker(stalls: List[float], stop: asyncio.Event) -> None:
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0.001)
+        now = time.perf_counter()
+        stalls.append(now - last)
+        last = now
+
+
+async def _measure(name: str, client: ChatCompletionClient, slow_client: SlowClient, requests: int) -> None:
+    messages: List[LLMMessage] = [UserMessage(content="What is the capital of France?", source="user")]
+    stalls: List[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(stalls, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*[client.create(messages) for _ in range(requests)])
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    print(
+        f"{name:<36} {elapsed * 1e3:9.1f}ms  client calls={slow_client.calls:<5}"
+        f" max loop stall={max(stalls, default=0.0) * 1e3:7.2f}ms"
+    )
+
+
+async def run(requests: int, latency: float) -> None:
+    slow_client = SlowClient(latency)
+    await _measure("uncached", slow_client, slow_client, requests)
+
+    slow_client = SlowClient(latency)
+    store: Optional[CacheStore[CHAT_CACHE_VALUE_TYPE]] = InMemoryStore[CHAT_CACHE_VALUE_TYPE]()
+    await _measure("ChatCompletionCache (memory)", ChatCompletionCache(slow_client, store), slow_client, requests)
+
+    try:
+        from autogen_ext.cache_store.diskcache import DiskCacheStore
+        from diskcache import Cache
+    except ImportError:
+        return
+    with tempfile.TemporaryDirectory() as directory, Cache(directory) as cache:
+        slow_client = SlowClient(latency)
+        store = DiskCacheStore[CHAT_CACHE_VALUE_TYPE](cache)
+        await _measure(
+            "ChatCompletionCache (diskcache)", ChatCompletionCache(slow_client, store), slow_client, requests
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500, help="Number of concurrent duplicate requests.")
+    parser.add_argument("--latency", type=float, default=0.2, help="Latency of a model client call in seconds.")
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.latency))
+
+
+if __name__ == "__main__":
+    main()
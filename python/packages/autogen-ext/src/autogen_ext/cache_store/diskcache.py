@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, Optional, TypeVar, cast
 
 import diskcache
@@ -37,6 +38,13 @@ def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
     def set(self, key: str, value: T) -> None:
         self.cache.set(key, cast(Any, value))  # type: ignore[reportUnknownMemberType]
 
+    async def aget(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        # diskcache does blocking file I/O, so it runs in a worker thread.
+        return await asyncio.to_thread(self.get, key, default)
+
+    async def aset(self, key: str, value: T) -> None:
+        await asyncio.to_thread(self.set, key, value)
+
     def _to_config(self) -> DiskCacheStoreConfig:
         # Get directory from cache instance
         return DiskCacheStoreConfig(directory=self.cache.directory)
@@ -1,6 +1,8 @@
+import asyncio
 from typing import Any, Dict, Optional, TypeVar, cast
 
 import redis
+import redis.asyncio
 from autogen_core import CacheStore, Component
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -21,6 +23,35 @@ class RedisStoreConfig(BaseModel):
     socket_timeout: Optional[float] = None
 
 
+def _redis_from_config(config: RedisStoreConfig) -> redis.Redis:
+    return redis.Redis(
+        host=config.host,
+        port=config.port,
+        db=config.db,
+        username=config.username,
+        password=config.password,
+        ssl=config.ssl,
+        socket_timeout=config.socket_timeout,
+    )
+
+
+def _config_from_connection_kwargs(connection_kwargs: Dict[str, Any]) -> RedisStoreConfig:
+    # Extract connection info from the connection pool of a redis instance
+    username = connection_kwargs.get("username")
+    password = connection_kwargs.get("password")
+    socket_timeout = connection_kwargs.get("socket_timeout")
+
+    return RedisStoreConfig(
+        host=str(connection_kwargs.get("host", "localhost")),
+        port=int(connection_kwargs.get("port", 6379)),
+        db=int(connection_kwargs.get("db", 0)),
+        username=str(username) if username is not None else None,
+        password=str(password) if password is not None else None,
+        ssl=bool(connection_kwargs.get("ssl", False)),
+        socket_timeout=float(socket_timeout) if socket_timeout is not None else None,
+    )
+
+
 class RedisStore(CacheStore[T], Component[RedisStoreConfig]):
     """
     A typed CacheStore implementation that uses redis as the underlying storage.
@@ -46,29 +77,76 @@ def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
     def set(self, key: str, value: T) -> None:
         self.cache.set(key, cast(Any, value))
 
+    async def aget(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        # The synchronous client blocks on network I/O, so it runs in a worker thread.
+        # Use AsyncRedisStore to avoid the thread hop.
+        return await asyncio.to_thread(self.get, key, default)
+
+    async def aset(self, key: str, value: T) -> None:
+        await asyncio.to_thread(self.set, key, value)
+
     def _to_config(self) -> RedisStoreConfig:
-        # Extract connection info from redis instance
-        connection_pool = self.cache.connection_pool
-        connection_kwargs: Dict[str, Any] = connection_pool.connection_kwargs  # type: ignore[reportUnknownMemberType]
-
-        username = connection_kwargs.get("username")
-        password = connection_kwargs.get("password")
-        socket_timeout = connection_kwargs.get("socket_timeout")
-
-        return RedisStoreConfig(
-            host=str(connection_kwargs.get("host", "localhost")),
-            port=int(connection_kwargs.get("port", 6379)),
-            db=int(connection_kwargs.get("db", 0)),
-            username=str(username) if username is not None else None,
-            password=str(password) if password is not None else None,
-            ssl=bool(connection_kwargs.get("ssl", False)),
-            socket_timeout=float(socket_timeout) if socket_timeout is not None else None,
-        )
+        return _config_from_connection_kwargs(self.cache.connection_pool.connection_kwargs)  # type: ignore[reportUnknownMemberType]
 
     @classmethod
     def _from_config(cls, config: RedisStoreConfig) -> Self:
         # Create new redis instance from config
-        redis_instance = redis.Redis(
+        return cls(redis_instance=_redis_from_config(config))
+
+
+class AsyncRedisStore(CacheStore[T], Component[RedisStoreConfig]):
+    """
+    A typed CacheStore implementation that uses the asyncio redis client as the underlying storage.
+    The async methods :meth:`aget` and :meth:`aset`, which
+    :class:`~autogen_ext.models.cache.ChatCompletionCache` uses, do not block the event loop.
+    The synchronous methods :meth:`get` and :meth:`set` use a synchronous `redis.Redis` client,
+    which is created from the connection settings of `redis_instance` on first use if it is not given.
+
+    Args:
+        redis_instance: An instance of `redis.asyncio.Redis`.
+                        The user is responsible for managing the Redis instance's lifetime.
+        sync_redis_instance: An optional instance of `redis.Redis` connected to the same server,
+                             used by :meth:`get` and :meth:`set`.
+    """
+
+    component_config_schema = RedisStoreConfig
+    component_provider_override = "autogen_ext.cache_store.redis.AsyncRedisStore"
+
+    def __init__(self, redis_instance: redis.asyncio.Redis, sync_redis_instance: Optional[redis.Redis] = None):
+        self.cache = redis_instance
+        self._sync_cache = sync_redis_instance
+
+    @property
+    def sync_cache(self) -> redis.Redis:
+        """The synchronous client used by :meth:`get` and :meth:`set`."""
+        if self._sync_cache is None:
+            self._sync_cache = _redis_from_config(self._to_config())
+        return self._sync_cache
+
+    def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        value = cast(Optional[T], self.sync_cache.get(key))
+        if value is None:
+            return default
+        return value
+
+    def set(self, key: str, value: T) -> None:
+        self.sync_cache.set(key, cast(Any, value))
+
+    async def aget(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        value = cast(Optional[T], await self.cache.get(key))
+        if value is None:
+            return default
+        return value
+
+    async def aset(self, key: str, value: T) -> None:
+        await self.cache.set(key, cast(Any, value))
+
+    def _to_config(self) -> RedisStoreConfig:
+        return _config_from_connection_kwargs(self.cache.connection_pool.connection_kwargs)  # type: ignore[reportUnknownMemberType]
+
+    @classmethod
+    def _from_config(cls, config: RedisStoreConfig) -> Self:
+        redis_instance = redis.asyncio.Redis(
             host=config.host,
             port=config.port,
             db=config.db,
@@ -1,6 +1,7 @@
-from ._chat_completion_cache import CHAT_CACHE_VALUE_TYPE, ChatCompletionCache
+from ._chat_completion_cache import CHAT_CACHE_VALUE_TYPE, CachedStreamResult, ChatCompletionCache
 
 __all__ = [
     "CHAT_CACHE_VALUE_TYPE",
+    "CachedStreamResult",
     "ChatCompletionCache",
 ]
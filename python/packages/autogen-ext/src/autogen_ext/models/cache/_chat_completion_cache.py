@@ -1,7 +1,10 @@
+import asyncio
 import hashlib
 import json
 import warnings
-from typing import Any, AsyncGenerator, List, Mapping, Optional, Sequence, Union, cast
+import weakref
+from functools import partial
+from typing import Any, AsyncGenerator, Dict, List, Mapping, Optional, Sequence, Tuple, Union, cast
 
 from autogen_core import CacheStore, CancellationToken, Component, ComponentModel, InMemoryStore
 from autogen_core.models import (
@@ -16,7 +19,102 @@
 from pydantic import BaseModel
 from typing_extensions import Self
 
-CHAT_CACHE_VALUE_TYPE = Union[CreateResult, List[Union[str, CreateResult]]]
+
+class CachedStreamResult(BaseModel):
+    """The result of a streamed completion, as stored by :class:`ChatCompletionCache` with
+    `compact_stream_cache` enabled."""
+
+    result: CreateResult
+    """The final result of the stream."""
+    text: Optional[str] = None
+    """The concatenated string chunks, if they differ from the content of the result."""
+    chunk_offsets: Optional[List[int]] = None
+    """The end offsets of the string chunks in the streamed text, if chunk boundaries are stored."""
+
+
+CHAT_CACHE_VALUE_TYPE = Union[CreateResult, List[Union[str, CreateResult]], CachedStreamResult]
+
+
+class _MessageDigests:
+    """Digests of messages, memoized for the lifetime of each message object.
+
+    Messages must not be modified after they are passed to the cache, as the digest is not recomputed.
+    """
+
+    def __init__(self) -> None:
+        self._digests: Dict[int, Tuple[weakref.ref[LLMMessage], bytes]] = {}
+
+    def get(self, message: LLMMessage) -> bytes:
+        key = id(message)
+        entry = self._digests.get(key)
+        if entry is not None and entry[0]() is message:
+            return entry[1]
+        digest = hashlib.sha256(message.model_dump_json().encode()).digest()
+        self._digests[key] = (weakref.ref(message, partial(self._forget, key)), digest)
+        return digest
+
+    def _forget(self, key: int, ref: weakref.ref[LLMMessage]) -> None:
+        entry = self._digests.get(key)
+        if entry is not None and entry[0] is ref:
+            del self._digests[key]
+
+
+_message_digests = _MessageDigests()
+_schema_digests: weakref.WeakKeyDictionary[type[BaseModel], bytes] = weakref.WeakKeyDictionary()
+_tool_digests: weakref.WeakKeyDictionary[Tool, bytes] = weakref.WeakKeyDictionary()
+
+
+def _schema_digest(model: type[BaseModel]) -> bytes:
+    digest = _schema_digests.get(model)
+    if digest is None:
+        digest = hashlib.sha256(json.dumps(model.model_json_schema(), sort_keys=True).encode()).digest()
+        _schema_digests[model] = digest
+    return digest
+
+
+def _tool_digest(tool: Tool | ToolSchema) -> bytes:
+    if not isinstance(tool, Tool):
+        return hashlib.sha256(json.dumps(tool, sort_keys=True).encode()).digest()
+    try:
+        digest = _tool_digests.get(tool)
+    except TypeError:
+        # The tool cannot be weakly referenced or hashed.
+        return hashlib.sha256(json.dumps(tool.schema, sort_keys=True).encode()).digest()
+    if digest is None:
+        digest = hashlib.sha256(json.dumps(tool.schema, sort_keys=True).encode()).digest()
+        _tool_digests[tool] = digest
+    return digest
+
+
+def _cache_key(
+    messages: Sequence[LLMMessage],
+    tools: Sequence[Tool | ToolSchema],
+    json_output: Optional[bool | type[BaseModel]],
+    extra_create_args: Mapping[str, Any],
+) -> str:
+    """Compute the cache key of a request.
+
+    The key chains the digest of each message, which is computed once per message object, so a conversation
+    that grows by one message only serializes the new message. Structured output schemas and tools are
+    digested once per type and per tool object.
+    """
+    json_output_data: str | bool | None = None
+    if isinstance(json_output, type) and issubclass(json_output, BaseModel):
+        json_output_data = _schema_digest(json_output).hex()
+    elif isinstance(json_output, bool):
+        json_output_data = json_output
+
+    key = hashlib.sha256()
+    key.update(len(messages).to_bytes(8, "big"))
+    for message in messages:
+        key.update(_message_digests.get(message))
+    key.update(len(tools).to_bytes(8, "big"))
+    for tool in tools:
+        key.update(_tool_digest(tool))
+    key.update(
+        json.dumps({"json_output": json_output_data, "extra_create_args": extra_create_args}, sort_keys=True).encode()
+    )
+    return key.hexdigest()
 
 
 class ChatCompletionCacheConfig(BaseModel):
@@ -24,6 +122,9 @@ class ChatCompletionCacheConfig(BaseModel):
 
     client: ComponentModel
     store: Optional[ComponentModel] = None
+    compact_stream_cache: bool = False
+    store_chunk_boundaries: bool = False
+    stream_replay_chunk_size: Optional[int] = None
 
 
 class ChatCompletionCache(ChatCompletionClient, Component[ChatCompletionCacheConfig]):
@@ -79,11 +180,30 @@ async def main():
 
     You can now use the `cached_client` as you would the original client, but with caching enabled.
 
+    The store is accessed through its async methods :meth:`~autogen_core.CacheStore.aget` and
+    :meth:`~autogen_core.CacheStore.aset`, so stores that do network or disk I/O do not block the event loop.
+    Concurrent :meth:`create` calls with the same cache key are coalesced: only the first one calls the
+    underlying client, and the others wait for its result and return it marked as cached. If the first
+    call fails, the waiting calls call the underlying client themselves.
+
+    A streamed completion is stored only after the stream completes, so a cancelled or failed stream leaves
+    no entry. By default the list of streamed chunks is stored. With `compact_stream_cache`, a
+    :class:`CachedStreamResult` holding only the final result is stored instead, and replayed as a single
+    string chunk followed by the result, or re-chunked at `stream_replay_chunk_size` characters.
+
     Args:
         client (ChatCompletionClient): The original ChatCompletionClient to wrap.
         store (CacheStore): A store object that implements get and set methods.
             The user is responsible for managing the store's lifecycle & clearing it (if needed).
             Defaults to using in-memory cache.
+        compact_stream_cache (bool): Store streamed completions as a :class:`CachedStreamResult`
+            instead of the list of chunks. Defaults to False.
+        store_chunk_boundaries (bool): With `compact_stream_cache`, also store the offsets of the
+            original chunks, so that a replay without `stream_replay_chunk_size` yields the original chunks.
+            Defaults to False.
+        stream_replay_chunk_size (int | None): The number of characters per string chunk when replaying a
+            compact entry. None replays the original chunks if their boundaries were stored, and a single
+            chunk otherwise. Defaults to None.
     """
 
     component_type = "chat_completion_cache"
@@ -94,39 +214,34 @@ def __init__(
         self,
         client: ChatCompletionClient,
         store: Optional[CacheStore[CHAT_CACHE_VALUE_TYPE]] = None,
+        *,
+        compact_stream_cache: bool = False,
+        store_chunk_boundaries: bool = False,
+        stream_replay_chunk_size: Optional[int] = None,
     ):
+        if stream_replay_chunk_size is not None and stream_replay_chunk_size < 1:
+            raise ValueError("stream_replay_chunk_size must be a positive integer or None")
         self.client = client
         self.store = store or InMemoryStore[CHAT_CACHE_VALUE_TYPE]()
+        self._compact_stream_cache = compact_stream_cache
+        self._store_chunk_boundaries = store_chunk_boundaries
+        self._stream_replay_chunk_size = stream_replay_chunk_size
+        # Futures of the create calls in flight, by cache key. A future resolves to None if the call failed.
+        self._in_flight: Dict[str, asyncio.Future[Optional[CreateResult]]] = {}
 
-    def _check_cache(
+    async def _check_cache(
         self,
         messages: Sequence[LLMMessage],
         tools: Sequence[Tool | ToolSchema],
         json_output: Optional[bool | type[BaseModel]],
         extra_create_args: Mapping[str, Any],
-    ) -> tuple[Optional[Union[CreateResult, List[Union[str, CreateResult]]]], str]:
+    ) -> tuple[Optional[CHAT_CACHE_VALUE_TYPE], str]:
         """
         Helper function to check the cache for a result.
         Returns a tuple of (cached_result, cache_key).
         """
-
-        json_output_data: str | bool | None = None
-
-        if isinstance(json_output, type) and issubclass(json_output, BaseModel):
-            json_output_data = json.dumps(json_output.model_json_schema())
-        elif isinstance(json_output, bool):
-            json_output_data = json_output
-
-        data = {
-            "messages": [message.model_dump() for message in messages],
-            "tools": [(tool.schema if isinstance(tool, Tool) else tool) for tool in tools],
-            "json_output": json_output_data,
-            "extra_create_args": extra_create_args,
-        }
-        serialized_data = json.dumps(data, sort_keys=True)
-        cache_key = hashlib.sha256(serialized_data.encode()).hexdigest()
-
-        cached_result = cast(Optional[CreateResult], self.store.get(cache_key))
+        cache_key = _cache_key(messages, tools, json_output, extra_create_args)
+        cached_result = await self.store.aget(cache_key)
         if cached_result is not None:
             return cached_result, cache_key
 
@@ -148,21 +263,40 @@ async def create(
 
         NOTE: cancellation_token is ignored for cached results.
         """
-        cached_result, cache_key = self._check_cache(messages, tools, json_output, extra_create_args)
-        if cached_result:
-            assert isinstance(cached_result, CreateResult)
-            cached_result.cached = True
-            return cached_result
-
-        result = await self.client.create(
-            messages,
-            tools=tools,
-            json_output=json_output,
-            extra_create_args=extra_create_args,
-            cancellation_token=cancellation_token,
-        )
-        self.store.set(cache_key, result)
-        return result
+        while True:
+            cached_result, cache_key = await self._check_cache(messages, tools, json_output, extra_create_args)
+            if isinstance(cached_result, CachedStreamResult):
+                # Stored by create_stream with compact_stream_cache.
+                return cached_result.result.model_copy(update={"cached": True})
+            if isinstance(cached_result, CreateResult):
+                cached_result.cached = True
+                return cached_result
+            # A list of chunks stored by create_stream is treated as a miss, and replaced by the result.
+
+            in_flight = self._in_flight.get(cache_key)
+            if in_flight is None:
+                break
+            # An identical request is in flight, wait for its result instead of calling the client again.
+            shared_result = await asyncio.shield(in_flight)
+            if shared_result is not None:
+                return shared_result.model_copy(update={"cached": True})
+
+        in_flight = asyncio.get_running_loop().create_future()
+        self._in_flight[cache_key] = in_flight
+        result: Optional[CreateResult] = None
+        try:
+            result = await self.client.create(
+                messages,
+                tools=tools,
+                json_output=json_output,
+                extra_create_args=extra_create_args,
+                cancellation_token=cancellation_token,
+            )
+            await self.store.aset(cache_key, result)
+            return result
+        finally:
+            del self._in_flight[cache_key]
+            in_flight.set_result(result)
 
     def create_stream(
         self,
@@ -182,12 +316,20 @@ def create_stream(
         """
 
         async def _generator() -> AsyncGenerator[Union[str, CreateResult], None]:
-            cached_result, cache_key = self._check_cache(
+            cached_result, cache_key = await self._check_cache(
                 messages,
                 tools,
                 json_output,
                 extra_create_args,
             )
+            if isinstance(cached_result, CreateResult):
+                # Stored by create, replayed like a compact stream result.
+                cached_result = CachedStreamResult(result=cached_result)
+            if isinstance(cached_result, CachedStreamResult):
+                for chunk in self._replay_chunks(cached_result):
+                    yield chunk
+                yield cached_result.result.model_copy(update={"cached": True})
+                return
             if cached_result:
                 assert isinstance(cached_result, list)
                 for result in cached_result:
@@ -205,14 +347,60 @@ async def _generator() -> AsyncGenerator[Union[str, CreateResult], None]:
             )
 
             output_results: List[Union[str, CreateResult]] = []
-            self.store.set(cache_key, output_results)
-
             async for result in result_stream:
                 output_results.append(result)
                 yield result
 
+            # Only a stream that completed is stored.
+            if not output_results or not isinstance(output_results[-1], CreateResult):
+                return
+            if self._compact_stream_cache:
+                await self.store.aset(cache_key, self._compact(output_results))
+            else:
+                await self.store.aset(cache_key, output_results)
+
         return _generator()
 
+    def _compact(self, output_results: List[Union[str, CreateResult]]) -> CachedStreamResult:
+        result = output_results[-1]
+        assert isinstance(result, CreateResult)
+        chunks = [chunk for chunk in output_results if isinstance(chunk, str)]
+        text = "".join(chunks)
+        chunk_offsets: Optional[List[int]] = None
+        if self._store_chunk_boundaries:
+            chunk_offsets = []
+            offset = 0
+            for chunk in chunks:
+                offset += len(chunk)
+                chunk_offsets.append(offset)
+        # The text is only stored when the final content differs from the streamed text, e.g. for tool calls.
+        return CachedStreamResult(
+            result=result,
+            text=text if text != result.content else None,
+            chunk_offsets=chunk_offsets,
+        )
+
+    def _replay_chunks(self, cached: CachedStreamResult) -> List[str]:
+        if cached.text is not None:
+            text = cached.text
+        elif isinstance(cached.result.content, str):
+            text = cached.result.content
+        else:
+            text = ""
+        if not text:
+            return []
+        if self._stream_replay_chunk_size is not None:
+            size = self._stream_replay_chunk_size
+            return [text[start : start + size] for start in range(0, len(text), size)]
+        if cached.chunk_offsets is not None:
+            chunks: List[str] = []
+            start = 0
+            for end in cached.chunk_offsets:
+                chunks.append(text[start:end])
+                start = end
+            return chunks
+        return [text]
+
     async def close(self) -> None:
         await self.client.close()
 
@@ -240,7 +428,10 @@ def total_usage(self) -> RequestUsage:
     def _to_config(self) -> ChatCompletionCacheConfig:
         return ChatCompletionCacheConfig(
             client=self.client.dump_component(),
-            store=self.store.dump_component() if not isinstance(self.store, InMemoryStore) else None,
+            store=self.store.dump_component(),
+            compact_stream_cache=self._compact_stream_cache,
+            store_chunk_boundaries=self._store_chunk_boundaries,
+            stream_replay_chunk_size=self._stream_replay_chunk_size,
         )
 
     @classmethod
@@ -249,4 +440,10 @@ def _from_config(cls, config: ChatCompletionCacheConfig) -> Self:
         store: Optional[CacheStore[CHAT_CACHE_VALUE_TYPE]] = (
             CacheStore.load_component(config.store) if config.store else InMemoryStore()
         )
-        return cls(client=client, store=store)
+        return cls(
+            client=client,
+            store=store,
+            compact_stream_cache=config.compact_stream_cache,
+            store_chunk_boundaries=config.store_chunk_boundaries,
+            stream_replay_chunk_size=config.stream_replay_chunk_size,
+        )
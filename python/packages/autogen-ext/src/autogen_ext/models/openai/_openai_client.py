@@ -1,12 +1,16 @@
 import asyncio
+import functools
 import inspect
 import json
 import logging
 import math
 import os
 import re
+import threading
 import warnings
+import weakref
 from asyncio import Task
+from collections import OrderedDict
 from dataclasses import dataclass
 from importlib.metadata import PackageNotFoundError, version
 from typing import (
@@ -19,6 +23,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -274,6 +279,152 @@ def normalize_name(name: str) -> str:
     return re.sub(r"[^a-zA-Z0-9_-]", "_", name)[:64]
 
 
+_MESSAGE_TOKEN_CACHE_SIZE = 4096
+_TOOL_TOKEN_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        trace_logger.warning(f"Model {model} not found. Using cl100k_base encoding.")
+        return tiktoken.get_encoding("cl100k_base")
+
+
+class _TokenCountCache:
+    """A least recently used cache of token counts.
+
+    Entries are keyed by the identity of the counted object together with the counting parameters. The entry
+    holds a weak reference to the object, so that the cache does not keep counted messages and tools alive and
+    an id reused by a new object is not mistaken for the old one. Objects that cannot be weakly referenced are
+    not cached.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Tuple[Any, ...], Tuple[weakref.ref[Any], int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, obj: object, key: Tuple[Any, ...]) -> int | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0]() is not obj:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, obj: object, key: Tuple[Any, ...], tokens: int) -> None:
+        try:
+            ref = weakref.ref(obj)
+        except TypeError:
+            return
+        with self._lock:
+            self._entries[key] = (ref, tokens)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
+_message_token_cache = _TokenCountCache(_MESSAGE_TOKEN_CACHE_SIZE)
+_tool_token_cache = _TokenCountCache(_TOOL_TOKEN_CACHE_SIZE)
+
+
+def _count_message_tokens(
+    message: LLMMessage,
+    encoding: tiktoken.Encoding,
+    model: str,
+    add_name_prefixes: bool,
+    model_family: str,
+) -> int:
+    key = (id(message), model, add_name_prefixes, model_family)
+    cached = _message_token_cache.get(message, key)
+    if cached is not None:
+        return cached
+
+    tokens_per_message = 3
+    tokens_per_name = 1
+    num_tokens = tokens_per_message
+    oai_message = to_oai_type(message, prepend_name=add_name_prefixes, model=model, model_family=model_family)
+    for oai_message_part in oai_message:
+        for key_name, value in oai_message_part.items():
+            if value is None:
+                continue
+
+            if isinstance(message, UserMessage) and isinstance(value, list):
+                typed_message_value = cast(List[ChatCompletionContentPartParam], value)
+
+                assert len(typed_message_value) == len(
+                    message.content
+                ), "Mismatch in message content and typed message value"
+
+                # We need image properties that are only in the original message
+                for part, content_part in zip(typed_message_value, message.content, strict=False):
+                    if isinstance(content_part, Image):
+                        # TODO: add detail parameter
+                        num_tokens += calculate_vision_tokens(content_part)
+                    elif isinstance(part, str):
+                        num_tokens += len(encoding.encode(part))
+                    else:
+                        try:
+                            serialized_part = json.dumps(part)
+                            num_tokens += len(encoding.encode(serialized_part))
+                        except TypeError:
+                            trace_logger.warning(f"Could not convert {part} to string, skipping.")
+            else:
+                if not isinstance(value, str):
+                    try:
+                        value = json.dumps(value)
+                    except TypeError:
+                        trace_logger.warning(f"Could not convert {value} to string, skipping.")
+                        continue
+                num_tokens += len(encoding.encode(value))
+                if key_name == "name":
+                    num_tokens += tokens_per_name
+    _message_token_cache.set(message, key, num_tokens)
+    return num_tokens
+
+
+def _count_tool_tokens(tool: Tool | ToolSchema, encoding: tiktoken.Encoding) -> int:
+    key = (id(tool), encoding.name)
+    cached = _tool_token_cache.get(tool, key)
+    if cached is not None:
+        return cached
+
+    function = convert_tools([tool])[0]["function"]
+    tool_tokens = len(encoding.encode(function["name"]))
+    if "description" in function:
+        tool_tokens += len(encoding.encode(function["description"]))
+    tool_tokens -= 2
+    if "parameters" in function:
+        parameters = function["parameters"]
+        if "properties" in parameters:
+            assert isinstance(parameters["properties"], dict)
+            for propertiesKey in parameters["properties"]:  # pyright: ignore
+                assert isinstance(propertiesKey, str)
+                tool_tokens += len(encoding.encode(propertiesKey))
+                v = parameters["properties"][propertiesKey]  # pyright: ignore
+                for field in v:  # pyright: ignore
+                    if field == "type":
+                        tool_tokens += 2
+                        tool_tokens += len(encoding.encode(v["type"]))  # pyright: ignore
+                    elif field == "description":
+                        tool_tokens += 2
+                        tool_tokens += len(encoding.encode(v["description"]))  # pyright: ignore
+                    elif field == "enum":
+                        tool_tokens -= 3
+                        for o in v["enum"]:  # pyright: ignore
+                            tool_tokens += 3
+                            tool_tokens += len(encoding.encode(o))  # pyright: ignore
+                    else:
+                        trace_logger.warning(f"Not supported field {field}")
+            tool_tokens += 11
+            if len(parameters["properties"]) == 0:  # pyright: ignore
+                tool_tokens -= 2
+    _tool_token_cache.set(tool, key, tool_tokens)
+    return tool_tokens
+
+
 def count_tokens_openai(
     messages: Sequence[LLMMessage],
     model: str,
@@ -282,92 +433,38 @@ def count_tokens_openai(
     tools: Sequence[Tool | ToolSchema] = [],
     model_family: str = ModelFamily.UNKNOWN,
 ) -> int:
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        trace_logger.warning(f"Model {model} not found. Using cl100k_base encoding.")
-        encoding = tiktoken.get_encoding("cl100k_base")
-    tokens_per_message = 3
-    tokens_per_name = 1
-    num_tokens = 0
-
-    # Message tokens.
-    for message in messages:
-        num_tokens += tokens_per_message
-        oai_message = to_oai_type(message, prepend_name=add_name_prefixes, model=model, model_family=model_family)
-        for oai_message_part in oai_message:
-            for key, value in oai_message_part.items():
-                if value is None:
-                    continue
-
-                if isinstance(message, UserMessage) and isinstance(value, list):
-                    typed_message_value = cast(List[ChatCompletionContentPartParam], value)
-
-                    assert len(typed_message_value) == len(
-                        message.content
-                    ), "Mismatch in message content and typed message value"
-
-                    # We need image properties that are only in the original message
-                    for part, content_part in zip(typed_message_value, message.content, strict=False):
-                        if isinstance(content_part, Image):
-                            # TODO: add detail parameter
-                            num_tokens += calculate_vision_tokens(content_part)
-                        elif isinstance(part, str):
-                            num_tokens += len(encoding.encode(part))
-                        else:
-                            try:
-                                serialized_part = json.dumps(part)
-                                num_tokens += len(encoding.encode(serialized_part))
-                            except TypeError:
-                                trace_logger.warning(f"Could not convert {part} to string, skipping.")
-                else:
-                    if not isinstance(value, str):
-                        try:
-                            value = json.dumps(value)
-                        except TypeError:
-                            trace_logger.warning(f"Could not convert {value} to string, skipping.")
-                            continue
-                    num_tokens += len(encoding.encode(value))
-                    if key == "name":
-                        num_tokens += tokens_per_name
-    num_tokens += 3  # every reply is primed with <|start|>assistant<|message|>
+    """Count the tokens of a request with the given messages and tools.
+
+    The encoding of each model is loaded once, and the token counts of messages and tools are cached by
+    identity, so counting a history that only grows at the end encodes the new messages only. Messages and
+    tool schemas must not be modified after they are counted.
+    """
+    return count_tokens_openai_batch(
+        [messages], model, add_name_prefixes=add_name_prefixes, tools=tools, model_family=model_family
+    )[0]
 
+
+def count_tokens_openai_batch(
+    batch: Sequence[Sequence[LLMMessage]],
+    model: str,
+    *,
+    add_name_prefixes: bool = False,
+    tools: Sequence[Tool | ToolSchema] = [],
+    model_family: str = ModelFamily.UNKNOWN,
+) -> List[int]:
+    """Count the tokens of several requests that share the same tools, see :func:`count_tokens_openai`."""
+    encoding = _get_encoding(model)
     # Tool tokens.
-    oai_tools = convert_tools(tools)
-    for tool in oai_tools:
-        function = tool["function"]
-        tool_tokens = len(encoding.encode(function["name"]))
-        if "description" in function:
-            tool_tokens += len(encoding.encode(function["description"]))
-        tool_tokens -= 2
-        if "parameters" in function:
-            parameters = function["parameters"]
-            if "properties" in parameters:
-                assert isinstance(parameters["properties"], dict)
-                for propertiesKey in parameters["properties"]:  # pyright: ignore
-                    assert isinstance(propertiesKey, str)
-                    tool_tokens += len(encoding.encode(propertiesKey))
-                    v = parameters["properties"][propertiesKey]  # pyright: ignore
-                    for field in v:  # pyright: ignore
-                        if field == "type":
-                            tool_tokens += 2
-                            tool_tokens += len(encoding.encode(v["type"]))  # pyright: ignore
-                        elif field == "description":
-                            tool_tokens += 2
-                            tool_tokens += len(encoding.encode(v["description"]))  # pyright: ignore
-                        elif field == "enum":
-                            tool_tokens -= 3
-                            for o in v["enum"]:  # pyright: ignore
-                                tool_tokens += 3
-                                tool_tokens += len(encoding.encode(o))  # pyright: ignore
-                        else:
-                            trace_logger.warning(f"Not supported field {field}")
-                tool_tokens += 11
-                if len(parameters["properties"]) == 0:  # pyright: ignore
-                    tool_tokens -= 2
-        num_tokens += tool_tokens
-    num_tokens += 12
-    return num_tokens
+    tool_tokens = sum(_count_tool_tokens(tool, encoding) for tool in tools) + 12
+    result: List[int] = []
+    for messages in batch:
+        # Message tokens.
+        num_tokens = sum(
+            _count_message_tokens(message, encoding, model, add_name_prefixes, model_family) for message in messages
+        )
+        num_tokens += 3  # every reply is primed with <|start|>assistant<|message|>
+        result.append(num_tokens + tool_tokens)
+    return result
 
 
 @dataclass
@@ -1073,6 +1170,21 @@ def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool |
             model_family=self._model_info["family"],
         )
 
+    def count_tokens_batch(
+        self, batch: Sequence[Sequence[LLMMessage]], *, tools: Sequence[Tool | ToolSchema] = []
+    ) -> List[int]:
+        """Count the tokens of several lists of messages that are sent with the same tools.
+
+        This is equivalent to calling :meth:`count_tokens` for each list, but the tools are only counted once.
+        """
+        return count_tokens_openai_batch(
+            batch,
+            self._create_args["model"],
+            add_name_prefixes=self._add_name_prefixes,
+            tools=tools,
+            model_family=self._model_info["family"],
+        )
+
     def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
         token_limit = _model_info.get_token_limit(self._create_args["model"])
         return token_limit - self.count_tokens(messages, tools=tools)
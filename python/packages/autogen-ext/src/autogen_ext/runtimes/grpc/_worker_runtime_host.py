@@ -3,6 +3,8 @@
 import signal
 from typing import Optional, Sequence
 
+from autogen_core._runtime_impl_helpers import DEFAULT_RECIPIENT_CACHE_CAPACITY
+
 from ._constants import GRPC_IMPORT_ERROR_STR
 from ._type_helpers import ChannelArgumentType
 from ._worker_runtime_host_servicer import GrpcWorkerAgentRuntimeHostServicer
@@ -17,9 +19,14 @@
 
 
 class GrpcWorkerAgentRuntimeHost:
-    def __init__(self, address: str, extra_grpc_config: Optional[ChannelArgumentType] = None) -> None:
+    def __init__(
+        self,
+        address: str,
+        extra_grpc_config: Optional[ChannelArgumentType] = None,
+        recipient_cache_capacity: int | None = DEFAULT_RECIPIENT_CACHE_CAPACITY,
+    ) -> None:
         self._server = grpc.aio.server(options=extra_grpc_config)
-        self._servicer = GrpcWorkerAgentRuntimeHostServicer()
+        self._servicer = GrpcWorkerAgentRuntimeHostServicer(recipient_cache_capacity=recipient_cache_capacity)
         agent_worker_pb2_grpc.add_AgentRpcServicer_to_server(self._servicer, self._server)
         self._server.add_insecure_port(address)
         self._address = address
@@ -8,7 +8,7 @@
 
 from autogen_core import TopicId
 from autogen_core._agent_id import AgentId
-from autogen_core._runtime_impl_helpers import SubscriptionManager
+from autogen_core._runtime_impl_helpers import DEFAULT_RECIPIENT_CACHE_CAPACITY, SubscriptionManager
 
 from ._constants import GRPC_IMPORT_ERROR_STR
 from ._utils import subscription_from_proto, subscription_to_proto
@@ -95,9 +95,14 @@ async def _handle_message(self, message: ReceiveT) -> None:
 
 
 class GrpcWorkerAgentRuntimeHostServicer(agent_worker_pb2_grpc.AgentRpcServicer):
-    """A gRPC servicer that hosts message delivery service for agents."""
+    """A gRPC servicer that hosts message delivery service for agents.
 
-    def __init__(self) -> None:
+    Args:
+        recipient_cache_capacity (int | None, optional): The maximum number of topics whose subscribed
+            recipients are cached. Set to None to disable eviction. Defaults to 10,000.
+    """
+
+    def __init__(self, recipient_cache_capacity: int | None = DEFAULT_RECIPIENT_CACHE_CAPACITY) -> None:
         self._data_connections: Dict[
             ClientConnectionId, ChannelConnection[agent_worker_pb2.Message, agent_worker_pb2.Message]
         ] = {}
@@ -108,7 +113,7 @@ def __init__(self) -> None:
         self._agent_type_to_client_id: Dict[str, ClientConnectionId] = {}
         self._pending_responses: Dict[ClientConnectionId, Dict[str, Future[Any]]] = {}
         self._background_tasks: Set[Task[Any]] = set()
-        self._subscription_manager = SubscriptionManager()
+        self._subscription_manager = SubscriptionManager(recipient_cache_capacity=recipient_cache_capacity)
         self._client_id_to_subscription_id_mapping: Dict[ClientConnectionId, set[str]] = {}
 
     async def OpenChannel(  # type: ignore
@@ -53,3 +53,16 @@ def test_diskcache_with_different_instances() -> None:
         loaded_store_1: DiskCacheStore[int] = DiskCacheStore.load_component(store_1_config)
         assert loaded_store_1.get(test_key) == test_value_1
         loaded_store_1.cache.close()
+
+
+@pytest.mark.asyncio
+async def test_diskcache_store_async() -> None:
+    from autogen_ext.cache_store.diskcache import DiskCacheStore
+    from diskcache import Cache
+
+    with tempfile.TemporaryDirectory() as temp_dir, Cache(temp_dir) as cache:
+        store = DiskCacheStore[int](cache)
+        await store.aset("test_key", 42)
+        assert await store.aget("test_key") == 42
+        assert store.get("test_key") == 42
+        assert await store.aget("non_existent_key", 99) == 99
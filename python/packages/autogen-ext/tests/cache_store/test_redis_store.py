@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -56,3 +56,40 @@ def test_redis_with_different_instances() -> None:
     store_1_config = store_1.dump_component()
     assert store_1_config.component_type == "cache_store"
     assert store_1_config.component_version == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_store_async() -> None:
+    from autogen_ext.cache_store.redis import AsyncRedisStore, RedisStore
+
+    redis_instance = MagicMock()
+    store = RedisStore[int](redis_instance)
+    await store.aset("test_key", 42)
+    redis_instance.set.assert_called_with("test_key", 42)
+    redis_instance.get.return_value = None
+    assert await store.aget("test_key", 99) == 99
+
+    async_redis_instance = AsyncMock()
+    async_store = AsyncRedisStore[int](async_redis_instance)
+    await async_store.aset("test_key", 42)
+    async_redis_instance.set.assert_awaited_with("test_key", 42)
+    async_redis_instance.get.return_value = 42
+    assert await async_store.aget("test_key") == 42
+    async_redis_instance.get.return_value = None
+    assert await async_store.aget("test_key", 99) == 99
+
+    # The synchronous methods use a synchronous client connected to the same server.
+    sync_redis_instance = MagicMock()
+    async_store = AsyncRedisStore[int](async_redis_instance, sync_redis_instance)
+    async_store.set("test_key", 7)
+    sync_redis_instance.set.assert_called_with("test_key", 7)
+    sync_redis_instance.get.return_value = None
+    assert async_store.get("test_key", 99) == 99
+    async_redis_instance.set.assert_awaited_with("test_key", 42)
+
+    # Without one, it is created from the connection settings of the async client.
+    async_redis_instance = redis.asyncio.Redis(host="redis.example", port=6380, db=2)
+    async_store = AsyncRedisStore[int](async_redis_instance)
+    sync_kwargs = async_store.sync_cache.connection_pool.connection_kwargs
+    assert (sync_kwargs["host"], sync_kwargs["port"], sync_kwargs["db"]) == ("redis.example", 6380, 2)
+    assert async_store.sync_cache is async_store.sync_cache
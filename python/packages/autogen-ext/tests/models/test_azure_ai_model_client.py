@@ -8,7 +8,9 @@
 import pytest
 from autogen_core import CancellationToken, FunctionCall, Image
 from autogen_core.models import CreateResult, ModelFamily, UserMessage
+from autogen_core.tools import FunctionTool
 from autogen_ext.models.azure import AzureAIChatCompletionClient
+from autogen_ext.models.azure._azure_ai_client import convert_tools
 from autogen_ext.models.azure.config import GITHUB_MODELS_ENDPOINT
 from azure.ai.inference.aio import (
     ChatCompletionsClient,
@@ -308,6 +310,18 @@ async def test_function_calling_success(function_calling_client: AzureAIChatComp
     assert result.content[0].arguments == '{"foo": "bar"}'
 
 
+def test_convert_tools_does_not_modify_tool_schema() -> None:
+    def add(x: int, y: int) -> int:
+        return x + y
+
+    tool = FunctionTool(add, description="Add two numbers.")
+    schema = tool.schema
+    definitions = convert_tools([tool])
+    assert "title" not in definitions[0].function.parameters["properties"]["x"]
+    assert tool.schema == schema
+    assert tool.schema["parameters"]["properties"]["x"]["title"] == "X"
+
+
 @pytest.mark.asyncio
 async def test_multimodal_unsupported_raises_error(azure_client: AzureAIChatCompletionClient) -> None:
     """
@@ -1,5 +1,6 @@
+import asyncio
 import copy
-from typing import List, Tuple, Union
+from typing import Any, List, Tuple, Union
 
 import pytest
 from autogen_core.models import (
@@ -9,7 +10,8 @@
     SystemMessage,
     UserMessage,
 )
-from autogen_ext.models.cache import ChatCompletionCache
+from autogen_ext.models.cache import CachedStreamResult, ChatCompletionCache
+from autogen_ext.models.cache._chat_completion_cache import _cache_key  # pyright: ignore[reportPrivateUsage]
 from autogen_ext.models.replay import ReplayChatCompletionClient
 from pydantic import BaseModel
 
@@ -184,3 +186,171 @@ async def test_cache_create_stream() -> None:
     # cached_client_config = cached_client.dump_component()
     # loaded_client = ChatCompletionCache.load_component(cached_client_config)
     # assert loaded_client.client == cached_client.client
+
+
+class SlowReplayChatCompletionClient(ReplayChatCompletionClient):
+    def __init__(self, responses: List[str], fail_first: bool = False) -> None:
+        super().__init__(responses)
+        self.calls = 0
+        self.fail_first = fail_first
+
+    async def create(self, *args: Any, **kwargs: Any) -> CreateResult:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.fail_first and self.calls == 1:
+            raise RuntimeError("Test failure")
+        return await super().create(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_cache_coalesces_concurrent_requests() -> None:
+    replay_client = SlowReplayChatCompletionClient(["response 0", "response 1"])
+    replay_client.set_cached_bool_value(False)
+    cached_client = ChatCompletionCache(replay_client)
+    messages: List[LLMMessage] = [UserMessage(content="Hello", source="user")]
+
+    results = await asyncio.gather(*[cached_client.create(messages) for _ in range(10)])
+    assert replay_client.calls == 1
+    assert all(result.content == "response 0" for result in results)
+    assert not results[0].cached
+    assert all(result.cached for result in results[1:])
+
+    # A different request is not coalesced.
+    other = await cached_client.create([UserMessage(content="Bye", source="user")])
+    assert other.content == "response 1"
+    assert replay_client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_coalesced_request_failure() -> None:
+    replay_client = SlowReplayChatCompletionClient(["response 0"], fail_first=True)
+    replay_client.set_cached_bool_value(False)
+    cached_client = ChatCompletionCache(replay_client)
+    messages: List[LLMMessage] = [UserMessage(content="Hello", source="user")]
+
+    results = await asyncio.gather(*[cached_client.create(messages) for _ in range(3)], return_exceptions=True)
+    # The first call fails, one of the waiting calls retries and the last one shares its result.
+    assert isinstance(results[0], RuntimeError)
+    assert replay_client.calls == 2
+    assert [result.content for result in results[1:] if isinstance(result, CreateResult)] == ["response 0"] * 2
+
+
+def test_cache_key_is_incremental(monkeypatch: pytest.MonkeyPatch) -> None:
+    class Answer(BaseModel):
+        text: str
+
+    messages: List[LLMMessage] = [UserMessage(content=f"Message {i}", source="user") for i in range(20)]
+    key = _cache_key(messages, [], Answer, {"temperature": 0})
+
+    # Equal requests built from new objects have the same key, different requests do not.
+    same_messages: List[LLMMessage] = [UserMessage(content=f"Message {i}", source="user") for i in range(20)]
+    assert _cache_key(same_messages, [], Answer, {"temperature": 0}) == key
+    assert _cache_key(messages[:-1], [], Answer, {"temperature": 0}) != key
+    assert _cache_key(messages, [], True, {"temperature": 0}) != key
+    assert _cache_key(messages, [], Answer, {"temperature": 1}) != key
+
+    # Appending a message only serializes the new message.
+    dumped: List[str] = []
+    original_dump_json = UserMessage.model_dump_json
+
+    def counting_dump_json(self: UserMessage, **kwargs: Any) -> str:
+        dumped.append(str(self.content))
+        return original_dump_json(self, **kwargs)
+
+    monkeypatch.setattr(UserMessage, "model_dump_json", counting_dump_json)
+    new_message = UserMessage(content="Message 20", source="user")
+    assert _cache_key([*messages, new_message], [], Answer, {"temperature": 0}) != key
+    assert dumped == ["Message 20"]
+
+
+async def _collect_stream(client: ChatCompletionClient, messages: List[LLMMessage]) -> List[Union[str, CreateResult]]:
+    return [chunk async for chunk in client.create_stream(messages)]
+
+
+@pytest.mark.asyncio
+async def test_cache_create_stream_compact() -> None:
+    replay_client = ReplayChatCompletionClient(["one two three four"])
+    replay_client.set_cached_bool_value(False)
+    cached_client = ChatCompletionCache(replay_client, compact_stream_cache=True)
+    messages: List[LLMMessage] = [UserMessage(content="Hello", source="user")]
+
+    original = await _collect_stream(cached_client, messages)
+    assert original[:-1] == ["one ", "two ", "three ", "four"]
+    stored = await cached_client.store.aget(await _stored_key(cached_client, messages))
+    assert isinstance(stored, CachedStreamResult)
+    assert stored.text is None
+    assert stored.chunk_offsets is None
+
+    # Replayed as a single chunk followed by the result.
+    replayed = await _collect_stream(cached_client, messages)
+    assert replayed[:-1] == ["one two three four"]
+    assert isinstance(replayed[-1], CreateResult)
+    assert replayed[-1].cached
+    assert replayed[-1].content == "one two three four"
+
+    # Re-chunked at a fixed size.
+    rechunked_client = ChatCompletionCache(replay_client, cached_client.store, stream_replay_chunk_size=5)
+    rechunked = await _collect_stream(rechunked_client, messages)
+    assert rechunked[:-1] == ["one t", "wo th", "ree f", "our"]
+
+
+@pytest.mark.asyncio
+async def test_cache_create_and_create_stream_share_results() -> None:
+    replay_client = ReplayChatCompletionClient(["one two", "three four", "five six"])
+    replay_client.set_cached_bool_value(False)
+    messages: List[LLMMessage] = [UserMessage(content="Hello", source="user")]
+
+    # A compact stream result is returned by create.
+    cached_client = ChatCompletionCache(replay_client, compact_stream_cache=True)
+    streamed = await _collect_stream(cached_client, messages)
+    result = await cached_client.create(messages)
+    assert result.cached
+    assert result.content == "one two"
+    assert isinstance(streamed[-1], CreateResult)
+    assert not streamed[-1].cached
+
+    # A list of chunks is a miss for create, which replaces it with its result.
+    cached_client = ChatCompletionCache(replay_client)
+    await _collect_stream(cached_client, messages)
+    result = await cached_client.create(messages)
+    assert not result.cached
+    assert result.content == "five six"
+    assert isinstance(await cached_client.store.aget(await _stored_key(cached_client, messages)), CreateResult)
+
+    # A result of create is replayed by create_stream.
+    replayed = await _collect_stream(cached_client, messages)
+    assert replayed[:-1] == ["five six"]
+    assert isinstance(replayed[-1], CreateResult)
+    assert replayed[-1].cached
+
+
+@pytest.mark.asyncio
+async def test_cache_create_stream_chunk_boundaries() -> None:
+    replay_client = ReplayChatCompletionClient(["one two three"])
+    cached_client = ChatCompletionCache(replay_client, compact_stream_cache=True, store_chunk_boundaries=True)
+    messages: List[LLMMessage] = [UserMessage(content="Hello", source="user")]
+
+    original = await _collect_stream(cached_client, messages)
+    replayed = await _collect_stream(cached_client, messages)
+    assert replayed[:-1] == original[:-1] == ["one ", "two ", "three"]
+
+    config = cached_client.dump_component()
+    loaded = ChatCompletionCache.load_component(config)
+    assert loaded.dump_component().config == config.config
+
+
+@pytest.mark.asyncio
+async def test_cache_create_stream_incomplete_is_not_stored() -> None:
+    replay_client = ReplayChatCompletionClient(["one two three"])
+    cached_client = ChatCompletionCache(replay_client)
+    messages: List[LLMMessage] = [UserMessage(content="Hello", source="user")]
+
+    stream = cached_client.create_stream(messages)
+    assert await stream.__anext__() == "one "
+    await stream.aclose()
+    assert await cached_client.store.aget(await _stored_key(cached_client, messages)) is None
+
+
+async def _stored_key(cached_client: ChatCompletionCache, messages: List[LLMMessage]) -> str:
+    _, cache_key = await cached_client._check_cache(messages, [], None, {})  # pyright: ignore[reportPrivateUsage]
+    return cache_key
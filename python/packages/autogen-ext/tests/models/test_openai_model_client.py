@@ -1,7 +1,9 @@
 import asyncio
+import gc
 import json
 import logging
 import os
+import weakref
 from typing import Annotated, Any, AsyncGenerator, Dict, List, Literal, Tuple, TypeVar
 from unittest.mock import MagicMock
 
@@ -29,6 +31,7 @@
     BaseOpenAIChatCompletionClient,
     calculate_vision_tokens,
     convert_tools,
+    count_tokens_openai,
     to_oai_type,
 )
 from autogen_ext.models.openai._transformation import TransformerMap, get_transformer
@@ -442,6 +445,64 @@ def tool2(test1: int, test2: List[int]) -> str:
     assert remaining_tokens
 
 
+class _WordEncoding:
+    name = "words"
+
+    def __init__(self) -> None:
+        self.encoded: List[str] = []
+
+    def encode(self, text: str) -> List[str]:
+        self.encoded.append(text)
+        return text.split()
+
+
+def test_openai_count_tokens_cache_and_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    encoding = _WordEncoding()
+    monkeypatch.setattr("autogen_ext.models.openai._openai_client._get_encoding", lambda model: encoding)
+    client = OpenAIChatCompletionClient(model="gpt-4o", api_key="api_key")
+    messages: List[LLMMessage] = [
+        SystemMessage(content="You are a helpful assistant."),
+        UserMessage(content="What is the weather in Seattle?", source="user"),
+        AssistantMessage(content="It is raining.", source="assistant"),
+    ]
+
+    def get_weather(city: str) -> str:
+        return "rain"
+
+    tools = [FunctionTool(get_weather, description="Get the weather for a city.")]
+
+    num_tokens = client.count_tokens(messages, tools=tools)
+    encoded = len(encoding.encoded)
+    assert encoded > 0
+    # Counting the same messages and tools again does not encode anything.
+    assert client.count_tokens(messages, tools=tools) == num_tokens
+    assert len(encoding.encoded) == encoded
+
+    # Appending a message only encodes the new message.
+    new_message = UserMessage(content="And tomorrow?", source="user")
+    longer = client.count_tokens([*messages, new_message], tools=tools)
+    assert "And tomorrow?" in encoding.encoded[encoded:]
+    assert "What is the weather in Seattle?" not in encoding.encoded[encoded:]
+    assert longer > num_tokens
+
+    batch = client.count_tokens_batch([messages[:1], messages, [*messages, new_message]], tools=tools)
+    assert batch == [
+        count_tokens_openai(messages[:1], "gpt-4o", tools=tools, model_family=client.model_info["family"]),
+        num_tokens,
+        longer,
+    ]
+
+
+def test_openai_count_tokens_cache_does_not_keep_messages_alive(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("autogen_ext.models.openai._openai_client._get_encoding", lambda model: _WordEncoding())
+    message = UserMessage(content="What is the weather in Seattle?", source="user")
+    count_tokens_openai([message], "gpt-4o")
+    message_ref = weakref.ref(message)
+    del message
+    gc.collect()
+    assert message_ref() is None
+
+
 @pytest.mark.parametrize(
     "mock_size, expected_num_tokens",
     [